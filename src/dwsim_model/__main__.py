@@ -11,17 +11,25 @@ Subcommands
 run       — Build, solve, and report a single simulation scenario.
 sweep     — Run a 1-D or 2-D parameter sweep and save results to CSV.
 validate  — Validate all YAML config files against Pydantic schemas.
+compile-config — Resolve and validate a config into a single-file bundle.
 export    — Export the current flowsheet to a DWSIM GUI (.dwxml) file.
 summary   — Print a human-readable summary of the reaction configuration.
+serve     — Keep DWSIM loaded in a local model server for run/sweep --server.
 
 Examples
 --------
     # Run the baseline scenario and save results to results/
     python -m dwsim_model run --scenario baseline
 
+    # Run every scenario under config/scenarios on a worker pool
+    python -m dwsim_model run --all-scenarios --workers 4
+
     # Run a custom config with verbose logging
     python -m dwsim_model run --config my_config.yaml --verbose
 
+    # Time each phase (build / configure / solve / extract) and save cProfile data
+    python -m dwsim_model run --profile
+
     # Sweep biomass flow rate from 2.0 to 6.0 kg/s in 9 steps
     python -m dwsim_model sweep \\
         --param feeds.Gasifier_Biomass_Feed.mass_flow_kg_s \\
@@ -32,14 +40,26 @@ Examples
     # Validate config files only (no simulation)
     python -m dwsim_model validate --config config/master_config.yaml
 
+    # Compile the config once; later runs load the bundle in one read
+    python -m dwsim_model compile-config --config config/master_config.yaml
+    python -m dwsim_model run --config config/master_config.cfgbundle
+
     # Print reaction summary
     python -m dwsim_model summary
+
+    # Profile the Python side without DWSIM (simulated results)
+    python -m dwsim_model --backend fake run --profile
+
+    # Keep DWSIM warm in one process and send runs to it
+    python -m dwsim_model serve &
+    python -m dwsim_model run --server http://127.0.0.1:8765
 """
 
 from __future__ import annotations
 
 import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -62,11 +82,6 @@ def _setup_logging(verbose: bool) -> None:
 
 def cmd_run(args: argparse.Namespace) -> int:
     """Build, solve, and report a single scenario."""
-    from dwsim_model.gasification import GasificationFlowsheet
-    from dwsim_model.results.extractor import ResultsExtractor
-    from dwsim_model.results.metrics import MetricsCalculator
-    from dwsim_model.results.reporter import generate_html_report, generate_json_report
-
     logger = logging.getLogger("dwsim_model.cli.run")
 
     # Resolve config path
@@ -75,34 +90,115 @@ def cmd_run(args: argparse.Namespace) -> int:
 
     logger.info(f"Starting scenario '{scenario}' ...")
 
-    # Build flowsheet
-    flowsheet = GasificationFlowsheet(config_path=config_path)
-    flowsheet.build_flowsheet()  # fix: was build() - method name mismatch
+    out_dir = Path(args.output or "results")
 
-    # Solve
-    logger.info("Solving flowsheet ...")
-    try:
-        flowsheet.run()  # fix: was solve() - method name mismatch
-        logger.info("Flowsheet solved successfully.")
-    except Exception as exc:
-        logger.error(f"Solve failed: {exc}")
-        if not args.force:
+    if args.all_scenarios or args.scenarios:
+        if args.server or args.save_dwxml or args.profile:
+            logger.error(
+                "--all-scenarios/--scenarios cannot be combined with "
+                "--server, --save-dwxml or --profile."
+            )
             return 1
-        logger.warning("--force flag set — continuing with partial results.")
+        return _run_scenario_batch(args, config_path, out_dir, logger)
 
-    # Extract results
-    extractor = ResultsExtractor()
-    results = extractor.extract(flowsheet.builder)
+    if args.server:
+        if args.save_dwxml or args.profile:
+            logger.error(
+                "--save-dwxml and --profile need a local solve; drop --server."
+            )
+            return 1
+        solved = _solve_on_server(args.server, config_path, logger)
+        if solved is None:
+            return 1
+        results, metrics = solved
+        _print_kpi_table(metrics)
+        _write_reports(results, metrics, out_dir, scenario, logger)
+        return 0
 
-    # Calculate metrics
-    calculator = MetricsCalculator()
-    metrics = calculator.calculate(results)
+    # A cache hit skips build + solve entirely.  --save-dwxml needs a live
+    # flowsheet and --profile needs a real solve to measure, so both always
+    # solve.
+    cache = None
+    resolved = None
+    if not args.no_cache and not args.save_dwxml and not args.profile:
+        from dwsim_model.config_loader import ConfigLoader
+        from dwsim_model.results.cache import ResultCache
+
+        resolved = ConfigLoader(config_path=config_path).load()
+        if resolved:
+            cache = ResultCache()
+
+    # Prebuilt flowsheet snapshots turn the build into a single file load.
+    snapshots = None
+    if not args.no_snapshot:
+        from dwsim_model.snapshot import SnapshotStore
+
+        snapshots = SnapshotStore(out_dir / ".snapshots")
+
+    profiler = None
+    if args.profile:
+        from dwsim_model.profiling import Profiler
+
+        profiler = Profiler(cprofile=True)
+
+    flowsheet = None
+    hit = cache.get(resolved) if cache is not None else None
+    if hit is not None:
+        results, metrics = hit
+        print("(result cache hit — solve skipped; use --no-cache to force)")
+    else:
+        if profiler is not None:
+            with profiler:
+                solved = _solve_scenario(config_path, args.force, logger, snapshots)
+        else:
+            solved = _solve_scenario(config_path, args.force, logger, snapshots)
+        if solved is None:
+            return 1
+        flowsheet, results, metrics = solved
+        if cache is not None and results.converged:
+            cache.put(resolved, results, metrics)
 
     # Print KPI summary to console
     _print_kpi_table(metrics)
 
     # Write reports
-    out_dir = Path(args.output or "results")
+    timing = profiler.to_dict() if profiler is not None else None
+    _write_reports(results, metrics, out_dir, scenario, logger, timing=timing)
+
+    if profiler is not None:
+        prof_path = profiler.dump_stats(out_dir / f"{scenario}.prof")
+        print("\nPhase timing:")
+        print(profiler.format_table())
+        print(f"\n✓  cProfile data: {prof_path}")
+
+    # Save .dwxml if requested (--save-dwxml bypasses the cache, see above)
+    if args.save_dwxml and flowsheet is not None:
+        try:
+            dwxml_path = out_dir / f"{scenario}.dwxml"
+            flowsheet.builder.save(
+                str(dwxml_path)
+            )  # fix: was sim.SaveToFile() - wrong DWSIM API
+            logger.info(f"DWSIM file saved: {dwxml_path}")
+            print(f"✓  DWXML file:   {dwxml_path}")
+        except Exception as exc:
+            logger.warning(f"Could not save DWXML: {exc}")
+
+    return 0
+
+
+def _write_reports(
+    results,
+    metrics,
+    out_dir: Path,
+    scenario: str,
+    logger: logging.Logger,
+    *,
+    timing=None,
+    targets=None,
+) -> None:
+    """Write the HTML and JSON reports for ``cmd_run``."""
+    from dwsim_model.results.reporter import generate_html_report, generate_json_report
+
     out_dir.mkdir(parents=True, exist_ok=True)
 
     html_path = out_dir / f"{scenario}_report.html"
@@ -114,28 +210,171 @@ def cmd_run(args: argparse.Namespace) -> int:
         html_path,
         scenario_name=scenario,
         model_version="2.0",
+        targets=targets,
+        timing=timing,
+    )
+    generate_json_report(
+        results, metrics, json_path, scenario_name=scenario, timing=timing
     )
-    generate_json_report(results, metrics, json_path, scenario_name=scenario)
 
     logger.info(f"Reports written to {out_dir}/")
     print(f"\n✓  HTML report: {html_path}")
     print(f"✓  JSON report: {json_path}")
 
-    # Save .dwxml if requested
-    if args.save_dwxml:
-        try:
-            dwxml_path = out_dir / f"{scenario}.dwxml"
-            flowsheet.builder.save(
-                str(dwxml_path)
-            )  # fix: was sim.SaveToFile() - wrong DWSIM API
-            logger.info(f"DWSIM file saved: {dwxml_path}")
-            print(f"✓  DWXML file:   {dwxml_path}")
-        except Exception as exc:
-            logger.warning(f"Could not save DWXML: {exc}")
 
+def _run_scenario_batch(
+    args: argparse.Namespace, config_path, out_dir: Path, logger: logging.Logger
+) -> int:
+    """Solve several scenarios on a worker pool and write a comparison table."""
+    from dwsim_model.analysis.scenarios import (
+        comparison_rows,
+        discover_scenarios,
+        run_scenarios,
+    )
+
+    if args.all_scenarios:
+        names = discover_scenarios(config_path)
+    else:
+        names = [n.strip() for n in args.scenarios.split(",") if n.strip()]
+    if not names:
+        logger.error("No scenarios to run.")
+        return 1
+
+    cache = None
+    if not args.no_cache:
+        from dwsim_model.results.cache import ResultCache
+
+        cache = ResultCache()
+    snapshots = None
+    if not args.no_snapshot:
+        from dwsim_model.snapshot import SnapshotStore
+
+        snapshots = SnapshotStore(out_dir / ".snapshots")
+
+    logger.info(f"Running {len(names)} scenarios: {', '.join(names)}")
+    outcomes = run_scenarios(
+        config_path, names, workers=args.workers, cache=cache, snapshots=snapshots
+    )
+
+    for outcome in outcomes:
+        if outcome.error is None:
+            _write_reports(
+                outcome.results,
+                outcome.metrics,
+                out_dir,
+                outcome.name,
+                logger,
+                targets=outcome.targets,
+            )
+
+    rows = comparison_rows(outcomes)
+    table_path = out_dir / "scenario_comparison.csv"
+    _write_rows_csv(rows, table_path)
+    _print_comparison_table(rows)
+    print(f"\n✓  Comparison table: {table_path}")
+
+    failed = [o.name for o in outcomes if o.error is not None]
+    if failed:
+        logger.error(f"{len(failed)} scenario(s) failed: {', '.join(failed)}")
+        return 1
     return 0
 
 
+def _write_rows_csv(rows: list[dict], path: Path) -> None:
+    """Write dict rows to CSV with the union of their keys as columns."""
+    import csv
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    with path.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.DictWriter(fh, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _print_comparison_table(rows: list[dict]) -> None:
+    """Print the headline KPIs of each scenario side by side."""
+    columns = [
+        ("cold_gas_efficiency", "CGE", ".1%"),
+        ("carbon_conversion_efficiency", "Carbon conv.", ".1%"),
+        ("h2_co_ratio", "H₂/CO", ".2f"),
+        ("syngas_lhv_mj_nm3", "LHV MJ/Nm³", ".2f"),
+        ("specific_energy_consumption_kWh_t", "SEC kWh/t", ".0f"),
+        ("tar_loading_mg_Nm3", "Tar mg/Nm³", ".1f"),
+    ]
+    width = 20 + 14 * len(columns) + 10
+    print("\n" + "─" * width)
+    print(f"  {'Scenario':<18}" + "".join(f"{c[1]:>14}" for c in columns) + "  Status")
+    print("─" * width)
+    for row in rows:
+        cells = "".join(
+            f"{row[key]:>14{spec}}" if row.get(key) is not None else f"{'—':>14}"
+            for key, _label, spec in columns
+        )
+        if row.get("error"):
+            status = "failed"
+        else:
+            status = "ok" if row.get("converged") else "not converged"
+        print(f"  {row['scenario']:<18}{cells}  {status}")
+    print("─" * width)
+
+
+def _solve_on_server(url: str, config_path, logger: logging.Logger):
+    """
+    Resolve the config locally and solve it on a ``serve`` process.
+
+    Returns ``(results, metrics)``, or None when the server failed.
+    """
+    from dwsim_model.server import ModelClient, ServerError
+
+    client = ModelClient(url, config_path=config_path)
+    try:
+        resolved = client.resolve()
+        logger.info(f"Solving on model server {client.url} ...")
+        return client.run(resolved)
+    except ServerError as exc:
+        logger.error(str(exc))
+        return None
+
+
+def _solve_scenario(config_path, force: bool, logger: logging.Logger, snapshots=None):
+    """
+    Build, solve and evaluate one flowsheet for ``cmd_run``.
+
+    Returns ``(flowsheet, results, metrics)``, or None when the solve
+    failed and *force* is not set.
+    """
+    from dwsim_model.gasification import GasificationFlowsheet
+    from dwsim_model.results.extractor import ResultsExtractor
+    from dwsim_model.results.metrics import MetricsCalculator
+
+    # Build flowsheet
+    flowsheet = GasificationFlowsheet(config_path=config_path, snapshots=snapshots)
+    flowsheet.build_flowsheet()  # fix: was build() - method name mismatch
+
+    # Solve
+    logger.info("Solving flowsheet ...")
+    solved = True
+    try:
+        flowsheet.run()  # fix: was solve() - method name mismatch
+        logger.info("Flowsheet solved successfully.")
+    except Exception as exc:
+        logger.error(f"Solve failed: {exc}")
+        if not force:
+            return None
+        logger.warning("--force flag set — continuing with partial results.")
+        solved = False
+
+    # Extract results (a failed solve is never reported as converged)
+    extractor = ResultsExtractor(compound_names=list(flowsheet.compound_set))
+    results = extractor.extract(flowsheet.builder, converged=None if solved else False)
+
+    # Calculate metrics
+    calculator = MetricsCalculator()
+    metrics = calculator.calculate(results)
+    return flowsheet, results, metrics
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Subcommand: sweep
 # ─────────────────────────────────────────────────────────────────────────────
@@ -150,9 +389,57 @@ def cmd_sweep(args: argparse.Namespace) -> int:
     logger = logging.getLogger("dwsim_model.cli.sweep")
 
     config_path = Path(args.config) if args.config else None
-    ps = ParameterSweep(base_config_path=config_path)
+    cache = None
+    if not args.no_cache:
+        from dwsim_model.results.cache import ResultCache
+
+        cache = ResultCache()
+    snapshots = None
+    if not args.no_snapshot:
+        from dwsim_model.snapshot import SnapshotStore
+
+        snapshots = SnapshotStore()
+    runner = None
+    if args.server:
+        from dwsim_model.server import ModelClient
+
+        runner = ModelClient(args.server, config_path=config_path)
+    elif args.warm:
+        from dwsim_model.analysis.warm import WarmModelRunner
+
+        runner = WarmModelRunner(
+            config_path=config_path, cache=cache, snapshots=snapshots
+        )
+    elif args.stage_cache:
+        from dwsim_model.analysis.stages import StagedModelRunner
+
+        runner = StagedModelRunner(config_path=config_path, snapshots=snapshots)
+    elif args.continuation:
+        from dwsim_model.analysis.continuation import ContinuationRunner
+
+        runner = ContinuationRunner(
+            config_path=config_path,
+            cache=cache,
+            snapshots=snapshots,
+            measure_cold=args.measure_cold,
+        )
+    ps = ParameterSweep(
+        base_config_path=config_path,
+        model_runner=runner,
+        workers=args.workers,
+        cache=cache,
+        profile=args.profile,
+        snapshots=snapshots,
+    )
 
     kpis = args.kpis if args.kpis else None
+    out_path = Path(args.output) if args.output else Path("results/sweep.csv")
+
+    # Stream rows to a JSONL checkpoint so a crashed sweep can be resumed.
+    checkpoint = Path(args.checkpoint) if args.checkpoint else None
+    if args.resume and checkpoint is None:
+        checkpoint = out_path.with_suffix(".jsonl")
+    ckpt = {"checkpoint": checkpoint, "resume": args.resume}
 
     if args.param_b:
         # 2-D sweep
@@ -165,7 +452,25 @@ def cmd_sweep(args: argparse.Namespace) -> int:
         max_b = args.max_b if args.max_b is not None else args.max
         steps_b = args.steps_b or args.steps
         values_b = np.linspace(min_b, max_b, steps_b)
-        df = ps.sweep_2d(args.param, values_a, args.param_b, values_b, kpis=kpis)
+        order = args.order or ("serpentine" if args.continuation else "raster")
+        df = ps.sweep_2d(
+            args.param, values_a, args.param_b, values_b, kpis=kpis, order=order, **ckpt
+        )
+    elif args.adaptive:
+        # Adaptive 1-D sweep: --steps is the initial grid, --budget the cap
+        logger.info(
+            f"Adaptive sweep: '{args.param}' from {args.min} to {args.max}, "
+            f"budget {args.budget} runs"
+        )
+        df = ps.sweep_adaptive(
+            args.param,
+            (args.min, args.max),
+            kpis=kpis,
+            budget=args.budget,
+            tol=args.tol,
+            initial_points=args.steps,
+            **ckpt,
+        )
     else:
         # 1-D sweep
         values = np.linspace(args.min, args.max, args.steps)
@@ -173,10 +478,9 @@ def cmd_sweep(args: argparse.Namespace) -> int:
             f"1-D sweep: '{args.param}' from {args.min} to {args.max} "
             f"in {args.steps} steps"
         )
-        df = ps.sweep_1d(args.param, values, kpis=kpis)
+        df = ps.sweep_1d(args.param, values, kpis=kpis, **ckpt)
 
     # Save output
-    out_path = Path(args.output) if args.output else Path("results/sweep.csv")
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
@@ -192,6 +496,8 @@ def cmd_sweep(args: argparse.Namespace) -> int:
 
     # Print a quick table of results to console
     _print_sweep_summary(df)
+    if args.continuation and args.workers <= 1:
+        logger.info(f"Continuation summary: {runner.summary()}")
 
     return 0
 
@@ -269,6 +575,34 @@ def _validate_yaml_directory(directory: Path, label: str, logger) -> bool:
     return ok
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Subcommand: compile-config
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def cmd_compile_config(args: argparse.Namespace) -> int:
+    """Resolve and validate a config and write it as a single-file bundle."""
+    from dwsim_model.config.bundle import compile_config, read_bundle
+
+    logger = logging.getLogger("dwsim_model.cli.compile_config")
+
+    config_path = Path(args.config) if args.config else _find_default_config()
+    if not config_path or not config_path.exists():
+        print(f"✗  Config file not found: {config_path}", file=sys.stderr)
+        return 1
+
+    try:
+        output = compile_config(config_path, args.output)
+    except Exception as exc:
+        print(f"✗  {config_path}: cannot compile\n   {exc}", file=sys.stderr)
+        logger.debug("Compile error detail:", exc_info=True)
+        return 1
+
+    n_sources = len(read_bundle(output).sources)
+    print(f"✓  Compiled {config_path} → {output} ({n_sources} source files)")
+    return 0
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Subcommand: export
 # ─────────────────────────────────────────────────────────────────────────────
@@ -317,6 +651,39 @@ def cmd_summary(args: argparse.Namespace) -> int:
     return 0
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Subcommand: serve
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    """Keep DWSIM loaded and serve run/sweep requests until interrupted."""
+    from dwsim_model.server import ModelServer
+
+    cache = None
+    if not args.no_cache:
+        from dwsim_model.results.cache import ResultCache
+
+        cache = ResultCache()
+    snapshots = None
+    if not args.no_snapshot:
+        from dwsim_model.snapshot import SnapshotStore
+
+        snapshots = SnapshotStore()
+
+    server = ModelServer(
+        host=args.host,
+        port=args.port,
+        config_path=Path(args.config) if args.config else None,
+        cache=cache,
+        snapshots=snapshots,
+    )
+    url = server.start()
+    print(f"Model server ready at {url}  (Ctrl-C to stop)")
+    server.serve_forever()
+    return 0
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Console output helpers
 # ─────────────────────────────────────────────────────────────────────────────
@@ -413,6 +780,15 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enable DEBUG-level logging.",
     )
+    parser.add_argument(
+        "--backend",
+        choices=("dwsim", "fake"),
+        help=(
+            "Simulation backend.  'fake' is a pure-Python stand-in with simple "
+            "mass/energy balances for benchmarking without DWSIM "
+            "(default: $DWSIM_BACKEND, else dwsim)."
+        ),
+    )
 
     subs = parser.add_subparsers(dest="command", metavar="<subcommand>")
     subs.required = True
@@ -423,6 +799,24 @@ def _build_parser() -> argparse.ArgumentParser:
     run_p.add_argument(
         "--scenario", default="baseline", help="Scenario name (default: baseline)"
     )
+    batch_g = run_p.add_mutually_exclusive_group()
+    batch_g.add_argument(
+        "--all-scenarios",
+        action="store_true",
+        help="Run every scenario under config/scenarios and write a comparison table",
+    )
+    batch_g.add_argument(
+        "--scenarios",
+        metavar="A,B,C",
+        help="Comma-separated scenario names (or YAML paths) to run as a batch",
+    )
+    run_p.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --all-scenarios/--scenarios "
+        "(default: one per topology batch, at most the CPU count)",
+    )
     run_p.add_argument("--output", help="Output directory (default: results/)")
     run_p.add_argument(
         "--save-dwxml", action="store_true", help="Also save a DWSIM .dwxml file"
@@ -432,6 +826,29 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Continue even if the solver doesn't converge",
     )
+    run_p.add_argument(
+        "--server",
+        metavar="URL",
+        help="Solve on a running 'serve' process (e.g. http://127.0.0.1:8765) "
+        "instead of starting DWSIM here",
+    )
+    run_p.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always solve; do not read or write the result cache",
+    )
+    run_p.add_argument(
+        "--no-snapshot",
+        action="store_true",
+        help="Construct the flowsheet object by object instead of loading the "
+        "saved prebuilt snapshot",
+    )
+    run_p.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time each model phase, count DWSIM calls and save cProfile data "
+        "(<output>/<scenario>.prof); bypasses the result cache",
+    )
 
     # ── sweep ──
     sw_p = subs.add_parser("sweep", help="Parameter sweep (1-D or 2-D).")
@@ -453,6 +870,92 @@ def _build_parser() -> argparse.ArgumentParser:
         "--steps-b", type=int, help="Steps for param B (default: same as --steps)"
     )
     sw_p.add_argument("--kpis", nargs="+", help="KPI names to record (default: all)")
+    sw_p.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="1-D only: refine where KPIs change fastest instead of a fixed grid",
+    )
+    sw_p.add_argument(
+        "--budget",
+        type=int,
+        default=20,
+        help="Total runs for --adaptive (default: 20)",
+    )
+    sw_p.add_argument(
+        "--tol",
+        type=float,
+        default=0.02,
+        help="Refinement tolerance for --adaptive, as a fraction of KPI range "
+        "(default: 0.02)",
+    )
+    sw_p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for grid points (default: 1 = serial)",
+    )
+    runner_g = sw_p.add_mutually_exclusive_group()
+    runner_g.add_argument(
+        "--warm",
+        action="store_true",
+        help="Reuse one built flowsheet and patch changed streams between points",
+    )
+    runner_g.add_argument(
+        "--stage-cache",
+        action="store_true",
+        help="Reuse cached gasifier/PEM/TRC outlets and solve only the stages "
+        "whose inputs changed (results/.stages)",
+    )
+    runner_g.add_argument(
+        "--server",
+        metavar="URL",
+        help="Solve every point on a running 'serve' process "
+        "(e.g. http://127.0.0.1:8765)",
+    )
+    runner_g.add_argument(
+        "--continuation",
+        action="store_true",
+        help="Seed each solve with the previous point's converged streams "
+        "(2-D order defaults to serpentine)",
+    )
+    sw_p.add_argument(
+        "--measure-cold",
+        action="store_true",
+        help="With --continuation, also solve each warm-started point cold and "
+        "report its time saving (doubles the solves)",
+    )
+    sw_p.add_argument(
+        "--order",
+        choices=("raster", "serpentine", "nearest"),
+        help="Order in which 2-D grid points are solved "
+        "(default: serpentine with --continuation, else raster)",
+    )
+    sw_p.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always solve; do not read or write the result cache",
+    )
+    sw_p.add_argument(
+        "--no-snapshot",
+        action="store_true",
+        help="Construct the flowsheet object by object instead of loading the "
+        "saved prebuilt snapshot",
+    )
+    sw_p.add_argument(
+        "--profile",
+        action="store_true",
+        help="Add per-phase time_*_s and interop_* columns to every row",
+    )
+    sw_p.add_argument(
+        "--checkpoint",
+        help="Append each finished row to this JSONL file as it completes",
+    )
+    sw_p.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip points already recorded in the checkpoint "
+        "(default checkpoint: the --output path with a .jsonl suffix)",
+    )
     sw_p.add_argument(
         "--output",
         default="results/sweep.csv",
@@ -463,6 +966,17 @@ def _build_parser() -> argparse.ArgumentParser:
     val_p = subs.add_parser("validate", help="Validate YAML config files.")
     val_p.add_argument("--config", help="Path to master_config.yaml")
 
+    # ── compile-config ──
+    cc_p = subs.add_parser(
+        "compile-config",
+        help="Resolve and validate a config into a single-file bundle.",
+    )
+    cc_p.add_argument("--config", help="Path to master_config.yaml")
+    cc_p.add_argument(
+        "--output",
+        help="Bundle path (default: the config path with a .cfgbundle suffix)",
+    )
+
     # ── export ──
     exp_p = subs.add_parser("export", help="Export flowsheet to DWSIM GUI file.")
     exp_p.add_argument("--config", help="Path to master_config.yaml")
@@ -471,6 +985,29 @@ def _build_parser() -> argparse.ArgumentParser:
     # ── summary ──
     subs.add_parser("summary", help="Print reaction configuration summary.")
 
+    # ── serve ──
+    srv_p = subs.add_parser(
+        "serve", help="Run a local model server that keeps DWSIM loaded."
+    )
+    srv_p.add_argument("--config", help="Path to master_config.yaml")
+    srv_p.add_argument(
+        "--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)"
+    )
+    srv_p.add_argument(
+        "--port", type=int, default=8765, help="TCP port (default: 8765)"
+    )
+    srv_p.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always solve; do not read or write the result cache",
+    )
+    srv_p.add_argument(
+        "--no-snapshot",
+        action="store_true",
+        help="Construct flowsheets object by object instead of loading the "
+        "saved prebuilt snapshot",
+    )
+
     return parser
 
 
@@ -485,13 +1022,18 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     _setup_logging(args.verbose)
+    if args.backend:
+        # Through the environment so sweep worker processes inherit it.
+        os.environ["DWSIM_BACKEND"] = args.backend
 
     dispatch = {
         "run": cmd_run,
         "sweep": cmd_sweep,
         "validate": cmd_validate,
+        "compile-config": cmd_compile_config,
         "export": cmd_export,
         "summary": cmd_summary,
+        "serve": cmd_serve,
     }
 
     handler = dispatch.get(args.command)
@@ -0,0 +1,346 @@
+"""
+analysis/continuation.py
+========================
+Continuation sweeps: walk the grid along a short path and warm-start each
+solve from the previous converged solution.
+
+Why this exists
+---------------
+``sweep_2d`` visits its grid in raster order and every point is solved
+from DWSIM's default initial state.  The equilibrium (PEM) and PFR (TRC)
+reactors iterate from whatever state their streams hold, so a cold start
+costs extra iterations — and the long jump from the end of one row to the
+start of the next is where convergence failures cluster.
+
+Two pieces fix that:
+
+* :func:`grid_order` reorders the points so consecutive solves are
+  neighbours — ``"serpentine"`` (boustrophedon: every other row reversed)
+  for regular grids, ``"nearest"`` (greedy nearest-neighbour on the
+  normalised parameter values) for anything else.  Rows still come back in
+  grid order.
+* :class:`ContinuationRunner` builds each point like the default runner but,
+  before solving, seeds every internal stream (anything not set by the
+  config) with the temperature, pressure, flow and composition of the
+  previous converged point.
+
+Each row gets the warm-start bookkeeping so the gain is visible per point:
+
+    warm_started       — solve was seeded from the previous point
+    solve_time_s       — wall time of the DWSIM solve alone
+    time_saved_s       — cold solve time of this point − this solve time
+
+Only time is reported: the DWSIM automation API exposes no solver
+iteration count.  A saving needs a cold solve of the *same* point to
+compare against, so ``time_saved_s`` is only filled in with
+``measure_cold=True``: each warm-started point is then solved a second
+time from DWSIM's default state (doubling the solve cost of the sweep).
+Without it the column is None.
+
+Usage
+-----
+    from dwsim_model.analysis.continuation import ContinuationRunner
+    from dwsim_model.analysis.sweep import ParameterSweep
+
+    runner = ContinuationRunner(config_path="config/master_config.yaml",
+                                measure_cold=True)
+    ps = ParameterSweep(base_config_path="config/master_config.yaml",
+                        model_runner=runner)
+    df = ps.sweep_2d(..., order="serpentine")
+    print(runner.summary())
+
+Or from the CLI: ``python -m dwsim_model sweep ... --continuation
+[--measure-cold]``.
+
+With ``workers=N`` each worker keeps its own previous solution, and the
+points it receives are only roughly adjacent; run serially for the
+tightest continuation.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from dwsim_model.analysis.stages import set_stream_state, stream_state
+from dwsim_model.config_loader import ConfigLoader
+
+logger = logging.getLogger(__name__)
+
+#: Point orderings accepted by :func:`grid_order`.
+ORDERS: tuple[str, ...] = ("raster", "serpentine", "nearest")
+
+#: Row columns added by :class:`ContinuationRunner`.
+CONTINUATION_COLUMNS: tuple[str, ...] = (
+    "warm_started",
+    "solve_time_s",
+    "time_saved_s",
+)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Point ordering
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def serpentine_order(n_rows: int, n_cols: int) -> list[int]:
+    """Row-major grid indices with every other row reversed."""
+    order: list[int] = []
+    for row in range(n_rows):
+        cols = range(n_cols) if row % 2 == 0 else range(n_cols - 1, -1, -1)
+        order.extend(row * n_cols + col for col in cols)
+    return order
+
+
+def nearest_neighbour_order(coords: Sequence[Sequence[float]]) -> list[int]:
+    """
+    Greedy nearest-neighbour path through *coords*, starting at the first.
+
+    Each dimension is scaled by its range so parameters with different
+    units weigh equally.
+    """
+    if not coords:
+        return []
+    dims = len(coords[0])
+    spans = []
+    for d in range(dims):
+        values = [c[d] for c in coords]
+        spans.append((max(values) - min(values)) or 1.0)
+
+    def distance(i: int, j: int) -> float:
+        return sum(((coords[i][d] - coords[j][d]) / spans[d]) ** 2 for d in range(dims))
+
+    remaining = set(range(1, len(coords)))
+    order = [0]
+    while remaining:
+        last = order[-1]
+        nearest = min(remaining, key=lambda j: (distance(last, j), j))
+        order.append(nearest)
+        remaining.remove(nearest)
+    return order
+
+
+def grid_order(
+    order: str, shape: tuple[int, int], coords: Sequence[Sequence[float]]
+) -> list[int]:
+    """
+    Return the visiting order of a row-major 2-D grid.
+
+    Parameters
+    ----------
+    order:
+        One of :data:`ORDERS`.
+    shape:
+        ``(len(values_a), len(values_b))``.
+    coords:
+        Parameter values of every point, in row-major order (used by
+        ``"nearest"``).
+    """
+    if order == "raster":
+        return list(range(len(coords)))
+    if order == "serpentine":
+        return serpentine_order(*shape)
+    if order == "nearest":
+        return nearest_neighbour_order(coords)
+    raise ValueError(f"Unknown point order '{order}' (choose from {ORDERS}).")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Runner
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class ContinuationRunner:
+    """
+    Model runner that seeds each solve with the previous converged solution.
+
+    Parameters
+    ----------
+    config_path:
+        Master config used to resolve relative references in the configs
+        passed to the runner.
+    cache:
+        Optional ``ResultCache``.  Hits are returned without solving and
+        leave the seed untouched; only converged solves are stored.
+    snapshots:
+        Optional ``SnapshotStore`` for the per-point builds.
+    measure_cold:
+        Also solve every warm-started point cold, on a fresh flowsheet, and
+        report ``time_saved_s`` against that solve.
+
+    Attributes
+    ----------
+    cold_solves, warm_solves:
+        Number of unseeded and seeded solves so far.
+    reference_solves:
+        Number of cold reference solves made for ``measure_cold``.
+    """
+
+    def __init__(
+        self,
+        config_path: str | Path | None = None,
+        cache=None,
+        snapshots=None,
+        measure_cold: bool = False,
+    ):
+        self.config_path = Path(config_path) if config_path else None
+        self.cache = cache
+        self.snapshots = snapshots
+        self.measure_cold = measure_cold
+        self.cold_solves = 0
+        self.warm_solves = 0
+        self.reference_solves = 0
+        self._seed: dict[str, dict[str, Any]] | None = None
+        self._cold_times: list[float] = []
+        self._time_saved: list[float] = []
+
+    def __call__(self, config: dict) -> dict:
+        """Run *config*; KPI dict plus the :data:`CONTINUATION_COLUMNS`."""
+        _results, metrics, stats = self._solve(config)
+        return metrics.to_dict() | stats
+
+    def solve(self, config: dict):
+        """
+        Solve *config* warm-started from the previous point.
+
+        Returns
+        -------
+        (FlowsheetResults, GasificationMetrics)
+        """
+        results, metrics, _stats = self._solve(config)
+        return results, metrics
+
+    def reset(self) -> None:
+        """Forget the previous solution; the next solve starts cold."""
+        self._seed = None
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Counts and mean savings of the seeded solves so far.
+
+        The cold means cover the unseeded sweep points and the
+        ``measure_cold`` reference solves.
+        """
+
+        def mean(values):
+            return round(sum(values) / len(values), 4) if values else None
+
+        return {
+            "cold_solves": self.cold_solves,
+            "warm_solves": self.warm_solves,
+            "reference_solves": self.reference_solves,
+            "mean_cold_solve_time_s": mean(self._cold_times),
+            "mean_time_saved_s": mean(self._time_saved),
+        }
+
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _solve(self, config: dict):
+        from dwsim_model.results.extractor import ResultsExtractor
+        from dwsim_model.results.metrics import MetricsCalculator
+
+        loader = ConfigLoader(config_path=self.config_path, config_data=config)
+        resolved = loader.load()
+
+        if self.cache is not None:
+            hit = self.cache.get(resolved)
+            if hit is not None:
+                return (*hit, {})
+
+        flowsheet = self._build(config)
+        configured = set(resolved.get("feeds") or {})
+        warm = self._apply_seed(loader, flowsheet.builder, configured)
+        flowsheet.run()
+
+        builder = flowsheet.builder
+        extractor = ResultsExtractor(compound_names=list(flowsheet.compound_set))
+        results = extractor.extract(builder)
+        metrics = MetricsCalculator().calculate(results)
+        solve_s = builder.last_solve_s
+        reference_s = (
+            self._cold_reference(config) if warm and self.measure_cold else None
+        )
+        stats = self._record(warm, solve_s, reference_s)
+
+        if results.converged:
+            self._seed = {
+                name: stream_state(stream)
+                for name, stream in results.streams.items()
+                if name not in configured and stream.mass_flow_kg_s > 0
+            }
+        else:
+            # Do not carry an unconverged state into the next point.
+            self._seed = None
+        if self.cache is not None and results.converged:
+            self.cache.put(resolved, results, metrics)
+        return results, metrics, stats
+
+    def _build(self, config: dict):
+        from dwsim_model.gasification import GasificationFlowsheet
+
+        flowsheet = GasificationFlowsheet(
+            config_path=str(self.config_path) if self.config_path else None,
+            runtime_config=config,
+            snapshots=self.snapshots,
+        )
+        flowsheet.build_flowsheet()
+        return flowsheet
+
+    def _cold_reference(self, config: dict) -> float | None:
+        """Solve *config* unseeded; its solve time, or None on failure."""
+        try:
+            flowsheet = self._build(config)
+            flowsheet.run()
+        except Exception as exc:
+            logger.warning(f"Continuation: cold reference solve failed: {exc}")
+            return None
+        self.reference_solves += 1
+        return flowsheet.builder.last_solve_s
+
+    def _apply_seed(self, loader: ConfigLoader, builder, configured: set[str]) -> bool:
+        """Write the previous solution onto the internal streams."""
+        if not self._seed:
+            return False
+        seeded = 0
+        for name, state in self._seed.items():
+            stream = builder.materials.get(name)
+            if stream is None or name in configured:
+                continue
+            try:
+                set_stream_state(loader, stream, name, state)
+            except Exception as exc:
+                logger.debug(f"Continuation: could not seed '{name}': {exc}")
+                continue
+            seeded += 1
+        logger.debug(f"Continuation: seeded {seeded} streams from the previous point.")
+        return seeded > 0
+
+    def _record(
+        self, warm: bool, solve_s: float | None, reference_s: float | None = None
+    ) -> dict[str, Any]:
+        """
+        Book-keep one solve and return its continuation columns.
+
+        *reference_s* is the solve time of a cold solve of the same point;
+        ``time_saved_s`` stays None without it.
+        """
+        time_saved = None
+        if warm:
+            self.warm_solves += 1
+            cold_s = reference_s
+        else:
+            self.cold_solves += 1
+            cold_s = solve_s
+
+        if cold_s is not None:
+            self._cold_times.append(cold_s)
+        if warm and solve_s is not None and cold_s is not None:
+            time_saved = cold_s - solve_s
+            self._time_saved.append(time_saved)
+        return {
+            "warm_started": warm,
+            "solve_time_s": round(solve_s, 4) if solve_s is not None else None,
+            "time_saved_s": round(time_saved, 4) if time_saved is not None else None,
+        }
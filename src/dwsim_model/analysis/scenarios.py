@@ -0,0 +1,290 @@
+"""
+analysis/scenarios.py
+=====================
+Batch execution of named scenarios (``config/scenarios/*.yaml``).
+
+Why this exists
+---------------
+Comparing operating cases used to mean one ``dwsim_model run`` per
+scenario, each paying the DWSIM start-up and a full flowsheet build.
+:func:`run_scenarios` resolves every scenario's overrides through
+``ConfigLoader``, groups the scenarios by ``(reactor_mode, compound_set)``
+— the keys that decide what gets built — and solves each group with one
+``WarmModelRunner``, so scenarios after the first in a group only patch
+the streams their overrides change.  Groups (split further when there are
+more workers than groups) run concurrently on a process pool.
+
+Usage
+-----
+    from dwsim_model.analysis.scenarios import (
+        comparison_rows, discover_scenarios, run_scenarios,
+    )
+
+    names = discover_scenarios("config/master_config.yaml")
+    outcomes = run_scenarios("config/master_config.yaml", names, workers=4)
+    rows = comparison_rows(outcomes)
+
+Or from the CLI: ``python -m dwsim_model run --all-scenarios`` (or
+``--scenarios baseline,air_blown``), which also writes the per-scenario
+reports and ``scenario_comparison.csv``.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from dwsim_model.config_loader import ConfigLoader, _find_default_config
+
+logger = logging.getLogger(__name__)
+
+#: Resolved-config keys that decide the flowsheet topology of a scenario.
+GROUP_KEYS: tuple[str, ...] = ("reactor_mode", "compound_set")
+
+
+@dataclass
+class ScenarioOutcome:
+    """
+    Result of one scenario in a batch.
+
+    ``results`` and ``metrics`` are None when the scenario failed; the
+    exception text is in ``error``.  ``targets`` are the scenario's KPI
+    targets, for the report.
+    """
+
+    name: str
+    group: tuple
+    results: Any = None
+    metrics: Any = None
+    error: str | None = None
+    elapsed_s: float = 0.0
+    targets: dict[str, Any] = field(default_factory=dict)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Scenario resolution
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _master_path(config_path: str | Path | None) -> Path:
+    path = Path(config_path) if config_path else _find_default_config()
+    if path is None or not path.exists():
+        raise FileNotFoundError(f"Config file not found: {path}")
+    if path.suffix not in {".yaml", ".yml"}:
+        raise ValueError(
+            f"Scenario batches need a master YAML config, not {path.name}."
+        )
+    return path
+
+
+def scenario_dir(config_path: str | Path | None = None) -> Path:
+    """Directory holding the scenario files of *config_path*."""
+    return _master_path(config_path).parent / "scenarios"
+
+
+def discover_scenarios(config_path: str | Path | None = None) -> list[str]:
+    """Names (file stems) of every scenario next to *config_path*, sorted."""
+    directory = scenario_dir(config_path)
+    return sorted(p.stem for p in directory.glob("*.yaml"))
+
+
+def _scenario_file(config_path: Path, name: str) -> Path:
+    candidate = Path(name)
+    if candidate.suffix in {".yaml", ".yml"} and candidate.exists():
+        return candidate.resolve()
+    path = config_path.parent / "scenarios" / f"{name}.yaml"
+    if not path.exists():
+        raise FileNotFoundError(f"Scenario '{name}' not found: {path}")
+    return path.resolve()
+
+
+def resolve_scenario(config_path: str | Path | None, name: str) -> dict[str, Any]:
+    """
+    Resolve the master config with *name* as its active scenario.
+
+    *name* is a file stem under ``config/scenarios`` or a path to a
+    scenario YAML file.
+    """
+    import yaml
+
+    master = _master_path(config_path)
+    with master.open("r", encoding="utf-8") as fh:
+        raw = yaml.safe_load(fh) or {}
+    raw["scenario"] = str(_scenario_file(master, name))
+    return ConfigLoader(config_path=master, config_data=raw).load()
+
+
+def group_key(resolved: dict[str, Any]) -> tuple:
+    """``(reactor_mode, compound_set)`` of a resolved config."""
+    return tuple(resolved.get(key) for key in GROUP_KEYS)
+
+
+def partition(
+    items: Sequence[tuple[str, dict[str, Any]]], n_batches: int
+) -> list[list[tuple[str, dict[str, Any]]]]:
+    """
+    Split ``(name, resolved)`` pairs into batches of one topology each.
+
+    Scenarios are grouped by :func:`group_key`; while there are fewer
+    batches than *n_batches*, the largest batch is halved so every worker
+    has something to do.
+    """
+    groups: dict[tuple, list] = {}
+    for item in items:
+        groups.setdefault(group_key(item[1]), []).append(item)
+    batches = list(groups.values())
+    while len(batches) < n_batches:
+        largest = max(batches, key=len)
+        if len(largest) < 2:
+            break
+        batches.remove(largest)
+        half = (len(largest) + 1) // 2
+        batches += [largest[:half], largest[half:]]
+    return batches
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Execution
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _solve_batch(
+    config_path: Path,
+    batch: list[tuple[str, dict[str, Any]]],
+    cache=None,
+    snapshots=None,
+) -> list[ScenarioOutcome]:
+    """Solve one same-topology batch on a single warm flowsheet."""
+    from dwsim_model.analysis.warm import WarmModelRunner
+
+    runner = WarmModelRunner(config_path=config_path, cache=cache, snapshots=snapshots)
+    outcomes = []
+    for name, resolved in batch:
+        outcome = ScenarioOutcome(
+            name=name,
+            group=group_key(resolved),
+            targets=dict(resolved.get("targets") or {}),
+        )
+        started = time.perf_counter()
+        try:
+            outcome.results, outcome.metrics = runner.solve(resolved)
+        except Exception as exc:
+            logger.error(f"Scenario '{name}' failed: {exc}")
+            outcome.error = f"{type(exc).__name__}: {exc}"
+        outcome.elapsed_s = round(time.perf_counter() - started, 3)
+        outcomes.append(outcome)
+    logger.info(
+        f"Solved {len(batch)} scenario(s) with {runner.builds} build(s) "
+        f"and {runner.patched_runs} patched run(s)."
+    )
+    return outcomes
+
+
+def run_scenarios(
+    config_path: str | Path | None,
+    names: Sequence[str],
+    workers: int | None = None,
+    cache=None,
+    snapshots=None,
+) -> list[ScenarioOutcome]:
+    """
+    Resolve and solve every scenario in *names*.
+
+    Parameters
+    ----------
+    config_path:
+        Master config (the scenario line in it is replaced per scenario).
+    names:
+        Scenario file stems or paths.
+    workers:
+        Worker processes (default: one per batch, at most ``os.cpu_count()``).
+        ``1`` solves in this process.
+    cache, snapshots:
+        Optional ``ResultCache`` / ``SnapshotStore`` for the runners.
+
+    Returns
+    -------
+    One :class:`ScenarioOutcome` per name, in the order given.  A scenario
+    that fails to resolve or solve is reported in its outcome's ``error``.
+    """
+    master = _master_path(config_path)
+    outcomes: dict[str, ScenarioOutcome] = {}
+    items = []
+    for name in dict.fromkeys(names):
+        try:
+            items.append((name, resolve_scenario(master, name)))
+        except Exception as exc:
+            logger.error(f"Scenario '{name}' could not be resolved: {exc}")
+            outcomes[name] = ScenarioOutcome(
+                name=name, group=(), error=f"{type(exc).__name__}: {exc}"
+            )
+
+    n_workers = workers or min(len(items), os.cpu_count() or 1)
+    batches = partition(items, max(n_workers, 1)) if items else []
+    n_workers = min(n_workers, len(batches))
+    logger.info(
+        f"Running {len(items)} scenario(s) in {len(batches)} batch(es) "
+        f"on {max(n_workers, 1)} worker(s)."
+    )
+
+    if n_workers <= 1:
+        for batch in batches:
+            for outcome in _solve_batch(master, batch, cache, snapshots):
+                outcomes[outcome.name] = outcome
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                executor.submit(_solve_batch, master, batch, cache, snapshots)
+                for batch in batches
+            ]
+            for future, batch in zip(futures, batches, strict=True):
+                try:
+                    solved = future.result()
+                except Exception as exc:
+                    # A crashed worker takes its whole batch with it.
+                    error = f"{type(exc).__name__}: {exc}"
+                    solved = [
+                        ScenarioOutcome(name=n, group=group_key(r), error=error)
+                        for n, r in batch
+                    ]
+                for outcome in solved:
+                    outcomes[outcome.name] = outcome
+    return [outcomes[name] for name in dict.fromkeys(names)]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Comparison
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def comparison_rows(outcomes: Sequence[ScenarioOutcome]) -> list[dict[str, Any]]:
+    """
+    One row per scenario: its topology, KPIs, convergence and error.
+
+    Non-scalar KPI entries (the warnings list) are reduced to a count.
+    """
+    rows = []
+    for outcome in outcomes:
+        row: dict[str, Any] = {"scenario": outcome.name}
+        row.update(
+            zip(GROUP_KEYS, outcome.group or (None,) * len(GROUP_KEYS), strict=True)
+        )
+        if outcome.metrics is not None:
+            for key, value in outcome.metrics.to_dict().items():
+                if isinstance(value, (list, tuple)):
+                    row[f"n_{key}"] = len(value)
+                elif not isinstance(value, dict):
+                    row[key] = value
+        row["converged"] = (
+            outcome.results.converged if outcome.results is not None else False
+        )
+        row["elapsed_s"] = outcome.elapsed_s
+        row["error"] = outcome.error
+        rows.append(row)
+    return rows
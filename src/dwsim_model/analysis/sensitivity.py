@@ -0,0 +1,234 @@
+"""
+analysis/sensitivity.py
+=======================
+Space-filling designs and variance-based (Sobol) sensitivity indices.
+
+Why this exists
+---------------
+One-at-a-time sensitivity (``ParameterSweep.sensitivity_oat``) moves each
+parameter along a line through the base point.  It cannot see interactions
+(e.g. steam/oxygen ratio effects) and says nothing about how much of a
+KPI's variance each parameter is responsible for.
+
+This module provides the pieces for a global analysis:
+
+* ``sobol_sequence`` / ``latin_hypercube`` — space-filling samples of the
+  unit hypercube.
+* ``saltelli_design`` — the ``A``, ``B`` and ``AB_i`` matrices of the
+  Saltelli scheme (``N × (d + 2)`` model runs for ``d`` parameters).
+* ``sobol_indices`` — first-order (``S1``) and total (``ST``) indices from
+  the model outputs, using the Saltelli (2010) / Jansen estimators, with
+  bootstrap confidence intervals.
+
+``S1`` is the share of output variance explained by a parameter alone;
+``ST`` additionally includes all its interactions.  ``ST - S1`` is
+therefore a direct measure of interaction effects, which OAT cannot give.
+
+The runs themselves are executed by ``ParameterSweep.sensitivity_sobol``,
+which reuses the sweep engine (and its worker pool).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+# Joe & Kuo (2008) direction-number initialisation for dimensions 2..21:
+# (degree s, polynomial coefficients a, initial m_1..m_s).  Dimension 1 is
+# the van der Corput sequence.
+_SOBOL_DIRECTIONS: tuple[tuple[int, int, tuple[int, ...]], ...] = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+    (6, 19, (1, 1, 1, 15, 7, 5)),
+    (6, 22, (1, 3, 1, 15, 13, 25)),
+    (6, 25, (1, 1, 5, 5, 19, 61)),
+    (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+    (7, 4, (1, 3, 7, 13, 13, 15, 69)),
+)
+
+#: Highest dimension supported by ``sobol_sequence``.
+SOBOL_MAX_DIM = len(_SOBOL_DIRECTIONS) + 1
+
+_SOBOL_BITS = 32
+
+SAMPLERS = ("sobol", "lhs")
+
+
+def _require_numpy() -> None:
+    if not _HAS_NUMPY:
+        raise ImportError(
+            "numpy is required for global sensitivity analysis. "
+            "Install it with: pip install numpy"
+        )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Designs
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def sobol_sequence(n: int, dim: int, skip: int = 1) -> np.ndarray:
+    """
+    Return the first *n* points of the *dim*-dimensional Sobol sequence.
+
+    The all-zeros first point is skipped by default.  Gray-code ordering,
+    so any prefix of the sequence is itself well spread.
+    """
+    _require_numpy()
+    if not 1 <= dim <= SOBOL_MAX_DIM:
+        raise ValueError(
+            f"Sobol sequence supports 1..{SOBOL_MAX_DIM} dimensions, got {dim}; "
+            "use sampler='lhs' for more parameters."
+        )
+
+    bits = _SOBOL_BITS
+    v = np.zeros((dim, bits), dtype=np.uint64)
+    v[0] = [1 << (bits - 1 - i) for i in range(bits)]
+    for j, (s, a, m) in enumerate(_SOBOL_DIRECTIONS[: dim - 1], start=1):
+        for i in range(bits):
+            if i < s:
+                v[j, i] = m[i] << (bits - 1 - i)
+            else:
+                value = int(v[j, i - s]) ^ (int(v[j, i - s]) >> s)
+                for k in range(1, s):
+                    if (a >> (s - 1 - k)) & 1:
+                        value ^= int(v[j, i - k])
+                v[j, i] = value
+
+    total = n + skip
+    points = np.empty((total, dim))
+    x = np.zeros(dim, dtype=np.uint64)
+    for idx in range(total):
+        points[idx] = x / float(1 << bits)
+        # Flip the direction number of the lowest zero bit of idx.
+        c = (~idx & (idx + 1)).bit_length() - 1
+        x ^= v[:, c]
+    return points[skip:]
+
+
+def latin_hypercube(n: int, dim: int, seed: int | None = None) -> np.ndarray:
+    """Return an *n*-point Latin hypercube sample of the unit *dim*-cube."""
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    strata = np.column_stack([rng.permutation(n) for _ in range(dim)])
+    return (strata + rng.random((n, dim))) / n
+
+
+def saltelli_design(
+    n: int, dim: int, sampler: str = "sobol", seed: int | None = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build the Saltelli matrices on the unit cube.
+
+    Returns ``(A, B, AB)`` where ``A`` and ``B`` are ``n × dim`` and ``AB``
+    is ``dim × n × dim``: ``AB[i]`` is ``A`` with column *i* taken from
+    ``B``.  Total model runs: ``n × (dim + 2)``.
+    """
+    if sampler == "sobol":
+        base = sobol_sequence(n, 2 * dim)
+    elif sampler == "lhs":
+        base = latin_hypercube(n, 2 * dim, seed=seed)
+    else:
+        raise ValueError(f"sampler must be one of {SAMPLERS}, got '{sampler}'")
+
+    A, B = base[:, :dim], base[:, dim:]
+    AB = np.repeat(A[None, :, :], dim, axis=0)
+    for i in range(dim):
+        AB[i, :, i] = B[:, i]
+    return A, B, AB
+
+
+def scale_to_bounds(unit: np.ndarray, bounds: list[tuple[float, float]]) -> np.ndarray:
+    """Map unit-cube samples onto per-column ``(low, high)`` bounds."""
+    low = np.array([b[0] for b in bounds], dtype=float)
+    high = np.array([b[1] for b in bounds], dtype=float)
+    return low + unit * (high - low)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Indices
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def sobol_indices(
+    f_A: np.ndarray,
+    f_B: np.ndarray,
+    f_AB: np.ndarray,
+    n_bootstrap: int = 200,
+    seed: int | None = 0,
+) -> dict[str, Any]:
+    """
+    First-order and total Sobol indices from Saltelli-design outputs.
+
+    Parameters
+    ----------
+    f_A, f_B:
+        Model outputs for the ``A`` and ``B`` matrices, shape ``(n,)``.
+    f_AB:
+        Outputs for the ``AB_i`` matrices, shape ``(dim, n)``.
+        Samples with a NaN anywhere in their block (failed runs) are
+        dropped before estimating.
+    n_bootstrap:
+        Bootstrap resamples for the 95 % confidence half-widths
+        (0 disables them).
+
+    Returns
+    -------
+    dict with arrays ``S1``, ``ST``, ``S1_conf``, ``ST_conf`` (length
+    ``dim``) and the number of samples ``n`` actually used.
+    """
+    _require_numpy()
+    f_A = np.asarray(f_A, dtype=float)
+    f_B = np.asarray(f_B, dtype=float)
+    f_AB = np.asarray(f_AB, dtype=float)
+    dim = f_AB.shape[0]
+
+    ok = np.isfinite(f_A) & np.isfinite(f_B) & np.all(np.isfinite(f_AB), axis=0)
+    f_A, f_B, f_AB = f_A[ok], f_B[ok], f_AB[:, ok]
+    n = int(ok.sum())
+
+    nan = np.full(dim, np.nan)
+    if n < 2:
+        return {"S1": nan, "ST": nan, "S1_conf": nan, "ST_conf": nan, "n": n}
+
+    def estimate(idx):
+        a, b, ab = f_A[idx], f_B[idx], f_AB[:, idx]
+        var = np.var(np.concatenate([a, b]))
+        if var <= 0:
+            return np.zeros(dim), np.zeros(dim)
+        s1 = np.mean(b * (ab - a), axis=1) / var  # Saltelli (2010)
+        st = 0.5 * np.mean((a - ab) ** 2, axis=1) / var  # Jansen (1999)
+        return s1, st
+
+    s1, st = estimate(np.arange(n))
+
+    s1_conf = st_conf = nan
+    if n_bootstrap > 0:
+        rng = np.random.default_rng(seed)
+        draws = [estimate(rng.integers(0, n, n)) for _ in range(n_bootstrap)]
+        s1_conf = 1.96 * np.std([d[0] for d in draws], axis=0)
+        st_conf = 1.96 * np.std([d[1] for d in draws], axis=0)
+
+    return {"S1": s1, "ST": st, "S1_conf": s1_conf, "ST_conf": st_conf, "n": n}
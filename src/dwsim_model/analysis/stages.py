@@ -0,0 +1,437 @@
+"""
+analysis/stages.py
+==================
+Stage-level memoization of reactor outlets for downstream sweeps.
+
+Why this exists
+---------------
+A sweep over a PEM or TRC parameter solves the gasifier again at every
+point, even though ``Syngas_Pre_PEM`` depends only on the gasifier feeds,
+its energy streams and its reactor contract — none of which the sweep
+touches.  The same holds for the PEM when only TRC or quench values move.
+
+``StagedModelRunner`` keys every reactor stage on its own inputs and
+solves only the stages whose inputs changed.  Stages that were solved
+before are taken from a ``StageCache``; the first stage that misses is
+built as a stage-only flowsheet (``GasificationFlowsheet(start_stage=...)``)
+whose free-standing inlet is set to the cached outlet of the stage before
+it.  The cleanup train (quench → blower) has no reactor and is always
+solved.
+
+The stage key
+-------------
+SHA-256 over the stage's reactor type, the resolved config of the streams
+it owns (feeds and energy streams, see :func:`stage_streams`), its
+``reactors`` config block, the contents of its reactor contract YAML, the
+compound set, the package version and the state (T, P, mass flow, mole
+fractions) of its syngas inlet.  Because the inlet state is part of the
+key, a change upstream invalidates every stage below it.
+
+Usage
+-----
+    from dwsim_model.analysis.stages import StageCache, StagedModelRunner
+    from dwsim_model.analysis.sweep import ParameterSweep
+
+    ps = ParameterSweep(
+        base_config_path="config/master_config.yaml",
+        model_runner=StagedModelRunner(
+            config_path="config/master_config.yaml", stage_cache=StageCache()
+        ),
+    )
+    df = ps.sweep_1d("feeds.PEM_Oxygen_Feed.mass_flow_kg_s", [0.3, 0.5, 0.7])
+    # first point: full solve; later points: PEM → cleanup only
+
+Or from the CLI: ``python -m dwsim_model sweep ... --stage-cache``.
+
+The boundary stream is re-created from extracted values, so a stage-only
+solve sees the upstream outlet at the extractor's precision; enthalpy is
+recomputed by DWSIM from T, P and composition.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from dwsim_model import __version__
+from dwsim_model.config_loader import ConfigLoader
+from dwsim_model.results.extractor import FlowsheetResults, StreamResult
+from dwsim_model.topology import (
+    STAGE_OUTLETS,
+    STAGES,
+    build_gasifier_stage,
+    build_pem_stage,
+    build_trc_stage,
+)
+
+logger = logging.getLogger(__name__)
+
+#: Default stage-cache location, next to the result cache.
+DEFAULT_STAGE_CACHE_DIR = Path("results") / ".stages"
+
+#: Stages whose outlets are memoized, in flow order.
+MEMO_STAGES: tuple[str, ...] = tuple(STAGE_OUTLETS)
+
+#: Bump when the key payload or the entry layout changes.
+_ENTRY_FORMAT = 1
+
+_STAGE_BUILDERS = {
+    "gasifier": build_gasifier_stage,
+    "pem": build_pem_stage,
+    "trc": build_trc_stage,
+}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Stage inputs and keys
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class _StreamRecorder:
+    """Stand-in builder that records the stream names a stage creates."""
+
+    def __init__(self):
+        self.materials: list[str] = []
+        self.energy_streams: list[str] = []
+
+    def add_object(self, obj_type_name: str, name: str, _x: int = 0, _y: int = 0):
+        if obj_type_name == "MaterialStream":
+            self.materials.append(name)
+        elif obj_type_name == "EnergyStream":
+            self.energy_streams.append(name)
+        return name
+
+
+@functools.cache
+def stage_streams(stage: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Return ``(material_streams, energy_streams)`` owned by *stage*.
+
+    Read from the topology builders themselves, so the list cannot drift
+    from what the flowsheet contains.  The syngas inlet belongs to the
+    stage upstream and is not included.
+    """
+    recorder = _StreamRecorder()
+    kwargs = {} if stage == "gasifier" else {"syngas_inlet": "upstream"}
+    _STAGE_BUILDERS[stage](recorder, "reactor", lambda *_: None, **kwargs)
+    return tuple(recorder.materials), tuple(recorder.energy_streams)
+
+
+def stream_state(result: StreamResult) -> dict[str, Any]:
+    """The part of a stream result that defines it as a boundary condition."""
+    return {
+        "temperature_C": result.temperature_C,
+        "pressure_kPa": result.pressure_kPa,
+        "mass_flow_kg_s": result.mass_flow_kg_s,
+        "mole_fractions": dict(result.mole_fractions),
+    }
+
+
+def set_stream_state(
+    loader: ConfigLoader, stream, name: str, state: dict[str, Any]
+) -> None:
+    """Write a :func:`stream_state` dict back onto a DWSIM material stream."""
+    props = {
+        "temperature_C": state["temperature_C"],
+        "pressure_Pa": state["pressure_kPa"] * 1000.0,
+        "mass_flow_kg_s": state["mass_flow_kg_s"],
+        "components": state["mole_fractions"],
+    }
+    loader._set_stream_conditions(stream, name, props)
+    loader._set_stream_composition(stream, name, props)
+
+
+def stage_key(
+    stage: str,
+    resolved_config: dict[str, Any],
+    reactor_type: str,
+    compound_set: Sequence[str],
+    inlet: dict[str, Any] | None = None,
+) -> str:
+    """
+    Return the content hash of one stage's inputs.
+
+    Parameters
+    ----------
+    stage:
+        One of ``MEMO_STAGES``.
+    resolved_config:
+        Fully resolved config from ``ConfigLoader.load()``.
+    reactor_type:
+        DWSIM object type of the stage's reactor.
+    compound_set:
+        Compound list of the flowsheet.
+    inlet:
+        :func:`stream_state` of the syngas entering the stage (None for
+        the gasifier).
+    """
+    from dwsim_model.chemistry.reactions import (
+        REACTOR_CONTRACT_CACHE,
+        REACTOR_CONTRACTS,
+        reactor_contract_path,
+    )
+    from dwsim_model.results.cache import _json_default
+
+    materials, energy = stage_streams(stage)
+    feeds = resolved_config.get("feeds") or {}
+    energy_cfg = resolved_config.get("energy_streams") or {}
+    payload = {
+        "stage": stage,
+        "reactor_type": reactor_type,
+        "feeds": {name: feeds[name] for name in materials if name in feeds},
+        "energy_streams": {
+            name: energy_cfg[name] for name in energy if name in energy_cfg
+        },
+        "reactor": (resolved_config.get("reactors") or {}).get(stage),
+        "contract": REACTOR_CONTRACT_CACHE.digest(
+            reactor_contract_path(REACTOR_CONTRACTS[stage])
+        ),
+        "compound_set": list(compound_set),
+        "inlet": inlet,
+        "package_version": __version__,
+        "format": _ENTRY_FORMAT,
+    }
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=_json_default
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class StageCache:
+    """
+    On-disk store of solved stages: the stream results each stage owns.
+
+    Entries are JSON files named by stage key and written atomically, so
+    sweep workers can share one directory.
+
+    Parameters
+    ----------
+    directory:
+        Where entries are stored.  Created on first write.
+    """
+
+    def __init__(self, directory: str | Path = DEFAULT_STAGE_CACHE_DIR):
+        self.directory = Path(directory)
+
+    def get(self, key: str) -> FlowsheetResults | None:
+        """Return the stored stage results for *key*, or None on a miss."""
+        path = self._entry_path(key)
+        if not path.exists():
+            return None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            return FlowsheetResults.from_dict(entry["results"])
+        except Exception as exc:
+            logger.warning(f"Discarding unreadable stage entry {path.name}: {exc}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, key: str, stage: str, results: FlowsheetResults) -> Path:
+        """Store the stream results of *stage* under *key*."""
+        path = self._entry_path(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "format": _ENTRY_FORMAT,
+            "stage": stage,
+            "results": results.to_dict(),
+        }
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(entry, fh, default=str)
+            os.replace(tmp_name, path)
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        logger.debug(f"Stage cache stored {stage}: {key[:12]}")
+        return path
+
+    def clear(self) -> None:
+        """Remove every stage entry."""
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Runner
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class StagedModelRunner:
+    """
+    Model runner that re-solves only the stages whose inputs changed.
+
+    Parameters
+    ----------
+    config_path:
+        Master config path used to resolve relative sub-file references in
+        the configs passed to the runner.
+    stage_cache:
+        ``StageCache`` holding solved stages.  Defaults to one under
+        ``results/.stages``.
+    snapshots:
+        Optional ``SnapshotStore`` for the (full or stage-only) builds.
+
+    Attributes
+    ----------
+    stage_hits:
+        Number of reactor stages taken from the cache so far.
+    stage_solves:
+        Number of reactor stages solved so far.
+    """
+
+    def __init__(
+        self,
+        config_path: str | Path | None = None,
+        stage_cache: StageCache | None = None,
+        snapshots=None,
+    ):
+        self.config_path = Path(config_path) if config_path else None
+        self.stage_cache = stage_cache if stage_cache is not None else StageCache()
+        self.snapshots = snapshots
+        self.stage_hits = 0
+        self.stage_solves = 0
+
+    def __call__(self, config: dict) -> dict:
+        """Run *config* and return the KPI dict (``ParameterSweep`` runner API)."""
+        _results, metrics = self.solve(config)
+        return metrics.to_dict()
+
+    def solve(self, config: dict):
+        """
+        Solve *config*, reusing cached upstream stages.
+
+        Returns
+        -------
+        (FlowsheetResults, GasificationMetrics)
+        """
+        from dwsim_model.gasification import GasificationFlowsheet
+        from dwsim_model.results.extractor import ResultsExtractor
+        from dwsim_model.results.metrics import MetricsCalculator
+
+        loader = ConfigLoader(config_path=self.config_path, config_data=config)
+        resolved = loader.load()
+
+        flowsheet = GasificationFlowsheet(
+            config_path=str(self.config_path) if self.config_path else None,
+            runtime_config=config,
+            snapshots=self.snapshots,
+        )
+        reactor_types = flowsheet._get_reactor_types()
+        compounds = list(flowsheet.compound_set)
+
+        # Walk the train while stages hit; stop at the first miss.
+        cached: list[FlowsheetResults] = []
+        inlet: dict[str, Any] | None = None
+        start = STAGES[-1]
+        for stage in MEMO_STAGES:
+            key = stage_key(stage, resolved, reactor_types[stage], compounds, inlet)
+            hit = self.stage_cache.get(key)
+            outlet = hit.streams.get(STAGE_OUTLETS[stage]) if hit else None
+            if outlet is None:
+                start = stage
+                break
+            cached.append(hit)
+            inlet = stream_state(outlet)
+        self.stage_hits += len(cached)
+        logger.info(
+            f"Stage cache: reusing {len(cached)} stage(s), solving from '{start}'."
+        )
+
+        flowsheet.start_stage = start
+        flowsheet.build_flowsheet()
+        if inlet is not None:
+            boundary = STAGE_OUTLETS[MEMO_STAGES[len(cached) - 1]]
+            self._set_boundary(loader, flowsheet.builder, boundary, inlet)
+        flowsheet.run()
+
+        extractor = ResultsExtractor(compound_names=compounds)
+        solved = extractor.extract(flowsheet.builder)
+        results = _merge(cached, solved)
+
+        solved_stages = MEMO_STAGES[len(cached) :]
+        self.stage_solves += len(solved_stages)
+        if results.converged:
+            self._store(solved_stages, results, resolved, reactor_types, compounds)
+
+        metrics = MetricsCalculator().calculate(results)
+        return results, metrics
+
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _set_boundary(
+        loader: ConfigLoader, builder, name: str, state: dict[str, Any]
+    ) -> None:
+        """Set the stage-only flowsheet's inlet to a cached outlet state."""
+        set_stream_state(loader, builder.materials[name], name, state)
+        logger.debug(f"Stage cache: set boundary stream '{name}' from cache.")
+
+    def _store(
+        self,
+        stages: Sequence[str],
+        results: FlowsheetResults,
+        resolved: dict[str, Any],
+        reactor_types: dict[str, str],
+        compounds: list[str],
+    ) -> None:
+        """Store each freshly solved stage, keyed on its actual inlet state."""
+        for stage in stages:
+            index = MEMO_STAGES.index(stage)
+            inlet = None
+            if index > 0:
+                upstream = results.streams.get(STAGE_OUTLETS[MEMO_STAGES[index - 1]])
+                if upstream is None:
+                    return
+                inlet = stream_state(upstream)
+            materials, energy = stage_streams(stage)
+            if STAGE_OUTLETS[stage] not in results.streams:
+                return
+            part = FlowsheetResults(
+                streams={
+                    n: results.streams[n] for n in materials if n in results.streams
+                },
+                energy_streams={
+                    n: results.energy_streams[n]
+                    for n in energy
+                    if n in results.energy_streams
+                },
+                converged=True,
+            )
+            key = stage_key(stage, resolved, reactor_types[stage], compounds, inlet)
+            self.stage_cache.put(key, stage, part)
+
+
+def _merge(
+    cached: list[FlowsheetResults], solved: FlowsheetResults
+) -> FlowsheetResults:
+    """Combine cached stage results with the stage-only solve."""
+    results = FlowsheetResults(
+        converged=solved.converged,
+        errors=list(solved.errors),
+        metrics=dict(solved.metrics),
+    )
+    results.streams.update(solved.streams)
+    results.energy_streams.update(solved.energy_streams)
+    # The boundary stream appears in both.  The cached copy wins: it is the
+    # upstream stage's outlet, and the inlet state that downstream stage
+    # keys are computed from.
+    for part in cached:
+        results.streams.update(part.streams)
+        results.energy_streams.update(part.energy_streams)
+    return results
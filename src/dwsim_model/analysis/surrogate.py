@@ -0,0 +1,503 @@
+"""
+analysis/surrogate.py
+=====================
+Fast response-surface models fitted to accumulated sweep results.
+
+Why this exists
+---------------
+Every "what-if" question answered by DWSIM costs a full solve (tens of
+seconds).  Over time we accumulate hundreds of solved points in
+``sweep_1d`` / ``sweep_2d`` DataFrames; a surrogate fitted to those points
+answers the same questions in microseconds, with an uncertainty estimate
+and a flag telling you when you are asking about a region it never saw.
+
+Two model kinds are available (NumPy only, no SciPy / scikit-learn):
+
+``"gp"`` (default)
+    Gaussian-process regression with a squared-exponential kernel.  The
+    length scale is picked per KPI by maximising the log marginal
+    likelihood over a small grid.  Uncertainty is the posterior standard
+    deviation — it grows away from the training points.
+``"poly"``
+    Least-squares polynomial of the given degree.  Uncertainty is the
+    usual prediction standard error from the residual variance.
+
+Usage
+-----
+    from dwsim_model.analysis.sweep import ParameterSweep
+    from dwsim_model.analysis.surrogate import SurrogateModel
+
+    model = SurrogateModel.fit(
+        [df_flow, df_flow_vs_steam],
+        params={
+            "mass_flow_kg_s": "feeds.Gasifier_Biomass_Feed.mass_flow_kg_s",
+            "steam_flow": "feeds.Gasifier_Steam_Feed.mass_flow_kg_s",
+        },
+        kpis=["cold_gas_efficiency", "h2_co_ratio"],
+    )
+    model.save("results/surrogate_cge.json")
+
+    pred = model.predict({"mass_flow_kg_s": 9.5, "steam_flow": 1.2})
+    pred.mean["cold_gas_efficiency"], pred.std["cold_gas_efficiency"]
+    pred.in_domain          # False → extrapolating, do not trust blindly
+
+    # Drop-in replacement for the DWSIM runner:
+    ps = ParameterSweep(base_config_path=..., model_runner=model)
+
+*params* maps DataFrame column names (the sweep labels) to config
+dot-paths; the paths are what the surrogate reads when it is used as a
+``model_runner``.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+#: Candidate GP length scales, in units of the normalised [0, 1] input box.
+_GP_LENGTH_SCALES = (0.05, 0.1, 0.2, 0.35, 0.5, 0.75, 1.0, 1.5, 2.5)
+
+#: Relative slack on the training bounding box before flagging extrapolation.
+_DOMAIN_TOLERANCE = 1e-9
+
+_FORMAT_VERSION = 1
+
+
+@dataclass
+class SurrogatePrediction:
+    """One surrogate prediction."""
+
+    mean: dict[str, float] = field(default_factory=dict)
+    std: dict[str, float] = field(default_factory=dict)
+    in_domain: bool = True
+
+    def to_dict(self) -> dict[str, Any]:
+        """Flatten to the KPI-dict shape returned by model runners."""
+        out: dict[str, Any] = dict(self.mean)
+        out.update({f"{k}_std": v for k, v in self.std.items()})
+        out["out_of_domain"] = not self.in_domain
+        return out
+
+
+class SurrogateModel:
+    """
+    Response-surface model predicting KPIs from swept parameters.
+
+    Build one with :meth:`fit`; use :meth:`predict` for single points or
+    call the instance with a config dict as a ``ParameterSweep`` runner.
+
+    Parameters
+    ----------
+    params:
+        ``{column_name: config_dot_path}`` for each input parameter.
+    kind:
+        ``"gp"`` or ``"poly"``.
+    degree:
+        Polynomial degree (``kind="poly"`` only).
+    noise:
+        Observation noise variance relative to the standardised KPI
+        (``kind="gp"`` only).  DWSIM is deterministic, so the default is a
+        small nugget for numerical stability.
+    """
+
+    KINDS = ("gp", "poly")
+
+    def __init__(
+        self,
+        params: Mapping[str, str],
+        kind: str = "gp",
+        degree: int = 2,
+        noise: float = 1e-6,
+    ):
+        if not _HAS_NUMPY:
+            raise ImportError(
+                "numpy is required for surrogate models. "
+                "Install it with: pip install numpy"
+            )
+        if kind not in self.KINDS:
+            raise ValueError(f"kind must be one of {self.KINDS}, got '{kind}'")
+        if not params:
+            raise ValueError("At least one input parameter is required.")
+
+        self.params = dict(params)
+        self.kind = kind
+        self.degree = int(degree)
+        self.noise = float(noise)
+
+        self.lower: np.ndarray | None = None
+        self.upper: np.ndarray | None = None
+        self._data: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+        self._fits: dict[str, _KpiFit] = {}
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Fitting
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def fit(
+        cls,
+        frames,
+        params: Mapping[str, str],
+        kpis: list[str] | None = None,
+        kind: str = "gp",
+        defaults: Mapping[str, float] | None = None,
+        **kwargs,
+    ) -> SurrogateModel:
+        """
+        Fit a surrogate to one or more sweep results.
+
+        Parameters
+        ----------
+        frames:
+            A sweep DataFrame / list of row dicts, or an iterable of them.
+        params:
+            ``{column_name: config_dot_path}`` for each input parameter.
+        kpis:
+            KPI columns to model.  None = every numeric non-parameter
+            column.
+        kind:
+            ``"gp"`` or ``"poly"``.
+        defaults:
+            Values for parameters a frame did not sweep (typically the
+            base-config values).  Rows missing a parameter without a
+            default are dropped.
+        **kwargs:
+            Passed to the constructor (``degree``, ``noise``).
+        """
+        model = cls(params, kind=kind, **kwargs)
+        rows = _collect_rows(frames)
+        model._fit_rows(rows, kpis, defaults or {})
+        return model
+
+    def _fit_rows(
+        self,
+        rows: list[dict[str, Any]],
+        kpis: list[str] | None,
+        defaults: Mapping[str, float],
+    ) -> None:
+        columns = list(self.params)
+        usable = []
+        for row in rows:
+            if row.get("error") not in (None, "") and not _is_nan(row.get("error")):
+                continue
+            x = []
+            for col in columns:
+                value = row.get(col, defaults.get(col))
+                if not _is_number(value):
+                    break
+                x.append(float(value))
+            else:
+                usable.append((x, row))
+
+        if not usable:
+            raise ValueError(
+                f"No usable training rows: every row failed or lacks one of {columns}."
+            )
+
+        if kpis is None:
+            from dwsim_model.analysis.sweep import is_kpi_column
+
+            kpis = sorted(
+                {
+                    k
+                    for _, row in usable
+                    for k, v in row.items()
+                    if k not in self.params and is_kpi_column(k) and _is_number(v)
+                }
+            )
+
+        X_all = np.array([x for x, _ in usable], dtype=float)
+        self.lower = X_all.min(axis=0)
+        self.upper = X_all.max(axis=0)
+
+        for kpi in kpis:
+            pairs = [(x, row.get(kpi)) for x, row in usable if _is_number(row.get(kpi))]
+            if len(pairs) < 2:
+                logger.warning(f"Surrogate: not enough data for '{kpi}' — skipped.")
+                continue
+            X = np.array([x for x, _ in pairs], dtype=float)
+            y = np.array([float(v) for _, v in pairs], dtype=float)
+            self._data[kpi] = (X, y)
+            self._fits[kpi] = self._fit_kpi(X, y)
+
+        logger.info(
+            f"Surrogate ({self.kind}) fitted on {len(usable)} points: "
+            f"{len(self._fits)} KPIs over {columns}"
+        )
+
+    def _fit_kpi(self, X: np.ndarray, y: np.ndarray) -> _KpiFit:
+        Z = self._normalise(X)
+        y_mean = float(y.mean())
+        y_scale = float(y.std()) or 1.0
+        t = (y - y_mean) / y_scale
+        if self.kind == "gp":
+            return _fit_gp(Z, t, y_mean, y_scale, self.noise)
+        return _fit_poly(Z, t, y_mean, y_scale, self.degree)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Prediction
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @property
+    def kpis(self) -> list[str]:
+        return list(self._fits)
+
+    def in_domain(self, x: Mapping[str, float]) -> bool:
+        """True when *x* lies inside the training data's bounding box."""
+        v = self._vector(x)
+        slack = _DOMAIN_TOLERANCE * np.maximum(self.upper - self.lower, 1.0)
+        return bool(np.all(v >= self.lower - slack) and np.all(v <= self.upper + slack))
+
+    def predict(self, x: Mapping[str, float]) -> SurrogatePrediction:
+        """Predict every KPI at one point given as ``{column_name: value}``."""
+        self._check_fitted()
+        v = self._vector(x)
+        z = self._normalise(v[None, :])
+        pred = SurrogatePrediction(in_domain=self.in_domain(x))
+        for kpi, fit in self._fits.items():
+            mean, std = fit.predict(z)
+            pred.mean[kpi] = float(mean[0])
+            pred.std[kpi] = float(std[0])
+        return pred
+
+    def predict_many(
+        self, points: Iterable[Mapping[str, float]]
+    ) -> list[SurrogatePrediction]:
+        """Predict a batch of points."""
+        return [self.predict(p) for p in points]
+
+    def __call__(self, config: dict) -> dict:
+        """``ParameterSweep`` runner API: read the inputs from *config*."""
+        from dwsim_model.analysis.sweep import _get_nested
+
+        x = {}
+        for column, path in self.params.items():
+            value = _get_nested(config, path)
+            if not _is_number(value):
+                raise KeyError(f"Surrogate input '{path}' not found in config")
+            x[column] = float(value)
+        pred = self.predict(x)
+        if not pred.in_domain:
+            logger.warning(f"Surrogate: {x} is outside the trained domain.")
+        return pred.to_dict()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Persistence
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def save(self, path: str | Path) -> Path:
+        """
+        Write the surrogate to a JSON file.
+
+        The training data is stored rather than the fitted matrices; the
+        fit is repeated on load, which is cheap and keeps the file format
+        independent of the solver internals.
+        """
+        self._check_fitted()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "format": _FORMAT_VERSION,
+            "kind": self.kind,
+            "params": self.params,
+            "degree": self.degree,
+            "noise": self.noise,
+            "lower": self.lower.tolist(),
+            "upper": self.upper.tolist(),
+            "data": {
+                kpi: {"X": X.tolist(), "y": y.tolist()}
+                for kpi, (X, y) in self._data.items()
+            },
+        }
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        logger.info(f"Surrogate saved to {path}")
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> SurrogateModel:
+        """Load a surrogate written by :meth:`save`."""
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+        if payload.get("format") != _FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported surrogate file format: {payload.get('format')!r}"
+            )
+        model = cls(
+            payload["params"],
+            kind=payload["kind"],
+            degree=payload["degree"],
+            noise=payload["noise"],
+        )
+        model.lower = np.array(payload["lower"], dtype=float)
+        model.upper = np.array(payload["upper"], dtype=float)
+        for kpi, d in payload["data"].items():
+            X = np.array(d["X"], dtype=float)
+            y = np.array(d["y"], dtype=float)
+            model._data[kpi] = (X, y)
+            model._fits[kpi] = model._fit_kpi(X, y)
+        return model
+
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _check_fitted(self) -> None:
+        if not self._fits:
+            raise RuntimeError("Surrogate has not been fitted.")
+
+    def _vector(self, x: Mapping[str, float]) -> np.ndarray:
+        missing = [c for c in self.params if c not in x]
+        if missing:
+            raise KeyError(f"Missing surrogate inputs: {missing}")
+        return np.array([float(x[c]) for c in self.params], dtype=float)
+
+    def _normalise(self, X: np.ndarray) -> np.ndarray:
+        span = self.upper - self.lower
+        span = np.where(span > 0, span, 1.0)
+        return (X - self.lower) / span
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Per-KPI fits
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass
+class _KpiFit:
+    """Fitted state for one KPI; inputs are normalised, outputs standardised."""
+
+    kind: str
+    y_mean: float
+    y_scale: float
+    Z: Any = None  # GP: training inputs
+    alpha: Any = None  # GP: K⁻¹ t ; poly: coefficients
+    chol: Any = None  # GP: Cholesky factor of K ; poly: (ΦᵀΦ)⁺
+    length_scale: float = 0.0
+    degree: int = 0
+    sigma2: float = 0.0  # poly: residual variance
+
+    def predict(self, Z: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if self.kind == "gp":
+            k = _rbf_kernel(Z, self.Z, self.length_scale)
+            mean = k @ self.alpha
+            v = np.linalg.solve(self.chol, k.T)
+            var = np.clip(1.0 - np.sum(v * v, axis=0), 0.0, None)
+        else:
+            phi = _poly_features(Z, self.degree)
+            mean = phi @ self.alpha
+            var = self.sigma2 * (1.0 + np.sum((phi @ self.chol) * phi, axis=1))
+        return (
+            self.y_mean + self.y_scale * mean,
+            self.y_scale * np.sqrt(var),
+        )
+
+
+def _rbf_kernel(A: np.ndarray, B: np.ndarray, length_scale: float) -> np.ndarray:
+    d2 = np.sum((A[:, None, :] - B[None, :, :]) ** 2, axis=-1)
+    return np.exp(-0.5 * d2 / length_scale**2)
+
+
+def _fit_gp(
+    Z: np.ndarray, t: np.ndarray, y_mean: float, y_scale: float, noise: float
+) -> _KpiFit:
+    """Pick the length scale with the best log marginal likelihood."""
+    n = len(t)
+    best = None
+    for ell in _GP_LENGTH_SCALES:
+        K = _rbf_kernel(Z, Z, ell) + (noise + 1e-10) * np.eye(n)
+        try:
+            L = np.linalg.cholesky(K)
+        except np.linalg.LinAlgError:
+            continue
+        alpha = np.linalg.solve(L.T, np.linalg.solve(L, t))
+        lml = -0.5 * t @ alpha - np.sum(np.log(np.diag(L)))
+        if best is None or lml > best[0]:
+            best = (lml, ell, L, alpha)
+
+    if best is None:
+        raise ValueError(
+            "Gaussian process fit failed: kernel matrix not positive definite."
+        )
+
+    _, ell, L, alpha = best
+    return _KpiFit(
+        kind="gp",
+        y_mean=y_mean,
+        y_scale=y_scale,
+        Z=Z,
+        alpha=alpha,
+        chol=L,
+        length_scale=ell,
+    )
+
+
+def _poly_features(Z: np.ndarray, degree: int) -> np.ndarray:
+    n, d = Z.shape
+    cols = [np.ones(n)]
+    for deg in range(1, degree + 1):
+        for combo in itertools.combinations_with_replacement(range(d), deg):
+            cols.append(np.prod(Z[:, combo], axis=1))
+    return np.column_stack(cols)
+
+
+def _fit_poly(
+    Z: np.ndarray, t: np.ndarray, y_mean: float, y_scale: float, degree: int
+) -> _KpiFit:
+    phi = _poly_features(Z, degree)
+    coef, *_ = np.linalg.lstsq(phi, t, rcond=None)
+    resid = t - phi @ coef
+    dof = len(t) - phi.shape[1]
+    sigma2 = float(resid @ resid / dof) if dof > 0 else 0.0
+    return _KpiFit(
+        kind="poly",
+        y_mean=y_mean,
+        y_scale=y_scale,
+        alpha=coef,
+        chol=np.linalg.pinv(phi.T @ phi),
+        degree=degree,
+        sigma2=sigma2,
+    )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _collect_rows(frames) -> list[dict[str, Any]]:
+    """Flatten DataFrames / row lists (or an iterable of them) into row dicts."""
+    if hasattr(frames, "to_dict") or (
+        isinstance(frames, list) and (not frames or isinstance(frames[0], dict))
+    ):
+        frames = [frames]
+    rows: list[dict[str, Any]] = []
+    for frame in frames:
+        if hasattr(frame, "to_dict"):
+            rows.extend(frame.to_dict("records"))
+        else:
+            rows.extend(dict(r) for r in frame)
+    return rows
+
+
+def _is_nan(value: Any) -> bool:
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _is_number(value: Any) -> bool:
+    return (
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and not _is_nan(value)
+    ) or (_HAS_NUMPY and isinstance(value, np.number) and not np.isnan(value))
@@ -16,8 +16,10 @@ optimiser.
 
 The sweep engine works by:
 1. Loading the base configuration from YAML files.
-2. Deep-copying that config and patching a single key at a specific
-   nested path (e.g. feeds → Gasifier_Biomass_Feed → mass_flow_kg_s).
+2. Wrapping that config in a copy-on-write ``ConfigOverlay`` and patching
+   a single key at a specific nested path (e.g. feeds →
+   Gasifier_Biomass_Feed → mass_flow_kg_s).  The base is shared, never
+   copied, so a point costs only its patches.
 3. Running the simulation for each patched config.
 4. Collecting all results into a pandas DataFrame for easy analysis.
 
@@ -46,17 +48,77 @@ Usage (2-D sweep)
         values_b=[2.0, 3.0, 4.0],
         kpis=["cold_gas_efficiency", "h2_co_ratio", "tar_loading_mg_Nm3"],
     )
+
+Parallel execution
+------------------
+Every grid point is an independent build → solve → extract, so points can
+run in separate processes.  Pass ``workers=N`` to spread them over a
+process pool; rows still come back in grid order and failed points still
+carry an ``error`` column:
+
+    ps = ParameterSweep(base_config_path="config/master_config.yaml", workers=8)
+    df2d = ps.sweep_2d(...)
+
+Adaptive refinement
+-------------------
+``sweep_adaptive`` replaces a fixed ``values`` list with a run budget: it
+starts from a coarse grid and keeps bisecting the intervals where the KPIs
+jump or bend the most, so cliffs get resolved without wasting runs on flat
+regions:
+
+    df = ps.sweep_adaptive(
+        "feeds.Gasifier_Oxygen_Feed.mass_flow_kg_s",
+        bounds=(1.0, 5.0),
+        kpis=["cold_gas_efficiency", "tar_loading_mg_Nm3"],
+        budget=25,
+        tol=0.02,
+    )
+
+Checkpoint / resume
+-------------------
+Pass ``checkpoint="results/sweep.jsonl"`` to stream every finished row to
+an append-only JSONL file as it completes (rows are then not accumulated
+in memory).  After a crash or a killed job, call the same sweep again with
+``resume=True``: points already recorded are skipped, matched by a hash of
+their config patch on top of the base config.
+
+Global sensitivity
+------------------
+``sensitivity_sobol`` varies all parameters together over a Sobol / LHS
+design and returns first-order and total Sobol indices per KPI, so
+interaction effects show up as ``ST - S1`` (see ``analysis/sensitivity.py``):
+
+    indices, runs = ps.sensitivity_sobol(
+        {
+            "feeds.Gasifier_Steam_Feed.mass_flow_kg_s": (0.5, 2.0),
+            "feeds.Gasifier_Oxygen_Feed.mass_flow_kg_s": (2.0, 4.0),
+        },
+        kpis=["cold_gas_efficiency", "h2_co_ratio"],
+        n_samples=64,
+        workers=8,
+    )
 """
 
 from __future__ import annotations
 
-import copy
+import contextlib
+import functools
+import hashlib
+import itertools
+import json
 import logging
+import pickle
 import time
-from collections.abc import Callable, Sequence
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Optional
 
+from dwsim_model.analysis.continuation import CONTINUATION_COLUMNS, grid_order
+from dwsim_model.config.overlay import ConfigOverlay
+from dwsim_model.profiling import Profiler, is_profile_column
+
 logger = logging.getLogger(__name__)
 
 # pandas is optional; the sweep will still work and return a list of dicts
@@ -82,12 +144,16 @@ def _set_nested(d: dict, dot_path: str, value: Any) -> dict:
     """
     Set a value in a nested dict using a dot-separated path.
 
+    A ``ConfigOverlay`` is patched copy-on-write instead of in place.
+
     Example
     -------
     >>> cfg = {"feeds": {"Steam": {"mass_flow_kg_s": 1.0}}}
     >>> _set_nested(cfg, "feeds.Steam.mass_flow_kg_s", 2.5)
     {'feeds': {'Steam': {'mass_flow_kg_s': 2.5}}}
     """
+    if isinstance(d, ConfigOverlay):
+        return d.set(dot_path, value)
     keys = dot_path.split(".")
     node = d
     for key in keys[:-1]:
@@ -100,12 +166,12 @@ def _set_nested(d: dict, dot_path: str, value: Any) -> dict:
     return d
 
 
-def _get_nested(d: dict, dot_path: str, default=None) -> Any:
-    """Get a value from a nested dict using a dot-separated path."""
+def _get_nested(d: Mapping, dot_path: str, default=None) -> Any:
+    """Get a value from a nested dict (or overlay) using a dot-separated path."""
     keys = dot_path.split(".")
     node = d
     for key in keys:
-        if not isinstance(node, dict) or key not in node:
+        if not isinstance(node, Mapping) or key not in node:
             return default
         node = node[key]
     return node
@@ -116,7 +182,9 @@ def _get_nested(d: dict, dot_path: str, default=None) -> Any:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def _default_model_runner(config: dict) -> dict:
+def _default_model_runner(
+    config: dict, cache=None, snapshots=None, kpis: Optional[Sequence[str]] = None
+) -> dict:
     """
     Run the gasification model with the given config dict and return KPIs.
 
@@ -124,27 +192,279 @@ def _default_model_runner(config: dict) -> dict:
     In test environments (no DWSIM), replace this with a mock via the
     *model_factory* argument to ParameterSweep.
 
+    When *cache* (a ``ResultCache``) is given, the config is resolved first
+    and a cached result is returned without building the flowsheet.  With
+    *snapshots* (a ``SnapshotStore``) the flowsheet is loaded from a saved
+    prebuilt topology instead of being constructed object by object.
+
+    With *kpis*, only the streams and properties those KPIs depend on are
+    extracted (``metrics.extraction_plan``); the other KPIs in
+    the returned dict are then meaningless, and the partial result is not
+    written to the cache.  Unconverged solves are never cached either, so a
+    failed point is solved again on the next sweep.
+
     Returns
     -------
     dict: {kpi_name: value, ...}  — all available KPIs from GasificationMetrics
     """
     from dwsim_model.gasification import GasificationFlowsheet
     from dwsim_model.results.extractor import ResultsExtractor
-    from dwsim_model.results.metrics import MetricsCalculator
+    from dwsim_model.results.metrics import MetricsCalculator, extraction_plan
+
+    resolved = None
+    if cache is not None:
+        from dwsim_model.config_loader import ConfigLoader
+
+        resolved = ConfigLoader(config_data=config).load()
+        hit = cache.get(resolved)
+        if hit is not None:
+            return hit[1].to_dict()
 
-    flowsheet = GasificationFlowsheet(runtime_config=config)
+    flowsheet = GasificationFlowsheet(runtime_config=config, snapshots=snapshots)
     flowsheet.build_flowsheet()  # fix: was build() - method name mismatch
     flowsheet.run()  # fix: was solve() - method name mismatch
 
-    extractor = ResultsExtractor(compound_names=list(flowsheet.compound_set))
+    plan = extraction_plan(kpis)
+    extractor = ResultsExtractor(compound_names=list(flowsheet.compound_set), plan=plan)
     results = extractor.extract(flowsheet.builder)
 
     calculator = MetricsCalculator()
     metrics = calculator.calculate(results)
 
+    if cache is not None and plan is None and results.converged:
+        cache.put(resolved, results, metrics)
     return metrics.to_dict()
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Per-point execution (shared by the serial loop and the worker pool)
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+#: Runner installed in each pool worker by ``_init_worker``.  Shipping it once
+#: per worker (instead of once per task) lets stateful runners such as
+#: ``WarmModelRunner`` keep their warm flowsheet across grid points.
+_WORKER_RUNNER: Optional[Callable[[dict], dict]] = None
+
+#: Base config shipped once per worker; tasks carry only their patches.
+_WORKER_BASE: Optional[dict] = None
+
+
+def _init_worker(
+    runner: Callable[[dict], dict],
+    base_config: Optional[dict] = None,
+    contracts: Optional[dict] = None,
+) -> None:
+    """
+    Process-pool initializer: load DWSIM automation once per worker.
+
+    ``get_automation`` caches the Automation3 instance in a module global,
+    so every flowsheet built later in this worker reuses it instead of
+    paying the pythonnet/CLR start-up cost per grid point.  *contracts*
+    (from ``export_reactor_contracts``) prefill the worker's reactor
+    contract cache so it never parses the contract YAML itself.
+    """
+    global _WORKER_RUNNER, _WORKER_BASE
+    _WORKER_RUNNER = runner
+    _WORKER_BASE = base_config if base_config is not None else {}
+    if contracts:
+        from dwsim_model.chemistry.reactions import REACTOR_CONTRACT_CACHE
+
+        REACTOR_CONTRACT_CACHE.prefill(contracts)
+    try:
+        from dwsim_model.core import get_automation
+
+        get_automation()
+    except Exception as exc:
+        # Custom runners (mocks, surrogates) may not need DWSIM at all.
+        logger.warning(f"Sweep worker could not preload DWSIM automation: {exc}")
+
+
+def _run_worker_point(
+    patches: dict[str, Any], kpis: Optional[list[str]], profile: bool = False
+) -> dict[str, Any]:
+    """Pool task: overlay *patches* on the worker's base config and run it."""
+    if _WORKER_RUNNER is None:
+        raise RuntimeError("Sweep worker was started without a model runner.")
+    config = ConfigOverlay(_WORKER_BASE, patches)
+    return _run_point(_WORKER_RUNNER, config, kpis, profile)
+
+
+#: Status columns a runner may return that are kept even when the caller
+#: asks for specific KPIs (``out_of_domain`` comes from surrogate runners,
+#: the warm-start columns from ``ContinuationRunner``).
+_RUNNER_FLAGS = ("out_of_domain", *CONTINUATION_COLUMNS)
+
+#: Sweep-row columns that are never KPIs: the sweep's own bookkeeping and
+#: the runner flags (solve times and iteration counts are not responses).
+NON_KPI_COLUMNS: frozenset[str] = frozenset(
+    {"run_time_s", "converged", "error", "swept_param", *_RUNNER_FLAGS}
+)
+
+
+def is_kpi_column(name: str) -> bool:
+    """True unless *name* is a bookkeeping, runner-flag or profiling column."""
+    return name not in NON_KPI_COLUMNS and not is_profile_column(name)
+
+
+@contextlib.contextmanager
+def narrowed_runner(
+    runner: Callable[[dict], dict], kpis: Optional[Sequence[str]]
+) -> Iterator[Callable[[dict], dict]]:
+    """
+    Yield *runner* set up to extract only what *kpis* need.
+
+    The default runner gets a ``kpis`` keyword; runner objects with a
+    ``kpis`` attribute (``WarmModelRunner``) have it set for the duration
+    of the block.  Other runners are yielded unchanged.
+    """
+    if not kpis:
+        yield runner
+        return
+    base = runner.func if isinstance(runner, functools.partial) else runner
+    if base is _default_model_runner:
+        yield functools.partial(runner, kpis=tuple(kpis))
+    elif hasattr(runner, "kpis") and runner.kpis is None:
+        runner.kpis = tuple(kpis)
+        try:
+            yield runner
+        finally:
+            runner.kpis = None
+    else:
+        yield runner
+
+
+def _run_point(
+    runner: Callable[[dict], dict],
+    config: dict,
+    kpis: Optional[list[str]],
+    profile: bool = False,
+) -> dict[str, Any]:
+    """
+    Run *runner* on one config and return the KPI columns for its row.
+
+    Failures are captured in an ``error`` column instead of being raised,
+    so one bad point never aborts the rest of the sweep.  With *profile*
+    the row also gets per-phase ``time_<phase>_s`` / ``interop_<phase>``
+    columns and an ``interop_calls`` total (see ``dwsim_model.profiling``).
+    """
+    profiler = Profiler() if profile else None
+    t0 = time.perf_counter()
+    try:
+        with profiler or contextlib.nullcontext():
+            kpi_dict = runner(config)
+    except Exception as exc:
+        return {"error": str(exc)}
+    elapsed = time.perf_counter() - t0
+
+    if kpis:
+        # Runner status flags survive KPI filtering (see _RUNNER_FLAGS).
+        kpi_dict = {k: kpi_dict.get(k) for k in kpis} | {
+            k: kpi_dict[k] for k in _RUNNER_FLAGS if k in kpi_dict
+        }
+    outcome: dict[str, Any] = dict(kpi_dict)
+    outcome["run_time_s"] = round(elapsed, 2)
+    outcome["converged"] = kpi_dict.get("converged")
+    if profiler is not None:
+        outcome.update(profiler.columns())
+        outcome["interop_calls"] = profiler.interop_calls
+    return outcome
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Checkpointing
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _config_digest(config: dict) -> str:
+    """Stable hash of a config dict (key order does not matter)."""
+    canonical = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _point_hash(patch: dict[str, Any], base_digest: str) -> str:
+    """Identify one grid point by its config patch and the base config."""
+    return _config_digest({"base": base_digest, "patch": patch})[:16]
+
+
+class SweepCheckpoint:
+    """
+    Append-only JSONL record of finished sweep rows.
+
+    One line per finished grid point: the row (swept values + KPIs) plus a
+    ``point_hash`` identifying the point's config patch on top of the base
+    config.  Rows are flushed as they finish, so a crashed or killed sweep
+    loses at most the points that were in flight.  A half-written last
+    line is ignored on reading.
+
+    Usage
+    -----
+        df = ps.sweep_2d(..., checkpoint="results/sweep.jsonl")
+        # ... job killed at point 350 ...
+        df = ps.sweep_2d(..., checkpoint="results/sweep.jsonl", resume=True)
+
+        # Inspect a partial sweep without re-running anything:
+        rows = SweepCheckpoint("results/sweep.jsonl").rows()
+    """
+
+    HASH_KEY = "point_hash"
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def reset(self) -> None:
+        """Start an empty record (overwrites an existing file)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text("", encoding="utf-8")
+
+    def append(self, point_hash: str, row: dict[str, Any]) -> None:
+        """Append one finished row and flush it to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        record = {self.HASH_KEY: point_hash, **row}
+        with self.path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(record, default=str) + "\n")
+            fh.flush()
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """Yield every readable record, oldest first."""
+        if not self.path.exists():
+            return
+        with self.path.open("r", encoding="utf-8") as fh:
+            for lineno, line in enumerate(fh, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(
+                        f"{self.path}:{lineno}: skipping unreadable checkpoint line"
+                    )
+
+    def completed(self) -> set[str]:
+        """Hashes of points whose latest record has no error."""
+        latest: dict[str, bool] = {}
+        for record in self.records():
+            latest[record.get(self.HASH_KEY)] = "error" not in record
+        return {h for h, ok in latest.items() if ok}
+
+    def rows(self) -> list[dict[str, Any]]:
+        """All recorded rows (latest record per point), in first-seen order."""
+        latest: dict[str, dict[str, Any]] = {}
+        for record in self.records():
+            latest[record.pop(self.HASH_KEY, None)] = record
+        return list(latest.values())
+
+    def rows_for(self, hashes: list[str]) -> list[dict[str, Any]]:
+        """Latest recorded row for each hash in *hashes*, in that order."""
+        wanted = set(hashes)
+        latest: dict[str, dict[str, Any]] = {}
+        for record in self.records():
+            point_hash = record.pop(self.HASH_KEY, None)
+            if point_hash in wanted:
+                latest[point_hash] = record
+        return [latest[h] for h in hashes if h in latest]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Main sweep class
 # ─────────────────────────────────────────────────────────────────────────────
@@ -163,15 +483,48 @@ class ParameterSweep:
         Optional callable with signature ``(config: dict) -> dict``.
         Defaults to the DWSIM model runner above.  Provide a mock here
         for testing without DWSIM.
+    workers:
+        Number of worker processes used to run grid points.  ``1`` (the
+        default) runs everything in the calling process.  With ``N > 1``
+        points are dispatched to a process pool; each worker loads DWSIM
+        automation once and keeps it for all the points it runs.  The
+        runner must then be picklable (a module-level function or an
+        instance of a module-level class).
+    cache:
+        Optional ``ResultCache`` consulted by the default model runner, so
+        points that were solved before (by any sweep, run or GUI session)
+        are not solved again.  Ignored when a custom *model_runner* is given.
+    snapshots:
+        Optional ``SnapshotStore`` used by the default model runner, so each
+        worker loads the prebuilt flowsheet instead of constructing it.
+        Ignored when a custom *model_runner* is given.
+    profile:
+        Add per-phase timing and DWSIM interop-count columns
+        (``time_<phase>_s``, ``interop_<phase>``, ``interop_calls``) to
+        every row.  See ``dwsim_model.profiling``.
     """
 
     def __init__(
         self,
         base_config_path: str | Path | None = None,
         model_runner: Optional[Callable[[dict], dict]] = None,
+        workers: int = 1,
+        cache=None,
+        profile: bool = False,
+        *,
+        snapshots=None,
     ):
         self.base_config_path = Path(base_config_path) if base_config_path else None
-        self._runner = model_runner or _default_model_runner
+        if model_runner is not None:
+            self._runner = model_runner
+        elif cache is not None or snapshots is not None:
+            self._runner = functools.partial(
+                _default_model_runner, cache=cache, snapshots=snapshots
+            )
+        else:
+            self._runner = _default_model_runner
+        self.workers = max(1, int(workers))
+        self.profile = profile
         self._base_config: dict = {}
 
         if self.base_config_path:
@@ -180,11 +533,22 @@ class ParameterSweep:
     # ── Config loading ────────────────────────────────────────────────────
 
     def _load_config(self, path: Path) -> dict:
-        """Load a YAML config file into a plain dict."""
+        """
+        Load a YAML config file into a plain dict.
+
+        A compiled bundle (``compile-config``) yields its resolved config,
+        which workers then run without re-reading any sub-file.
+        """
         import yaml
 
+        from dwsim_model.config.bundle import is_bundle
+
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
+        if is_bundle(path):
+            from dwsim_model.config_loader import ConfigLoader
+
+            return ConfigLoader(config_path=path).load()
         with path.open("r", encoding="utf-8") as fh:
             return yaml.safe_load(fh) or {}
 
@@ -200,6 +564,10 @@ class ParameterSweep:
         values: Sequence[float],
         kpis: Optional[list[str]] = None,
         label: Optional[str] = None,
+        workers: Optional[int] = None,
+        *,
+        checkpoint: str | Path | None = None,
+        resume: bool = False,
     ):
         """
         Sweep one parameter over a sequence of values.
@@ -216,6 +584,15 @@ class ParameterSweep:
             are returned.
         label:
             Human-readable name for the parameter (used in output column).
+        workers:
+            Number of worker processes for this sweep.  None uses the
+            value given to the constructor.
+        checkpoint:
+            Optional JSONL path.  Each finished row is appended to it as
+            soon as it completes (see ``SweepCheckpoint``).
+        resume:
+            With *checkpoint*, skip points already recorded there without
+            an error instead of starting a fresh file.
 
         Returns
         -------
@@ -223,39 +600,18 @@ class ParameterSweep:
         Each row corresponds to one simulation run.
         """
         label = label or param_path.rsplit(".", maxsplit=1)[-1]
-        rows = []
 
         logger.info(f"Starting 1-D sweep: '{param_path}' over {len(values)} values")
 
-        for i, val in enumerate(values):
-            config = copy.deepcopy(self._base_config)
-            try:
-                _set_nested(config, param_path, float(val))
-            except KeyError as exc:
-                logger.warning(f"[sweep_1d] Could not set {param_path}={val}: {exc}")
-                continue
-
-            row: dict[str, Any] = {label: float(val)}
-            t0 = time.perf_counter()
-
-            try:
-                kpi_dict = self._runner(config)
-                elapsed = time.perf_counter() - t0
-                logger.debug(
-                    f"  Run {i + 1}/{len(values)}: {label}={val} → "
-                    f"CGE={kpi_dict.get('cold_gas_efficiency', '?'):.3f}  "
-                    f"({elapsed:.1f}s)"
-                )
-                if kpis:
-                    kpi_dict = {k: kpi_dict.get(k) for k in kpis}
-                row.update(kpi_dict)
-                row["run_time_s"] = round(elapsed, 2)
-                row["converged"] = kpi_dict.get("converged")  # type: ignore[assignment]
-            except Exception as exc:
-                logger.error(f"  Run {i + 1}: {label}={val} FAILED: {exc}")
-                row["error"] = str(exc)  # type: ignore[assignment]
-
-            rows.append(row)
+        points = [({param_path: float(val)}, {label: float(val)}) for val in values]
+        rows = self._run_grid(
+            points,
+            kpis=kpis,
+            workers=workers,
+            tag="sweep_1d",
+            checkpoint=checkpoint,
+            resume=resume,
+        )
 
         logger.info(f"1-D sweep complete — {len(rows)} successful runs.")
         return _to_dataframe(rows)
@@ -271,6 +627,11 @@ class ParameterSweep:
         kpis: Optional[list[str]] = None,
         label_a: Optional[str] = None,
         label_b: Optional[str] = None,
+        *,
+        workers: Optional[int] = None,
+        checkpoint: str | Path | None = None,
+        resume: bool = False,
+        order: str = "raster",
     ):
         """
         Sweep two parameters over a 2-D grid (len(values_a) × len(values_b) runs).
@@ -285,6 +646,22 @@ class ParameterSweep:
             KPI keys to return.  None = all.
         label_a, label_b:
             Column names for the swept parameters.
+        workers:
+            Number of worker processes for this sweep.  None uses the
+            value given to the constructor.
+        checkpoint:
+            Optional JSONL path.  Each finished row is appended to it as
+            soon as it completes (see ``SweepCheckpoint``).
+        resume:
+            With *checkpoint*, skip points already recorded there without
+            an error instead of starting a fresh file.
+        order:
+            Order in which points are solved: ``"raster"`` (row by row),
+            ``"serpentine"`` (every other row reversed) or ``"nearest"``
+            (greedy nearest-neighbour path).  The last two keep consecutive
+            solves adjacent for warm-starting runners such as
+            ``ContinuationRunner`` (see ``analysis/continuation.py``).  Rows
+            are returned in grid order regardless.
 
         Returns
         -------
@@ -299,47 +676,319 @@ class ParameterSweep:
             f"= {total_runs} runs"
         )
 
-        rows = []
-        run_idx = 0
+        points = [
+            (
+                {param_a_path: float(val_a), param_b_path: float(val_b)},
+                {label_a: float(val_a), label_b: float(val_b)},
+            )
+            for val_a in values_a
+            for val_b in values_b
+        ]
+        sequence = grid_order(
+            order,
+            (len(values_a), len(values_b)),
+            [tuple(columns.values()) for _patch, columns in points],
+        )
+        rows = self._run_grid(
+            points,
+            kpis=kpis,
+            workers=workers,
+            tag="sweep_2d",
+            checkpoint=checkpoint,
+            resume=resume,
+            order=sequence,
+        )
+
+        logger.info(f"2-D sweep complete — {len(rows)} runs finished.")
+        return _to_dataframe(rows)
+
+    # ── Adaptive 1-D sweep ────────────────────────────────────────────────
+
+    def sweep_adaptive(
+        self,
+        param_path: str,
+        bounds: tuple[float, float],
+        kpis: Optional[list[str]] = None,
+        *,
+        budget: int = 20,
+        tol: float = 0.02,
+        initial_points: int = 5,
+        label: Optional[str] = None,
+        workers: Optional[int] = None,
+        checkpoint: str | Path | None = None,
+        resume: bool = False,
+    ):
+        """
+        Sweep one parameter, spending runs where the KPIs change fastest.
+
+        Starts with ``initial_points`` evenly spaced values over *bounds*,
+        then repeatedly bisects the intervals with the highest refinement
+        score until *budget* runs have been spent or no interval scores
+        above *tol*.
+
+        An interval's score is the largest, over all tracked KPIs, of
+
+        * its **jump** — ``|Δkpi|`` across the interval, and
+        * its **bend** — how far an endpoint deviates from the straight line
+          through its two neighbours (a curvature measure),
+
+        both normalised by that KPI's observed range so KPIs with different
+        units are comparable.  Both shrink as intervals are refined, so the
+        loop terminates once the curve is resolved to *tol*.
+
+        Parameters
+        ----------
+        param_path:
+            Dot-separated path into the config dict.
+        bounds:
+            ``(low, high)`` range of the parameter.
+        kpis:
+            KPI keys to return and to refine on.  None = all KPIs returned,
+            all numeric ones used for refinement.
+        budget:
+            Maximum total number of runs (including the initial grid).
+        tol:
+            Stop refining once every interval scores below this fraction
+            of the KPI range.
+        initial_points:
+            Size of the initial evenly spaced grid (at least 2).
+        label:
+            Column name for the parameter.
+        workers:
+            Number of worker processes.  Each refinement round bisects up
+            to this many intervals at once.
+        checkpoint, resume:
+            As for ``sweep_1d``.  Refinement is deterministic, so a resumed
+            adaptive sweep replays the recorded rounds without re-running
+            them.
+
+        Returns
+        -------
+        pandas.DataFrame or list of dicts — same columns as ``sweep_1d``,
+        one row per run, sorted by parameter value.
+        """
+        low, high = float(bounds[0]), float(bounds[1])
+        if high <= low:
+            raise ValueError(f"bounds must satisfy low < high, got {bounds}")
+        if budget < 2:
+            raise ValueError("budget must allow at least 2 runs")
+
+        label = label or param_path.rsplit(".", maxsplit=1)[-1]
+        n_workers = self.workers if workers is None else max(1, int(workers))
+        n_initial = max(2, min(int(initial_points), int(budget)))
+        min_width = (high - low) * 1e-6
+
+        logger.info(
+            f"Starting adaptive sweep: '{param_path}' over [{low}, {high}], "
+            f"budget={budget}, tol={tol}"
+        )
+
+        def run(values: list[float], resume: bool) -> list[dict[str, Any]]:
+            points = [({param_path: v}, {label: v}) for v in values]
+            return self._run_grid(
+                points,
+                kpis=kpis,
+                workers=n_workers,
+                tag="sweep_adaptive",
+                checkpoint=checkpoint,
+                resume=resume,
+            )
+
+        step = (high - low) / (n_initial - 1)
+        initial = [low + i * step for i in range(n_initial - 1)] + [high]
+        rows = run(initial, resume)
+        tried = set(initial)
+
+        while len(tried) < budget:
+            good = sorted((r for r in rows if "error" not in r), key=lambda r: r[label])
+            scores = _interval_scores(good, label, kpis)
+            candidates = []
+            for (left, right), score in sorted(
+                scores.items(), key=lambda item: item[1], reverse=True
+            ):
+                mid = 0.5 * (left + right)
+                if score <= tol or right - left <= min_width or mid in tried:
+                    continue
+                candidates.append(mid)
+                if len(candidates) >= min(n_workers, budget - len(tried)):
+                    break
+
+            if not candidates:
+                logger.info("Adaptive sweep: all intervals within tolerance.")
+                break
+
+            logger.debug(f"Adaptive sweep: refining at {candidates}")
+            tried.update(candidates)
+            # Later rounds always append to the checkpoint of the first.
+            rows.extend(run(candidates, resume=True))
+
+        rows.sort(key=lambda r: r[label])
+        logger.info(f"Adaptive sweep complete — {len(rows)} runs.")
+        return _to_dataframe(rows)
+
+    # ── Grid execution ────────────────────────────────────────────────────
+
+    def _run_grid(
+        self,
+        points: list[tuple[dict[str, float], dict[str, Any]]],
+        kpis: Optional[list[str]],
+        workers: Optional[int],
+        tag: str,
+        *,
+        checkpoint: str | Path | None = None,
+        resume: bool = False,
+        order: Optional[list[int]] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Run every grid point and return one row per point, in grid order.
+
+        Each point is a ``(patch, columns)`` pair: *patch* maps config
+        dot-paths to values and *columns* are the swept-parameter values
+        written at the start of the row.  Points whose patch cannot be
+        applied to the base config are skipped with a warning.
 
-        for val_a in values_a:
-            for val_b in values_b:
-                run_idx += 1
-                config = copy.deepcopy(self._base_config)
+        Configs are built one at a time as points are dispatched.  With a
+        *checkpoint* path every finished row is appended to that JSONL
+        file instead of being held in memory, and the result is read back
+        at the end; with ``resume=True`` points already recorded there
+        (without an error) are not run again.
 
+        *order* is the sequence of point indices to dispatch (default: grid
+        order); it changes only the order of the solves, not of the rows.
+        """
+        store = SweepCheckpoint(checkpoint) if checkpoint else None
+        hashes: list[str] = []
+        done: set[str] = set()
+        if store is not None:
+            base_digest = _config_digest(self._base_config)
+            hashes = [_point_hash(patch, base_digest) for patch, _ in points]
+            if resume:
+                done = store.completed()
+            else:
+                store.reset()
+
+        sequence = range(len(points)) if order is None else order
+        todo = [i for i in sequence if not done or hashes[i] not in done]
+        if done:
+            logger.info(
+                f"[{tag}] Resuming from {store.path}: "
+                f"{len(points) - len(todo)} of {len(points)} points already done"
+            )
+
+        def prepared():
+            for i in todo:
+                patch, _columns = points[i]
+                config = ConfigOverlay(self._base_config)
                 try:
-                    _set_nested(config, param_a_path, float(val_a))
-                    _set_nested(config, param_b_path, float(val_b))
+                    for path, value in patch.items():
+                        _set_nested(config, path, value)
                 except KeyError as exc:
-                    logger.warning(
-                        f"[sweep_2d] Run {run_idx}: could not set params: {exc}"
-                    )
+                    logger.warning(f"[{tag}] Run {i + 1}: could not set params: {exc}")
                     continue
+                yield i, config
 
-                row: dict[str, Any] = {label_a: float(val_a), label_b: float(val_b)}
-                t0 = time.perf_counter()
+        n_workers = self.workers if workers is None else max(1, int(workers))
+        total = len(todo)
 
-                try:
-                    kpi_dict = self._runner(config)
-                    elapsed = time.perf_counter() - t0
+        rows: dict[int, dict[str, Any]] = {}
+        with narrowed_runner(self._runner, kpis) as runner:
+            if n_workers > 1 and total > 1:
+                outcomes = self._run_in_pool(prepared(), kpis, n_workers, total, runner)
+            else:
+                outcomes = (
+                    (i, _run_point(runner, config, kpis, self.profile))
+                    for i, config in prepared()
+                )
+
+            for n, (i, outcome) in enumerate(outcomes, start=1):
+                columns = points[i][1]
+                if "error" in outcome:
+                    logger.error(
+                        f"  Run {n}/{total}: {columns} FAILED: {outcome['error']}"
+                    )
+                else:
                     logger.debug(
-                        f"  Run {run_idx}/{total_runs}: "
-                        f"{label_a}={val_a}, {label_b}={val_b} → "
-                        f"CGE={kpi_dict.get('cold_gas_efficiency', '?'):.3f}  "
-                        f"({elapsed:.1f}s)"
+                        f"  Run {n}/{total}: {columns} → "
+                        f"CGE={outcome.get('cold_gas_efficiency', '?')}  "
+                        f"({outcome.get('run_time_s', '?')}s)"
                     )
-                    if kpis:
-                        kpi_dict = {k: kpi_dict.get(k) for k in kpis}
-                    row.update(kpi_dict)
-                    row["run_time_s"] = round(elapsed, 2)
-                except Exception as exc:
-                    logger.error(f"  Run {run_idx}: ({val_a}, {val_b}) FAILED: {exc}")
-                    row["error"] = str(exc)  # type: ignore[assignment]
-
-                rows.append(row)
+                row: dict[str, Any] = dict(columns)
+                row.update(outcome)
+                if store is not None:
+                    store.append(hashes[i], row)
+                else:
+                    rows[i] = row
+
+        if store is not None:
+            return store.rows_for(hashes)
+        return [rows[i] for i in sorted(rows)]
+
+    def _run_in_pool(
+        self,
+        items: Iterable[tuple[int, ConfigOverlay]],
+        kpis: Optional[list[str]],
+        n_workers: int,
+        total: int,
+        runner: Optional[Callable[[dict], dict]] = None,
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        Run ``(index, overlay)`` items on a process pool.
 
-        logger.info(f"2-D sweep complete — {len(rows)} runs finished.")
-        return _to_dataframe(rows)
+        Yields ``(index, outcome)`` in input order.  The base config is sent
+        to each worker once; a task carries only its overlay's patches, and
+        only a small window of tasks is in flight at a time, so memory does
+        not grow with the size of the grid.
+        """
+        runner = self._runner if runner is None else runner
+        try:
+            pickle.dumps(runner)
+        except Exception as exc:
+            raise ValueError(
+                "workers > 1 requires a picklable model_runner (a module-level "
+                f"function or class instance): {exc}"
+            ) from exc
+
+        return self._iter_pool(items, kpis, n_workers, total, runner)
+
+    def _iter_pool(self, items, kpis, n_workers: int, total: int, runner):
+        from dwsim_model.chemistry.reactions import export_reactor_contracts
+
+        logger.info(f"Dispatching {total} runs to {n_workers} worker processes")
+        window = 2 * n_workers
+        items = iter(items)
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(runner, self._base_config, export_reactor_contracts()),
+        ) as executor:
+            pending: deque = deque()
+            for i, config in itertools.islice(items, window):
+                pending.append(
+                    (
+                        i,
+                        executor.submit(
+                            _run_worker_point, config.patches, kpis, self.profile
+                        ),
+                    )
+                )
+            while pending:
+                i, future = pending.popleft()
+                try:
+                    outcome = future.result()
+                except Exception as exc:
+                    # Worker crashed or the payload could not be transferred;
+                    # record it against this point like any other failure.
+                    outcome = {"error": str(exc)}
+                for j, config in itertools.islice(items, 1):
+                    pending.append(
+                        (
+                            j,
+                            executor.submit(
+                                _run_worker_point, config.patches, kpis, self.profile
+                            ),
+                        )
+                    )
+                yield i, outcome
 
     # ── Sensitivity (one-at-a-time) ────────────────────────────────────────
 
@@ -398,12 +1047,210 @@ class ParameterSweep:
             return pd.concat(all_rows, ignore_index=True)
         return all_rows
 
+    # ── Sensitivity (global, variance-based) ───────────────────────────────
+
+    def sensitivity_sobol(
+        self,
+        params: dict[str, tuple[float, float]],
+        kpis: Optional[list[str]] = None,
+        *,
+        n_samples: int = 64,
+        sampler: str = "sobol",
+        seed: Optional[int] = None,
+        workers: Optional[int] = None,
+        checkpoint: str | Path | None = None,
+        resume: bool = False,
+    ):
+        """
+        Global sensitivity analysis with first-order and total Sobol indices.
+
+        All parameters are varied together over a space-filling design
+        (Sobol sequence or Latin hypercube) arranged in the Saltelli
+        scheme, so interactions are captured.  The ``n_samples × (d + 2)``
+        design points are dispatched as one batch through the sweep
+        engine, so ``workers`` spreads them over the process pool.
+
+        Parameters
+        ----------
+        params:
+            {param_path: (min_val, max_val)} — parameter ranges to explore.
+        kpis:
+            KPI keys to analyse.  None = every numeric KPI returned.
+        n_samples:
+            Base sample size *N*.  Powers of two suit the Sobol sampler.
+        sampler:
+            ``"sobol"`` (default, up to 10 parameters) or ``"lhs"``.
+        seed:
+            Random seed for the LHS sampler and the bootstrap.
+        workers:
+            Number of worker processes.  None uses the constructor value.
+        checkpoint, resume:
+            As for ``sweep_1d``.  The design is deterministic for a given
+            *sampler* / *seed*, so an interrupted analysis can be resumed.
+
+        Returns
+        -------
+        (indices, runs):
+            *indices* has one row per (kpi, parameter) with ``S1``,
+            ``S1_conf``, ``ST`` and ``ST_conf`` (95 % bootstrap
+            half-widths); *runs* holds every design point and its KPIs.
+            Both are DataFrames if pandas is installed, else lists of dicts.
+        """
+        from dwsim_model.analysis.sensitivity import (
+            saltelli_design,
+            scale_to_bounds,
+            sobol_indices,
+        )
+
+        paths = list(params)
+        labels = _unique_labels(paths)
+        dim = len(paths)
+        if dim == 0:
+            raise ValueError("params must contain at least one parameter")
+
+        A, B, AB = saltelli_design(int(n_samples), dim, sampler=sampler, seed=seed)
+        bounds = [params[path] for path in paths]
+        blocks = [("A", A), ("B", B)] + [
+            (f"AB_{label}", AB[i]) for i, label in enumerate(labels)
+        ]
+
+        points = []
+        for block, unit in blocks:
+            for j, row in enumerate(scale_to_bounds(unit, bounds)):
+                values = [float(v) for v in row]
+                columns = {"sample_block": block, "sample_index": j}
+                columns.update(zip(labels, values, strict=True))
+                points.append((dict(zip(paths, values, strict=True)), columns))
+
+        logger.info(
+            f"Starting Sobol sensitivity ({sampler}): {dim} parameters, "
+            f"N={n_samples} → {len(points)} runs"
+        )
+        runs = self._run_grid(
+            points,
+            kpis=kpis,
+            workers=workers,
+            tag="sobol",
+            checkpoint=checkpoint,
+            resume=resume,
+        )
+
+        by_block: dict[str, dict[int, dict[str, Any]]] = {}
+        for row in runs:
+            by_block.setdefault(row["sample_block"], {})[row["sample_index"]] = row
+
+        if kpis is None:
+            kpis = sorted(
+                {
+                    k
+                    for row in runs
+                    if "error" not in row
+                    for k, v in row.items()
+                    if k not in labels
+                    and is_kpi_column(k)
+                    and k not in ("sample_block", "sample_index")
+                    and isinstance(v, (int, float))
+                    and not isinstance(v, bool)
+                }
+            )
+
+        def outputs(block: str, kpi: str) -> list[float]:
+            rows = by_block.get(block, {})
+            out = []
+            for j in range(int(n_samples)):
+                value = rows.get(j, {}).get(kpi)
+                ok = isinstance(value, (int, float)) and not isinstance(value, bool)
+                out.append(float(value) if ok else float("nan"))
+            return out
+
+        indices = []
+        for kpi in kpis:
+            result = sobol_indices(
+                outputs("A", kpi),
+                outputs("B", kpi),
+                [outputs(f"AB_{label}", kpi) for label in labels],
+                seed=seed,
+            )
+            for i, path in enumerate(paths):
+                indices.append(
+                    {
+                        "kpi": kpi,
+                        "param": path,
+                        "S1": float(result["S1"][i]),
+                        "S1_conf": float(result["S1_conf"][i]),
+                        "ST": float(result["ST"][i]),
+                        "ST_conf": float(result["ST_conf"][i]),
+                        "n_used": result["n"],
+                    }
+                )
+
+        logger.info(f"Sobol sensitivity complete — {len(runs)} runs.")
+        return _to_dataframe(indices), _to_dataframe(runs)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Helper
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+def _unique_labels(paths: list[str]) -> list[str]:
+    """Column labels for *paths*: the last segment, or the full path if ambiguous."""
+    short = [path.rsplit(".", maxsplit=1)[-1] for path in paths]
+    return [
+        label if short.count(label) == 1 else path
+        for label, path in zip(short, paths, strict=True)
+    ]
+
+
+def _interval_scores(
+    rows: list[dict[str, Any]], label: str, kpis: Optional[list[str]]
+) -> dict[tuple[float, float], float]:
+    """
+    Score each interval between consecutive rows (sorted by *label*).
+
+    Returns ``{(left, right): score}`` where the score is the largest
+    normalised KPI jump across the interval or bend at either endpoint.
+    See ``ParameterSweep.sweep_adaptive``.
+    """
+    if len(rows) < 2:
+        return {}
+
+    if kpis is None:
+        kpis = [
+            k
+            for k, v in rows[0].items()
+            if k != label
+            and is_kpi_column(k)
+            and isinstance(v, (int, float))
+            and not isinstance(v, bool)
+        ]
+
+    xs = [r[label] for r in rows]
+    scores = dict.fromkeys(itertools.pairwise(xs), 0.0)
+
+    for kpi in kpis:
+        ys = [r.get(kpi) for r in rows]
+        if any(not isinstance(y, (int, float)) or isinstance(y, bool) for y in ys):
+            continue
+        span = max(ys) - min(ys)
+        if span <= 0:
+            continue
+
+        # Bend at each interior point: distance from the chord through its
+        # neighbours, charged to both adjacent intervals.
+        bend = [0.0] * len(xs)
+        for j in range(1, len(xs) - 1):
+            x0, x1, x2 = xs[j - 1], xs[j], xs[j + 1]
+            chord = ys[j - 1] + (ys[j + 1] - ys[j - 1]) * (x1 - x0) / (x2 - x0)
+            bend[j] = abs(ys[j] - chord) / span
+
+        for i, interval in enumerate(scores):
+            jump = abs(ys[i + 1] - ys[i]) / span
+            scores[interval] = max(scores[interval], jump, bend[i], bend[i + 1])
+
+    return scores
+
+
 def _to_dataframe(rows: list[dict]):
     """Convert list of dicts to DataFrame if pandas available."""
     if _HAS_PANDAS:
@@ -0,0 +1,250 @@
+"""
+analysis/warm.py
+================
+A "warm" model runner that keeps one built flowsheet alive between runs.
+
+Why this exists
+---------------
+The default sweep runner builds a brand-new ``GasificationFlowsheet`` for
+every grid point: ~11 compounds, ~60 objects, ~70 connections and three
+reactor configurations, all through pythonnet interop calls.  A typical
+sweep only changes one feed value between points, so almost all of that
+work is repeated for nothing.
+
+``WarmModelRunner`` builds the topology once.  For each later config it
+resolves the config, diffs it against what is already loaded in DWSIM
+(``ConfigLoader.apply_to_flowsheet(previous=...)``), writes only the
+individual values that changed, and re-solves the existing flowsheet.  A full rebuild happens only
+when a topology-affecting key changes (see ``TOPOLOGY_KEYS``).
+
+The re-solve is incremental: only the patched streams and the objects
+downstream of them are recalculated, so a quench or cleanup sweep does not
+re-run the three reactors whose inputs did not change.  Pass
+``incremental=False`` to always run the full solver.
+
+Usage
+-----
+    from dwsim_model.analysis.sweep import ParameterSweep
+    from dwsim_model.analysis.warm import WarmModelRunner
+
+    ps = ParameterSweep(
+        base_config_path="config/master_config.yaml",
+        model_runner=WarmModelRunner(config_path="config/master_config.yaml"),
+    )
+    df = ps.sweep_1d("feeds.Gasifier_Biomass_Feed.mass_flow_kg_s", [8, 9, 10])
+
+The runner is picklable, so it also works with ``workers=N``: each worker
+process receives its own copy and keeps its own warm flowsheet.
+
+Pass ``cache=ResultCache()`` to skip the solve entirely for configs that
+have already been solved (see ``results/cache.py``).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from dwsim_model.config_loader import ConfigLoader
+
+logger = logging.getLogger(__name__)
+
+#: Resolved-config keys that change what gets built (object types, compound
+#: list, reactor contracts).  A change in any of them forces a full rebuild.
+TOPOLOGY_KEYS: tuple[str, ...] = ("reactor_mode", "compound_set", "reactors")
+
+
+class WarmModelRunner:
+    """
+    Model runner that reuses one built flowsheet across calls.
+
+    Parameters
+    ----------
+    config_path:
+        Master config path used to resolve relative sub-file references in
+        the configs passed to the runner.  None lets ``ConfigLoader`` pick
+        its default.
+    cache:
+        Optional ``ResultCache``.  Hits are returned without touching the
+        warm flowsheet; fresh converged solves are stored.
+    snapshots:
+        Optional ``SnapshotStore`` used for the full builds, so even a
+        rebuild loads the prebuilt topology instead of constructing it.
+    incremental:
+        Recalculate only what lies downstream of the patched streams
+        (default).  ``False`` re-runs the whole flowsheet every time.
+    kpis:
+        Optional KPI names.  Only the streams and properties these depend on
+        are extracted (``metrics.extraction_plan``), and such
+        partial results are not cached.  ``ParameterSweep`` sets this for
+        the duration of a sweep.
+
+    Attributes
+    ----------
+    builds:
+        Number of full flowsheet builds performed so far.
+    patched_runs:
+        Number of runs that re-solved the warm flowsheet after patching.
+    """
+
+    def __init__(
+        self,
+        config_path: str | Path | None = None,
+        cache=None,
+        snapshots=None,
+        incremental: bool = True,
+        kpis: Sequence[str] | None = None,
+    ):
+        self.config_path = Path(config_path) if config_path else None
+        self.cache = cache
+        self.snapshots = snapshots
+        self.incremental = incremental
+        self.kpis = tuple(kpis) if kpis else None
+        self.builds = 0
+        self.patched_runs = 0
+        self._flowsheet = None
+        self._applied: dict[str, Any] | None = None
+
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def __call__(self, config: dict) -> dict:
+        """Run *config* and return the KPI dict (``ParameterSweep`` runner API)."""
+        _results, metrics = self.solve(config)
+        return metrics.to_dict()
+
+    def solve(self, config: dict):
+        """
+        Bring the warm flowsheet to *config*, solve it and compute KPIs.
+
+        Returns
+        -------
+        (FlowsheetResults, GasificationMetrics)
+        """
+        from dwsim_model.results.extractor import ResultsExtractor
+        from dwsim_model.results.metrics import MetricsCalculator, extraction_plan
+
+        loader = ConfigLoader(config_path=self.config_path, config_data=config)
+        resolved = loader.load()
+
+        if self.cache is not None:
+            hit = self.cache.get(resolved)
+            if hit is not None:
+                return hit
+
+        patch_failed = False
+        try:
+            if self._needs_rebuild(resolved):
+                self._rebuild(config)
+            else:
+                changed = self._patch(loader, resolved)
+                patch_failed = bool(loader._errors)
+                if self.incremental:
+                    self._flowsheet.run(changed=changed)
+                else:
+                    self._flowsheet.run()
+                self.patched_runs += 1
+        except Exception:
+            # The DWSIM state is unknown after a failed build/solve; start
+            # from scratch on the next call rather than patching on top of it.
+            self.reset()
+            raise
+
+        if patch_failed:
+            # Some values were not written, so the flowsheet does not match
+            # *resolved*.  Leaving it unapplied forces a rebuild next call
+            # instead of diffing against values DWSIM never received.
+            logger.warning(
+                "Warm runner: config patch had errors — rebuilding on the next call."
+            )
+            self._applied = None
+        else:
+            self._applied = resolved
+
+        flowsheet = self._flowsheet
+        plan = extraction_plan(self.kpis)
+        extractor = ResultsExtractor(
+            compound_names=list(flowsheet.compound_set), plan=plan
+        )
+        results = extractor.extract(flowsheet.builder)
+        metrics = MetricsCalculator().calculate(results)
+
+        if (
+            self.cache is not None
+            and plan is None
+            and results.converged
+            and not patch_failed
+        ):
+            self.cache.put(resolved, results, metrics)
+        return results, metrics
+
+    def reset(self) -> None:
+        """Drop the warm flowsheet; the next call performs a full build."""
+        self._flowsheet = None
+        self._applied = None
+
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _needs_rebuild(self, resolved: dict[str, Any]) -> bool:
+        """Return True when *resolved* cannot be reached by patching streams."""
+        if self._flowsheet is None or self._applied is None:
+            return True
+
+        for key in TOPOLOGY_KEYS:
+            if resolved.get(key) != self._applied.get(key):
+                logger.info(f"Warm runner: '{key}' changed — rebuilding flowsheet.")
+                return True
+
+        # DWSIM has no notion of "unset": a stream that was configured before
+        # but is absent now can only be reset by a rebuild.
+        for section in ("feeds", "energy_streams"):
+            previous = self._applied.get(section, {})
+            current = resolved.get(section, {})
+            if set(previous) - set(current):
+                logger.info(
+                    f"Warm runner: entries removed from '{section}' — rebuilding."
+                )
+                return True
+        return False
+
+    def _rebuild(self, config: dict) -> None:
+        """Build, configure and solve a fresh flowsheet for *config*."""
+        from dwsim_model.gasification import GasificationFlowsheet
+
+        flowsheet = GasificationFlowsheet(
+            config_path=str(self.config_path) if self.config_path else None,
+            runtime_config=config,
+            snapshots=self.snapshots,
+        )
+        flowsheet.build_flowsheet()
+        self._flowsheet = flowsheet
+        self.builds += 1
+        flowsheet.run()
+
+    def _patch(self, loader: ConfigLoader, resolved: dict[str, Any]) -> list[str]:
+        """
+        Push only the feed and energy values that differ from the loaded state.
+
+        Returns the names of the streams that were written.
+        """
+        builder = self._flowsheet.builder
+        changed = loader.apply_to_flowsheet(
+            builder,
+            builder.materials,
+            builder.energy_streams,
+            previous=self._applied or {},
+        )
+        logger.debug(f"Warm runner: patched {changed or 'no streams'}.")
+        return changed
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Pickling: only the settings travel to worker processes, never the live
+    # DWSIM objects.
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = dict(self.__dict__)
+        state["_flowsheet"] = None
+        state["_applied"] = None
+        return state
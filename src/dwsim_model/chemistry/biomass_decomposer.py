@@ -22,6 +22,16 @@ The approach (Channiwala & Parikh correlation + element balance):
        - Add N, S, Cl as trace contaminants if in compound set
     4. Return mole fractions for each DWSIM compound.
 
+Feedstock libraries
+-------------------
+``decompose`` handles one ``BiomassFeed`` and raises on bad input.  To
+screen a database of analyses, ``decompose_batch`` takes columns instead
+(a DataFrame, or a dict of arrays: C, H, O, N, S, Cl on a daf basis plus
+``moisture_ar`` and ``ash_ar``) and returns a :class:`DecompositionBatch`:
+a mole-fraction matrix aligned to the compound set, the Channiwala–Parikh
+HHV of every row, and per-check validation masks.  Rows that fail a check
+get NaN instead of raising.  Requires NumPy.
+
 Reference:
     Channiwala & Parikh (2002) Fuel 81(8), 1051–1063
     Jarungthammachote & Dutta (2007) Energy Conv. Mgmt. 48(7), 2085–2091
@@ -30,7 +40,9 @@ Reference:
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +66,39 @@ _MW = {
     "He": 4.003,  # Ash proxy
 }
 
+#: Species every decomposition produces, in ``decompose`` order.
+_CORE_SPECIES = (
+    "Carbon monoxide",
+    "Hydrogen",
+    "Carbon dioxide",
+    "Methane",
+    "Water",
+    "Helium",
+)
+
+#: Trace species, included only when they are in the simulation.
+_TRACE_SPECIES = ("Ammonia", "Hydrogen sulfide", "Hydrogen chloride")
+
+#: Elements of the ultimate analysis.
+_ELEMENTS = ("C", "H", "O", "N", "S", "Cl")
+
+#: Limits shared by ``BiomassFeed`` validation and ``decompose_batch`` masks.
+_ULTIMATE_SUM_TOLERANCE = 0.03
+_MOISTURE_MAX = 0.60
+_ASH_MAX = 0.50
+
+
+def _channiwala_parikh(pct: Mapping[str, Any], ash_pct):
+    """HHV (MJ/kg) from as-received mass percentages; floats or arrays."""
+    return (
+        0.3491 * pct["C"]
+        + 1.1783 * pct["H"]
+        + 0.1005 * pct["S"]
+        - 0.1034 * pct["O"]
+        - 0.0151 * pct["N"]
+        - 0.0211 * ash_pct
+    )
+
 
 @dataclass
 class BiomassFeed:
@@ -89,17 +134,61 @@ class BiomassFeed:
 
     def __post_init__(self):
         total = sum(self.ultimate_daf.values())
-        if abs(total - 1.0) > 0.03:
+        if abs(total - 1.0) > _ULTIMATE_SUM_TOLERANCE:
             raise ValueError(
                 f"Ultimate analysis (daf) must sum to 1.0, got {total:.4f}. "
                 "Check that fractions, not percentages, were supplied."
             )
-        if not 0.0 <= self.moisture_ar <= 0.60:
+        if not 0.0 <= self.moisture_ar <= _MOISTURE_MAX:
             raise ValueError(f"moisture_ar {self.moisture_ar} out of range [0, 0.60]")
-        if not 0.0 <= self.ash_ar <= 0.50:
+        if not 0.0 <= self.ash_ar <= _ASH_MAX:
             raise ValueError(f"ash_ar {self.ash_ar} out of range [0, 0.50]")
 
 
+@dataclass(frozen=True)
+class DecompositionBatch:
+    """
+    Result of :meth:`BiomassDecomposer.decompose_batch`.
+
+    Attributes
+    ----------
+    compounds:
+        Column names of :attr:`mole_fractions`.
+    mole_fractions:
+        ``(n_rows, len(compounds))`` mole fractions, identical to
+        ``decompose`` for valid rows.  Species produced but not in
+        ``compounds`` are left out (see :attr:`unmapped_fraction`), so rows
+        may sum to less than 1.  NaN for invalid rows.
+    hhv_mj_kg:
+        Channiwala–Parikh HHV estimate (MJ/kg) per row; NaN for invalid rows.
+    total_moles:
+        Moles of gas-phase surrogate per kg of biomass.
+    unmapped_fraction:
+        Mole fraction of produced species that have no column.
+    checks:
+        ``{check: (n_rows,) bool}`` — True where the row passes.  Checks:
+        ``finite``, ``ultimate_sum``, ``moisture_range``, ``ash_range``,
+        ``daf_positive``, ``positive_moles``.
+    valid:
+        All checks passed.
+    trace_clipped:
+        Rows whose trace elements needed more H than available; as in
+        ``decompose`` their NH3, H2S and HCl are set to zero.
+    """
+
+    compounds: tuple[str, ...]
+    mole_fractions: Any
+    hhv_mj_kg: Any
+    total_moles: Any
+    unmapped_fraction: Any
+    checks: dict[str, Any]
+    valid: Any
+    trace_clipped: Any
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+
 class BiomassDecomposer:
     """
     Converts a BiomassFeed description into DWSIM component mole fractions.
@@ -127,7 +216,8 @@ class BiomassDecomposer:
             Used to decide whether to include trace species.  If None,
             only core species are used.
         """
-        self.available = set(available_compounds or [])
+        self.compound_names = list(available_compounds or [])
+        self.available = set(self.compound_names)
 
     # ─────────────────────────────────────────────────────────────────────────
 
@@ -303,17 +393,157 @@ class BiomassDecomposer:
         N = ua.get("N", 0.0) * daf * 100
         ash = feed.ash_ar * 100
 
-        hhv = (
-            0.3491 * C
-            + 1.1783 * H
-            + 0.1005 * S
-            - 0.1034 * O_pct
-            - 0.0151 * N
-            - 0.0211 * ash
-        )
+        hhv = _channiwala_parikh({"C": C, "H": H, "S": S, "O": O_pct, "N": N}, ash)
         logger.debug(f"Channiwala-Parikh HHV estimate: {hhv:.2f} MJ/kg")
         return hhv
 
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def decompose_batch(
+        self,
+        ultimate_daf,
+        moisture_ar=None,
+        ash_ar=None,
+        compounds: Sequence[str] | None = None,
+    ) -> DecompositionBatch:
+        """
+        Decompose many feeds at once with NumPy.
+
+        Same element balance as :meth:`decompose` and the same HHV
+        correlation as :meth:`estimate_hhv`, applied to columns.  Invalid
+        rows are flagged in the returned masks instead of raising.
+
+        Parameters
+        ----------
+        ultimate_daf:
+            DataFrame or mapping with columns ``C``, ``H``, ``O``, ``N``,
+            ``S``, ``Cl`` (daf mass fractions; missing elements count as 0).
+        moisture_ar, ash_ar:
+            As-received moisture and ash columns.  Default: the
+            ``moisture_ar`` / ``ash_ar`` columns of *ultimate_daf*.
+        compounds:
+            Columns of the mole-fraction matrix.  Default: the compound
+            list given to the decomposer, else the core species.
+
+        Returns
+        -------
+        DecompositionBatch
+        """
+        import numpy as np
+
+        def column(table, key):
+            if key in table:
+                return np.asarray(table[key], dtype=float)
+            return None
+
+        moisture = (
+            column(ultimate_daf, "moisture_ar")
+            if moisture_ar is None
+            else np.asarray(moisture_ar, dtype=float)
+        )
+        ash = (
+            column(ultimate_daf, "ash_ar")
+            if ash_ar is None
+            else np.asarray(ash_ar, dtype=float)
+        )
+        if moisture is None or ash is None:
+            raise ValueError(
+                "decompose_batch needs moisture_ar and ash_ar, as arguments "
+                "or as columns of ultimate_daf."
+            )
+        n = len(moisture)
+        ua = {}
+        for element in _ELEMENTS:
+            values = column(ultimate_daf, element)
+            ua[element] = np.zeros(n) if values is None else values
+            if len(ua[element]) != n:
+                raise ValueError(
+                    f"Column '{element}' has {len(ua[element])} rows, expected {n}."
+                )
+        if len(ash) != n:
+            raise ValueError(f"ash_ar has {len(ash)} rows, expected {n}.")
+
+        # ── Validation masks (BiomassFeed / decompose rules) ────────────────
+        daf = 1.0 - moisture - ash
+        finite = np.isfinite(moisture) & np.isfinite(ash)
+        for values in ua.values():
+            finite &= np.isfinite(values)
+        with np.errstate(invalid="ignore"):
+            total = sum(ua.values())
+            checks = {
+                "finite": finite,
+                "ultimate_sum": np.abs(total - 1.0) <= _ULTIMATE_SUM_TOLERANCE,
+                "moisture_range": (moisture >= 0.0) & (moisture <= _MOISTURE_MAX),
+                "ash_range": (ash >= 0.0) & (ash <= _ASH_MAX),
+                "daf_positive": daf > 0.0,
+            }
+
+        # ── Element balance (see decompose) ─────────────────────────────────
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mol = {e: ua[e] * daf / _MW[e] for e in _ELEMENTS}
+            mol_H2O_moist = moisture / _MW["H2O"]
+
+            h_trace = 3 * mol["N"] + 2 * mol["S"] + mol["Cl"]
+            trace_clipped = mol["H"] - h_trace < 0
+            keep_trace = np.where(trace_clipped, 0.0, 1.0)
+            mol_H_remaining = np.where(trace_clipped, mol["H"], mol["H"] - h_trace)
+
+            co2_frac = 0.15
+            mol_CO2 = mol["C"] * co2_frac
+            mol_CO = mol["C"] * (1.0 - co2_frac)
+            mol_H2O_from_O = np.maximum(mol["O"] - (mol_CO + 2 * mol_CO2), 0.0)
+            mol_H2 = np.maximum(mol_H_remaining - 2 * mol_H2O_from_O, 0.0) / 2
+            mol_CH4 = 0.03 * mol["C"]
+            mol_CO = np.maximum(mol_CO - 2 * mol_CH4, 0.0)
+            mol_H2 = np.maximum(mol_H2 - 4 * mol_CH4, 0.0)
+            mol_He = (ash / daf) * mol["C"] * 0.01
+
+            species = {
+                "Carbon monoxide": mol_CO,
+                "Hydrogen": mol_H2,
+                "Carbon dioxide": mol_CO2,
+                "Methane": mol_CH4,
+                "Water": mol_H2O_from_O + mol_H2O_moist,
+                "Helium": mol_He,
+            }
+            for name, element in zip(_TRACE_SPECIES, ("N", "S", "Cl"), strict=True):
+                if name in self.available:
+                    species[name] = mol[element] * keep_trace
+
+            total_moles = sum(species.values())
+            checks["positive_moles"] = total_moles > 0
+            valid = np.logical_and.reduce(list(checks.values()))
+
+            columns = tuple(compounds or self.compound_names or _CORE_SPECIES)
+            fractions = np.zeros((n, len(columns)))
+            for j, name in enumerate(columns):
+                if name in species:
+                    fractions[:, j] = species[name] / total_moles
+            unmapped = np.maximum(1.0 - fractions.sum(axis=1), 0.0)
+
+            pct = {e: ua[e] * daf * 100 for e in ("C", "H", "S", "O", "N")}
+            hhv = _channiwala_parikh(pct, ash * 100)
+
+        fractions[~valid] = np.nan
+        for values in (hhv, total_moles, unmapped):
+            values[~valid] = np.nan
+
+        n_invalid = int((~valid).sum())
+        logger.info(
+            f"BiomassDecomposer: decomposed {n} feeds into {len(columns)} "
+            f"columns; {n_invalid} invalid row(s)."
+        )
+        return DecompositionBatch(
+            compounds=columns,
+            mole_fractions=fractions,
+            hhv_mj_kg=hhv,
+            total_moles=total_moles,
+            unmapped_fraction=unmapped,
+            checks=checks,
+            valid=valid,
+            trace_clipped=trace_clipped & valid,
+        )
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Standalone test / demo
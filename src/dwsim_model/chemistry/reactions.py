@@ -6,16 +6,38 @@ Validated reactor-configuration adapters for the gasification train.
 This module is the Python-side contract between YAML reactor definitions and
 the DWSIM automation API. Unsupported API paths raise explicit errors instead
 of downgrading to "manual GUI setup required".
+
+Contract cache
+--------------
+Every flowsheet build configures three reactors, and ``ConfigLoader``
+validates the same reactor blocks again — a 1,000-point sweep used to
+parse and validate each contract YAML thousands of times.
+:data:`REACTOR_CONTRACT_CACHE` keeps the parsed and validated contract of
+each file keyed on ``(path, mtime, size)`` and its SHA-256: an unchanged
+file costs one ``stat``; a touched file with the same bytes is re-hashed
+but not re-parsed; an edited file is loaded afresh.  Validated blocks are
+also memoized by content, so ``ConfigLoader`` skips re-validating reactor
+blocks that scenario overrides left untouched.
+
+Sweep workers are prefilled from the parent with
+:func:`export_reactor_contracts` / :meth:`ReactorContractCache.prefill`.
+Cached ``ReactorConfig`` objects are shared — treat them as read-only.
 """
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
 import logging
+import threading
+from dataclasses import dataclass
 from pathlib import Path
 
 import yaml
 
 from dwsim_model.config.schema import ReactorConfig, validate_reactor_config
+from dwsim_model.profiling import count_interop
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +45,13 @@ _CONFIG_DIR = (
     Path(__file__).resolve().parent.parent.parent.parent / "config" / "reactors"
 )
 
+#: Reactor contract file of each stage, under ``config/reactors``.
+REACTOR_CONTRACTS = {
+    "gasifier": "gasifier_reactions.yaml",
+    "pem": "pem_reactions.yaml",
+    "trc": "trc_reactions.yaml",
+}
+
 _OPERATION_MODES = {
     "isothermal": 0,
     "adiabatic": 1,
@@ -48,22 +77,188 @@ class ReactorConfigurationError(RuntimeError):
     """Raised when the reactor contract cannot be applied to the runtime."""
 
 
+def reactor_contract_path(filename: str) -> Path:
+    """Return the path of a reactor contract file in ``config/reactors``."""
+    return _CONFIG_DIR / filename
+
+
 def _load_reactor_contract(filename: str) -> ReactorConfig:
-    """Load and validate a reactor YAML file as a runtime contract."""
-    path = _CONFIG_DIR / filename
-    if not path.exists():
-        raise ReactorConfigurationError(f"Reactor config not found: {path}")
+    """Load and validate a reactor YAML file as a runtime contract (cached)."""
+    return REACTOR_CONTRACT_CACHE.contract(reactor_contract_path(filename))
+
+
+def _reactor_payload(block: dict) -> dict:
+    """Flatten a contract file (``reactor:`` + ``reactions:``) for validation."""
+    payload = dict(block.get("reactor", {}))
+    payload["reactions"] = block.get("reactions", [])
+    return payload
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Contract cache
+# ─────────────────────────────────────────────────────────────────────────────
+
 
-    with path.open("r", encoding="utf-8") as fh:
-        raw = yaml.safe_load(fh) or {}
+@dataclass(frozen=True)
+class ContractEntry:
+    """One cached contract file: its fingerprint, raw YAML and validation."""
 
-    reactor_payload = dict(raw.get("reactor", {}))
-    reactor_payload["reactions"] = raw.get("reactions", [])
+    mtime_ns: int
+    size: int
+    digest: str
+    raw: dict
+    config: ReactorConfig
 
-    return validate_reactor_config(
-        reactor_payload,
-        reactor_name=reactor_payload.get("name", path.stem),
-    )
+
+class ReactorContractCache:
+    """
+    Process-wide cache of parsed and validated reactor contract files.
+
+    Attributes
+    ----------
+    hits, misses:
+        Lookups served from the cache and files (re)parsed.
+    """
+
+    def __init__(self):
+        self._files: dict[str, ContractEntry] = {}
+        self._validated: dict[str, ReactorConfig] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def entry(self, path: str | Path) -> ContractEntry:
+        """Return the cached entry of *path*, reloading it if the file changed."""
+        path = Path(path)
+        key = str(path.resolve())
+        try:
+            stat = path.stat()
+        except OSError as exc:
+            raise ReactorConfigurationError(
+                f"Reactor config not found: {path}"
+            ) from exc
+
+        with self._lock:
+            cached = self._files.get(key)
+            if (
+                cached is not None
+                and cached.mtime_ns == stat.st_mtime_ns
+                and cached.size == stat.st_size
+            ):
+                self.hits += 1
+                return cached
+
+            data = path.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            if cached is not None and cached.digest == digest:
+                # Touched but unchanged: keep the parsed contract.
+                self.hits += 1
+                raw, config = cached.raw, cached.config
+            else:
+                self.misses += 1
+                raw = _parse_contract(path, data)
+                payload = _reactor_payload(raw)
+                config = self._validate(
+                    payload, payload.get("name", path.stem), _block_digest(payload)
+                )
+            entry = ContractEntry(stat.st_mtime_ns, stat.st_size, digest, raw, config)
+            self._files[key] = entry
+            return entry
+
+    def contract(self, path: str | Path) -> ReactorConfig:
+        """Validated ``ReactorConfig`` of the contract file at *path*."""
+        return self.entry(path).config
+
+    def raw(self, path: str | Path) -> dict:
+        """A private copy of the parsed contract file at *path*."""
+        return copy.deepcopy(self.entry(path).raw)
+
+    def digest(self, path: str | Path) -> str | None:
+        """SHA-256 of the contract file at *path*, or None if it is missing."""
+        try:
+            return self.entry(path).digest
+        except (ReactorConfigurationError, ValueError, yaml.YAMLError):
+            try:
+                return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+            except OSError:
+                return None
+
+    def validate(self, block: dict, reactor_name: str = "") -> ReactorConfig:
+        """
+        Validate a contract block (``reactor:`` + ``reactions:``), memoized.
+
+        Blocks are keyed by content, so a block read from a cached file — or
+        an identical copy of one — is validated once per process.
+        """
+        payload = _reactor_payload(block)
+        name = payload.get("name", reactor_name)
+        with self._lock:
+            return self._validate(payload, name, _block_digest(payload))
+
+    def _validate(self, payload: dict, name: str, key: str) -> ReactorConfig:
+        config = self._validated.get(key)
+        if config is None:
+            config = validate_reactor_config(payload, reactor_name=name)
+            self._validated[key] = config
+        return config
+
+    def export(self) -> dict[str, ContractEntry]:
+        """Picklable copy of the file entries, for :meth:`prefill`."""
+        with self._lock:
+            return dict(self._files)
+
+    def prefill(self, entries: dict[str, ContractEntry] | None) -> None:
+        """
+        Seed the cache with entries exported by another process.
+
+        Entries are still checked against the file's mtime and size on
+        lookup, so a contract edited since the export is reloaded.
+        """
+        if not entries:
+            return
+        with self._lock:
+            for key, entry in entries.items():
+                self._files.setdefault(key, entry)
+                self._validated.setdefault(
+                    _block_digest(_reactor_payload(entry.raw)), entry.config
+                )
+
+    def clear(self) -> None:
+        """Drop every cached contract."""
+        with self._lock:
+            self._files.clear()
+            self._validated.clear()
+            self.hits = self.misses = 0
+
+
+def _parse_contract(path: Path, data: bytes) -> dict:
+    if path.suffix.lower() == ".json":
+        return json.loads(data) or {}
+    return yaml.safe_load(data) or {}
+
+
+def _block_digest(payload: dict) -> str:
+    canonical = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+#: The process-wide contract cache.
+REACTOR_CONTRACT_CACHE = ReactorContractCache()
+
+
+def export_reactor_contracts() -> dict[str, ContractEntry]:
+    """
+    Load every stage contract and export the cache for worker processes.
+
+    Contracts that fail to load are left out; workers then report the error
+    themselves when they build.
+    """
+    for filename in REACTOR_CONTRACTS.values():
+        try:
+            REACTOR_CONTRACT_CACHE.entry(reactor_contract_path(filename))
+        except Exception as exc:
+            logger.debug(f"Not exporting reactor contract '{filename}': {exc}")
+    return REACTOR_CONTRACT_CACHE.export()
 
 
 class ReactorAdapter:
@@ -119,6 +314,7 @@ class ReactorAdapter:
         reaction_type = self._resolve_reaction_type()
 
         try:
+            count_interop()
             reaction_obj = self.sim.AddReaction(
                 reaction.name,
                 reaction_type,
@@ -183,6 +379,7 @@ class ReactorAdapter:
             )
 
         try:
+            count_interop()
             reactions.Add(reaction_id)
         except Exception as exc:
             raise ReactorConfigurationError(
@@ -194,6 +391,7 @@ class ReactorAdapter:
         if not hasattr(target, attr_name):
             return False
         try:
+            count_interop()
             setattr(target, attr_name, value)
             return True
         except Exception:
@@ -229,6 +427,7 @@ class ReactorAdapter:
             return False
 
         try:
+            count_interop()
             self.reactor_obj.SetPropertyValue(prop_name, value)
             return True
         except Exception as exc:
@@ -240,19 +439,19 @@ class ReactorAdapter:
 
 
 def configure_gasifier(gasifier_obj, sim) -> None:
-    config = _load_reactor_contract("gasifier_reactions.yaml")
+    config = _load_reactor_contract(REACTOR_CONTRACTS["gasifier"])
     ReactorAdapter(gasifier_obj, sim, config).apply()
     logger.info("Gasifier configured with %d reactions.", len(config.reactions))
 
 
 def configure_pem(pem_obj, sim) -> None:
-    config = _load_reactor_contract("pem_reactions.yaml")
+    config = _load_reactor_contract(REACTOR_CONTRACTS["pem"])
     ReactorAdapter(pem_obj, sim, config).apply()
     logger.info("PEM configured with %d reactions.", len(config.reactions))
 
 
 def configure_trc(trc_obj, sim) -> None:
-    config = _load_reactor_contract("trc_reactions.yaml")
+    config = _load_reactor_contract(REACTOR_CONTRACTS["trc"])
     ReactorAdapter(trc_obj, sim, config).apply()
     logger.info("TRC configured with %d reactions.", len(config.reactions))
 
@@ -0,0 +1,196 @@
+"""
+compounds.py
+============
+Compiled compound registry: the property tables in ``constants.py`` turned
+into index-aligned vectors for one compound list.
+
+Why this exists
+---------------
+Per-stream calculations used to scan dicts — the extractor fuzzy-matched
+every compound against every molecular-weight key to get a mixture MW, and
+``MetricsCalculator`` looped over ``LHV_MJ_KG``, ``CARBON_MASS_FRACTION``
+and ``TAR_SPECIES`` for every stream.  A :class:`CompoundRegistry` looks the
+properties up once, by exact name, for the active compound set; after that
+a mixture property is a dot product of a fraction vector with a property
+vector:
+
+    mw_mix  = x · mw_g_mol
+    lhv     = w · lhv_mj_kg
+    carbon  = w · carbon_mass_fraction
+    tar     = w · is_tar
+
+Compounds missing from a table get 0 for that property (as the dict scans
+did), so an unknown compound contributes nothing.
+
+Vectors are NumPy arrays when NumPy is installed and plain tuples otherwise;
+:meth:`CompoundRegistry.dot` handles both.
+
+Usage
+-----
+    from dwsim_model.compounds import compound_registry
+
+    registry = compound_registry(flowsheet.compound_set)   # cached per list
+    x = registry.vector(stream.mole_fractions)             # or an aligned array
+    mw_mix = registry.dot(x, registry.mw_g_mol)
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from dwsim_model.constants import (
+    CARBON_MASS_FRACTION,
+    ELEMENT_ATOMS,
+    ELEMENTS,
+    LHV_MJ_KG,
+    MW_G_MOL,
+    TAR_SPECIES,
+)
+
+logger = logging.getLogger(__name__)
+
+# numpy is optional; without it the vectors are tuples.
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+#: Every compound with at least one tabulated property, in a stable order.
+KNOWN_COMPOUNDS: tuple[str, ...] = tuple(
+    dict.fromkeys([*MW_G_MOL, *LHV_MJ_KG, *CARBON_MASS_FRACTION, *sorted(TAR_SPECIES)])
+)
+
+
+def _vector(values: Sequence[float]):
+    return np.asarray(values, dtype=float) if _HAS_NUMPY else tuple(values)
+
+
+@dataclass(frozen=True, eq=False)
+class CompoundRegistry:
+    """
+    Property vectors aligned with ``names``.
+
+    Attributes
+    ----------
+    names:
+        Compound names; position ``i`` of every vector belongs to ``names[i]``.
+    mw_g_mol, lhv_mj_kg, carbon_mass_fraction:
+        Molecular weight, lower heating value and carbon mass fraction.
+    is_tar:
+        1.0 for tar surrogate species, else 0.0.
+    element_atoms:
+        ``len(names) × len(ELEMENTS)`` atoms per molecule (rows of tuples
+        without NumPy).
+    """
+
+    names: tuple[str, ...]
+    mw_g_mol: Any
+    lhv_mj_kg: Any
+    carbon_mass_fraction: Any
+    is_tar: Any
+    element_atoms: Any
+    index: dict[str, int] = field(repr=False)
+
+    @classmethod
+    def build(cls, names: Iterable[str]) -> CompoundRegistry:
+        """Look up every property of *names* in ``constants.py``."""
+        names = tuple(names)
+        missing = [n for n in names if n not in MW_G_MOL]
+        if missing:
+            logger.debug(f"No molecular weight for {missing}; they count as 0.")
+        atoms = [
+            tuple(float(ELEMENT_ATOMS.get(n, {}).get(e, 0)) for e in ELEMENTS)
+            for n in names
+        ]
+        return cls(
+            names=names,
+            mw_g_mol=_vector([MW_G_MOL.get(n, 0.0) for n in names]),
+            lhv_mj_kg=_vector([LHV_MJ_KG.get(n, 0.0) for n in names]),
+            carbon_mass_fraction=_vector(
+                [CARBON_MASS_FRACTION.get(n, 0.0) for n in names]
+            ),
+            is_tar=_vector([1.0 if n in TAR_SPECIES else 0.0 for n in names]),
+            element_atoms=(
+                np.asarray(atoms, dtype=float).reshape(len(names), len(ELEMENTS))
+                if _HAS_NUMPY
+                else tuple(atoms)
+            ),
+            index={n: i for i, n in enumerate(names)},
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def vector(self, fractions: Mapping[str, float] | Sequence[float]):
+        """
+        Return *fractions* as a vector aligned with :attr:`names`.
+
+        A mapping is scattered by name (compounds outside the registry are
+        dropped); anything else is assumed to be aligned already.
+        """
+        if not isinstance(fractions, Mapping):
+            return fractions
+        values = [0.0] * len(self.names)
+        for name, value in fractions.items():
+            i = self.index.get(name)
+            if i is not None:
+                values[i] = value
+        return _vector(values)
+
+    @staticmethod
+    def dot(a, b) -> float:
+        """Dot product of two aligned vectors (NumPy or tuples)."""
+        if _HAS_NUMPY:
+            return float(np.dot(a, b))
+        return sum(x * y for x, y in zip(a, b, strict=True))
+
+    # ── Mixture properties ──────────────────────────────────────────────────
+
+    def mixture_mw(self, mole_fractions) -> float:
+        """Mixture molecular weight (g/mol) from mole fractions."""
+        return self.dot(self.vector(mole_fractions), self.mw_g_mol)
+
+    def lhv(self, mass_fractions) -> float:
+        """Mixture LHV (MJ/kg) from mass fractions."""
+        return self.dot(self.vector(mass_fractions), self.lhv_mj_kg)
+
+    def carbon_fraction(self, mass_fractions) -> float:
+        """Carbon mass fraction of the mixture."""
+        return self.dot(self.vector(mass_fractions), self.carbon_mass_fraction)
+
+    def tar_fraction(self, mass_fractions) -> float:
+        """Mass fraction of tar surrogate species."""
+        return self.dot(self.vector(mass_fractions), self.is_tar)
+
+    def element_moles(self, mole_fractions) -> dict[str, float]:
+        """Moles of each element per mole of mixture."""
+        x = self.vector(mole_fractions)
+        if _HAS_NUMPY:
+            totals = np.asarray(x, dtype=float) @ self.element_atoms
+        else:
+            totals = [
+                sum(xi * row[j] for xi, row in zip(x, self.element_atoms, strict=True))
+                for j in range(len(ELEMENTS))
+            ]
+        return {e: float(t) for e, t in zip(ELEMENTS, totals, strict=True)}
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_registry(names: tuple[str, ...]) -> CompoundRegistry:
+    return CompoundRegistry.build(names)
+
+
+def compound_registry(names: Iterable[str] | None = None) -> CompoundRegistry:
+    """
+    Return the (cached) registry for *names*.
+
+    With no names, the registry covers :data:`KNOWN_COMPOUNDS` — suitable
+    for fraction dicts of unknown origin.
+    """
+    return _cached_registry(tuple(names) if names is not None else KNOWN_COMPOUNDS)
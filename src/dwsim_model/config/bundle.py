@@ -0,0 +1,231 @@
+"""
+config/bundle.py
+================
+Compiled config bundles: a master config resolved, validated and written
+to one binary file.
+
+Why this exists
+---------------
+``ConfigLoader`` reads ``master_config.yaml``, then every feed, reactor,
+energy, equipment and scenario sub-file it references, probes candidate
+directories for each relative path and runs Pydantic validation on the
+result.  That is repeated by every process that loads the config — the
+CLI, each sweep worker, the model server.
+
+``compile_config`` does all of that once and pickles the resolved config
+together with a fingerprint ``(mtime_ns, size, sha256)`` of every source
+file it read.  Loading a bundle is one file read; staleness is detected by
+``stat``-ing the recorded sources and re-hashing only those whose stat
+changed, so an edit to any sub-file makes the bundle stale while a mere
+``touch`` does not.
+
+A stale bundle raises :class:`StaleBundleError` from :func:`load_bundle`;
+``ConfigLoader`` catches it, logs a warning and loads the sources instead.
+
+Bundles are pickles: only load bundles you compiled yourself.
+
+Usage
+-----
+    python -m dwsim_model compile-config --config config/master_config.yaml
+    python -m dwsim_model run --config config/master_config.cfgbundle
+
+    from dwsim_model.config.bundle import compile_config, load_bundle
+
+    path = compile_config("config/master_config.yaml")
+    resolved = load_bundle(path)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from dwsim_model import __version__
+
+logger = logging.getLogger(__name__)
+
+#: File suffix that marks a compiled bundle.
+BUNDLE_SUFFIX = ".cfgbundle"
+
+#: Bump when the bundle layout changes; older bundles are rejected.
+BUNDLE_FORMAT = 1
+
+
+class StaleBundleError(ValueError):
+    """Raised when a bundle's sources changed since it was compiled."""
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Source fingerprints
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _fingerprint(path: Path) -> tuple[int, int, str]:
+    stat = path.stat()
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    return stat.st_mtime_ns, stat.st_size, digest
+
+
+def _source_changed(path: str, fingerprint: tuple[int, int, str]) -> bool:
+    mtime_ns, size, digest = fingerprint
+    try:
+        stat = os.stat(path)
+        if stat.st_mtime_ns == mtime_ns and stat.st_size == size:
+            return False
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest() != digest
+    except OSError:
+        return True
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Bundle
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class ConfigBundle:
+    """
+    A resolved config and the sources it was compiled from.
+
+    Attributes
+    ----------
+    resolved:
+        Output of ``ConfigLoader.load()`` for :attr:`config_path`.
+    config_path:
+        The master config that was compiled.
+    sources:
+        ``{path: (mtime_ns, size, sha256)}`` of every file read.
+    package_version:
+        ``dwsim_model`` version that compiled the bundle.
+    """
+
+    resolved: dict[str, Any]
+    config_path: str
+    sources: dict[str, tuple[int, int, str]]
+    package_version: str
+
+    def stale_sources(self) -> list[str]:
+        """Sources that changed or disappeared since compilation."""
+        return [
+            path
+            for path, fingerprint in self.sources.items()
+            if _source_changed(path, fingerprint)
+        ]
+
+    def check(self) -> None:
+        """
+        Raise :class:`StaleBundleError` if a source changed or the bundle
+        was compiled by another package version.
+        """
+        if self.package_version != __version__:
+            raise StaleBundleError(
+                f"Bundle of {self.config_path} was compiled by dwsim_model "
+                f"{self.package_version}"
+            )
+        stale = self.stale_sources()
+        if stale:
+            raise StaleBundleError(
+                f"Bundle of {self.config_path} is stale; changed sources: {stale}"
+            )
+
+
+def is_bundle(path: str | Path | None) -> bool:
+    """True if *path* names a compiled bundle."""
+    return path is not None and Path(path).suffix == BUNDLE_SUFFIX
+
+
+def default_bundle_path(config_path: str | Path) -> Path:
+    """``config/master_config.yaml`` → ``config/master_config.cfgbundle``."""
+    return Path(config_path).with_suffix(BUNDLE_SUFFIX)
+
+
+def compile_config(
+    config_path: str | Path | None = None, output: str | Path | None = None
+) -> Path:
+    """
+    Resolve and validate *config_path* and write it as a bundle.
+
+    Parameters
+    ----------
+    config_path:
+        Master config to compile (default: the one ``ConfigLoader`` finds).
+    output:
+        Bundle path (default: :func:`default_bundle_path`).
+
+    Returns
+    -------
+    Path of the written bundle.
+
+    Raises
+    ------
+    ValueError
+        If the config cannot be loaded or resolves to nothing.
+    """
+    from dwsim_model.config_loader import ConfigLoader
+
+    loader = ConfigLoader(config_path=config_path)
+    if loader.config_path is None or is_bundle(loader.config_path):
+        raise ValueError(f"Not a source config: {loader.config_path}")
+    resolved = loader.load()
+    if not resolved:
+        raise ValueError(f"Config {loader.config_path} resolved to nothing.")
+
+    payload = {
+        "format": BUNDLE_FORMAT,
+        "package_version": __version__,
+        "config_path": str(loader.config_path.resolve()),
+        "sources": {str(p.resolve()): _fingerprint(p) for p in loader.sources},
+        "resolved": resolved,
+    }
+    output = Path(output) if output else default_bundle_path(loader.config_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    # Write-then-rename so a concurrent reader never sees a partial bundle.
+    fd, tmp = tempfile.mkstemp(dir=output.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, output)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    logger.info(
+        f"Compiled {loader.config_path} → {output} ({len(payload['sources'])} sources)"
+    )
+    return output
+
+
+def read_bundle(path: str | Path) -> ConfigBundle:
+    """Read a bundle without checking its sources."""
+    payload = pickle.loads(Path(path).read_bytes())
+    if not isinstance(payload, dict) or payload.get("format") != BUNDLE_FORMAT:
+        raise ValueError(
+            f"{path} is not a format-{BUNDLE_FORMAT} config bundle; "
+            "recompile it with 'compile-config'."
+        )
+    return ConfigBundle(
+        resolved=payload["resolved"],
+        config_path=payload["config_path"],
+        sources=payload["sources"],
+        package_version=payload["package_version"],
+    )
+
+
+def load_bundle(path: str | Path, check: bool = True) -> dict[str, Any]:
+    """
+    Return the resolved config stored in the bundle at *path*.
+
+    Raises
+    ------
+    StaleBundleError
+        If *check* and the bundle is stale (see :meth:`ConfigBundle.check`).
+    """
+    bundle = read_bundle(path)
+    if check:
+        bundle.check()
+    return bundle.resolved
@@ -0,0 +1,189 @@
+"""
+config/overlay.py
+=================
+Copy-on-write view of a config dict: a shared base plus sparse patches.
+
+Why this exists
+---------------
+A sweep point differs from the base config in one or two values, but the
+resolved config carries full reactor YAML trees, reaction lists and
+scenario blocks.  Deep-copying all of that for every point just to change
+``feeds.Gasifier_Biomass_Feed.mass_flow_kg_s`` dominated the Python-side
+cost of large designs.
+
+``ConfigOverlay`` is a read-only ``Mapping`` over the base dict with a
+small patch map keyed by dot-path.  Reading a key returns the patched value
+if there is one, a nested overlay view if something below that key is
+patched, and the base object itself otherwise.  The base is never copied
+or modified.
+
+Everything that reads configs (``ConfigLoader``, ``GasificationFlowsheet``,
+``_get_nested`` / ``_set_nested`` in the sweep engine) accepts any
+``Mapping``, so an overlay can be passed wherever a config dict is
+expected.
+
+Usage
+-----
+    from dwsim_model.config.overlay import ConfigOverlay
+
+    cfg = ConfigOverlay(base_config)
+    cfg.set("feeds.Gasifier_Biomass_Feed.mass_flow_kg_s", 9.0)
+    cfg["feeds"]["Gasifier_Biomass_Feed"]["mass_flow_kg_s"]   # 9.0
+    base_config["feeds"]["Gasifier_Biomass_Feed"]["mass_flow_kg_s"]  # unchanged
+
+Consumers must treat values read from an overlay as read-only: unpatched
+branches are the base's own objects.  Call ``to_dict()`` for an
+independent plain-dict copy.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+
+class _Patched:
+    """Leaf of the patch tree: holds a replacement value."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __reduce__(self):
+        return (_Patched, (self.value,))
+
+
+class ConfigOverlay(Mapping):
+    """
+    Read-only mapping of *base* with dot-path *patches* applied on top.
+
+    Parameters
+    ----------
+    base:
+        The shared config dict.  Never modified.
+    patches:
+        Optional ``{dot_path: value}`` patches, applied with :meth:`set`.
+    """
+
+    def __init__(
+        self,
+        base: Mapping[str, Any] | None = None,
+        patches: Mapping[str, Any] | None = None,
+    ):
+        self._base: Mapping[str, Any] = base if base is not None else {}
+        # Nested dict mirroring the config structure; leaves are _Patched.
+        self._tree: dict[str, Any] = {}
+        self.patches: dict[str, Any] = {}
+        self._is_view = False
+        for path, value in (patches or {}).items():
+            self.set(path, value)
+
+    @classmethod
+    def _view(cls, base: Mapping[str, Any], tree: dict[str, Any]) -> ConfigOverlay:
+        view = cls.__new__(cls)
+        view._base = base
+        view._tree = tree
+        view.patches = {}
+        view._is_view = True
+        return view
+
+    # ── Mapping protocol ─────────────────────────────────────────────────
+
+    def __getitem__(self, key: str) -> Any:
+        node = self._tree.get(key)
+        if isinstance(node, _Patched):
+            return node.value
+        value = self._base[key]  # KeyError propagates for unknown keys
+        if node is not None and isinstance(value, Mapping):
+            return self._view(value, node)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._base
+        for key, node in self._tree.items():
+            if key not in self._base and isinstance(node, _Patched):
+                yield key
+
+    def __len__(self) -> int:
+        extra = sum(
+            1
+            for key, node in self._tree.items()
+            if key not in self._base and isinstance(node, _Patched)
+        )
+        return len(self._base) + extra
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._base or isinstance(self._tree.get(key), _Patched)
+
+    def __repr__(self) -> str:
+        return f"ConfigOverlay({len(self.patches)} patches over {len(self._base)} keys)"
+
+    # ── Patching ─────────────────────────────────────────────────────────
+
+    def set(self, dot_path: str, value: Any) -> ConfigOverlay:
+        """
+        Patch *dot_path* to *value* without touching the base.
+
+        Same rules as ``_set_nested``: every intermediate key must already
+        exist (``KeyError`` otherwise); the final key may be new.  Only
+        the top-level overlay can be patched, not the nested views it
+        hands out.
+        """
+        if self._is_view:
+            raise TypeError("Nested config views are read-only; patch the root.")
+        # Re-inserting keeps ``patches`` in application order for replay.
+        self.patches.pop(dot_path, None)
+        keys = dot_path.split(".")
+        view: Mapping[str, Any] = self
+        tree = self._tree
+        for depth, key in enumerate(keys[:-1]):
+            if key not in view or not isinstance(view[key], Mapping):
+                raise KeyError(
+                    f"Path '{dot_path}' not found in config — missing key '{key}'."
+                )
+            node = tree.get(key)
+            if isinstance(node, _Patched):
+                # A whole sub-dict was replaced earlier; patch inside a copy.
+                replaced = copy.deepcopy(dict(node.value))
+                _set_in_plain(replaced, keys[depth + 1 :], value, dot_path)
+                tree[key] = _Patched(replaced)
+                self.patches[dot_path] = value
+                return self
+            view = view[key]
+            tree = tree.setdefault(key, {})
+        tree[keys[-1]] = _Patched(value)
+        self.patches[dot_path] = value
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return an independent, fully materialised plain-dict copy."""
+        return {
+            key: value.to_dict()
+            if isinstance(value, ConfigOverlay)
+            else copy.deepcopy(value)
+            for key, value in self.items()
+        }
+
+    @property
+    def base(self) -> Mapping[str, Any]:
+        return self._base
+
+    # Pickle / deepcopy as base + patches so the tree is rebuilt consistently.
+    def __reduce__(self):
+        if self._is_view:
+            # A nested view has no patch list of its own; materialise it.
+            return (dict, (self.to_dict(),))
+        return (ConfigOverlay, (self._base, dict(self.patches)))
+
+
+def _set_in_plain(d: dict, keys: list[str], value: Any, dot_path: str) -> None:
+    node = d
+    for key in keys[:-1]:
+        if not isinstance(node.get(key), dict):
+            raise KeyError(
+                f"Path '{dot_path}' not found in config — missing key '{key}'."
+            )
+        node = node[key]
+    node[keys[-1]] = value
@@ -19,16 +19,18 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
+from dwsim_model.chemistry.reactions import REACTOR_CONTRACT_CACHE
 from dwsim_model.config.schema import (
     MasterConfig,
     ScenarioConfig,
     validate_master_config,
-    validate_reactor_config,
     validate_stream_config,
 )
+from dwsim_model.profiling import count_interop, span
 
 logger = logging.getLogger(__name__)
 
@@ -76,23 +78,41 @@ def _load_file(path: Path) -> dict:
             raise ValueError(f"Unsupported config format: {suffix}")
 
 
-def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+def _deep_merge(base: Mapping[str, Any], override: Mapping[str, Any]) -> dict[str, Any]:
     """Recursively merge *override* into *base* and return the merged dict."""
     merged = dict(base)
     for key, value in override.items():
         current = merged.get(key)
-        if isinstance(current, dict) and isinstance(value, dict):
+        if isinstance(current, Mapping) and isinstance(value, Mapping):
             merged[key] = _deep_merge(current, value)
         else:
             merged[key] = value
     return merged
 
 
-def _is_runtime_config(raw: dict[str, Any]) -> bool:
+def _temperature_K(props: Mapping[str, Any]) -> float | None:
+    """Feed temperature in K from ``temperature_C`` or ``temperature_K``."""
+    if "temperature_C" in props:
+        return float(props["temperature_C"]) + 273.15
+    if "temperature_K" in props:
+        return float(props["temperature_K"])
+    return None
+
+
+def _normalised_components(props: Mapping[str, Any]) -> dict[str, float]:
+    """A feed's ``components`` scaled to sum to 1 ({} if empty or all zero)."""
+    components = props.get("components") or {}
+    total = sum(float(v) for v in components.values())
+    if not total:
+        return {}
+    return {c: float(f) / total for c, f in components.items()}
+
+
+def _is_runtime_config(raw: Mapping[str, Any]) -> bool:
     """Return True when the config is already expanded to stream dictionaries."""
     feeds = raw.get("feeds")
-    if isinstance(feeds, dict) and feeds:
-        return all(isinstance(value, dict) for value in feeds.values())
+    if isinstance(feeds, Mapping) and feeds:
+        return all(isinstance(value, Mapping) for value in feeds.values())
     return "energy_streams" in raw
 
 
@@ -109,13 +129,23 @@ class ConfigLoader:
     ----------
     config_path:
         Explicit path to the config file.  If None, the loader searches for a
-        default config (see :func:`_find_default_config`).
+        default config (see :func:`_find_default_config`).  A compiled
+        ``.cfgbundle`` (see ``config/bundle.py``) is loaded in one read.
+    config_data:
+        Optional in-memory config used instead of reading *config_path*.
+        Any mapping is accepted, including a copy-on-write
+        ``ConfigOverlay``; only its top level is copied.
+
+    Attributes
+    ----------
+    sources:
+        Every file read by the last :meth:`load`.
     """
 
     def __init__(
         self,
         config_path: str | Path | None = None,
-        config_data: dict[str, Any] | None = None,
+        config_data: Mapping[str, Any] | None = None,
     ):
         if config_path is not None:
             self.config_path: Path | None = Path(config_path)
@@ -124,12 +154,14 @@ class ConfigLoader:
 
         self._config_data = dict(config_data) if config_data is not None else None
         self.config: dict[str, Any] = {}
+        self.sources: list[Path] = []
         self._errors: list[str] = []
 
     # ─────────────────────────────────────────────────────────────────────────
 
     def load(self) -> dict:
         """Load and return the configuration dictionary."""
+        self.sources = []
         if self._config_data is not None:
             self.config = self._resolve_sub_configs(self._config_data)
             logger.info(
@@ -146,9 +178,17 @@ class ConfigLoader:
             )
             return {}
 
+        from dwsim_model.config.bundle import is_bundle
+
+        if is_bundle(self.config_path):
+            resolved = self._load_bundle()
+            if resolved is not None:
+                self.config = resolved
+                return self.config
+
         logger.info(f"Loading config from: {self.config_path}")
         try:
-            raw = _load_file(self.config_path)
+            raw = self._read(self.config_path)
         except Exception as exc:
             logger.error(f"Failed to read config file {self.config_path}: {exc}")
             return {}
@@ -161,6 +201,30 @@ class ConfigLoader:
         )
         return self.config
 
+    def _load_bundle(self) -> dict | None:
+        """
+        Load a compiled bundle; None after switching to its stale sources.
+        """
+        from dwsim_model.config.bundle import StaleBundleError, read_bundle
+
+        bundle = read_bundle(self.config_path)
+        try:
+            bundle.check()
+        except StaleBundleError as exc:
+            logger.warning(
+                f"{exc} — loading {bundle.config_path} instead; "
+                "rerun 'compile-config' to refresh the bundle."
+            )
+            self.config_path = Path(bundle.config_path)
+            return None
+        logger.info(f"Config loaded from bundle: {self.config_path}")
+        return bundle.resolved
+
+    def _read(self, path: Path) -> dict:
+        """Read one config file and record it in :attr:`sources`."""
+        self.sources.append(path)
+        return _load_file(path)
+
     # ─────────────────────────────────────────────────────────────────────────
 
     def _resolve_sub_configs(self, raw: dict) -> dict:
@@ -196,25 +260,29 @@ class ConfigLoader:
         }
 
         for _section, sub_path in master.feeds.items():
-            sub = _load_file(self._resolve_ref_path(sub_path))
+            sub = self._read(self._resolve_ref_path(sub_path))
             for stream_name, props in sub.items():
                 if isinstance(props, dict):
                     resolved["feeds"][stream_name] = props
 
         for reactor_name, sub_path in master.reactors.items():
-            sub = _load_file(self._resolve_ref_path(sub_path))
+            # Reactor contracts are parsed once per process (see
+            # chemistry/reactions.py); each load gets its own copy.
+            path = self._resolve_ref_path(sub_path)
+            self.sources.append(path)
+            sub = REACTOR_CONTRACT_CACHE.raw(path)
             resolved["reactors"][reactor_name] = sub
 
         if master.energy:
-            energy_data = _load_file(self._resolve_ref_path(master.energy))
+            energy_data = self._read(self._resolve_ref_path(master.energy))
             resolved["energy_streams"].update(energy_data.get("energy_streams", {}))
 
         if master.equipment:
-            resolved["equipment"] = _load_file(self._resolve_ref_path(master.equipment))
+            resolved["equipment"] = self._read(self._resolve_ref_path(master.equipment))
 
         scenario_ref = raw.get("scenario")
         if scenario_ref:
-            scenario_data = _load_file(self._resolve_ref_path(str(scenario_ref)))
+            scenario_data = self._read(self._resolve_ref_path(str(scenario_ref)))
             resolved["scenario"] = self._validate_scenario_config(
                 scenario_data
             ).model_dump()
@@ -260,12 +328,9 @@ class ConfigLoader:
             validate_stream_config(props, stream_name=stream_name)
 
         for reactor_name, reactor_block in resolved.get("reactors", {}).items():
-            reactor_payload = dict(reactor_block.get("reactor", {}))
-            reactor_payload["reactions"] = reactor_block.get("reactions", [])
-            validate_reactor_config(
-                reactor_payload,
-                reactor_name=reactor_payload.get("name", reactor_name),
-            )
+            # Memoized by content: blocks no override touched are not
+            # validated again.
+            REACTOR_CONTRACT_CACHE.validate(reactor_block, reactor_name=reactor_name)
 
     # ─────────────────────────────────────────────────────────────────────────
 
@@ -274,7 +339,8 @@ class ConfigLoader:
         builder,
         materials: dict,
         energy_streams: dict,
-    ) -> None:
+        previous: Mapping[str, Any] | None = None,
+    ) -> list[str]:
         """
         Push loaded configuration values into DWSIM stream objects.
 
@@ -288,30 +354,66 @@ class ConfigLoader:
             Dict mapping stream name → DWSIM EnergyStream object.
             NOTE: The original code passed ``b.energies`` here — that attribute
             does not exist.  The correct attribute is ``b.energy_streams``.
+        previous:
+            Resolved config last applied to these same stream objects.  When
+            given, only values that differ from it are written: each
+            temperature, pressure, mass flow, mole fraction and energy value
+            is compared on its own, and compounds dropped from a feed's
+            ``components`` are set to 0.  Streams absent from the current
+            config are left untouched (DWSIM has no "unset").  Failed
+            writes are collected in ``_errors``; a caller that tracks
+            *previous* must not treat the config as applied when there are
+            any, or the failed values are never retried.
+
+        Returns
+        -------
+        Names of the streams that received at least one write.
         """
         if not self.config:
             logger.debug("apply_to_flowsheet: config is empty, nothing to apply.")
-            return
+            return []
+
+        prev_feeds = prev_energy = None
+        if previous is not None:
+            prev_feeds = previous.get("feeds") or {}
+            prev_energy = previous.get("energy_streams") or {}
 
         self._errors = []
-        self._apply_material_streams(materials, self.config.get("feeds", {}))
-        self._apply_energy_streams(
-            energy_streams, self.config.get("energy_streams", {})
-        )
+        with span("apply_config"):
+            changed = self._apply_material_streams(
+                materials, self.config.get("feeds", {}), prev_feeds
+            )
+            changed += self._apply_energy_streams(
+                energy_streams, self.config.get("energy_streams", {}), prev_energy
+            )
 
         if self._errors:
             logger.warning(
                 f"Config application finished with {len(self._errors)} error(s):\n"
                 + "\n".join(f"  • {e}" for e in self._errors)
             )
+        elif previous is not None:
+            logger.debug(f"Config diff applied to {len(changed)} stream(s).")
         else:
             logger.info("All config values applied successfully.")
+        return changed
 
     # ─────────────────────────────────────────────────────────────────────────
 
-    def _apply_material_streams(self, materials: dict, feeds: dict) -> None:
-        """Apply T, P, flow, and composition to material streams."""
+    def _apply_material_streams(
+        self, materials: dict, feeds: dict, previous: Mapping | None = None
+    ) -> list[str]:
+        """
+        Apply T, P, flow, and composition to material streams.
+
+        With *previous* (the feeds applied last time) only changed values
+        are written.  Returns the streams that were written.
+        """
+        changed: list[str] = []
         for stream_name, props in feeds.items():
+            before = None if previous is None else previous.get(stream_name, {})
+            if before is not None and before == props:
+                continue
             if stream_name not in materials:
                 self._errors.append(
                     f"Stream '{stream_name}' in config not found in flowsheet."
@@ -320,60 +422,103 @@ class ConfigLoader:
 
             stream = materials[stream_name]
             try:
-                self._set_stream_conditions(stream, stream_name, props)
-                self._set_stream_composition(stream, stream_name, props)
+                wrote = self._set_stream_conditions(stream, stream_name, props, before)
+                wrote |= self._set_stream_composition(
+                    stream, stream_name, props, before
+                )
             except Exception as exc:
                 self._errors.append(f"{stream_name}: {exc}")
+                wrote = True  # partially written — treat as changed
+            if wrote:
+                changed.append(stream_name)
+        return changed
+
+    def _set_stream_conditions(
+        self, stream, name: str, props: Mapping, before: Mapping | None = None
+    ) -> bool:
+        """
+        Set T, P, and mass-flow on a material stream.
 
-    def _set_stream_conditions(self, stream, name: str, props: dict) -> None:
-        """Set T, P, and mass-flow on a material stream."""
-        if "temperature_C" in props:
-            t_k = float(props["temperature_C"]) + 273.15
+        Values equal to those in *before* are skipped.  Returns True if
+        anything was written.
+        """
+        wrote = False
+        t_k = _temperature_K(props)
+        if t_k is not None and (before is None or t_k != _temperature_K(before)):
+            count_interop()
             stream.SetPropertyValue("Temperature", t_k)
-            logger.debug(f"{name}: T = {props['temperature_C']} °C ({t_k:.2f} K)")
-        elif "temperature_K" in props:
-            stream.SetPropertyValue("Temperature", float(props["temperature_K"]))
-
-        if "pressure_Pa" in props:
-            stream.SetPropertyValue("Pressure", float(props["pressure_Pa"]))
-
-        if "mass_flow_kg_s" in props:
-            stream.SetPropertyValue("MassFlow", float(props["mass_flow_kg_s"]))
-
-    def _set_stream_composition(self, stream, name: str, props: dict) -> None:
+            logger.debug(f"{name}: T = {t_k:.2f} K")
+            wrote = True
+
+        for key, prop_name in (
+            ("pressure_Pa", "Pressure"),
+            ("mass_flow_kg_s", "MassFlow"),
+        ):
+            if key not in props:
+                continue
+            value = float(props[key])
+            if before is not None and key in before and float(before[key]) == value:
+                continue
+            count_interop()
+            stream.SetPropertyValue(prop_name, value)
+            wrote = True
+        return wrote
+
+    def _set_stream_composition(
+        self, stream, name: str, props: Mapping, before: Mapping | None = None
+    ) -> bool:
         """
         Apply mole fractions from a ``components`` dict.
 
         Fractions are normalised if they don't sum to exactly 1.0
-        (tolerance ±0.02).
+        (tolerance ±0.02).  With *before*, only fractions that differ from
+        its normalised composition are written, and compounds it had but
+        *props* lacks are set to 0.  Returns True if anything was written.
         """
-        components: dict = props.get("components", {})
+        components: Mapping = props.get("components", {})
         if not components:
-            return
+            return False
+        if before is not None and before.get("components") == components:
+            return False
 
         total = sum(float(v) for v in components.values())
         if total == 0:
             self._errors.append(f"{name}: all component fractions are zero — skipped.")
-            return
+            return False
 
         if abs(total - 1.0) > 0.02:
             logger.warning(
                 f"{name}: component fractions sum to {total:.4f} — normalising."
             )
 
-        for compound, fraction in components.items():
-            norm_frac = float(fraction) / total
+        fractions = {c: float(f) / total for c, f in components.items()}
+        old = _normalised_components(before) if before is not None else {}
+        for compound in old:
+            fractions.setdefault(compound, 0.0)
+
+        wrote = False
+        for compound, norm_frac in fractions.items():
+            if before is not None and old.get(compound) == norm_frac:
+                continue
             try:
+                count_interop()
                 stream.SetPropertyValue(f"MoleFraction.{compound}", norm_frac)
                 logger.debug(f"{name}: x({compound}) = {norm_frac:.4f}")
+                wrote = True
             except Exception as exc:
-                logger.warning(
+                self._errors.append(
                     f"{name}: could not set fraction for '{compound}': {exc}"
                 )
+        return wrote
 
-    def _apply_energy_streams(self, energy_streams: dict, energy_config: dict) -> None:
-        """Apply power values to energy streams."""
+    def _apply_energy_streams(
+        self, energy_streams: dict, energy_config: dict, previous: Mapping | None = None
+    ) -> list[str]:
+        """Apply power values to energy streams (only changed ones with *previous*)."""
+        changed: list[str] = []
         for e_name, e_val in energy_config.items():
+            if previous is not None and previous.get(e_name) == e_val:
+                continue
             if e_name not in energy_streams:
                 self._errors.append(
                     f"Energy stream '{e_name}' in config not found in flowsheet."
@@ -382,16 +527,20 @@ class ConfigLoader:
             try:
                 self._set_energy_stream_value(energy_streams[e_name], float(e_val))
                 logger.info(f"Applied {e_val} W to energy stream '{e_name}'.")
+                changed.append(e_name)
             except Exception as exc:
                 self._errors.append(f"Energy stream {e_name}: {exc}")
+        return changed
 
     @staticmethod
     def _set_energy_stream_value(stream, value_watts: float) -> None:
         """Apply an energy flow using the DWSIM property identifier supported by the runtime."""
         try:
+            count_interop()
             stream.SetPropertyValue("PROP_ES_0", value_watts / 1000.0)
             return
         except Exception:
             pass
 
+        count_interop()
         stream.SetPropertyValue("EnergyFlow", value_watts)
@@ -56,6 +56,79 @@ COMPOUNDS_EXTENDED = (
     SYNGAS_CORE + C2_HYDROCARBONS + TAR_SURROGATES + TRACE_CONTAMINANTS + INERTS[:1]
 )
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Compound properties  (compiled into arrays by dwsim_model.compounds)
+# ─────────────────────────────────────────────────────────────────────────────
+
+#: Lower Heating Values (MJ/kg) for key fuel species.
+#: Sources: Perry's Chemical Engineers Handbook, 8th Ed.
+LHV_MJ_KG: dict[str, float] = {
+    "Hydrogen": 119.96,
+    "Carbon monoxide": 10.10,
+    "Methane": 50.05,
+    "Ethylene": 47.19,
+    "Ethane": 47.48,
+    "Acetylene": 48.22,
+    "Naphthalene": 39.85,
+    "Toluene": 40.94,
+}
+
+#: Molecular weights (g/mol) of every compound in the registry above.
+MW_G_MOL: dict[str, float] = {
+    "Hydrogen": 2.016,
+    "Carbon monoxide": 28.010,
+    "Methane": 16.043,
+    "Carbon dioxide": 44.010,
+    "Water": 18.015,
+    "Nitrogen": 28.014,
+    "Oxygen": 32.000,
+    "Helium": 4.003,
+    "Argon": 39.948,
+    "Ethylene": 28.053,
+    "Ethane": 30.069,
+    "Acetylene": 26.038,
+    "Naphthalene": 128.174,
+    "Toluene": 92.140,
+    "Hydrogen sulfide": 34.081,
+    "Ammonia": 17.031,
+}
+
+#: Carbon mass fraction by species for surrogate and product streams.
+CARBON_MASS_FRACTION: dict[str, float] = {
+    "Carbon monoxide": 12.011 / 28.010,
+    "Carbon dioxide": 12.011 / 44.010,
+    "Methane": 12.011 / 16.043,
+    "Ethylene": 24.022 / 28.053,
+    "Ethane": 24.022 / 30.069,
+    "Acetylene": 24.022 / 26.038,
+    "Naphthalene": 120.110 / 128.174,
+    "Toluene": 84.077 / 92.140,
+}
+
+#: Elements tracked in :data:`ELEMENT_ATOMS`, in column order.
+ELEMENTS = ("C", "H", "O", "N", "S")
+
+#: Atoms of each element per molecule (omitted elements are zero).
+ELEMENT_ATOMS: dict[str, dict[str, int]] = {
+    "Hydrogen": {"H": 2},
+    "Carbon monoxide": {"C": 1, "O": 1},
+    "Methane": {"C": 1, "H": 4},
+    "Carbon dioxide": {"C": 1, "O": 2},
+    "Water": {"H": 2, "O": 1},
+    "Nitrogen": {"N": 2},
+    "Oxygen": {"O": 2},
+    "Ethylene": {"C": 2, "H": 4},
+    "Ethane": {"C": 2, "H": 6},
+    "Acetylene": {"C": 2, "H": 2},
+    "Naphthalene": {"C": 10, "H": 8},
+    "Toluene": {"C": 7, "H": 8},
+    "Hydrogen sulfide": {"H": 2, "S": 1},
+    "Ammonia": {"N": 1, "H": 3},
+}
+
+#: Tar surrogate species counted by the tar-loading KPI.
+TAR_SPECIES = {"Naphthalene", "Toluene", "Phenol", "Benzene"}
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Default property packages
 # ─────────────────────────────────────────────────────────────────────────────
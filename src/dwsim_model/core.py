@@ -1,6 +1,11 @@
 import logging
 import os
 import sys
+import time
+from collections.abc import Iterable
+
+from dwsim_model.profiling import count_interop, span
+from dwsim_model.topology import downstream_order
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +16,12 @@ _ObjectType = None
 
 
 def get_automation(dwsim_path: str | None = None):
+    """
+    Return the process-wide ``(Automation3, ObjectType)`` pair.
+
+    With ``DWSIM_BACKEND=fake`` the pure-Python stand-in from
+    ``dwsim_model.fake_backend`` is returned instead of loading DWSIM.
+    """
     if dwsim_path is None:
         dwsim_path = os.environ.get("DWSIM_PATH", r"C:\Users\diete\AppData\Local\DWSIM")
 
@@ -18,6 +29,14 @@ def get_automation(dwsim_path: str | None = None):
     if _interf is not None:
         return _interf, _ObjectType
 
+    if os.environ.get("DWSIM_BACKEND", "").strip().lower() == "fake":
+        from dwsim_model.fake_backend import FakeAutomation, ObjectType
+
+        _interf = FakeAutomation.from_env()
+        _ObjectType = ObjectType
+        logger.info("Using the fake DWSIM backend (simulated, not a process model).")
+        return _interf, _ObjectType
+
     if dwsim_path not in sys.path:
         sys.path.append(dwsim_path)
 
@@ -54,12 +73,19 @@ class FlowsheetBuilder:
         self.materials: dict[str, object] = {}
         self.energy_streams: dict[str, object] = {}
         self.operations: dict[str, object] = {}
+        # (source, target) object names of every connection, used to find
+        # what lies downstream of a changed stream.
+        self.connections: list[tuple[str, str]] = []
+        self._names: dict[int, str] = {}
+        # Wall time of the last full solve.
+        self.last_solve_s: float | None = None
 
     def add_compound(self, name: str) -> None:
         """Add a compound to the simulation."""
         if not name:
             raise ValueError("Compound name cannot be empty")
         try:
+            count_interop()
             self.sim.AddCompound(name)
             logger.debug(f"Added compound '{name}' to the simulation.")
         except Exception as e:
@@ -77,6 +103,7 @@ class FlowsheetBuilder:
                     f"Package {package_name} not found. Available: {list(pp_dict)}"
                 )
             prop_pack = pp_dict[package_name]
+            count_interop()
             self.sim.AddPropertyPackage(prop_pack)
             logger.debug(f"Added property package '{package_name}'.")
             return prop_pack
@@ -92,6 +119,7 @@ class FlowsheetBuilder:
             raise ValueError("Object type and name cannot be empty")
         try:
             ot = getattr(self.ObjectType, obj_type_name)
+            count_interop()
             obj = self.sim.AddObject(ot, x, y, name)
             if hasattr(obj, "GraphicObject") and obj.GraphicObject is not None:
                 try:
@@ -101,6 +129,7 @@ class FlowsheetBuilder:
                         f"Exception setting GraphicObject.ShowObjectData: {exc}"
                     )  # AUTO-FIXED
 
+            self._names[id(obj)] = name
             if obj_type_name == "MaterialStream":
                 self.materials[name] = obj
             elif obj_type_name == "EnergyStream":
@@ -126,9 +155,13 @@ class FlowsheetBuilder:
         try:
             source_graphic = source_obj.GraphicObject
             target_graphic = target_obj.GraphicObject
+            count_interop(3)
             self.sim.ConnectObjects(
                 source_graphic, target_graphic, source_port, target_port
             )
+            self.connections.append(
+                (self._name_of(source_obj), self._name_of(target_obj))
+            )
             logger.debug(
                 f"Connected {source_obj} to {target_obj} (ports {source_port}->{target_port})."
             )
@@ -136,18 +169,88 @@ class FlowsheetBuilder:
             logger.error(f"Failed to connect {source_obj} to {target_obj}: {e}")
             raise RuntimeError(f"Failed to connect {source_obj} to {target_obj}: {e}")
 
-    def calculate(self) -> None:
-        """Run the simulation flowsheet."""
+    def _name_of(self, obj) -> str:
+        name = self._names.get(id(obj))
+        if name is None:
+            name = str(obj.GraphicObject.Tag)
+        return name
+
+    def calculate(self, changed: Iterable[str] | None = None) -> None:
+        """
+        Run the simulation flowsheet.
+
+        With *changed* (names of streams whose inputs were modified since the
+        last converged solve) only those streams and the objects downstream
+        of them are recalculated; everything upstream keeps its converged
+        state.  Falls back to a full solve if that is not possible.
+        """
+        self.last_solve_s = None
+        if changed is not None and self._calculate_downstream(changed):
+            return
+
         # CalculateFlowsheet2 handles IFlowsheet cleanly in older Pythonnet bindings
         try:
             logger.info("Starting flowsheet calculation.")
-            self.interf.CalculateFlowsheet2(self.sim)
+            start = time.perf_counter()
+            with span("solve"):
+                count_interop()
+                self.interf.CalculateFlowsheet2(self.sim)
+            self.last_solve_s = time.perf_counter() - start
             logger.info("Flowsheet calculation finished successfully.")
         except Exception as e:
             # This handles DWSIM solver exceptions nicely
             logger.error(f"DWSIM solver returned an error: {e}")
             raise RuntimeError(f"DWSIM solver returned an error: {e}")
 
+    def _calculate_downstream(self, changed: Iterable[str]) -> bool:
+        """
+        Recalculate *changed* and its downstream objects in dependency order.
+
+        Returns False (after logging why) when the caller should run the
+        full solver instead.
+        """
+        changed = set(changed)
+        objects = {**self.materials, **self.energy_streams, **self.operations}
+        unknown = changed - set(objects)
+        if unknown:
+            logger.info(
+                f"Downstream solve: unknown objects {sorted(unknown)} — "
+                "running full solve."
+            )
+            return False
+        if not self.connections:
+            logger.info("Downstream solve: no connection graph — running full solve.")
+            return False
+
+        # Energy streams hang off their unit operation (unit → stream), so a
+        # changed duty has to recalculate the unit that consumes it.
+        changed |= {
+            source
+            for source, target in self.connections
+            if target in changed
+            and target in self.energy_streams
+            and source in self.operations
+        }
+        order = downstream_order(self.connections, changed)
+        if order is None:
+            logger.info("Changed streams feed a recycle loop — running full solve.")
+            return False
+
+        logger.info(
+            f"Downstream solve: recalculating {len(order)} of {len(objects)} objects."
+        )
+        with span("solve"):
+            try:
+                for name in order:
+                    count_interop()
+                    objects[name].Calculate()
+            except Exception as e:
+                logger.warning(
+                    f"Downstream solve failed at '{name}': {e} — running full solve."
+                )
+                return False
+        return True
+
     def save(self, filepath: str) -> None:
         """Save the flowsheet to a .dwxml or .dwsjson file for GUI visualization."""
         try:
@@ -158,3 +261,83 @@ class FlowsheetBuilder:
         except Exception as e:
             logger.error(f"Failed to save flowsheet to {filepath}: {e}")
             raise RuntimeError(f"Failed to save flowsheet: {e}")
+
+    def load(self, filepath: str) -> None:
+        """
+        Replace the current flowsheet with one written by :meth:`save`.
+
+        The ``materials`` / ``energy_streams`` / ``operations`` dicts are
+        rebuilt from the loaded objects by name (see :meth:`rebind`).
+        """
+        abs_path = os.path.abspath(filepath)
+        try:
+            count_interop()
+            sim = self.interf.LoadFlowsheet(abs_path)
+        except Exception as e:
+            logger.error(f"Failed to load flowsheet from {abs_path}: {e}")
+            raise RuntimeError(f"Failed to load flowsheet: {e}")
+        if sim is None:
+            raise RuntimeError(f"Failed to load flowsheet: {abs_path} returned None")
+
+        previous = self.sim
+        self.sim = sim
+        try:
+            self.rebind()
+        except Exception as e:
+            self.sim = previous
+            logger.error(f"Could not rebind objects loaded from {abs_path}: {e}")
+            raise RuntimeError(f"Failed to load flowsheet: {e}")
+        logger.info(
+            f"Loaded flowsheet from {abs_path}: {len(self.materials)} material "
+            f"streams, {len(self.energy_streams)} energy streams, "
+            f"{len(self.operations)} operations."
+        )
+
+    def rebind(self) -> None:
+        """Rebuild the name → object dicts from the objects in ``self.sim``."""
+        materials: dict[str, object] = {}
+        energy_streams: dict[str, object] = {}
+        operations: dict[str, object] = {}
+        names: dict[int, str] = {}
+        graphics = []
+
+        count_interop()
+        for obj in list(self.sim.SimulationObjects.Values):
+            count_interop(2)
+            graphic = obj.GraphicObject
+            name = str(graphic.Tag)
+            names[id(obj)] = name
+            graphics.append((name, graphic))
+            if graphic.ObjectType == self.ObjectType.MaterialStream:
+                materials[name] = obj
+            elif graphic.ObjectType == self.ObjectType.EnergyStream:
+                energy_streams[name] = obj
+            else:
+                operations[name] = obj
+
+        self.materials = materials
+        self.energy_streams = energy_streams
+        self.operations = operations
+        self._names = names
+        self.connections = self._read_connections(graphics)
+
+    @staticmethod
+    def _read_connections(graphics) -> list[tuple[str, str]]:
+        """Recover ``(source, target)`` pairs from loaded graphic objects."""
+        connections = []
+        for name, graphic in graphics:
+            connectors = list(getattr(graphic, "OutputConnectors", None) or [])
+            energy = getattr(graphic, "EnergyConnector", None)
+            if energy is not None:
+                connectors.append(energy)
+            for connector in connectors:
+                try:
+                    if not connector.IsAttached:
+                        continue
+                    count_interop()
+                    target = connector.AttachedConnector.AttachedTo.Tag
+                except Exception as exc:
+                    logger.debug(f"Could not read a connector of '{name}': {exc}")
+                    continue
+                connections.append((name, str(target)))
+        return connections
@@ -0,0 +1,814 @@
+"""
+fake_backend.py
+===============
+Pure-Python stand-in for the DWSIM ``Automation3`` runtime.
+
+Why this exists
+---------------
+Outside Windows/DWSIM the only backend has been the ``MagicMock`` patching
+in ``tests/conftest.py``, which returns mocks instead of numbers.  That is
+enough for contract tests but useless for benchmarking or load-testing the
+Python side of the pipeline — config application, extraction, metrics,
+sweeps, caches and reporting.
+
+``FakeAutomation`` implements the part of the ``Automation3`` / flowsheet
+surface this package uses (``CreateFlowsheet``, ``AddObject``,
+``ConnectObjects``, ``SetPropertyValue`` / ``GetPropertyValue``,
+``CalculateFlowsheet2``, ``SaveFlowsheet`` / ``LoadFlowsheet`` …) and
+solves the flowsheet with simple mass and energy balances:
+
+* Mixer               — sums component mass flows; mass-weighted temperature,
+                        lowest inlet pressure.
+* Heater / Compressor — add the attached energy stream's |duty|.
+* Cooler              — removes the attached energy stream's |duty|.
+* Reactors            — each attached reaction moves ``conversion`` of its
+                        base component's mass to CO/H₂ (mass is conserved);
+                        outlet at the reactor temperature/pressure if set.
+                        The ash proxy (Helium) leaves through port 1.
+* Separators          — SolidSeparator sends Helium, ComponentSeparator
+                        sends Water to port 1.
+
+The numbers are plausible in magnitude and conserve mass exactly, but they
+are **not** a process model — use them for throughput and profiling only.
+
+Equilibrium, Gibbs and PFR reactors mimic an iterative solver: the number
+of iterations grows with the distance between the outlet stream's current
+state (the initial estimate) and the solution; with
+``iteration_latency_s`` set, warm starts therefore solve measurably faster.
+
+Simulated latency
+-----------------
+``solve_latency_s`` is slept per ``CalculateFlowsheet2`` call (spread over
+the unit operations when objects are recalculated one at a time) and
+``call_latency_s`` per interop call, to mimic the pythonnet crossing cost,
+and ``iteration_latency_s`` per reactor iteration.  All default to 0 and
+can be set through ``DWSIM_FAKE_SOLVE_LATENCY_S``,
+``DWSIM_FAKE_CALL_LATENCY_S`` and ``DWSIM_FAKE_ITERATION_LATENCY_S``.
+
+Usage
+-----
+    DWSIM_BACKEND=fake python -m dwsim_model run
+    python -m dwsim_model --backend fake sweep --param ... --workers 4
+
+    from dwsim_model.fake_backend import use_fake_backend
+
+    use_fake_backend(solve_latency_s=0.5)
+    runner = WarmModelRunner()            # or any other runner / the CLI
+"""
+
+from __future__ import annotations
+
+import enum
+import itertools
+import json
+import logging
+import math
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from dwsim_model.constants import KELVIN_OFFSET, MW_G_MOL, STANDARD_PRESSURE_PA
+
+logger = logging.getLogger(__name__)
+
+#: Environment variable read by ``core.get_automation`` to pick a backend.
+BACKEND_ENV = "DWSIM_BACKEND"
+SOLVE_LATENCY_ENV = "DWSIM_FAKE_SOLVE_LATENCY_S"
+CALL_LATENCY_ENV = "DWSIM_FAKE_CALL_LATENCY_S"
+ITERATION_LATENCY_ENV = "DWSIM_FAKE_ITERATION_LATENCY_S"
+
+#: Constant heat capacity used for every stream (J/kg/K).
+CP_J_KG_K = 1500.0
+_REFERENCE_T_K = 25.0 + KELVIN_OFFSET
+_DEFAULT_MW = 30.0
+
+# Where converted base-component mass goes in a fake reactor (mass split).
+_REACTION_PRODUCTS = {"Carbon monoxide": 0.9, "Hydrogen": 0.1}
+_ASH_PROXY = "Helium"
+
+# Reactor property IDs (see chemistry/reactions.py) read by the fake solver.
+_REACTOR_PRESSURE_PROPS = ("PROP_CR_0", "PROP_EQ_0", "PROP_PF_0")
+_REACTOR_TEMPERATURE_PROPS = ("PROP_EQ_1",)
+
+# Simulated iterative reactor solve: each iteration halves the error of the
+# initial estimate until it is below the tolerance.
+_ITERATION_TOL = 1e-4
+_MAX_ITERATIONS = 50
+
+
+class ObjectType(enum.Enum):
+    """Subset of ``DWSIM.Interfaces.Enums.GraphicObjects.ObjectType``."""
+
+    MaterialStream = "MaterialStream"
+    EnergyStream = "EnergyStream"
+    Mixer = "Mixer"
+    Splitter = "Splitter"
+    Heater = "Heater"
+    Cooler = "Cooler"
+    Compressor = "Compressor"
+    Pump = "Pump"
+    Valve = "Valve"
+    Vessel = "Vessel"
+    SolidSeparator = "SolidSeparator"
+    ComponentSeparator = "ComponentSeparator"
+    RCT_Conversion = "RCT_Conversion"
+    RCT_Equilibrium = "RCT_Equilibrium"
+    RCT_Gibbs = "RCT_Gibbs"
+    RCT_PFR = "RCT_PFR"
+    RCT_CSTR = "RCT_CSTR"
+
+
+_REACTORS = {
+    ObjectType.RCT_Conversion,
+    ObjectType.RCT_Equilibrium,
+    ObjectType.RCT_Gibbs,
+    ObjectType.RCT_PFR,
+    ObjectType.RCT_CSTR,
+}
+_ITERATIVE_REACTORS = _REACTORS - {ObjectType.RCT_Conversion}
+
+
+class FakeSolverError(RuntimeError):
+    """Raised by the fake solver for inputs DWSIM would also reject."""
+
+
+class _Collection(dict):
+    """Dict with the .NET ``Values`` / ``Keys`` accessors the code uses."""
+
+    @property
+    def Values(self) -> list:
+        return list(self.values())
+
+    @property
+    def Keys(self) -> list:
+        return list(self.keys())
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Graphic objects and connectors
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class _Link:
+    """Both ends of a connection (``AttachedConnector``)."""
+
+    def __init__(
+        self, source: _Graphic, target: _Graphic, source_port: int, target_port: int
+    ):
+        self.AttachedFrom = source
+        self.AttachedTo = target
+        self.AttachedFromConnectorIndex = source_port
+        self.AttachedToConnectorIndex = target_port
+
+
+class _Connector:
+    def __init__(self):
+        self.IsAttached = False
+        self.AttachedConnector: _Link | None = None
+
+    def attach(self, link: _Link) -> None:
+        self.IsAttached = True
+        self.AttachedConnector = link
+
+
+class _Graphic:
+    """``GraphicObject``: tag, type, position and connectors."""
+
+    def __init__(
+        self, owner: _SimObject, object_type: ObjectType, tag: str, x: int, y: int
+    ):
+        self.Owner = owner
+        self.ObjectType = object_type
+        self.Tag = tag
+        self.X = x
+        self.Y = y
+        self.ShowObjectData = False
+        self.InputConnectors: list[_Connector] = []
+        self.OutputConnectors: list[_Connector] = []
+        self.EnergyConnector = _Connector()
+
+    @staticmethod
+    def port(connectors: list[_Connector], index: int) -> _Connector:
+        while len(connectors) <= index:
+            connectors.append(_Connector())
+        return connectors[index]
+
+    def attached(self, connectors: Iterable[_Connector], *, incoming: bool) -> dict:
+        """Port index → object on the other end, for attached connectors."""
+        found = {}
+        for index, connector in enumerate(connectors):
+            if connector.IsAttached:
+                link = connector.AttachedConnector
+                found[index] = (
+                    link.AttachedFrom if incoming else link.AttachedTo
+                ).Owner
+        return found
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Simulation objects
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class _SimObject:
+    def __init__(
+        self,
+        flowsheet: FakeFlowsheet,
+        object_type: ObjectType,
+        tag: str,
+        x: int,
+        y: int,
+    ):
+        self.Name = f"{object_type.value}-{next(flowsheet.ids)}"
+        self.GraphicObject = _Graphic(self, object_type, tag, x, y)
+        self._flowsheet = flowsheet
+        self.properties: dict[str, Any] = {}
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.GraphicObject.Tag}>"
+
+    def SetPropertyValue(self, prop: str, value) -> None:
+        self._flowsheet.tick()
+        self.properties[str(prop)] = value
+
+    def GetPropertyValue(self, prop: str):
+        self._flowsheet.tick()
+        return self.properties.get(str(prop))
+
+    def Calculate(self, *args) -> None:
+        """Streams hold state; unit operations override this."""
+        self._flowsheet.tick()
+
+    def state(self) -> dict[str, Any]:
+        return {"properties": dict(self.properties)}
+
+    def restore(self, state: dict[str, Any]) -> None:
+        self.properties = dict(state.get("properties", {}))
+
+
+class FakeMaterialStream(_SimObject):
+    """Material stream holding T, P, mass flow and a mole-fraction vector."""
+
+    def __init__(self, flowsheet, object_type, tag, x, y):
+        super().__init__(flowsheet, object_type, tag, x, y)
+        self.temperature_K = _REFERENCE_T_K
+        self.pressure_Pa = STANDARD_PRESSURE_PA
+        self.mass_flow = 0.0
+        self.mole_fractions: dict[str, float] = {}
+        self.Phases = {0: _Phase(flowsheet)}
+
+    # ── Property access ─────────────────────────────────────────────────────
+
+    def SetPropertyValue(self, prop: str, value) -> None:
+        self._flowsheet.tick()
+        prop = str(prop)
+        if prop == "Temperature":
+            self.temperature_K = float(value)
+        elif prop == "Pressure":
+            self.pressure_Pa = float(value)
+        elif prop == "MassFlow":
+            self.mass_flow = float(value)
+        elif prop.startswith("MoleFraction."):
+            self.mole_fractions[prop.split(".", 1)[1]] = float(value)
+        else:
+            self.properties[prop] = value
+
+    def GetPropertyValue(self, prop: str):
+        self._flowsheet.tick()
+        prop = str(prop)
+        if prop == "Temperature":
+            return self.temperature_K
+        if prop == "Pressure":
+            return self.pressure_Pa
+        if prop == "MassFlow":
+            return self.mass_flow
+        if prop == "SpecificEnthalpy":
+            return CP_J_KG_K * (self.temperature_K - _REFERENCE_T_K)
+        if prop.startswith("MoleFraction."):
+            return self.mole_composition().get(prop.split(".", 1)[1], 0.0)
+        if prop.startswith("MassFraction."):
+            return self.mass_composition().get(prop.split(".", 1)[1], 0.0)
+        return self.properties.get(prop)
+
+    def GetOverallComposition(self) -> list[float]:
+        self._flowsheet.tick()
+        mole = self.mole_composition()
+        return [mole.get(c, 0.0) for c in self._flowsheet.SelectedCompounds]
+
+    def GetOverallMassComposition(self) -> list[float]:
+        self._flowsheet.tick()
+        mass = self.mass_composition()
+        return [mass.get(c, 0.0) for c in self._flowsheet.SelectedCompounds]
+
+    # ── Composition helpers ─────────────────────────────────────────────────
+
+    def mole_composition(self) -> dict[str, float]:
+        total = sum(self.mole_fractions.values())
+        if total <= 0:
+            return {}
+        return {c: x / total for c, x in self.mole_fractions.items()}
+
+    def mass_composition(self) -> dict[str, float]:
+        weighted = {
+            c: x * MW_G_MOL.get(c, _DEFAULT_MW) for c, x in self.mole_fractions.items()
+        }
+        total = sum(weighted.values())
+        if total <= 0:
+            return {}
+        return {c: w / total for c, w in weighted.items()}
+
+    def component_flows(self) -> dict[str, float]:
+        """Mass flow of each compound (kg/s)."""
+        return {c: w * self.mass_flow for c, w in self.mass_composition().items()}
+
+    def set_from(
+        self, flows: dict[str, float], temperature_K: float, pressure_Pa: float
+    ) -> None:
+        """Overwrite the stream state from component mass flows (kg/s)."""
+        self.mass_flow = sum(flows.values())
+        moles = {c: m / MW_G_MOL.get(c, _DEFAULT_MW) for c, m in flows.items() if m > 0}
+        total = sum(moles.values())
+        self.mole_fractions = {c: n / total for c, n in moles.items()} if total else {}
+        self.temperature_K = temperature_K
+        self.pressure_Pa = pressure_Pa
+
+    def state(self) -> dict[str, Any]:
+        return {
+            **super().state(),
+            "temperature_K": self.temperature_K,
+            "pressure_Pa": self.pressure_Pa,
+            "mass_flow": self.mass_flow,
+            "mole_fractions": dict(self.mole_fractions),
+        }
+
+    def restore(self, state: dict[str, Any]) -> None:
+        super().restore(state)
+        self.temperature_K = state["temperature_K"]
+        self.pressure_Pa = state["pressure_Pa"]
+        self.mass_flow = state["mass_flow"]
+        self.mole_fractions = dict(state["mole_fractions"])
+
+
+class _Phase:
+    """``Phases[0]`` — only its compound list is used."""
+
+    def __init__(self, flowsheet: FakeFlowsheet):
+        self._flowsheet = flowsheet
+
+    @property
+    def Compounds(self) -> _Collection:
+        return self._flowsheet.SelectedCompounds
+
+
+class FakeEnergyStream(_SimObject):
+    """Energy stream; ``PROP_ES_0`` is in kW, ``EnergyFlow`` in W."""
+
+    def __init__(self, flowsheet, object_type, tag, x, y):
+        super().__init__(flowsheet, object_type, tag, x, y)
+        self.energy_flow_W = 0.0
+
+    def SetPropertyValue(self, prop: str, value) -> None:
+        self._flowsheet.tick()
+        prop = str(prop)
+        if prop == "PROP_ES_0":
+            self.energy_flow_W = float(value) * 1000.0
+        elif prop == "EnergyFlow":
+            self.energy_flow_W = float(value)
+        else:
+            self.properties[prop] = value
+
+    def GetPropertyValue(self, prop: str):
+        self._flowsheet.tick()
+        prop = str(prop)
+        if prop == "PROP_ES_0":
+            return self.energy_flow_W / 1000.0
+        if prop == "EnergyFlow":
+            return self.energy_flow_W
+        return self.properties.get(prop)
+
+    def state(self) -> dict[str, Any]:
+        return {**super().state(), "energy_flow_W": self.energy_flow_W}
+
+    def restore(self, state: dict[str, Any]) -> None:
+        super().restore(state)
+        self.energy_flow_W = state["energy_flow_W"]
+
+
+class FakeUnitOperation(_SimObject):
+    """Unit operation solved from its attached inlet streams."""
+
+    def __init__(self, flowsheet, object_type, tag, x, y):
+        super().__init__(flowsheet, object_type, tag, x, y)
+        self.Reactions = _ReactionList()
+
+    def Calculate(self, *args) -> None:
+        self._flowsheet.tick()
+        self._flowsheet.sleep_unit()
+        self.solve()
+
+    # ── Solver ──────────────────────────────────────────────────────────────
+
+    def _inlets(self) -> list[FakeMaterialStream]:
+        graphic = self.GraphicObject
+        attached = graphic.attached(graphic.InputConnectors, incoming=True)
+        return [
+            obj
+            for _i, obj in sorted(attached.items())
+            if isinstance(obj, FakeMaterialStream)
+        ]
+
+    def _outlets(self) -> dict[int, FakeMaterialStream]:
+        graphic = self.GraphicObject
+        attached = graphic.attached(graphic.OutputConnectors, incoming=False)
+        return {
+            i: obj for i, obj in attached.items() if isinstance(obj, FakeMaterialStream)
+        }
+
+    def _duty_W(self) -> float:
+        """|duty| of every energy stream attached to this unit, in W."""
+        graphic = self.GraphicObject
+        neighbours = [
+            *graphic.attached(graphic.InputConnectors, incoming=True).values(),
+            *graphic.attached(graphic.OutputConnectors, incoming=False).values(),
+            *graphic.attached([graphic.EnergyConnector], incoming=False).values(),
+        ]
+        return sum(
+            abs(obj.energy_flow_W)
+            for obj in neighbours
+            if isinstance(obj, FakeEnergyStream)
+        )
+
+    def solve(self) -> None:
+        inlets = self._inlets()
+        outlets = self._outlets()
+        if not outlets:
+            return
+
+        flows: dict[str, float] = {}
+        for stream in inlets:
+            for compound, m in stream.component_flows().items():
+                flows[compound] = flows.get(compound, 0.0) + m
+        total = sum(s.mass_flow for s in inlets)
+        t_k = (
+            sum(s.mass_flow * s.temperature_K for s in inlets) / total
+            if total > 0
+            else (inlets[0].temperature_K if inlets else _REFERENCE_T_K)
+        )
+        p_pa = min((s.pressure_Pa for s in inlets), default=STANDARD_PRESSURE_PA)
+
+        kind = self.GraphicObject.ObjectType
+        side: dict[str, float] = {}
+        if kind in (ObjectType.Heater, ObjectType.Compressor, ObjectType.Pump):
+            t_k += self._temperature_change(self._duty_W(), total)
+        elif kind is ObjectType.Cooler:
+            t_k -= self._temperature_change(self._duty_W(), total)
+        elif kind in _REACTORS:
+            flows = self._react(flows)
+            side = {_ASH_PROXY: flows.pop(_ASH_PROXY, 0.0)}
+            t_k = self._reactor_value(_REACTOR_TEMPERATURE_PROPS, t_k)
+            p_pa = self._reactor_value(_REACTOR_PRESSURE_PROPS, p_pa)
+        elif kind is ObjectType.SolidSeparator:
+            side = {_ASH_PROXY: flows.pop(_ASH_PROXY, 0.0)}
+        elif kind is ObjectType.ComponentSeparator:
+            side = {"Water": flows.pop("Water", 0.0)}
+
+        t_k = max(t_k, 1.0)
+        if 1 in outlets:
+            outlets[1].set_from(side, t_k, p_pa)
+        else:
+            for compound, m in side.items():
+                flows[compound] = flows.get(compound, 0.0) + m
+        if 0 in outlets:
+            guess = outlets[0]
+            initial = (guess.temperature_K, guess.mole_composition())
+            guess.set_from(flows, t_k, p_pa)
+            if kind in _ITERATIVE_REACTORS:
+                self._flowsheet.iterate(self._iterations(initial, guess))
+
+    @staticmethod
+    def _iterations(initial: tuple, solved: FakeMaterialStream) -> int:
+        """Iterations needed to converge from *initial* (T, x) to *solved*."""
+        t0, x0 = initial
+        x1 = solved.mole_composition()
+        error = abs(t0 - solved.temperature_K) / max(solved.temperature_K, 1.0)
+        for compound in set(x0) | set(x1):
+            error = max(error, abs(x0.get(compound, 0.0) - x1.get(compound, 0.0)))
+        if error <= _ITERATION_TOL:
+            return 1
+        return min(1 + math.ceil(math.log2(error / _ITERATION_TOL)), _MAX_ITERATIONS)
+
+    @staticmethod
+    def _temperature_change(duty_W: float, mass_flow: float) -> float:
+        return duty_W / (mass_flow * CP_J_KG_K) if mass_flow > 0 else 0.0
+
+    def _reactor_value(self, props: tuple[str, ...], default: float) -> float:
+        for prop in props:
+            value = self.properties.get(prop)
+            if value is not None:
+                return float(value)
+        return default
+
+    def _react(self, flows: dict[str, float]) -> dict[str, float]:
+        flows = dict(flows)
+        compounds = self._flowsheet.SelectedCompounds
+        for reaction_id in self.Reactions:
+            reaction = self._flowsheet.Reactions.get(reaction_id)
+            if reaction is None:
+                continue
+            base = reaction.BaseReactant
+            converted = flows.get(base, 0.0) * min(max(reaction.Conversion, 0.0), 1.0)
+            products = {c: s for c, s in _REACTION_PRODUCTS.items() if c in compounds}
+            if converted <= 0 or not products:
+                continue
+            flows[base] -= converted
+            share = sum(products.values())
+            for compound, split in products.items():
+                flows[compound] = flows.get(compound, 0.0) + converted * split / share
+        return flows
+
+
+class _ReactionList(list):
+    def Add(self, reaction_id: str) -> None:
+        self.append(str(reaction_id))
+
+
+class FakeReaction:
+    """Reaction created by ``AddReaction``; kinetics are stored, not used."""
+
+    def __init__(self, name: str, reaction_type: str, base: str, conversion: float):
+        self.ID = name
+        self.Name = name
+        self.ReactionType = reaction_type
+        self.BaseReactant = base
+        self.Conversion = float(conversion)
+        self.PreExponentialFactor = 0.0
+        self.ActivationEnergy = 0.0
+        self.ReactionOrder = 0.0
+
+    def state(self) -> dict[str, Any]:
+        return dict(vars(self))
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> FakeReaction:
+        reaction = cls(
+            state["Name"],
+            state["ReactionType"],
+            state["BaseReactant"],
+            state["Conversion"],
+        )
+        vars(reaction).update(state)
+        return reaction
+
+
+_OBJECT_CLASSES = {
+    ObjectType.MaterialStream: FakeMaterialStream,
+    ObjectType.EnergyStream: FakeEnergyStream,
+}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Flowsheet and automation
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class FakeFlowsheet:
+    """The ``IFlowsheet`` returned by ``FakeAutomation.CreateFlowsheet``."""
+
+    def __init__(self, automation: FakeAutomation):
+        self._automation = automation
+        self.ids = itertools.count(1)
+        self.SimulationObjects = _Collection()
+        self.SelectedCompounds = _Collection()
+        self.PropertyPackages = _Collection()
+        self.Reactions = _Collection()
+        self.connections: list[tuple[str, str, int, int]] = []
+
+    def tick(self) -> None:
+        self._automation.tick()
+
+    def iterate(self, iterations: int) -> None:
+        latency = self._automation.iteration_latency_s
+        if latency > 0:
+            time.sleep(latency * iterations)
+
+    def sleep_unit(self) -> None:
+        """Share of the solve latency paid by one unit-operation calculation."""
+        latency = self._automation.solve_latency_s
+        units = sum(
+            isinstance(o, FakeUnitOperation) for o in self.SimulationObjects.values()
+        )
+        if latency > 0 and units:
+            time.sleep(latency / units)
+
+    # ── Building ────────────────────────────────────────────────────────────
+
+    def AddCompound(self, name: str) -> None:
+        self.tick()
+        self.SelectedCompounds[str(name)] = str(name)
+
+    def AddPropertyPackage(self, package) -> None:
+        self.tick()
+        self.PropertyPackages[str(package)] = package
+
+    def AddObject(
+        self, object_type: ObjectType, x: int, y: int, name: str
+    ) -> _SimObject:
+        self.tick()
+        if not isinstance(object_type, ObjectType):
+            raise FakeSolverError(f"Unknown object type {object_type!r}.")
+        cls = _OBJECT_CLASSES.get(object_type, FakeUnitOperation)
+        obj = cls(self, object_type, str(name), int(x), int(y))
+        self.SimulationObjects[obj.Name] = obj
+        return obj
+
+    def ConnectObjects(
+        self, source: _Graphic, target: _Graphic, source_port: int, target_port: int
+    ) -> None:
+        self.tick()
+        link = _Link(source, target, int(source_port), int(target_port))
+        if isinstance(target.Owner, FakeEnergyStream) and not isinstance(
+            source.Owner, FakeEnergyStream | FakeMaterialStream
+        ):
+            source.EnergyConnector.attach(link)
+        else:
+            _Graphic.port(source.OutputConnectors, int(source_port)).attach(link)
+        _Graphic.port(target.InputConnectors, int(target_port)).attach(link)
+        self.connections.append(
+            (source.Tag, target.Tag, int(source_port), int(target_port))
+        )
+
+    def AddReaction(
+        self, name: str, reaction_type: str, base: str, conversion: float
+    ) -> FakeReaction:
+        self.tick()
+        reaction = FakeReaction(
+            str(name), str(reaction_type), str(base), float(conversion)
+        )
+        self.Reactions[reaction.ID] = reaction
+        return reaction
+
+    # ── Solving ─────────────────────────────────────────────────────────────
+
+    def solve(self) -> None:
+        """Calculate every unit operation in upstream-to-downstream order."""
+        from dwsim_model.topology import downstream_order
+
+        objects = {o.GraphicObject.Tag: o for o in self.SimulationObjects.values()}
+        pairs = [(s, t) for s, t, _sp, _tp in self.connections]
+        order = downstream_order(pairs, objects)
+        if order is None:
+            raise FakeSolverError("The fake solver does not handle recycle loops.")
+        for name in order:
+            obj = objects[name]
+            if isinstance(obj, FakeUnitOperation):
+                obj.solve()
+
+    # ── Persistence ─────────────────────────────────────────────────────────
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "compounds": list(self.SelectedCompounds),
+            "property_packages": list(self.PropertyPackages),
+            "reactions": [r.state() for r in self.Reactions.values()],
+            "objects": [
+                {
+                    "type": o.GraphicObject.ObjectType.value,
+                    "tag": o.GraphicObject.Tag,
+                    "x": o.GraphicObject.X,
+                    "y": o.GraphicObject.Y,
+                    "reactions": list(getattr(o, "Reactions", [])),
+                    "state": o.state(),
+                }
+                for o in self.SimulationObjects.values()
+            ],
+            "connections": [list(c) for c in self.connections],
+        }
+
+    @classmethod
+    def from_dict(
+        cls, automation: FakeAutomation, data: dict[str, Any]
+    ) -> FakeFlowsheet:
+        sim = cls(automation)
+        for compound in data["compounds"]:
+            sim.SelectedCompounds[compound] = compound
+        for package in data["property_packages"]:
+            sim.PropertyPackages[package] = package
+        for state in data["reactions"]:
+            reaction = FakeReaction.from_state(state)
+            sim.Reactions[reaction.ID] = reaction
+        by_tag = {}
+        for entry in data["objects"]:
+            obj = sim.AddObject(
+                ObjectType(entry["type"]), entry["x"], entry["y"], entry["tag"]
+            )
+            obj.restore(entry["state"])
+            if isinstance(obj, FakeUnitOperation):
+                obj.Reactions.extend(entry["reactions"])
+            by_tag[entry["tag"]] = obj
+        for source, target, source_port, target_port in data["connections"]:
+            sim.ConnectObjects(
+                by_tag[source].GraphicObject,
+                by_tag[target].GraphicObject,
+                source_port,
+                target_port,
+            )
+        return sim
+
+
+class FakeAutomation:
+    """
+    Drop-in for ``DWSIM.Automation.Automation3``.
+
+    Parameters
+    ----------
+    solve_latency_s:
+        Seconds slept per full ``CalculateFlowsheet2`` (and spread over the
+        unit operations when they are calculated one at a time).
+    call_latency_s:
+        Seconds slept per interop call (property reads/writes, object
+        creation), to mimic the pythonnet crossing cost.
+    iteration_latency_s:
+        Seconds slept per simulated reactor iteration.
+    """
+
+    def __init__(
+        self,
+        solve_latency_s: float = 0.0,
+        call_latency_s: float = 0.0,
+        iteration_latency_s: float = 0.0,
+    ):
+        if min(solve_latency_s, call_latency_s, iteration_latency_s) < 0:
+            raise ValueError("Simulated latencies must be >= 0.")
+        self.solve_latency_s = float(solve_latency_s)
+        self.call_latency_s = float(call_latency_s)
+        self.iteration_latency_s = float(iteration_latency_s)
+        self.AvailablePropertyPackages = _Collection(
+            {name: name for name in ("Peng-Robinson (PR)", "Soave-Redlich-Kwong (SRK)")}
+        )
+        self.solves = 0
+
+    @classmethod
+    def from_env(cls) -> FakeAutomation:
+        """Build with latencies from ``DWSIM_FAKE_*_LATENCY_S`` (default 0)."""
+        try:
+            return cls(
+                solve_latency_s=float(os.environ.get(SOLVE_LATENCY_ENV) or 0.0),
+                call_latency_s=float(os.environ.get(CALL_LATENCY_ENV) or 0.0),
+                iteration_latency_s=float(os.environ.get(ITERATION_LATENCY_ENV) or 0.0),
+            )
+        except ValueError as exc:
+            raise ValueError(f"Invalid fake-backend latency setting: {exc}") from exc
+
+    def tick(self) -> None:
+        if self.call_latency_s > 0:
+            time.sleep(self.call_latency_s)
+
+    def CreateFlowsheet(self) -> FakeFlowsheet:
+        self.tick()
+        return FakeFlowsheet(self)
+
+    def CalculateFlowsheet2(self, sim: FakeFlowsheet) -> list:
+        self.tick()
+        if self.solve_latency_s > 0:
+            time.sleep(self.solve_latency_s)
+        sim.solve()
+        self.solves += 1
+        return []
+
+    def SaveFlowsheet(
+        self, sim: FakeFlowsheet, path: str, compressed: bool = True
+    ) -> None:
+        self.tick()
+        Path(path).write_text(json.dumps(sim.to_dict()), encoding="utf-8")
+
+    def LoadFlowsheet(self, path: str) -> FakeFlowsheet:
+        self.tick()
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return FakeFlowsheet.from_dict(self, data)
+
+
+def use_fake_backend(
+    solve_latency_s: float = 0.0,
+    call_latency_s: float = 0.0,
+    iteration_latency_s: float = 0.0,
+) -> FakeAutomation:
+    """
+    Make ``core.get_automation`` return a ``FakeAutomation``.
+
+    Also sets ``DWSIM_BACKEND=fake`` (and the latency variables) so worker
+    processes started afterwards — e.g. ``ParameterSweep(workers=N)`` — use
+    the fake backend too.
+    """
+    from dwsim_model import core
+
+    automation = FakeAutomation(solve_latency_s, call_latency_s, iteration_latency_s)
+    os.environ[BACKEND_ENV] = "fake"
+    os.environ[SOLVE_LATENCY_ENV] = str(automation.solve_latency_s)
+    os.environ[CALL_LATENCY_ENV] = str(automation.call_latency_s)
+    os.environ[ITERATION_LATENCY_ENV] = str(automation.iteration_latency_s)
+    core._interf = automation
+    core._ObjectType = ObjectType
+    logger.info("Using the fake DWSIM backend (simulated, not a process model).")
+    return automation
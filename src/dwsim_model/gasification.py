@@ -1,10 +1,17 @@
 import logging
+from collections.abc import Iterable, Mapping
 from enum import Enum
+from typing import Any
 
 from dwsim_model.config_loader import ConfigLoader
 from dwsim_model.constants import COMPOUNDS_STANDARD, DEFAULT_PROPERTY_PACKAGE
 from dwsim_model.core import FlowsheetBuilder
+from dwsim_model.profiling import span
+from dwsim_model.snapshot import SnapshotStore, snapshot_key
 from dwsim_model.topology import (
+    STAGE_OUTLETS,
+    STAGES,
+    build_cleanup_stage,
     build_gasifier_stage,
     build_pem_stage,
     build_trc_stage,
@@ -12,6 +19,14 @@ from dwsim_model.topology import (
 
 logger = logging.getLogger(__name__)
 
+#: Reactor object of each stage; a loaded snapshot must contain those of the
+#: stages it was built with (plus ``Final_Syngas``) to be trusted.
+_STAGE_REACTORS = {
+    "gasifier": "Downdraft_Gasifier",
+    "pem": "PEM_Reactor",
+    "trc": "TRC_Reactor",
+}
+
 
 class ReactorMode(str, Enum):
     MIXED = "mixed"  # Gasifier: Conversion, PEM: Equilibrium, TRC: PFR
@@ -50,6 +65,18 @@ class GasificationFlowsheet:
     compound_set:
         List of DWSIM compound names.  Defaults to COMPOUNDS_STANDARD from
         constants.py — edit that file to add new species.
+    snapshots:
+        Optional ``SnapshotStore``.  When given, the built and
+        reactor-configured flowsheet is saved on first build and later
+        builds with the same reactor types, compounds and contracts load
+        it instead of constructing every object again.
+    start_stage:
+        First stage to build (one of ``topology.STAGES``).  The default
+        ``"gasifier"`` builds the whole train.  A later stage builds only
+        that stage and everything downstream of it, with a free-standing
+        inlet stream named like the upstream outlet (e.g. ``Syngas_Pre_TRC``
+        for ``"trc"``) whose state the caller sets before running.  Used by
+        the stage-memoizing sweep runner (``analysis/stages.py``).
     """
 
     def __init__(
@@ -59,8 +86,15 @@ class GasificationFlowsheet:
         custom_reactors: dict[str, str] | None = None,
         config_path: str | None = None,
         compound_set: list[str] | None = None,
-        runtime_config: dict | None = None,
+        runtime_config: Mapping[str, Any] | None = None,
+        *,
+        snapshots: SnapshotStore | None = None,
+        start_stage: str = "gasifier",
     ):
+        if start_stage not in STAGES:
+            raise ValueError(
+                f"start_stage must be one of {STAGES}, got '{start_stage}'"
+            )
         self.builder = builder or FlowsheetBuilder()
         self.mode = ReactorMode(mode)
         self.custom_reactors = custom_reactors or {}
@@ -70,7 +104,11 @@ class GasificationFlowsheet:
             dict(runtime_config) if runtime_config is not None else None
         )
         self._injected_config = self.runtime_config
+        self.snapshots = snapshots
+        self.start_stage = start_stage
+        self.loaded_from_snapshot = False
         self._is_built = False
+        self._thermo_ready = False
 
     # ──────────────────────────────────────────────────────────────────────────
     # Reactor type selection
@@ -110,15 +148,24 @@ class GasificationFlowsheet:
     # ──────────────────────────────────────────────────────────────────────────
 
     def setup_thermo(self) -> None:
-        """Sets up thermodynamics and compounds. DbC: Builder must exist."""
+        """
+        Sets up thermodynamics and compounds. DbC: Builder must exist.
+
+        Idempotent: ``build_flowsheet`` calls it too, and DWSIM rejects a
+        compound that is added twice.
+        """
         # AUTO-FIXED: Replaced assert with if-raise to prevent byte-code optimization removal
         if self.builder is None:
             raise RuntimeError("Builder instance required")
+        if self._thermo_ready:
+            logger.debug("setup_thermo() called again; compounds already added.")
+            return
 
         for compound in self.compound_set:
             self.builder.add_compound(compound)
 
         self.builder.add_property_package(DEFAULT_PROPERTY_PACKAGE)
+        self._thermo_ready = True
         logger.info(
             f"Thermo setup complete: {len(self.compound_set)} compounds, "
             f"package={DEFAULT_PROPERTY_PACKAGE}"
@@ -136,48 +183,43 @@ class GasificationFlowsheet:
             )
             return
 
+        with span("build"):
+            key = self.snapshot_key() if self.snapshots is not None else None
+            self.loaded_from_snapshot = key is not None and self.snapshots.load(
+                self.builder, key, required=self._snapshot_required()
+            )
+            if not self.loaded_from_snapshot:
+                self._build()
+                if key is not None:
+                    self.snapshots.save(self.builder, key)
+            self._load_config()
+
+        self._is_built = True
+        logger.info("Flowsheet build complete.")
+
+    def snapshot_key(self) -> str:
+        """Key of the prebuilt flowsheet this instance can reuse (see snapshot.py)."""
+        reactor_types = self._get_reactor_types()
+        if self.start_stage != STAGES[0]:
+            reactor_types["start_stage"] = self.start_stage
+        return snapshot_key(reactor_types, self.compound_set, DEFAULT_PROPERTY_PACKAGE)
+
+    def _built_stages(self) -> tuple[str, ...]:
+        return STAGES[STAGES.index(self.start_stage) :]
+
+    def _snapshot_required(self) -> tuple[str, ...]:
+        reactors = [
+            _STAGE_REACTORS[s] for s in self._built_stages() if s in _STAGE_REACTORS
+        ]
+        return (*reactors, "Final_Syngas")
+
+    def _build(self) -> None:
+        """Add compounds, objects and connections, then configure the reactors."""
+        self.setup_thermo()
         b = self.builder
         rtypes = self._get_reactor_types()
         connection_failures: list[str] = []
 
-        # ──────────────────────────────────────────────────────────────────────
-        # 4. Quench Vessel
-        # ──────────────────────────────────────────────────────────────────────
-        water_inj = b.add_object("MaterialStream", "Quench_Water_Injection", 1950, 200)
-        n2_inj = b.add_object("MaterialStream", "Quench_Nitrogen", 1950, 250)
-        stm_inj = b.add_object("MaterialStream", "Quench_Steam", 1950, 300)
-
-        quench = b.add_object("Mixer", "Quench_Vessel", 2100, 350)
-        s4 = b.add_object("MaterialStream", "Syngas_Pre_Baghouse", 2200, 350)
-
-        # ──────────────────────────────────────────────────────────────────────
-        # 5. Baghouse
-        # ──────────────────────────────────────────────────────────────────────
-        baghouse = b.add_object("SolidSeparator", "Baghouse", 2350, 350)
-        s5 = b.add_object("MaterialStream", "Clean_Syngas_Pre_Scrub", 2450, 350)
-        baghouse_solids = b.add_object(
-            "MaterialStream", "Baghouse_Solids_Out", 2450, 450
-        )
-
-        # ──────────────────────────────────────────────────────────────────────
-        # 6. Scrubber
-        # ──────────────────────────────────────────────────────────────────────
-        scrubber = b.add_object("ComponentSeparator", "Scrubber", 2600, 350)
-        s6 = b.add_object("MaterialStream", "Scrubbed_Syngas", 2700, 350)
-        scrubber_blowdown = b.add_object(
-            "MaterialStream", "Scrubber_Blowdown", 2700, 450
-        )
-
-        # ──────────────────────────────────────────────────────────────────────
-        # 7. Blower
-        # ──────────────────────────────────────────────────────────────────────
-        blower = b.add_object("Compressor", "Blower", 2850, 350)
-        product = b.add_object("MaterialStream", "Final_Syngas", 2950, 350)
-        e_blower = b.add_object("EnergyStream", "E_Blower", 2850, 250)
-
-        # ──────────────────────────────────────────────────────────────────────
-        # Connections
-        # ──────────────────────────────────────────────────────────────────────
         def safe_connect(src, tgt, p1=0, p2=0):
             try:
                 b.connect(src, tgt, p1, p2)
@@ -191,44 +233,38 @@ class GasificationFlowsheet:
                 connection_failures.append(message)
                 logger.error(message)
 
-        gasifier_stage = build_gasifier_stage(b, rtypes["gasifier"], safe_connect)
-        s1 = gasifier_stage["syngas_out"]
-        build_pem_stage(
-            b,
-            rtypes["pem"],
-            safe_connect,
-            syngas_inlet=s1,
-        )
-        s2 = b.materials["Syngas_Pre_TRC"]
-        build_trc_stage(
+        # Stages before ``start_stage`` are not built; the first built stage
+        # gets a standalone inlet named like the upstream outlet stream, so
+        # stream names match the full train.
+        built = self._built_stages()
+        syngas = None
+        if "gasifier" in built:
+            stage = build_gasifier_stage(b, rtypes["gasifier"], safe_connect)
+            syngas = stage["syngas_out"]
+        if "pem" in built:
+            stage = build_pem_stage(
+                b,
+                rtypes["pem"],
+                safe_connect,
+                syngas_inlet=syngas,
+                syngas_inlet_name=STAGE_OUTLETS["gasifier"],
+            )
+            syngas = stage["syngas_out"]
+        if "trc" in built:
+            stage = build_trc_stage(
+                b,
+                rtypes["trc"],
+                safe_connect,
+                syngas_inlet=syngas,
+                syngas_inlet_name=STAGE_OUTLETS["pem"],
+            )
+            syngas = stage["syngas_out"]
+        build_cleanup_stage(
             b,
-            rtypes["trc"],
             safe_connect,
-            syngas_inlet=s2,
+            syngas_inlet=syngas,
+            syngas_inlet_name=STAGE_OUTLETS["trc"],
         )
-        s3 = b.materials["Syngas_Pre_Quench"]
-
-        # Quench
-        safe_connect(s3, quench, 0, 0)
-        safe_connect(water_inj, quench, 0, 1)
-        safe_connect(n2_inj, quench, 0, 2)
-        safe_connect(stm_inj, quench, 0, 3)
-        safe_connect(quench, s4, 0, 0)
-
-        # Baghouse
-        safe_connect(s4, baghouse, 0, 0)
-        safe_connect(baghouse, s5, 0, 0)
-        safe_connect(baghouse, baghouse_solids, 1, 0)
-
-        # Scrubber
-        safe_connect(s5, scrubber, 0, 0)
-        safe_connect(scrubber, s6, 0, 0)
-        safe_connect(scrubber, scrubber_blowdown, 1, 0)
-
-        # Blower
-        safe_connect(s6, blower, 0, 0)
-        safe_connect(blower, product, 0, 0)
-        safe_connect(e_blower, blower, 0, 1)
 
         if connection_failures:
             raise RuntimeError(
@@ -239,11 +275,8 @@ class GasificationFlowsheet:
         # ──────────────────────────────────────────────────────────────────────
         # Post-connection configuration
         # ──────────────────────────────────────────────────────────────────────
-        self._configure_reactors()
-        self._load_config()
-
-        self._is_built = True
-        logger.info("Flowsheet build complete.")
+        with span("configure_reactors"):
+            self._configure_reactors()
 
     # ──────────────────────────────────────────────────────────────────────────
     # Reactor configuration
@@ -302,19 +335,41 @@ class GasificationFlowsheet:
                 config_path=self.config_path,
                 config_data=runtime_config,
             )
-            loader.load()
+            with span("load_config"):
+                loader.load()
+            if self.start_stage != STAGES[0]:
+                self._drop_unbuilt_streams(loader.config)
             loader.apply_to_flowsheet(b, b.materials, b.energy_streams)
             logger.info("External config applied successfully.")
         except Exception as exc:
             raise RuntimeError(f"Failed to apply external config: {exc}") from exc
 
+    def _drop_unbuilt_streams(self, resolved: dict[str, Any]) -> None:
+        """Remove config entries for streams of stages that were not built."""
+        b = self.builder
+        for section, objects in (
+            ("feeds", b.materials),
+            ("energy_streams", b.energy_streams),
+        ):
+            entries = resolved.get(section) or {}
+            resolved[section] = {k: v for k, v in entries.items() if k in objects}
+
     # ──────────────────────────────────────────────────────────────────────────
     # Run
     # ──────────────────────────────────────────────────────────────────────────
 
-    def run(self) -> None:
-        """Execute the configured flowsheet."""
+    def run(self, changed: Iterable[str] | None = None) -> None:
+        """
+        Execute the configured flowsheet.
+
+        *changed* lists the streams modified since the last converged run;
+        when given, only the part of the train downstream of them is
+        recalculated (see ``FlowsheetBuilder.calculate``).
+        """
         # AUTO-FIXED: Replaced assert with if-raise to prevent byte-code optimization removal
         if not self._is_built:
             raise RuntimeError("Flowsheet must be built before running")
-        self.builder.calculate()
+        if changed is None:
+            self.builder.calculate()
+        else:
+            self.builder.calculate(changed=changed)
@@ -66,6 +66,7 @@ class MainWindow(tk.Tk):
         self._sim_thread: threading.Thread | None = None
         self._last_results = None
         self._last_metrics = None
+        self._use_cache_var = tk.BooleanVar(value=True)
 
         self._build_menu()
         self._build_toolbar()
@@ -98,6 +99,8 @@ class MainWindow(tk.Tk):
         run_menu.add_command(label="Run Simulation", command=self._on_run)
         run_menu.add_command(label="Validate Config", command=self._on_validate)
         run_menu.add_command(label="Export to DWSIM…", command=self._on_export)
+        run_menu.add_separator()
+        run_menu.add_checkbutton(label="Use Result Cache", variable=self._use_cache_var)
         menubar.add_cascade(label="Run", menu=run_menu)
 
         # Scenario menu
@@ -352,15 +355,17 @@ class MainWindow(tk.Tk):
 
         self._sim_thread = threading.Thread(
             target=self._run_simulation_thread,
-            args=(cfg,),
+            args=(cfg, self._use_cache_var.get()),
             daemon=True,
         )
         self._sim_thread.start()
 
-    def _run_simulation_thread(self, cfg: dict) -> None:
+    def _run_simulation_thread(self, cfg: dict, use_cache: bool = True) -> None:
         """Worker thread: runs the simulation and posts results to GUI."""
         try:
+            from dwsim_model.config_loader import ConfigLoader
             from dwsim_model.gasification import GasificationFlowsheet
+            from dwsim_model.results.cache import ResultCache
             from dwsim_model.results.extractor import ResultsExtractor
             from dwsim_model.results.metrics import MetricsCalculator
             from dwsim_model.results.reporter import (
@@ -368,20 +373,38 @@ class MainWindow(tk.Tk):
                 generate_json_report,
             )
 
-            self._results_tab.log("Building flowsheet…")
-            flowsheet = GasificationFlowsheet()
-            flowsheet._injected_config = cfg
-            flowsheet.build()
-
-            self._results_tab.log("Solving…")
-            flowsheet.solve()
-            self._results_tab.log("Solve complete.", "INFO")
-
-            extractor = ResultsExtractor()
-            results = extractor.extract(flowsheet.builder)
-
-            calculator = MetricsCalculator()
-            metrics = calculator.calculate(results)
+            cache = ResultCache() if use_cache else None
+            hit = None
+            if cache is not None:
+                resolved = ConfigLoader(
+                    config_path=self._config_path, config_data=cfg
+                ).load()
+                hit = cache.get(resolved)
+
+            if hit is not None:
+                results, metrics = hit
+                self._results_tab.log("Result cache hit — solve skipped.", "INFO")
+            else:
+                self._results_tab.log("Building flowsheet…")
+                flowsheet = GasificationFlowsheet(
+                    config_path=self._config_path, runtime_config=cfg
+                )
+                flowsheet.build_flowsheet()
+
+                self._results_tab.log("Solving…")
+                flowsheet.run()
+                self._results_tab.log("Solve complete.", "INFO")
+
+                extractor = ResultsExtractor(
+                    compound_names=list(flowsheet.compound_set)
+                )
+                results = extractor.extract(flowsheet.builder)
+
+                calculator = MetricsCalculator()
+                metrics = calculator.calculate(results)
+
+                if cache is not None and results.converged:
+                    cache.put(resolved, results, metrics)
 
             self._last_results = results
             self._last_metrics = metrics
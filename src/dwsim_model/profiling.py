@@ -0,0 +1,233 @@
+"""
+profiling.py
+============
+Per-phase timing, DWSIM interop call counts and optional cProfile capture.
+
+Why this exists
+---------------
+A sweep row only carries ``run_time_s``, which cannot say whether a slow
+run spent its time building the flowsheet, configuring reactors, pushing
+config values, inside the DWSIM solver or reading results back.  Every one
+of those phases crosses the pythonnet boundary many times, and the number
+of crossings matters as much as the solver itself.
+
+The model code marks its phases with :func:`span` and counts each call into
+DWSIM with :func:`count_interop`.  Both are no-ops unless a
+:class:`Profiler` is active, so the instrumentation stays in place at
+negligible cost.
+
+Phases recorded by the model
+----------------------------
+build                GasificationFlowsheet.build_flowsheet (contains the
+                     two phases below)
+configure_reactors   reactor contracts → DWSIM reactors
+load_config          ConfigLoader.load (YAML / runtime-config resolution)
+apply_config         ConfigLoader.apply_to_flowsheet
+solve                FlowsheetBuilder.calculate
+extract              ResultsExtractor.extract
+metrics              MetricsCalculator.calculate
+
+Spans nest: ``total_s`` includes child spans, ``self_s`` does not.  Interop
+calls are attributed to the innermost open span (``other`` if none).
+
+Usage
+-----
+    from dwsim_model.profiling import Profiler
+
+    with Profiler(cprofile=True) as prof:
+        flowsheet.build_flowsheet()
+        flowsheet.run()
+    print(prof.format_table())
+    prof.dump_stats("results/run.prof")   # open with snakeviz / pstats
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import logging
+import pstats
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+#: Phase that collects interop calls made outside any span.
+UNATTRIBUTED = "other"
+
+#: Prefixes of the sweep-row columns written by :meth:`Profiler.columns`.
+PROFILE_COLUMN_PREFIXES = ("time_", "interop_")
+
+
+def is_profile_column(name: str) -> bool:
+    """True for timing / interop columns, which are never KPIs."""
+    return name.startswith(PROFILE_COLUMN_PREFIXES)
+
+
+@dataclass
+class PhaseStats:
+    """Accumulated statistics for one named phase."""
+
+    calls: int = 0
+    total_s: float = 0.0
+    self_s: float = 0.0
+    interop_calls: int = 0
+
+
+class Profiler:
+    """
+    Collects phase spans and interop counts while active (``with`` block).
+
+    Parameters
+    ----------
+    cprofile:
+        Also run ``cProfile`` for the duration of the block, for
+        function-level detail beyond the phase spans.
+    """
+
+    def __init__(self, cprofile: bool = False):
+        self.phases: dict[str, PhaseStats] = {}
+        self.wall_s = 0.0
+        self._stack: list[list] = []  # [name, start, child_seconds]
+        self._cprofile = cProfile.Profile() if cprofile else None
+        self._previous: Optional[Profiler] = None
+        self._started = 0.0
+
+    # ── Activation ──────────────────────────────────────────────────────────
+
+    def __enter__(self) -> Profiler:
+        global _ACTIVE
+        self._previous = _ACTIVE
+        _ACTIVE = self
+        self._started = time.perf_counter()
+        if self._cprofile is not None:
+            self._cprofile.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        global _ACTIVE
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        self.wall_s += time.perf_counter() - self._started
+        _ACTIVE = self._previous
+        self._previous = None
+
+    # ── Recording ───────────────────────────────────────────────────────────
+
+    def _open(self, name: str) -> None:
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _close(self) -> None:
+        name, start, child_s = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        stats = self.phases.setdefault(name, PhaseStats())
+        stats.calls += 1
+        stats.total_s += elapsed
+        stats.self_s += elapsed - child_s
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    def _count(self, n: int) -> None:
+        name = self._stack[-1][0] if self._stack else UNATTRIBUTED
+        self.phases.setdefault(name, PhaseStats()).interop_calls += n
+
+    # ── Reporting ───────────────────────────────────────────────────────────
+
+    @property
+    def interop_calls(self) -> int:
+        return sum(s.interop_calls for s in self.phases.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain-dict summary (JSON-serialisable) used by the HTML report."""
+        return {
+            "wall_s": self.wall_s,
+            "interop_calls": self.interop_calls,
+            "phases": {name: asdict(s) for name, s in self.phases.items()},
+        }
+
+    def columns(self) -> dict[str, Any]:
+        """
+        Flat per-phase columns for a sweep row.
+
+        ``time_<phase>_s`` is the inclusive span time and
+        ``interop_<phase>`` the number of DWSIM calls made in that phase.
+        """
+        row: dict[str, Any] = {}
+        for name, stats in self.phases.items():
+            if stats.calls:
+                row[f"time_{name}_s"] = round(stats.total_s, 6)
+            row[f"interop_{name}"] = stats.interop_calls
+        return row
+
+    def format_table(self) -> str:
+        """Human-readable phase table for console output."""
+        lines = [
+            f"  {'Phase':<22} {'Calls':>6} {'Total (s)':>10} "
+            f"{'Self (s)':>10} {'Interop':>9}",
+            "  " + "─" * 61,
+        ]
+        for name, s in self.phases.items():
+            lines.append(
+                f"  {name:<22} {s.calls:>6} {s.total_s:>10.4f} "
+                f"{s.self_s:>10.4f} {s.interop_calls:>9}"
+            )
+        lines.append("  " + "─" * 61)
+        lines.append(
+            f"  {'wall':<22} {'':>6} {self.wall_s:>10.4f} {'':>10} "
+            f"{self.interop_calls:>9}"
+        )
+        return "\n".join(lines)
+
+    def dump_stats(self, path: str | Path) -> Path:
+        """Write the cProfile statistics to *path* (``pstats`` format)."""
+        if self._cprofile is None:
+            raise RuntimeError("Profiler was created without cprofile=True.")
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._cprofile.dump_stats(str(path))
+        logger.info(f"cProfile statistics written to {path}")
+        return path
+
+    def top_functions(self, limit: int = 15, sort: str = "cumulative") -> str:
+        """Return the *limit* most expensive functions from cProfile as text."""
+        if self._cprofile is None:
+            return ""
+        buffer = io.StringIO()
+        stats = pstats.Stats(self._cprofile, stream=buffer)
+        stats.strip_dirs().sort_stats(sort).print_stats(limit)
+        return buffer.getvalue()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Instrumentation hooks (no-ops unless a Profiler is active)
+# ─────────────────────────────────────────────────────────────────────────────
+
+_ACTIVE: Optional[Profiler] = None
+
+
+def active_profiler() -> Optional[Profiler]:
+    """Return the profiler of the enclosing ``with Profiler()`` block, if any."""
+    return _ACTIVE
+
+
+@contextmanager
+def span(name: str):
+    """Time the enclosed block as phase *name* on the active profiler."""
+    profiler = _ACTIVE
+    if profiler is None:
+        yield
+        return
+    profiler._open(name)
+    try:
+        yield
+    finally:
+        profiler._close()
+
+
+def count_interop(n: int = 1) -> None:
+    """Record *n* calls across the pythonnet boundary in the current phase."""
+    if _ACTIVE is not None:
+        _ACTIVE._count(n)
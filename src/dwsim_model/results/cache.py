@@ -0,0 +1,238 @@
+"""
+results/cache.py
+================
+Persistent, content-addressed cache of solved-model results.
+
+Why this matters:
+    The same baseline and scenario configs are solved again and again from
+    CI, the GUI and the CLI, and each time we pay for a full DWSIM solve.
+    If nothing that influences the model has changed, the answer cannot
+    change either — so we store it on disk and hand it back next time.
+
+How it works
+------------
+* The cache **key** is a SHA-256 of a canonical JSON rendering of the fully
+  resolved config (the output of ``ConfigLoader.load()``), the reactor mode,
+  the compound list and the package version.  Any change to any of those
+  produces a different key; there is no invalidation to get wrong.
+* The cache **value** is one JSON file holding the serialised
+  ``FlowsheetResults`` and ``GasificationMetrics``.
+* Entries live under ``results/.cache`` by default.  When the directory
+  grows beyond ``max_bytes`` the least-recently-used entries are deleted.
+  Every hit refreshes the entry's modification time, so mtime order is LRU
+  order.
+
+Usage
+-----
+    from dwsim_model.config_loader import ConfigLoader
+    from dwsim_model.results.cache import ResultCache
+
+    resolved = ConfigLoader("config/master_config.yaml").load()
+    cache = ResultCache()
+    hit = cache.get(resolved)
+    if hit is None:
+        ...  # build, solve, extract, calculate
+        cache.put(resolved, results, metrics)
+    else:
+        results, metrics = hit
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from dwsim_model import __version__
+from dwsim_model.constants import COMPOUNDS_STANDARD
+from dwsim_model.results.extractor import FlowsheetResults
+from dwsim_model.results.metrics import GasificationMetrics
+
+logger = logging.getLogger(__name__)
+
+#: Default cache location, relative to the working directory (next to the
+#: reports written by ``python -m dwsim_model run``).
+DEFAULT_CACHE_DIR = Path("results") / ".cache"
+
+#: Default size budget for the cache directory.
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MiB
+
+#: Bump when the on-disk entry layout changes.
+_ENTRY_FORMAT = 1
+
+
+def config_cache_key(
+    resolved_config: dict[str, Any],
+    reactor_mode: str = "mixed",
+    compound_set: Sequence[str] | None = None,
+) -> str:
+    """
+    Return the content hash identifying one model run.
+
+    Parameters
+    ----------
+    resolved_config:
+        Fully resolved config dict from ``ConfigLoader.load()``.
+    reactor_mode:
+        Effective ``ReactorMode`` value of the flowsheet.
+    compound_set:
+        Effective compound list of the flowsheet.  Defaults to
+        ``COMPOUNDS_STANDARD``, the ``GasificationFlowsheet`` default.
+    """
+    payload = {
+        "config": resolved_config,
+        "reactor_mode": str(reactor_mode),
+        "compound_set": list(compound_set or COMPOUNDS_STANDARD),
+        "package_version": __version__,
+        "entry_format": _ENTRY_FORMAT,
+    }
+    canonical = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), default=_json_default
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _json_default(obj: Any) -> Any:
+    """Render non-JSON values (paths, enums, mappings) deterministically."""
+    if hasattr(obj, "items"):
+        return dict(obj.items())
+    if hasattr(obj, "value"):
+        return obj.value
+    return str(obj)
+
+
+class ResultCache:
+    """
+    On-disk LRU cache of ``(FlowsheetResults, GasificationMetrics)`` pairs.
+
+    Parameters
+    ----------
+    directory:
+        Where entries are stored.  Created on first write.
+    max_bytes:
+        Size budget for all entries together.  Oldest-used entries are
+        evicted after each write until the directory fits the budget.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = int(max_bytes)
+
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def key_for(
+        self,
+        resolved_config: dict[str, Any],
+        reactor_mode: str = "mixed",
+        compound_set: Sequence[str] | None = None,
+    ) -> str:
+        """Return the cache key for a run (see :func:`config_cache_key`)."""
+        return config_cache_key(resolved_config, reactor_mode, compound_set)
+
+    def get(
+        self,
+        resolved_config: dict[str, Any],
+        reactor_mode: str = "mixed",
+        compound_set: Sequence[str] | None = None,
+    ) -> tuple[FlowsheetResults, GasificationMetrics] | None:
+        """Return the cached results for this run, or None on a miss."""
+        path = self._entry_path(
+            self.key_for(resolved_config, reactor_mode, compound_set)
+        )
+        if not path.exists():
+            return None
+
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            results = FlowsheetResults.from_dict(entry["results"])
+            metrics = GasificationMetrics.from_state(entry["metrics"])
+        except Exception as exc:
+            logger.warning(f"Discarding unreadable cache entry {path.name}: {exc}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Refresh mtime so eviction treats this entry as recently used.
+        try:
+            os.utime(path)
+        except OSError as exc:
+            logger.debug(f"Could not touch cache entry {path.name}: {exc}")
+
+        logger.info(f"Result cache hit: {path.stem[:12]}")
+        return results, metrics
+
+    def put(
+        self,
+        resolved_config: dict[str, Any],
+        results: FlowsheetResults,
+        metrics: GasificationMetrics,
+        reactor_mode: str = "mixed",
+        compound_set: Sequence[str] | None = None,
+    ) -> Path:
+        """Store a solved run and evict old entries if over budget."""
+        key = self.key_for(resolved_config, reactor_mode, compound_set)
+        path = self._entry_path(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        entry = {
+            "format": _ENTRY_FORMAT,
+            "package_version": __version__,
+            "results": results.to_dict(),
+            "metrics": metrics.to_state(),
+        }
+
+        # Write to a temp file and rename so concurrent readers (other sweep
+        # workers, the GUI) never see a half-written entry.
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(entry, fh, default=str)
+            os.replace(tmp_name, path)
+        except Exception:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Result cache stored: {key[:12]}")
+        self.evict()
+        return path
+
+    def evict(self) -> int:
+        """Delete least-recently-used entries until under ``max_bytes``."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _mtime, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+
+        if removed:
+            logger.info(f"Result cache evicted {removed} least-recently-used entries.")
+        return removed
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
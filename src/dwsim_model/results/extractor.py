@@ -8,16 +8,57 @@ Why this matters:
     Without an extractor, running the model gives you no programmatic access
     to the results.  This module makes results available to the CLI, GUI,
     parametric sweep engine, and report generator.
+
+Bulk composition reads
+----------------------
+Reading fractions one ``GetPropertyValue("MoleFraction.<compound>")`` at a
+time costs ``2 × n_compounds`` pythonnet round-trips per stream, which
+dominates post-solve time in sweeps.  When NumPy is available the extractor
+instead pulls each stream's whole overall mole- and mass-fraction vectors
+with ``GetOverallComposition()`` / ``GetOverallMassComposition()`` (two
+calls per stream) and maps them onto ``compound_names`` by index.  The
+per-property path is kept as the fallback for streams or DWSIM builds where
+the bulk calls are unavailable.
+
+Selective extraction
+--------------------
+An :class:`ExtractionPlan` names the streams, the properties of each, and
+the energy streams to read; everything else is skipped.
+``metrics.extraction_plan(kpis)`` builds the smallest plan that
+still yields the requested KPIs, so a sweep recording two KPIs reads two or
+three streams instead of every stream in the flowsheet.  Properties not in
+the plan are left at 0.
+
+With NumPy the stream results are stored array-backed (one
+``StreamTable`` per run, see ``results/table.py``) rather than as a dict of
+``StreamResult`` objects; ``results.streams[name]`` works either way.
+
+Mixture molecular weight (for the Nm³/h flow) is the dot product of the
+mole-fraction vector with the compiled registry's MW vector
+(``dwsim_model.compounds``); the bulk path feeds it the vector it has just
+read, with no per-compound lookups.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
+from dwsim_model.compounds import compound_registry
+from dwsim_model.profiling import count_interop, span
+
 logger = logging.getLogger(__name__)
 
+# numpy is optional; without it every stream uses the per-property path.
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
 # DWSIM property string constants — avoids magic strings scattered through code
 _PROP_TEMPERATURE = "Temperature"  # Kelvin
 _PROP_PRESSURE = "Pressure"  # Pa
@@ -27,6 +68,9 @@ _PROP_MASSFRAC = "MassFraction."  # prefix: "MassFraction.CO"
 _PROP_ENTHALPY = "SpecificEnthalpy"  # J/kg
 _PROP_ENERGY_FLOW = "EnergyFlow"  # W
 
+# Fractions at or below this are treated as absent from the stream.
+_FRACTION_EPS = 1e-9
+
 
 @dataclass
 class StreamResult:
@@ -51,12 +95,64 @@ class EnergyStreamResult:
     energy_flow_kW: float = 0.0
 
 
+#: ``StreamResult`` properties an :class:`ExtractionPlan` can ask for.
+STREAM_PROPERTIES: frozenset[str] = frozenset(
+    {
+        "temperature_C",
+        "pressure_kPa",
+        "mass_flow_kg_s",
+        "specific_enthalpy_kJ_kg",
+        "volumetric_flow_Nm3_h",
+        "mole_fractions",
+        "mass_fractions",
+    }
+)
+
+
+@dataclass(frozen=True)
+class ExtractionPlan:
+    """
+    The streams, properties and energy streams an extraction reads.
+
+    Plans combine with ``|``; ``metrics.extraction_plan`` builds
+    one from a KPI list (see ``metrics.KPI_DEPENDENCIES``).
+    """
+
+    #: Stream name → ``STREAM_PROPERTIES`` to read for it.
+    streams: Mapping[str, frozenset[str]] = field(default_factory=dict)
+    #: Energy streams to read.
+    energy_streams: frozenset[str] = frozenset()
+
+    @classmethod
+    def of(
+        cls,
+        streams: Mapping[str, Iterable[str]] | None = None,
+        energy_streams: Iterable[str] = (),
+    ) -> ExtractionPlan:
+        """Build a plan from plain iterables, checking the property names."""
+        streams = {n: frozenset(props) for n, props in (streams or {}).items()}
+        for name, props in streams.items():
+            unknown = props - STREAM_PROPERTIES
+            if unknown:
+                raise ValueError(
+                    f"Unknown stream properties for '{name}': {sorted(unknown)}."
+                )
+        return cls(streams, frozenset(energy_streams))
+
+    def __or__(self, other: ExtractionPlan) -> ExtractionPlan:
+        streams = dict(self.streams)
+        for name, props in other.streams.items():
+            streams[name] = streams.get(name, frozenset()) | props
+        return ExtractionPlan(streams, self.energy_streams | other.energy_streams)
+
+
 @dataclass
 class FlowsheetResults:
     """All extracted results from a solved gasification flowsheet."""
 
-    # Stream results keyed by stream name
-    streams: dict[str, StreamResult] = field(default_factory=dict)
+    # Stream results keyed by stream name: a dict of StreamResult, or an
+    # array-backed StreamTable (results/table.py) mapping names to views.
+    streams: Mapping[str, StreamResult] = field(default_factory=dict)
     energy_streams: dict[str, EnergyStreamResult] = field(default_factory=dict)
 
     # Convergence info
@@ -93,6 +189,23 @@ class FlowsheetResults:
             "metrics": self.metrics,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> FlowsheetResults:
+        """Rebuild a FlowsheetResults from the output of :meth:`to_dict`."""
+        return cls(
+            streams={
+                name: StreamResult(name=name, **values)
+                for name, values in data.get("streams", {}).items()
+            },
+            energy_streams={
+                name: EnergyStreamResult(name=name, **values)
+                for name, values in data.get("energy_streams", {}).items()
+            },
+            converged=bool(data.get("converged", False)),
+            errors=list(data.get("errors", [])),
+            metrics=dict(data.get("metrics", {})),
+        )
+
 
 class ResultsExtractor:
     """
@@ -114,6 +227,22 @@ class ResultsExtractor:
     key_streams:
         If provided, only extract these stream names.  If None,
         extract all streams in builder.materials.
+    bulk:
+        Read composition vectors with one call per stream (requires
+        NumPy).  Set False to force the per-property path.
+    table:
+        Store the stream results as one array-backed ``StreamTable``
+        (requires NumPy; see ``results/table.py``).  Set False for a dict
+        of ``StreamResult`` objects.
+    plan:
+        Optional :class:`ExtractionPlan`.  Only its streams, properties and
+        energy streams are read (overrides *key_streams*).
+
+    Attributes
+    ----------
+    bulk_reads / fallback_reads:
+        Number of streams whose fractions were read via the bulk path and
+        via the per-property fallback in the last ``extract()`` call.
     """
 
     KELVIN_OFFSET = 273.15
@@ -122,12 +251,20 @@ class ResultsExtractor:
         self,
         compound_names: list[str] | None = None,
         key_streams: list[str] | None = None,
+        bulk: bool = True,
+        table: bool = True,
+        plan: ExtractionPlan | None = None,
     ):
-        self.compound_names = compound_names or []
+        self.compound_names = list(compound_names or [])
         self.key_streams = key_streams
+        self.plan = plan
+        self.bulk = bulk and _HAS_NUMPY
+        self.table = table and _HAS_NUMPY
+        self._reset_bulk_state()
 
     # ─────────────────────────────────────────────────────────────────────────
 
+    @span("extract")
     def extract(self, builder, converged: bool | None = None) -> FlowsheetResults:
         """
         Extract all results from a solved flowsheet.
@@ -147,26 +284,42 @@ class ResultsExtractor:
             All extracted stream data and derived metrics.
         """
         results = FlowsheetResults()
+        self._reset_bulk_state()
 
+        plan = self.plan
+        wanted = list(plan.streams) if plan is not None else self.key_streams
         streams_to_extract = (
-            {
-                n: builder.materials[n]
-                for n in self.key_streams
-                if n in builder.materials
-            }
-            if self.key_streams
+            {n: builder.materials[n] for n in wanted if n in builder.materials}
+            if wanted is not None
             else builder.materials
         )
 
+        rows = {}
         for name, stream_obj in streams_to_extract.items():
+            props = plan.streams[name] if plan is not None else None
             try:
-                results.streams[name] = self._extract_material_stream(name, stream_obj)
+                rows[name] = self._read_material_stream(stream_obj, props)
             except Exception as exc:
                 msg = f"Could not extract stream '{name}': {exc}"
                 logger.warning(msg)
                 results.errors.append(msg)
 
+        if self.table:
+            results.streams = self._stream_table(rows)
+        else:
+            results.streams = {
+                name: StreamResult(
+                    name=name,
+                    **scalars,
+                    mole_fractions=self._nonzero_fractions(mole),
+                    mass_fractions=self._nonzero_fractions(mass),
+                )
+                for name, (scalars, mole, mass) in rows.items()
+            }
+
         for name, e_obj in builder.energy_streams.items():
+            if plan is not None and name not in plan.energy_streams:
+                continue
             try:
                 results.energy_streams[name] = self._extract_energy_stream(name, e_obj)
             except Exception as exc:
@@ -184,48 +337,209 @@ class ResultsExtractor:
             f"{len(results.energy_streams)} energy streams, "
             f"converged={results.converged}"
         )
+        logger.debug(
+            f"Composition reads: {self.bulk_reads} bulk, "
+            f"{self.fallback_reads} per-property"
+        )
         return results
 
     # ─────────────────────────────────────────────────────────────────────────
 
-    def _extract_material_stream(self, name: str, stream_obj) -> StreamResult:
-        """Extract all properties from a single material stream."""
-        result = StreamResult(name=name)
+    def _read_material_stream(self, stream_obj, props: frozenset[str] | None = None):
+        """
+        Read one material stream (only *props*, if given).
+
+        Returns ``(scalars, mole, mass)``: the scalar ``StreamResult`` fields
+        and the mole / mass fraction vectors aligned with ``compound_names``.
+        """
+
+        def wants(*names: str) -> bool:
+            return props is None or any(n in props for n in names)
+
+        volumetric = wants("volumetric_flow_Nm3_h")
+        scalars = dict.fromkeys(
+            (
+                "temperature_C",
+                "pressure_kPa",
+                "mass_flow_kg_s",
+                "specific_enthalpy_kJ_kg",
+            ),
+            0.0,
+        )
+        if wants("temperature_C"):
+            # Temperature (DWSIM returns K; we store °C)
+            t_k = self._get_prop(stream_obj, _PROP_TEMPERATURE, default=0.0)
+            scalars["temperature_C"] = t_k - self.KELVIN_OFFSET if t_k else 0.0
+        if wants("pressure_kPa"):
+            # Pressure (Pa → kPa)
+            p_pa = self._get_prop(stream_obj, _PROP_PRESSURE, default=0.0)
+            scalars["pressure_kPa"] = p_pa / 1000.0 if p_pa else 0.0
+        if wants("mass_flow_kg_s") or volumetric:
+            scalars["mass_flow_kg_s"] = self._get_prop(
+                stream_obj, _PROP_MASSFLOW, default=0.0
+            )
+        if wants("specific_enthalpy_kJ_kg"):
+            # Specific enthalpy (J/kg → kJ/kg)
+            h = self._get_prop(stream_obj, _PROP_ENTHALPY, default=0.0)
+            scalars["specific_enthalpy_kJ_kg"] = (h / 1000.0) if h else 0.0
+
+        # Mole and mass fractions (mole fractions also feed the Nm³/h flow)
+        read_mole = wants("mole_fractions") or volumetric
+        read_mass = wants("mass_fractions")
+        empty = [0.0] * len(self.compound_names)
+        if read_mole or read_mass:
+            bulk = self._read_compositions_bulk(stream_obj, read_mole, read_mass)
+            if bulk is not None:
+                self.bulk_reads += 1
+                mole, mass = bulk
+            else:
+                self.fallback_reads += 1
+                mole, mass = self._read_compositions_per_property(
+                    stream_obj, read_mole, read_mass
+                )
+        mole = mole if read_mole else empty
+        mass = mass if read_mass else empty
 
-        # Temperature (DWSIM returns K; we store °C)
-        t_k = self._get_prop(stream_obj, _PROP_TEMPERATURE, default=0.0)
-        result.temperature_C = t_k - self.KELVIN_OFFSET if t_k else 0.0
+        # Volumetric flow at NTP (0°C, 101.325 kPa) using ideal gas
+        # V_dot = m_dot * R * T / (MW_mix * P)
+        scalars["volumetric_flow_Nm3_h"] = 0.0
+        if volumetric:
+            registry = compound_registry(self.compound_names)
+            scalars["volumetric_flow_Nm3_h"] = self._calc_volumetric_flow(
+                mass_flow_kg_s=scalars["mass_flow_kg_s"],
+                mw_mix_g_mol=registry.dot(mole, registry.mw_g_mol),
+            )
+        return scalars, mole, mass
+
+    def _stream_table(self, rows: dict):
+        """Pack ``_read_material_stream`` rows into a :class:`StreamTable`."""
+        from dwsim_model.results.table import SCALAR_FIELDS, StreamTable
+
+        shape = (len(rows), len(self.compound_names))
+        arrays = {
+            f: np.array([scalars[f] for scalars, _, _ in rows.values()], dtype=float)
+            for f in SCALAR_FIELDS
+        }
+        arrays["mole_fractions"] = np.array(
+            [mole for _, mole, _ in rows.values()], dtype=float
+        ).reshape(shape)
+        arrays["mass_fractions"] = np.array(
+            [mass for _, _, mass in rows.values()], dtype=float
+        ).reshape(shape)
+        return StreamTable(list(rows), self.compound_names, arrays)
+
+    def _read_compositions_per_property(
+        self, stream_obj, read_mole: bool = True, read_mass: bool = True
+    ) -> tuple[list, list]:
+        """Fallback: one GetPropertyValue call per compound and basis."""
+        mole, mass = [], []
+        for compound in self.compound_names:
+            if read_mole:
+                mf = self._get_prop(
+                    stream_obj, f"{_PROP_MOLFRAC}{compound}", default=0.0
+                )
+                mole.append(mf if mf and mf > _FRACTION_EPS else 0.0)
+
+            if read_mass:
+                wf = self._get_prop(
+                    stream_obj, f"{_PROP_MASSFRAC}{compound}", default=0.0
+                )
+                mass.append(wf if wf and wf > _FRACTION_EPS else 0.0)
+        return mole, mass
+
+    # ── Bulk composition path ─────────────────────────────────────────────
+
+    def _reset_bulk_state(self) -> None:
+        # Per-extraction state: the position of each compound_names entry in
+        # DWSIM's compound order, and whether this runtime supports the bulk
+        # calls at all.
+        self._bulk_index = None
+        self._dwsim_compound_count = 0
+        self._bulk_supported = self.bulk
+        self.bulk_reads = 0
+        self.fallback_reads = 0
+
+    def _read_compositions_bulk(
+        self, stream_obj, read_mole: bool = True, read_mass: bool = True
+    ):
+        """
+        Read the overall mole and mass fraction vectors in one call each.
 
-        # Pressure (Pa → kPa)
-        p_pa = self._get_prop(stream_obj, _PROP_PRESSURE, default=0.0)
-        result.pressure_kPa = p_pa / 1000.0 if p_pa else 0.0
+        Returns ``(mole, mass)`` arrays aligned with ``compound_names``
+        (compounds DWSIM does not know are 0; a basis that was not asked
+        for is None), or None when the bulk path cannot be used for this
+        stream (the caller then falls back).
+        """
+        if not self._bulk_supported or not self.compound_names:
+            return None
 
-        # Mass flow
-        result.mass_flow_kg_s = self._get_prop(stream_obj, _PROP_MASSFLOW, default=0.0)
+        try:
+            count_interop(int(read_mole) + int(read_mass))
+            mole = mass = None
+            if read_mole:
+                mole = np.asarray(list(stream_obj.GetOverallComposition()), dtype=float)
+            if read_mass:
+                mass = np.asarray(
+                    list(stream_obj.GetOverallMassComposition()), dtype=float
+                )
+        except Exception as exc:
+            # Missing API on this runtime — stop trying for this extraction
+            # rather than paying a failing interop call on every stream.
+            logger.debug(f"Bulk composition read unavailable: {exc}")
+            self._bulk_supported = False
+            return None
+
+        vectors = [v for v in (mole, mass) if v is not None]
+        index = self._compound_index(stream_obj, vectors[0].size)
+        if index is None or any(v.size != vectors[0].size for v in vectors):
+            return None
+
+        present = index >= 0
+        take = np.clip(index, 0, None)
+        return tuple(
+            None if v is None else np.where(present, v[take], 0.0) for v in (mole, mass)
+        )
 
-        # Specific enthalpy (J/kg → kJ/kg)
-        h = self._get_prop(stream_obj, _PROP_ENTHALPY, default=0.0)
-        result.specific_enthalpy_kJ_kg = (h / 1000.0) if h else 0.0
+    def _compound_index(self, stream_obj, size: int):
+        """
+        Map ``compound_names`` onto DWSIM's compound order.
 
-        # Mole and mass fractions
-        for compound in self.compound_names:
-            mf = self._get_prop(stream_obj, f"{_PROP_MOLFRAC}{compound}", default=0.0)
-            if mf and mf > 1e-9:
-                result.mole_fractions[compound] = mf
+        The order is a property of the flowsheet, not the stream, so it is
+        read once per extraction and reused.  Compounds DWSIM does not know
+        get index -1.
+        """
+        if self._bulk_index is not None:
+            return self._bulk_index if size == self._dwsim_compound_count else None
 
-            wf = self._get_prop(stream_obj, f"{_PROP_MASSFRAC}{compound}", default=0.0)
-            if wf and wf > 1e-9:
-                result.mass_fractions[compound] = wf
+        try:
+            count_interop()
+            dwsim_names = [str(n) for n in stream_obj.Phases[0].Compounds.Keys]
+        except Exception as exc:
+            logger.debug(f"Could not read compound order from stream: {exc}")
+            self._bulk_supported = False
+            return None
 
-        # Volumetric flow at NTP (0°C, 101.325 kPa) using ideal gas
-        # V_dot = m_dot * R * T / (MW_mix * P)
-        result.volumetric_flow_Nm3_h = self._calc_volumetric_flow(
-            mass_flow_kg_s=result.mass_flow_kg_s,
-            mole_fractions=result.mole_fractions,
-            pressure_Pa=p_pa or 101325.0,
+        if len(dwsim_names) != size:
+            logger.debug(
+                f"Composition vector has {size} entries but the stream lists "
+                f"{len(dwsim_names)} compounds — using per-property reads."
+            )
+            self._bulk_supported = False
+            return None
+
+        position = {n: i for i, n in enumerate(dwsim_names)}
+        self._bulk_index = np.array(
+            [position.get(c, -1) for c in self.compound_names], dtype=int
         )
+        self._dwsim_compound_count = size
+        return self._bulk_index
 
-        return result
+    def _nonzero_fractions(self, values) -> dict[str, float]:
+        return {
+            compound: float(v)
+            for compound, v in zip(self.compound_names, values, strict=True)
+            if v > _FRACTION_EPS
+        }
 
     def _extract_energy_stream(self, name: str, e_obj) -> EnergyStreamResult:
         """Extract energy flow from an energy stream."""
@@ -242,6 +556,7 @@ class ResultsExtractor:
         DWSIM properties can be read as attributes or via GetPropertyValue().
         We try both to be resilient across API versions.
         """
+        count_interop()
         try:
             val = obj.GetPropertyValue(prop_name)
             if val is not None:
@@ -259,38 +574,20 @@ class ResultsExtractor:
         return default
 
     @staticmethod
-    def _calc_volumetric_flow(
-        mass_flow_kg_s: float,
-        mole_fractions: dict[str, float],
-        pressure_Pa: float,
-    ) -> float:
+    def _calc_volumetric_flow(mass_flow_kg_s: float, mw_mix_g_mol: float) -> float:
         """
         Estimate volumetric flow at Normal Temperature and Pressure
         (NTP: 0°C = 273.15 K, 101325 Pa) in Nm³/h using ideal gas law.
 
         V_dot [m³/s] = (m_dot / MW_mix) * R * T_NTP / P_NTP
         """
-        from dwsim_model.chemistry.biomass_decomposer import _MW as MW_TABLE
-
-        if mass_flow_kg_s <= 0 or not mole_fractions:
+        if mass_flow_kg_s <= 0 or mw_mix_g_mol <= 0:
             return 0.0
 
         R = 8.314  # J/mol/K
         T_NTP = 273.15  # K
         P_NTP = 101325.0  # Pa
 
-        # MW mix (g/mol) from mole fractions
-        mw_mix = 0.0
-        for compound, xf in mole_fractions.items():
-            # Look for compound MW in our table (simplified name matching)
-            for key, mw in MW_TABLE.items():
-                if key.lower() in compound.lower() or compound.lower() in key.lower():
-                    mw_mix += xf * mw
-                    break
-
-        if mw_mix <= 0:
-            return 0.0
-
-        mw_mix_kg = mw_mix / 1000.0  # kg/mol
+        mw_mix_kg = mw_mix_g_mol / 1000.0  # kg/mol
         vol_flow_m3_s = (mass_flow_kg_s / mw_mix_kg) * R * T_NTP / P_NTP
         return vol_flow_m3_s * 3600.0  # m³/s → Nm³/h
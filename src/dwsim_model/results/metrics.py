@@ -47,61 +47,25 @@ Energy Balance Closure:
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field, fields
 from typing import Any
 
-logger = logging.getLogger(__name__)
-
-# Lower Heating Values (MJ/kg) for key fuel species
-# Sources: Perry's Chemical Engineers Handbook, 8th Ed.
-LHV_MJ_KG: dict[str, float] = {
-    "Hydrogen": 119.96,
-    "Carbon monoxide": 10.10,
-    "Methane": 50.05,
-    "Ethylene": 47.19,
-    "Ethane": 47.48,
-    "Acetylene": 48.22,
-    "Naphthalene": 39.85,
-    "Toluene": 40.94,
-}
-
-# Molecular weights (g/mol) — same subset
-MW_G_MOL: dict[str, float] = {
-    "Hydrogen": 2.016,
-    "Carbon monoxide": 28.010,
-    "Methane": 16.043,
-    "Carbon dioxide": 44.010,
-    "Water": 18.015,
-    "Nitrogen": 28.014,
-    "Oxygen": 32.000,
-    "Helium": 4.003,
-    "Ethylene": 28.053,
-    "Ethane": 30.069,
-    "Acetylene": 26.038,
-    "Naphthalene": 128.174,
-    "Toluene": 92.140,
-    "Hydrogen sulfide": 34.081,
-    "Ammonia": 17.031,
-}
+from dwsim_model.compounds import compound_registry
+from dwsim_model.constants import (  # noqa: F401 — re-exported for callers
+    CARBON_MASS_FRACTION,
+    LHV_MJ_KG,
+    MW_G_MOL,
+    TAR_SPECIES,
+)
+from dwsim_model.profiling import span
+from dwsim_model.results.extractor import ExtractionPlan
 
-# Carbon mass fraction by species for surrogate and product streams.
-CARBON_MASS_FRACTION: dict[str, float] = {
-    "Carbon monoxide": 12.011 / 28.010,
-    "Carbon dioxide": 12.011 / 44.010,
-    "Methane": 12.011 / 16.043,
-    "Ethylene": 24.022 / 28.053,
-    "Ethane": 24.022 / 30.069,
-    "Acetylene": 24.022 / 26.038,
-    "Naphthalene": 120.110 / 128.174,
-    "Toluene": 84.077 / 92.140,
-}
+logger = logging.getLogger(__name__)
 
 # Typical biomass LHV (MJ/kg, as-received) — used as fallback if not in config
 DEFAULT_BIOMASS_LHV_MJ_KG = 15.0
 
-# Tar surrogate species
-TAR_SPECIES = {"Naphthalene", "Toluene", "Phenol", "Benzene"}
-
 # Inlet and outlet stream names (matches STREAM_NAMES in constants.py)
 INLET_STREAMS = [
     "Gasifier_Biomass_Feed",
@@ -143,6 +107,80 @@ ENERGY_OUTLET_STREAMS = [
 ]
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# KPI dependencies
+# ─────────────────────────────────────────────────────────────────────────────
+
+_FLOW = "mass_flow_kg_s"
+_MASS = "mass_fractions"
+_SYNGAS = "Final_Syngas"
+_BIOMASS = "Gasifier_Biomass_Feed"
+
+#: Read by every calculation: calculate() needs the syngas stream to exist
+#: and checks the biomass feed before any KPI.
+_BASE_PLAN = ExtractionPlan.of({_SYNGAS: {_FLOW}, _BIOMASS: {_FLOW}})
+
+#: Streams, properties and energy streams each KPI is computed from.  KPIs
+#: missing here (and ``warnings``) need a full extraction.
+KPI_DEPENDENCIES: dict[str, ExtractionPlan] = {
+    "cold_gas_efficiency": ExtractionPlan.of({_SYNGAS: {_FLOW, _MASS}}),
+    "carbon_conversion_efficiency": ExtractionPlan.of(
+        {
+            _BIOMASS: {_FLOW, _MASS},
+            _SYNGAS: {_FLOW, _MASS},
+            "Syngas_Pre_PEM": {_FLOW, _MASS},
+            "Syngas_Pre_TRC": {_FLOW, _MASS},
+        }
+    ),
+    "h2_co_ratio": ExtractionPlan.of({_SYNGAS: {"mole_fractions"}}),
+    "specific_energy_consumption_kWh_t": ExtractionPlan.of(
+        energy_streams=["E_PEM_AC_Power", "E_PEM_DC_Power", "E_Blower"]
+    ),
+    "tar_loading_mg_Nm3": ExtractionPlan.of(
+        {_SYNGAS: {_FLOW, _MASS, "volumetric_flow_Nm3_h"}}
+    ),
+    "syngas_lhv_mj_kg": ExtractionPlan.of({_SYNGAS: {_MASS}}),
+    "syngas_lhv_mj_nm3": ExtractionPlan.of(
+        {_SYNGAS: {_FLOW, _MASS, "volumetric_flow_Nm3_h"}}
+    ),
+    "syngas_mass_flow_kg_s": ExtractionPlan.of({_SYNGAS: {_FLOW}}),
+    "syngas_volumetric_flow_Nm3_h": ExtractionPlan.of(
+        {_SYNGAS: {"volumetric_flow_Nm3_h"}}
+    ),
+    "syngas_temperature_C": ExtractionPlan.of({_SYNGAS: {"temperature_C"}}),
+    "feed_mass_flow_kg_s": ExtractionPlan.of({_BIOMASS: {_FLOW}}),
+    "biomass_lhv_mj_kg": ExtractionPlan.of(),
+    "mass_balance_closure": ExtractionPlan.of(
+        dict.fromkeys(INLET_STREAMS + OUTLET_STREAMS, frozenset({_FLOW}))
+    ),
+    "energy_balance_closure": ExtractionPlan.of(
+        dict.fromkeys(
+            INLET_STREAMS + OUTLET_STREAMS,
+            frozenset({_FLOW, "specific_enthalpy_kJ_kg"}),
+        ),
+        ENERGY_INLET_STREAMS + ENERGY_OUTLET_STREAMS,
+    ),
+}
+
+
+def extraction_plan(kpis: Iterable[str] | None) -> ExtractionPlan | None:
+    """
+    The smallest ``ExtractionPlan`` that yields *kpis*.
+
+    Returns None — extract everything — when *kpis* is empty or names
+    anything without an entry in :data:`KPI_DEPENDENCIES`.  KPIs outside the
+    plan come out of ``MetricsCalculator.calculate`` wrong (computed from
+    absent streams), so only read the ones asked for.
+    """
+    kpis = list(kpis or [])
+    if not kpis or any(k not in KPI_DEPENDENCIES for k in kpis):
+        return None
+    plan = _BASE_PLAN
+    for kpi in kpis:
+        plan |= KPI_DEPENDENCIES[kpi]
+    return plan
+
+
 @dataclass
 class GasificationMetrics:
     """All computed KPIs for one simulation run."""
@@ -194,6 +232,16 @@ class GasificationMetrics:
             "warnings": self.warnings,
         }
 
+    def to_state(self) -> dict[str, Any]:
+        """Unrounded field values, for lossless storage (see :meth:`from_state`)."""
+        return asdict(self)
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> GasificationMetrics:
+        """Rebuild metrics from :meth:`to_state` output; unknown keys are ignored."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in state.items() if k in known})
+
     def check_targets(self, targets: dict) -> list[str]:
         """
         Compare metrics against scenario targets.
@@ -273,9 +321,12 @@ class MetricsCalculator:
             )
         self.biomass_lhv_mj_kg = biomass_lhv_mj_kg
         self.biomass_carbon_mass_fraction = biomass_carbon_mass_fraction
+        # LHV, carbon and tar vectors for every tabulated compound.
+        self.registry = compound_registry()
 
     # ─────────────────────────────────────────────────────────────────────────
 
+    @span("metrics")
     def calculate(self, results) -> GasificationMetrics:
         """
         Compute all KPIs.
@@ -379,6 +430,201 @@ class MetricsCalculator:
 
         return m
 
+    @span("metrics")
+    def calculate_batch(self, runs) -> dict[str, Any]:
+        """
+        Compute the KPIs of many runs at once with NumPy.
+
+        Same rules and warnings as :meth:`calculate`, applied to stacked
+        arrays instead of one run at a time — use it to recompute an archive
+        of results after changing the biomass basis.
+
+        Parameters
+        ----------
+        runs:
+            A ``ResultsStack`` (results/table.py) or a sequence of
+            ``FlowsheetResults`` to stack.  A stream missing from a run is
+            treated as absent, as in :meth:`calculate`.
+
+        Returns
+        -------
+        dict
+            Columnar table: one ``(n_runs,)`` array per
+            :class:`GasificationMetrics` field, in field order, except
+            ``warnings`` which is a list of per-run lists.
+        """
+        import numpy as np
+
+        from dwsim_model.results.table import ResultsStack
+
+        stack = (
+            runs if isinstance(runs, ResultsStack) else ResultsStack.from_results(runs)
+        )
+        n = len(stack)
+        registry = compound_registry(stack.compounds)
+        zeros = np.zeros(n)
+
+        def present(name):
+            """(n_runs,) mask of runs that have stream *name*."""
+            if name not in stack.names:
+                return np.zeros(n, dtype=bool)
+            return ~np.isnan(stack.series(name, "mass_flow_kg_s"))
+
+        def column(name, field_name, fill=0.0):
+            if name not in stack.names:
+                return np.full(n, fill)
+            return np.nan_to_num(stack.series(name, field_name), nan=fill)
+
+        def fractions(name, basis):
+            if name not in stack.names:
+                return np.zeros((n, len(stack.compounds)))
+            values = stack.mole_fractions if basis == "mole" else stack.mass_fractions
+            return values[:, stack.names.index(name), :]
+
+        def energy(names):
+            total = np.zeros(n)
+            for e in names:
+                if e in stack.energy_names:
+                    flows = stack.energy_flow_kW[:, stack.energy_names.index(e)]
+                    total += np.abs(np.nan_to_num(flows))
+            return total
+
+        def divide(num, den, where):
+            return np.divide(num, den, out=np.zeros(n), where=where)
+
+        has_syngas = present("Final_Syngas")
+        has_biomass = present("Gasifier_Biomass_Feed")
+
+        flow = column("Final_Syngas", "mass_flow_kg_s")
+        volume = column("Final_Syngas", "volumetric_flow_Nm3_h")
+        w_syngas = fractions("Final_Syngas", "mass")
+        x_syngas = fractions("Final_Syngas", "mole")
+        feed = np.where(
+            has_biomass, column("Gasifier_Biomass_Feed", "mass_flow_kg_s"), 0.0
+        )
+        feeding = has_biomass & (feed > 0)
+
+        # ── Syngas LHV, CGE ──────────────────────────────────────────────────
+        lhv = w_syngas @ registry.lhv_mj_kg
+        lhv_nm3 = divide(flow * lhv * 3600.0, volume, (flow > 0) & (volume > 0))
+        cge = divide(
+            flow * lhv,
+            feed * self.biomass_lhv_mj_kg,
+            feeding & (self.biomass_lhv_mj_kg > 0),
+        )
+
+        # ── Carbon conversion ────────────────────────────────────────────────
+        if self.biomass_carbon_mass_fraction is not None:
+            carbon_feed = feed * self.biomass_carbon_mass_fraction
+        else:
+            w_biomass = fractions("Gasifier_Biomass_Feed", "mass")
+            carbon_feed = feed * (w_biomass @ registry.carbon_mass_fraction)
+        carbon_basis = feeding & (carbon_feed > 0)
+        carbon_gas = zeros.copy()
+        found = np.zeros(n, dtype=bool)
+        for name in ("Final_Syngas", "Syngas_Pre_PEM", "Syngas_Pre_TRC"):
+            name_flow = column(name, "mass_flow_kg_s")
+            use = ~found & present(name) & (name_flow > 0)
+            w = fractions(name, "mass")
+            carbon_gas = np.where(
+                use, name_flow * (w @ registry.carbon_mass_fraction), carbon_gas
+            )
+            found |= use
+        cce = np.minimum(divide(carbon_gas, carbon_feed, carbon_basis), 1.0)
+
+        # ── H2/CO, SEC, tar ──────────────────────────────────────────────────
+        h2 = (
+            x_syngas[:, registry.index["Hydrogen"]]
+            if "Hydrogen" in registry.index
+            else zeros
+        )
+        co = (
+            x_syngas[:, registry.index["Carbon monoxide"]]
+            if "Carbon monoxide" in registry.index
+            else zeros
+        )
+        h2_co = divide(h2, co, co >= 1e-9)
+        sec = divide(
+            energy(["E_PEM_AC_Power", "E_PEM_DC_Power", "E_Blower"]),
+            feed * 3.6,
+            feeding,
+        )
+        tar = divide(
+            flow * (w_syngas @ registry.is_tar) * 1e6 * 3600.0, volume, volume > 0
+        )
+
+        # ── Balances ─────────────────────────────────────────────────────────
+        def flows(names, enthalpy=False):
+            total = np.zeros(n)
+            for name in names:
+                value = column(name, "mass_flow_kg_s")
+                if enthalpy:
+                    value = value * column(name, "specific_enthalpy_kJ_kg")
+                total += value
+            return total
+
+        inlet = flows(INLET_STREAMS)
+        mass_closure = divide(flows(OUTLET_STREAMS), inlet, inlet > 0)
+        energy_in = flows(INLET_STREAMS, enthalpy=True) + energy(ENERGY_INLET_STREAMS)
+        energy_out = flows(OUTLET_STREAMS, enthalpy=True) + energy(
+            ENERGY_OUTLET_STREAMS
+        )
+        energy_closure = divide(energy_out, energy_in, np.abs(energy_in) >= 1e-6)
+
+        columns = {
+            "cold_gas_efficiency": cge,
+            "carbon_conversion_efficiency": cce,
+            "h2_co_ratio": h2_co,
+            "specific_energy_consumption_kWh_t": sec,
+            "tar_loading_mg_Nm3": tar,
+            "syngas_lhv_mj_kg": lhv,
+            "syngas_lhv_mj_nm3": lhv_nm3,
+            "syngas_mass_flow_kg_s": flow,
+            "syngas_volumetric_flow_Nm3_h": volume,
+            "syngas_temperature_C": column("Final_Syngas", "temperature_C"),
+            "feed_mass_flow_kg_s": feed,
+            "biomass_lhv_mj_kg": np.full(n, float(self.biomass_lhv_mj_kg)),
+            "mass_balance_closure": mass_closure,
+            "energy_balance_closure": energy_closure,
+        }
+        # Runs without syngas report zeros, as calculate() returns early.
+        for key, values in columns.items():
+            if key != "biomass_lhv_mj_kg":
+                columns[key] = np.where(has_syngas, values, 0.0)
+
+        warnings: list[list[str]] = [[] for _ in range(n)]
+        for i in range(n):
+            if not has_syngas[i]:
+                warnings[i].append(
+                    "Final_Syngas stream not found — most metrics will be zero."
+                )
+                continue
+            if not has_biomass[i]:
+                warnings[i].append(
+                    "Gasifier_Biomass_Feed not found — CGE and CCE unavailable."
+                )
+            if cge[i] > 1.5:
+                warnings[i].append(
+                    f"CGE = {cge[i]:.2%} > 150% — possible unit error "
+                    "in biomass LHV or mass flows."
+                )
+            if feeding[i] and not carbon_basis[i]:
+                warnings[i].append(
+                    "Carbon conversion carbon basis unavailable for Gasifier_Biomass_Feed."
+                )
+            if abs(mass_closure[i] - 1.0) > 0.01:
+                warnings[i].append(
+                    f"Mass balance not closed: {mass_closure[i]:.4f} "
+                    f"(deviation = {abs(mass_closure[i] - 1) * 100:.2f}%). "
+                    "Check that all inlet/outlet streams were solved."
+                )
+            if h2_co[i] == 0 and flow[i] > 0:
+                warnings[i].append("H2/CO ratio is 0 — syngas may contain no CO or H2.")
+        columns["warnings"] = warnings
+
+        logger.info(f"Metrics: computed KPIs for {n} runs in one batch.")
+        return columns
+
     # ─────────────────────────────────────────────────────────────────────────
     # Private calculation methods
     # ─────────────────────────────────────────────────────────────────────────
@@ -389,11 +635,7 @@ class MetricsCalculator:
 
         LHV_mix = Σ (w_i * LHV_i)
         """
-        lhv = 0.0
-        for compound, wf in mass_fractions.items():
-            if compound in LHV_MJ_KG:
-                lhv += wf * LHV_MJ_KG[compound]
-        return lhv
+        return self.registry.lhv(mass_fractions)
 
     @staticmethod
     def _calc_syngas_lhv_volumetric(syngas_stream, syngas_lhv_mj_kg: float) -> float:
@@ -447,14 +689,11 @@ class MetricsCalculator:
             return inferred_carbon_kg_s
         return None
 
-    @staticmethod
-    def _calc_stream_carbon_mass_flow(stream) -> float:
+    def _calc_stream_carbon_mass_flow(self, stream) -> float:
         """Compute the carbon mass flow in a stream from its carbon-bearing species."""
-        carbon_mass_flow = 0.0
-        for compound, carbon_fraction in CARBON_MASS_FRACTION.items():
-            wf = stream.mass_fractions.get(compound, 0.0)
-            carbon_mass_flow += stream.mass_flow_kg_s * wf * carbon_fraction
-        return carbon_mass_flow
+        return stream.mass_flow_kg_s * self.registry.carbon_fraction(
+            stream.mass_fractions
+        )
 
     @staticmethod
     def _calc_ratio(mole_fractions: dict, numerator: str, denominator: str) -> float:
@@ -485,8 +724,7 @@ class MetricsCalculator:
 
         return total_elec_kW / feed_t_h  # kW / (t/h) = kWh/t
 
-    @staticmethod
-    def _calc_tar_loading(syngas_stream) -> float:
+    def _calc_tar_loading(self, syngas_stream) -> float:
         """
         Tar loading in mg/Nm³.
 
@@ -496,10 +734,9 @@ class MetricsCalculator:
         if syngas_stream.volumetric_flow_Nm3_h <= 0:
             return 0.0
 
-        tar_kg_s = 0.0
-        for species in TAR_SPECIES:
-            wf = syngas_stream.mass_fractions.get(species, 0.0)
-            tar_kg_s += wf * syngas_stream.mass_flow_kg_s
+        tar_kg_s = syngas_stream.mass_flow_kg_s * self.registry.tar_fraction(
+            syngas_stream.mass_fractions
+        )
 
         # Convert: kg/s → mg/h, then divide by Nm³/h
         tar_mg_h = tar_kg_s * 1e6 * 3600.0
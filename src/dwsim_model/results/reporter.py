@@ -16,6 +16,8 @@ Sections produced
 5. Energy Balance  — energy inputs, losses, and closure
 6. Reaction Configuration  — summary from YAML configs
 7. Warnings / Errors  — anything logged during the run
+8. Timing  — per-phase spans and DWSIM interop counts (only when the run
+   was profiled, see ``dwsim_model.profiling``)
 """
 
 from __future__ import annotations
@@ -41,6 +43,8 @@ def generate_html_report(
     scenario_name: str = "Baseline",
     model_version: str = "2.0",
     targets: Optional[dict] = None,
+    *,
+    timing: Optional[dict] = None,
 ) -> Path:
     """
     Generate a self-contained HTML report and write it to *output_path*.
@@ -60,6 +64,8 @@ def generate_html_report(
     targets:
         Optional dict of KPI targets (from scenario YAML) for traffic-light
         colouring.  Keys match GasificationMetrics field names.
+    timing:
+        Optional ``Profiler.to_dict()`` summary; adds a Timing section.
 
     Returns
     -------
@@ -74,6 +80,7 @@ def generate_html_report(
         scenario_name=scenario_name,
         model_version=model_version,
         targets=targets or {},
+        timing=timing,
     )
 
     output_path.write_text(html, encoding="utf-8")
@@ -86,11 +93,14 @@ def generate_json_report(
     metrics,
     output_path: str | Path,
     scenario_name: str = "Baseline",
+    *,
+    timing: Optional[dict] = None,
 ) -> Path:
     """
     Write a machine-readable JSON report.
 
     Useful for programmatic consumption, parameter sweeps, and regression tests.
+    A ``timing`` block is included when a ``Profiler.to_dict()`` is given.
     """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -101,9 +111,13 @@ def generate_json_report(
         "converged": results.converged,
         "metrics": metrics.to_dict(),
         "streams": {name: _stream_to_dict(s) for name, s in results.streams.items()},
-        "energy_streams": results.energy_streams,
+        "energy_streams": {
+            name: e.energy_flow_kW for name, e in results.energy_streams.items()
+        },
         "errors": results.errors,
     }
+    if timing is not None:
+        report["timing"] = timing
 
     output_path.write_text(
         json.dumps(report, indent=2, default=str),
@@ -186,7 +200,9 @@ def _traffic_light_class(metric_key: str, value, targets: dict) -> str:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-def _build_html(results, metrics, scenario_name, model_version, targets) -> str:
+def _build_html(
+    results, metrics, scenario_name, model_version, targets, *, timing=None
+) -> str:
     """Assemble the complete HTML document string."""
 
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
@@ -226,6 +242,9 @@ def _build_html(results, metrics, scenario_name, model_version, targets) -> str:
     # ── Warnings & Errors ───────────────────────────────────────────────────
     warnings_html = _build_warnings(results, metrics)
 
+    # ── Timing (profiled runs only) ─────────────────────────────────────────
+    timing_html = _build_timing_section(timing)
+
     return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -396,6 +415,7 @@ def _build_html(results, metrics, scenario_name, model_version, targets) -> str:
     <h2>Warnings &amp; Diagnostics</h2>
     {warnings_html}
   </div>
+{timing_html}
 
   <div class="footer">
     DWSIM Gasification Model v{model_version} &mdash;
@@ -621,7 +641,7 @@ def _build_energy_table(results) -> str:
 
     rows = []
     for name, value in sorted(results.energy_streams.items()):
-        kw = value / 1000.0 if value is not None else None
+        kw = value.energy_flow_kW if value is not None else None
         desc = descriptions.get(name, "—")
         color = ""
         if kw is not None:
@@ -641,7 +661,9 @@ def _build_energy_table(results) -> str:
         ]
 
     # Total
-    total_kw = sum(v / 1000.0 for v in results.energy_streams.values() if v is not None)
+    total_kw = sum(
+        v.energy_flow_kW for v in results.energy_streams.values() if v is not None
+    )
     rows.append(
         f"<tr style='font-weight:700;background:#edf2f7;'>"
         f"<td>TOTAL</td>"
@@ -701,3 +723,43 @@ def _build_warnings(results, metrics) -> str:
         )
 
     return "\n".join(html_parts)
+
+
+def _build_timing_section(timing: Optional[dict]) -> str:
+    """Build the Timing section from a ``Profiler.to_dict()`` summary."""
+    if not timing:
+        return ""
+
+    wall = timing.get("wall_s") or 0.0
+    rows = []
+    for name, phase in timing.get("phases", {}).items():
+        share = phase["total_s"] / wall * 100 if wall else None
+        rows.append(
+            f"<tr><td><strong>{name}</strong></td>"
+            f'<td class="num">{phase["calls"]}</td>'
+            f'<td class="num">{_fmt(phase["total_s"], ".4f")}</td>'
+            f'<td class="num">{_fmt(phase["self_s"], ".4f")}</td>'
+            f'<td class="num">{_fmt(share, ".1f", "%")}</td>'
+            f'<td class="num">{phase["interop_calls"]}</td></tr>'
+        )
+    rows.append(
+        f"<tr style='font-weight:700;background:#edf2f7;'><td>WALL</td><td></td>"
+        f'<td class="num">{_fmt(wall, ".4f")}</td><td></td><td></td>'
+        f'<td class="num">{timing.get("interop_calls", 0)}</td></tr>'
+    )
+
+    return f"""
+  <!-- ── Timing ── -->
+  <div class="section">
+    <h2>Timing</h2>
+    <div class="table-scroll">
+      <table><thead><tr>
+        <th>Phase</th><th class='num'>Calls</th><th class='num'>Total (s)</th>
+        <th class='num'>Self (s)</th><th class='num'>Share of wall</th>
+        <th class='num'>DWSIM calls</th>
+      </tr></thead><tbody>
+      {"".join(rows)}
+      </tbody></table>
+    </div>
+  </div>
+"""
@@ -0,0 +1,387 @@
+"""
+results/table.py
+================
+Array-backed stream results: one row per stream, one column per compound.
+
+Why this exists
+---------------
+A dict-based ``StreamResult`` holds two ``{compound: fraction}`` dicts and
+five boxed floats.  Across ~30 streams that is a few hundred small Python
+objects per run — fine for one run, gigabytes for a 10,000-run sweep that
+keeps its stream results.  A :class:`StreamTable` stores the same data as
+
+    temperature_C, pressure_kPa, mass_flow_kg_s,
+    specific_enthalpy_kJ_kg, volumetric_flow_Nm3_h    (n_streams,)
+    mole_fractions, mass_fractions                     (n_streams, n_compounds)
+
+plus a ``name → row`` map, and behaves as a read-only mapping of stream
+name to :class:`StreamView`.  A view has the ``StreamResult`` attributes
+(fraction dicts are built on access, near-zero entries dropped) and writes
+straight through to the arrays, so ``results.streams[name]`` and
+``results.get_stream(name)`` keep working unchanged.
+
+:class:`ResultsStack` stacks many runs into 3-D ``(n_runs, n_streams,
+n_compounds)`` arrays; :meth:`ResultsStack.run` hands a single run back as
+a ``FlowsheetResults`` whose table slices the stack without copying.
+
+``ResultsExtractor`` produces tables by default when NumPy is installed;
+without NumPy it keeps the dict-based ``StreamResult`` objects.
+
+Usage
+-----
+    from dwsim_model.results.table import ResultsStack
+
+    stack = ResultsStack.from_results([runner.solve(c)[0] for c in configs])
+    h2 = stack.fractions("Final_Syngas", "Hydrogen")        # one value per run
+    stack.run(0).get_stream("Final_Syngas").mole_fractions  # dict view
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from dwsim_model.results.extractor import FlowsheetResults, StreamResult
+
+#: Per-stream scalar properties, in the order stored by :class:`StreamTable`.
+SCALAR_FIELDS: tuple[str, ...] = (
+    "temperature_C",
+    "pressure_kPa",
+    "mass_flow_kg_s",
+    "specific_enthalpy_kJ_kg",
+    "volumetric_flow_Nm3_h",
+)
+
+#: Composition properties; each is an ``(n_streams, n_compounds)`` array.
+FRACTION_FIELDS: tuple[str, ...] = ("mole_fractions", "mass_fractions")
+
+# Fractions at or below this are left out of the dict views.
+_FRACTION_EPS = 1e-9
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Single run
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _scalar(field: str) -> property:
+    def get(self) -> float:
+        return float(getattr(self._table, field)[self._row])
+
+    def put(self, value: float) -> None:
+        getattr(self._table, field)[self._row] = value
+
+    return property(get, put)
+
+
+def _fractions(field: str) -> property:
+    def get(self) -> dict[str, float]:
+        row = getattr(self._table, field)[self._row]
+        return {
+            c: float(v)
+            for c, v in zip(self._table.compounds, row, strict=True)
+            if v > _FRACTION_EPS
+        }
+
+    def put(self, values: Mapping[str, float]) -> None:
+        row = getattr(self._table, field)[self._row]
+        row[:] = 0.0
+        for compound, value in values.items():
+            row[self._table.column(compound)] = value
+
+    return property(get, put)
+
+
+class StreamView:
+    """
+    One row of a :class:`StreamTable`, with the ``StreamResult`` attributes.
+
+    Reads and writes go to the table's arrays; :meth:`to_result` makes an
+    independent dict-based copy.
+    """
+
+    __slots__ = ("_row", "_table")
+
+    def __init__(self, table: StreamTable, row: int):
+        self._table = table
+        self._row = row
+
+    @property
+    def name(self) -> str:
+        return self._table.names[self._row]
+
+    temperature_C = _scalar("temperature_C")
+    pressure_kPa = _scalar("pressure_kPa")
+    mass_flow_kg_s = _scalar("mass_flow_kg_s")
+    specific_enthalpy_kJ_kg = _scalar("specific_enthalpy_kJ_kg")
+    volumetric_flow_Nm3_h = _scalar("volumetric_flow_Nm3_h")
+    mole_fractions = _fractions("mole_fractions")
+    mass_fractions = _fractions("mass_fractions")
+
+    def to_result(self) -> StreamResult:
+        from dwsim_model.results.extractor import StreamResult
+
+        return StreamResult(
+            name=self.name,
+            **{f: getattr(self, f) for f in SCALAR_FIELDS + FRACTION_FIELDS},
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not hasattr(other, "mole_fractions"):
+            return NotImplemented
+        return all(
+            getattr(self, f) == getattr(other, f, None)
+            for f in ("name", *SCALAR_FIELDS, *FRACTION_FIELDS)
+        )
+
+    __hash__ = None  # mutable, like the dataclass it stands in for
+
+    def __repr__(self) -> str:
+        return (
+            f"StreamView({self.name!r}, T={self.temperature_C:.1f} C, "
+            f"m={self.mass_flow_kg_s:.4g} kg/s)"
+        )
+
+
+class StreamTable(Mapping):
+    """
+    Stream results of one run as arrays; a mapping of name → :class:`StreamView`.
+
+    Parameters
+    ----------
+    names, compounds:
+        Row and column labels.
+    arrays:
+        Every :data:`SCALAR_FIELDS` entry as an ``(n_streams,)`` array and
+        every :data:`FRACTION_FIELDS` entry as ``(n_streams, n_compounds)``.
+        Missing ones are zero-filled.  Arrays are used as given (not
+        copied), which is what lets a table be a slice of a
+        :class:`ResultsStack`.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        compounds: Sequence[str],
+        arrays: Mapping[str, Any] | None = None,
+    ):
+        self.names = tuple(names)
+        self.compounds = tuple(compounds)
+        self._rows = {n: i for i, n in enumerate(self.names)}
+        self._columns = {c: j for j, c in enumerate(self.compounds)}
+        arrays = arrays or {}
+        shape = {f: (len(self.names),) for f in SCALAR_FIELDS}
+        shape |= {f: (len(self.names), len(self.compounds)) for f in FRACTION_FIELDS}
+        for f, expected in shape.items():
+            value = arrays.get(f)
+            value = np.zeros(expected) if value is None else np.asarray(value)
+            if value.shape != expected:
+                raise ValueError(f"'{f}' has shape {value.shape}, expected {expected}.")
+            setattr(self, f, value)
+
+    @classmethod
+    def from_streams(
+        cls,
+        streams: Mapping[str, Any],
+        compounds: Sequence[str] | None = None,
+    ) -> StreamTable:
+        """
+        Pack dict-based stream results into a table.
+
+        *compounds* defaults to every compound found in the streams, in
+        first-seen order; fractions of other compounds are dropped.
+        """
+        if compounds is None:
+            seen: dict[str, None] = {}
+            for s in streams.values():
+                seen.update(dict.fromkeys(s.mole_fractions))
+                seen.update(dict.fromkeys(s.mass_fractions))
+            compounds = list(seen)
+        table = cls(list(streams), compounds)
+        for row, stream in enumerate(streams.values()):
+            view = table.view(row)
+            for f in SCALAR_FIELDS:
+                setattr(view, f, getattr(stream, f))
+            for f in FRACTION_FIELDS:
+                setattr(
+                    view,
+                    f,
+                    {
+                        c: v
+                        for c, v in getattr(stream, f).items()
+                        if c in table._columns
+                    },
+                )
+        return table
+
+    # ── Mapping protocol ────────────────────────────────────────────────────
+
+    def __getitem__(self, name: str) -> StreamView:
+        return StreamView(self, self._rows[name])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._rows
+
+    # ────────────────────────────────────────────────────────────────────────
+
+    def view(self, row: int) -> StreamView:
+        return StreamView(self, row)
+
+    def row(self, name: str) -> int:
+        return self._rows[name]
+
+    def column(self, compound: str) -> int:
+        """Column of *compound*; KeyError if the table does not track it."""
+        try:
+            return self._columns[compound]
+        except KeyError:
+            raise KeyError(
+                f"Compound '{compound}' is not a column of this table."
+            ) from None
+
+    def to_streams(self) -> dict[str, StreamResult]:
+        """Independent dict-based copies of every row."""
+        return {name: self[name].to_result() for name in self.names}
+
+    def __repr__(self) -> str:
+        return (
+            f"StreamTable({len(self.names)} streams × {len(self.compounds)} compounds)"
+        )
+
+    def __reduce__(self):
+        arrays = {f: getattr(self, f) for f in SCALAR_FIELDS + FRACTION_FIELDS}
+        return (StreamTable, (self.names, self.compounds, arrays))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Many runs
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class ResultsStack:
+    """
+    Stream and energy results of many runs in 2-D / 3-D arrays.
+
+    Attributes
+    ----------
+    names, compounds, energy_names:
+        Stream, compound and energy-stream labels shared by all runs.
+    temperature_C, pressure_kPa, ... :
+        ``(n_runs, n_streams)`` arrays (one per :data:`SCALAR_FIELDS`); NaN
+        where a run lacks a stream.
+    mole_fractions, mass_fractions:
+        ``(n_runs, n_streams, n_compounds)`` arrays.
+    energy_flow_kW:
+        ``(n_runs, n_energy_streams)``; NaN where missing.
+    converged:
+        ``(n_runs,)`` bool array.
+    """
+
+    def __init__(
+        self,
+        n_runs: int,
+        names: Sequence[str],
+        compounds: Sequence[str],
+        energy_names: Sequence[str] = (),
+    ):
+        self.names = tuple(names)
+        self.compounds = tuple(compounds)
+        self.energy_names = tuple(energy_names)
+        n, c = len(self.names), len(self.compounds)
+        for f in SCALAR_FIELDS:
+            setattr(self, f, np.full((n_runs, n), np.nan))
+        for f in FRACTION_FIELDS:
+            setattr(self, f, np.zeros((n_runs, n, c)))
+        self.energy_flow_kW = np.full((n_runs, len(self.energy_names)), np.nan)
+        self.converged = np.zeros(n_runs, dtype=bool)
+        self.errors: list[list[str]] = [[] for _ in range(n_runs)]
+
+    @classmethod
+    def from_results(cls, runs: Iterable[FlowsheetResults]) -> ResultsStack:
+        """
+        Stack *runs*; labels are the union over all runs, in first-seen order.
+        """
+        runs = list(runs)
+        tables = [
+            r.streams
+            if isinstance(r.streams, StreamTable)
+            else StreamTable.from_streams(r.streams)
+            for r in runs
+        ]
+        names = dict.fromkeys(n for t in tables for n in t.names)
+        compounds = dict.fromkeys(c for t in tables for c in t.compounds)
+        energy = dict.fromkeys(n for r in runs for n in r.energy_streams)
+        stack = cls(len(runs), names, compounds, energy)
+        for i, (result, table) in enumerate(zip(runs, tables, strict=True)):
+            stack.set_run(i, result, table)
+        return stack
+
+    def set_run(
+        self, i: int, result: FlowsheetResults, table: StreamTable | None = None
+    ) -> None:
+        """Copy one run into slot *i*."""
+        if table is None:
+            table = (
+                result.streams
+                if isinstance(result.streams, StreamTable)
+                else StreamTable.from_streams(result.streams, self.compounds)
+            )
+        rows = [self.names.index(n) for n in table.names]
+        cols = [self.compounds.index(c) for c in table.compounds]
+        for f in SCALAR_FIELDS:
+            getattr(self, f)[i, rows] = getattr(table, f)
+        for f in FRACTION_FIELDS:
+            getattr(self, f)[i][np.ix_(rows, cols)] = getattr(table, f)
+        for name, e in result.energy_streams.items():
+            self.energy_flow_kW[i, self.energy_names.index(name)] = e.energy_flow_kW
+        self.converged[i] = result.converged
+        self.errors[i] = list(result.errors)
+
+    def __len__(self) -> int:
+        return len(self.converged)
+
+    def run(self, i: int) -> FlowsheetResults:
+        """Run *i* as ``FlowsheetResults``; its stream table is a view into the stack."""
+        from dwsim_model.results.extractor import EnergyStreamResult, FlowsheetResults
+
+        table = StreamTable(
+            self.names,
+            self.compounds,
+            {f: getattr(self, f)[i] for f in SCALAR_FIELDS + FRACTION_FIELDS},
+        )
+        return FlowsheetResults(
+            streams=table,
+            energy_streams={
+                name: EnergyStreamResult(name, float(v))
+                for name, v in zip(
+                    self.energy_names, self.energy_flow_kW[i], strict=True
+                )
+                if not np.isnan(v)
+            },
+            converged=bool(self.converged[i]),
+            errors=list(self.errors[i]),
+        )
+
+    def series(self, stream: str, field: str):
+        """``field`` of *stream* across runs, shape ``(n_runs,)``."""
+        if field not in SCALAR_FIELDS:
+            raise ValueError(
+                f"Unknown stream field '{field}' (choose from {SCALAR_FIELDS})."
+            )
+        return getattr(self, field)[:, self.names.index(stream)]
+
+    def fractions(self, stream: str, compound: str, basis: str = "mole"):
+        """Mole or mass fraction of *compound* in *stream* across runs."""
+        if basis not in ("mole", "mass"):
+            raise ValueError(f"basis must be 'mole' or 'mass', not '{basis}'.")
+        values = self.mole_fractions if basis == "mole" else self.mass_fractions
+        return values[:, self.names.index(stream), self.compounds.index(compound)]
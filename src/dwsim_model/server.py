@@ -0,0 +1,356 @@
+"""
+server.py
+=========
+Long-lived local model server that keeps the DWSIM runtime warm.
+
+Why this exists
+---------------
+Every ``python -m dwsim_model run`` starts a fresh interpreter that pays the
+pythonnet/CLR start-up and the ``clr.AddReference`` assembly loads in
+``core.get_automation`` before any modelling happens — seconds per call in
+scripted pipelines that invoke the CLI many times.
+
+``python -m dwsim_model serve`` starts one persistent process that loads
+the automation once and keeps a warm flowsheet (``WarmModelRunner``)
+between requests.  ``run --server`` and ``sweep --server`` resolve their
+config locally and send it there instead of solving in-process.
+
+Protocol
+--------
+JSON over HTTP, bound to localhost only (default ``http://127.0.0.1:8765``).
+Plain TCP on localhost is used rather than a Unix socket because DWSIM
+itself mostly runs on Windows.
+
+    GET  /health    → {"status": "ok", "version", "requests", "builds"}
+    POST /run       {"config": <resolved config>}
+                    → {"results": FlowsheetResults.to_dict(),
+                       "metrics": GasificationMetrics.to_state()}
+    POST /sweep     {"configs": [<resolved config>, ...], "kpis": [...]}
+                    → {"rows": [<sweep row>, ...]}
+    POST /shutdown  → {"status": "stopping"}
+
+Failures come back as ``{"error": "..."}`` with status 400 (malformed
+request body, see ``BadRequest``) or 500 (anything raised while solving).
+Model work is serialised with a lock, since a DWSIM flowsheet is not
+thread-safe; ``/health`` answers while a run is in progress.
+
+Usage
+-----
+    python -m dwsim_model serve --port 8765 &
+    python -m dwsim_model run --server http://127.0.0.1:8765
+    python -m dwsim_model sweep --server http://127.0.0.1:8765 --param ...
+
+    from dwsim_model.server import ModelClient
+
+    client = ModelClient("http://127.0.0.1:8765")
+    results, metrics = client.run(resolved_config)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import Mapping, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from dwsim_model import __version__
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_SERVER_URL = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+
+
+class ServerError(RuntimeError):
+    """Raised by ``ModelClient`` when the server is unreachable or a request fails."""
+
+
+class BadRequest(ValueError):
+    """A request body the server cannot act on; answered with HTTP 400."""
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Server
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class ModelServer:
+    """
+    Holds the warm model runner and serves it over localhost HTTP.
+
+    Parameters
+    ----------
+    host, port:
+        Address to bind.  Port 0 picks a free port (see :attr:`url`).
+    config_path:
+        Master config used to resolve relative references in configs that
+        are not already resolved.
+    cache, snapshots:
+        Optional ``ResultCache`` / ``SnapshotStore`` for the default runner.
+    runner:
+        Object with ``solve(config) -> (FlowsheetResults, GasificationMetrics)``
+        that is also callable as a sweep runner.  Defaults to a
+        ``WarmModelRunner``.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        config_path: str | Path | None = None,
+        *,
+        cache=None,
+        snapshots=None,
+        runner=None,
+    ):
+        if runner is None:
+            from dwsim_model.analysis.warm import WarmModelRunner
+
+            runner = WarmModelRunner(
+                config_path=config_path, cache=cache, snapshots=snapshots
+            )
+        self.host = host
+        self.port = int(port)
+        self.runner = runner
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._httpd: ThreadingHTTPServer | None = None
+
+    @property
+    def url(self) -> str:
+        if self._httpd is None:
+            return f"http://{self.host}:{self.port}"
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    # ── Lifecycle ───────────────────────────────────────────────────────────
+
+    def start(self, preload: bool = True) -> str:
+        """Bind the socket (and load DWSIM automation); return the server URL."""
+        if preload:
+            try:
+                from dwsim_model.core import get_automation
+
+                get_automation()
+            except Exception as exc:
+                # Surrogate or mock runners may not need DWSIM at all.
+                logger.warning(f"Model server could not preload DWSIM: {exc}")
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.model = self
+        logger.info(f"Model server listening on {self.url}")
+        return self.url
+
+    def serve_forever(self) -> None:
+        """Handle requests until :meth:`shutdown` (or ``POST /shutdown``)."""
+        if self._httpd is None:
+            self.start()
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+            logger.info("Model server stopped.")
+
+    def shutdown(self) -> None:
+        """Stop ``serve_forever`` from another thread."""
+        if self._httpd is not None:
+            threading.Thread(target=self._httpd.shutdown, daemon=True).start()
+
+    # ── Request handlers ────────────────────────────────────────────────────
+
+    def health(self) -> dict[str, Any]:
+        return {
+            "status": "ok",
+            "version": __version__,
+            "requests": self.requests,
+            "builds": getattr(self.runner, "builds", None),
+        }
+
+    def run(self, body: Mapping[str, Any]) -> dict[str, Any]:
+        config = body.get("config")
+        if not isinstance(config, Mapping):
+            raise BadRequest("'config' must be a JSON object.")
+        with self._lock:
+            self.requests += 1
+            results, metrics = self.runner.solve(dict(config))
+        return {"results": results.to_dict(), "metrics": metrics.to_state()}
+
+    def sweep(self, body: Mapping[str, Any]) -> dict[str, Any]:
+        from dwsim_model.analysis.sweep import _run_point, narrowed_runner
+
+        configs = body.get("configs")
+        if not isinstance(configs, list) or not all(
+            isinstance(c, Mapping) for c in configs
+        ):
+            raise BadRequest("'configs' must be a list of JSON objects.")
+        kpis = body.get("kpis") or None
+        if kpis is not None and not (
+            isinstance(kpis, list) and all(isinstance(k, str) for k in kpis)
+        ):
+            raise BadRequest("'kpis' must be a list of KPI names.")
+        rows = []
+        with self._lock, narrowed_runner(self.runner, kpis) as runner:
+            self.requests += 1
+            for config in configs:
+                rows.append(_run_point(runner, config, kpis))
+        return {"rows": rows}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes requests to the ``ModelServer`` attached to the HTTP server."""
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._reply(200, self.server.model.health())
+        else:
+            self._reply(404, {"error": f"Unknown endpoint {self.path}"})
+
+    def do_POST(self) -> None:
+        model: ModelServer = self.server.model
+        routes = {"/run": model.run, "/sweep": model.sweep}
+        if self.path == "/shutdown":
+            self._reply(200, {"status": "stopping"})
+            model.shutdown()
+            return
+        if self.path not in routes:
+            self._reply(404, {"error": f"Unknown endpoint {self.path}"})
+            return
+        try:
+            payload = routes[self.path](self._read_body())
+        except BadRequest as exc:
+            self._reply(400, {"error": str(exc)})
+        except Exception as exc:
+            logger.error(f"Model server request {self.path} failed: {exc}")
+            self._reply(500, {"error": str(exc)})
+        else:
+            self._reply(200, payload)
+
+    def _read_body(self) -> dict[str, Any]:
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as exc:
+            raise BadRequest(f"Request body is not valid JSON: {exc}") from exc
+        if not isinstance(body, dict):
+            raise BadRequest("Request body must be a JSON object.")
+        return body
+
+    def _reply(self, status: int, payload: dict[str, Any]) -> None:
+        data = json.dumps(payload, default=str).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Client
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class ModelClient:
+    """
+    Client for a running model server.
+
+    Also usable as a ``ParameterSweep`` model runner: calling it with a
+    config resolves the config locally, solves it on the server and returns
+    the KPI dict.  It only holds the URL, so it pickles for ``workers=N``
+    (the server still runs points one at a time).
+
+    Parameters
+    ----------
+    url:
+        Server base URL.
+    config_path:
+        Master config used to resolve configs before sending them.
+    timeout:
+        Seconds to wait for a response (a full solve can take minutes).
+    """
+
+    def __init__(
+        self,
+        url: str = DEFAULT_SERVER_URL,
+        config_path: str | Path | None = None,
+        timeout: float = 600.0,
+    ):
+        self.url = url.rstrip("/")
+        self.config_path = Path(config_path) if config_path else None
+        self.timeout = timeout
+
+    def __call__(self, config: Mapping[str, Any]) -> dict:
+        _results, metrics = self.run(self.resolve(config))
+        return metrics.to_dict()
+
+    def resolve(self, config: Mapping[str, Any] | None = None) -> dict[str, Any]:
+        """Resolve *config* (or the master config) into the JSON the server takes."""
+        from dwsim_model.config_loader import ConfigLoader
+
+        return ConfigLoader(config_path=self.config_path, config_data=config).load()
+
+    def health(self) -> dict[str, Any]:
+        return self._request("GET", "/health")
+
+    def run(self, resolved_config: Mapping[str, Any]):
+        """
+        Solve one resolved config on the server.
+
+        Returns
+        -------
+        (FlowsheetResults, GasificationMetrics)
+        """
+        from dwsim_model.results.extractor import FlowsheetResults
+        from dwsim_model.results.metrics import GasificationMetrics
+
+        reply = self._request("POST", "/run", {"config": resolved_config})
+        return (
+            FlowsheetResults.from_dict(reply["results"]),
+            GasificationMetrics.from_state(reply["metrics"]),
+        )
+
+    def sweep(
+        self,
+        resolved_configs: Sequence[Mapping[str, Any]],
+        kpis: Sequence[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Solve a batch of resolved configs; returns one sweep row per config."""
+        body = {"configs": list(resolved_configs), "kpis": list(kpis or [])}
+        return self._request("POST", "/sweep", body)["rows"]
+
+    def shutdown(self) -> None:
+        self._request("POST", "/shutdown", {})
+
+    def _request(
+        self, method: str, path: str, body: Mapping[str, Any] | None = None
+    ) -> dict[str, Any]:
+        data = None
+        if body is not None:
+            data = json.dumps(body, default=str).encode("utf-8")
+        request = urllib.request.Request(
+            self.url + path,
+            data=data,
+            method=method,
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as exc:
+            try:
+                message = json.loads(exc.read()).get("error", exc.reason)
+            except Exception:
+                message = exc.reason
+            raise ServerError(f"Model server {path} failed: {message}") from exc
+        except (urllib.error.URLError, OSError) as exc:
+            raise ServerError(
+                f"Model server at {self.url} is not reachable: {exc}"
+            ) from exc
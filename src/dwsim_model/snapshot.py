@@ -0,0 +1,177 @@
+"""
+snapshot.py
+===========
+Saved copies of the built (but not yet configured) gasification flowsheet.
+
+Why this exists
+---------------
+``GasificationFlowsheet.build_flowsheet()`` creates every stream and unit
+operation and wires them together one ``AddObject`` / ``ConnectObjects``
+interop call at a time, then configures the three reactors.  None of that
+depends on the feed conditions — only on the reactor types, the compound
+set, the property package and the reactor contracts.  Doing it again in
+every sweep worker and every ``run`` is wasted start-up time.
+
+With a ``SnapshotStore`` the first build of a given combination is saved
+with ``FlowsheetBuilder.save`` right after reactor configuration, before
+any feed or energy values are applied.  Later builds with the same key
+load that file with ``FlowsheetBuilder.load``, rebind the builder's
+``materials`` / ``energy_streams`` / ``operations`` by object name and go
+straight to applying the config.
+
+The snapshot key
+----------------
+SHA-256 over the reactor types, compound set, property package, the
+contents of the reactor contract YAML files, the source of the modules
+that define the topology, and the package version.  Editing any of those
+selects a new snapshot; stale files are simply never loaded again.
+
+Usage
+-----
+    from dwsim_model.gasification import GasificationFlowsheet
+    from dwsim_model.snapshot import SnapshotStore
+
+    flowsheet = GasificationFlowsheet(snapshots=SnapshotStore())
+    flowsheet.build_flowsheet()   # first time: full build + save
+                                  # afterwards: a single LoadFlowsheet call
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Iterable, Mapping, Sequence
+from pathlib import Path
+
+from dwsim_model import __version__
+from dwsim_model.constants import DEFAULT_PROPERTY_PACKAGE
+from dwsim_model.profiling import span
+
+logger = logging.getLogger(__name__)
+
+#: Default snapshot location, next to the result cache.
+DEFAULT_SNAPSHOT_DIR = Path("results") / ".snapshots"
+
+#: Modules whose code determines what a freshly built flowsheet contains.
+_TOPOLOGY_SOURCES = ("core.py", "gasification.py", "topology.py")
+
+#: Bump when the snapshot layout or what it contains changes.
+_SNAPSHOT_FORMAT = 1
+
+
+def snapshot_key(
+    reactor_types: Mapping[str, str],
+    compound_set: Sequence[str],
+    property_package: str = DEFAULT_PROPERTY_PACKAGE,
+) -> str:
+    """Return the content hash identifying one prebuilt flowsheet."""
+    from dwsim_model.chemistry.reactions import (
+        REACTOR_CONTRACT_CACHE,
+        REACTOR_CONTRACTS,
+        reactor_contract_path,
+    )
+
+    package_dir = Path(__file__).resolve().parent
+    payload = {
+        "reactor_types": dict(reactor_types),
+        "compound_set": list(compound_set),
+        "property_package": property_package,
+        "contracts": {
+            stage: REACTOR_CONTRACT_CACHE.digest(reactor_contract_path(filename))
+            for stage, filename in REACTOR_CONTRACTS.items()
+        },
+        "sources": {
+            name: _file_digest(package_dir / name) for name in _TOPOLOGY_SOURCES
+        },
+        "package_version": __version__,
+        "format": _SNAPSHOT_FORMAT,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _file_digest(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class SnapshotStore:
+    """
+    Directory of saved flowsheets, one file per snapshot key.
+
+    Parameters
+    ----------
+    directory:
+        Where snapshot files are stored.  Created on first save.
+    """
+
+    def __init__(self, directory: str | Path = DEFAULT_SNAPSHOT_DIR):
+        self.directory = Path(directory)
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key[:32]}.dwxml"
+
+    def load(self, builder, key: str, required: Iterable[str] = ()) -> bool:
+        """
+        Load the snapshot for *key* into *builder*.
+
+        Returns False (and leaves *builder* untouched) on a miss.  A file
+        that cannot be loaded, or that lacks any of the *required* object
+        names, is deleted so the next build writes a fresh one.
+        """
+        path = self.path_for(key)
+        if not path.exists():
+            return False
+
+        with span("load_snapshot"):
+            try:
+                builder.load(str(path))
+            except Exception as exc:
+                logger.warning(f"Discarding unreadable snapshot {path.name}: {exc}")
+                path.unlink(missing_ok=True)
+                return False
+
+        known = set(builder.materials) | set(builder.energy_streams)
+        known |= set(builder.operations)
+        missing = [name for name in required if name not in known]
+        if missing:
+            logger.warning(
+                f"Discarding snapshot {path.name}: missing objects {missing}."
+            )
+            path.unlink(missing_ok=True)
+            return False
+
+        logger.info(f"Flowsheet snapshot loaded: {key[:12]}")
+        return True
+
+    def save(self, builder, key: str) -> Path | None:
+        """
+        Save *builder*'s flowsheet as the snapshot for *key*.
+
+        Failures are logged and reported as None — a missing snapshot only
+        costs the next build its speed-up.
+        """
+        path = self.path_for(key)
+        # Several sweep workers may build the same snapshot at once: write
+        # to a per-process name and rename, so readers never see half a file.
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp{path.suffix}")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            builder.save(str(tmp))
+            os.replace(tmp, path)
+        except Exception as exc:
+            logger.warning(f"Could not save flowsheet snapshot {path.name}: {exc}")
+            tmp.unlink(missing_ok=True)
+            return None
+
+        logger.info(f"Flowsheet snapshot stored: {key[:12]}")
+        return path
+
+    def clear(self) -> None:
+        """Remove every snapshot."""
+        for path in self.directory.glob("*.dwxml"):
+            path.unlink(missing_ok=True)
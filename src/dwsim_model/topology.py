@@ -1,9 +1,22 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterable
 
 Connector = Callable[[object, object, int, int], None]
 
+#: Process stages in flow order.  Each stage hands its syngas to the next
+#: through the stream in ``STAGE_OUTLETS``; "cleanup" is the quench,
+#: baghouse, scrubber and blower train after the TRC.
+STAGES: tuple[str, ...] = ("gasifier", "pem", "trc", "cleanup")
+
+#: Syngas stream leaving each reactor stage (= inlet of the next stage).
+STAGE_OUTLETS: dict[str, str] = {
+    "gasifier": "Syngas_Pre_PEM",
+    "pem": "Syngas_Pre_TRC",
+    "trc": "Syngas_Pre_Quench",
+}
+
 
 def _connect(
     connect: Connector, source, target, source_port: int = 0, target_port: int = 0
@@ -179,3 +192,104 @@ def build_trc_stage(
         "reactor": reactor,
         "syngas_out": syngas_out,
     }
+
+
+def build_cleanup_stage(
+    builder,
+    connect: Connector,
+    syngas_inlet=None,
+    syngas_inlet_name: str = "Syngas_Pre_Quench",
+) -> dict[str, object]:
+    """Create the quench, baghouse, scrubber and blower train and wire it."""
+    feed_syngas = syngas_inlet or builder.add_object(
+        "MaterialStream", syngas_inlet_name, 1950, 350
+    )
+    water_inj = builder.add_object(
+        "MaterialStream", "Quench_Water_Injection", 1950, 200
+    )
+    n2_inj = builder.add_object("MaterialStream", "Quench_Nitrogen", 1950, 250)
+    stm_inj = builder.add_object("MaterialStream", "Quench_Steam", 1950, 300)
+
+    quench = builder.add_object("Mixer", "Quench_Vessel", 2100, 350)
+    quenched = builder.add_object("MaterialStream", "Syngas_Pre_Baghouse", 2200, 350)
+
+    baghouse = builder.add_object("SolidSeparator", "Baghouse", 2350, 350)
+    filtered = builder.add_object("MaterialStream", "Clean_Syngas_Pre_Scrub", 2450, 350)
+    baghouse_solids = builder.add_object(
+        "MaterialStream", "Baghouse_Solids_Out", 2450, 450
+    )
+
+    scrubber = builder.add_object("ComponentSeparator", "Scrubber", 2600, 350)
+    scrubbed = builder.add_object("MaterialStream", "Scrubbed_Syngas", 2700, 350)
+    scrubber_blowdown = builder.add_object(
+        "MaterialStream", "Scrubber_Blowdown", 2700, 450
+    )
+
+    blower = builder.add_object("Compressor", "Blower", 2850, 350)
+    product = builder.add_object("MaterialStream", "Final_Syngas", 2950, 350)
+    e_blower = builder.add_object("EnergyStream", "E_Blower", 2850, 250)
+
+    _connect(connect, feed_syngas, quench, 0, 0)
+    _connect(connect, water_inj, quench, 0, 1)
+    _connect(connect, n2_inj, quench, 0, 2)
+    _connect(connect, stm_inj, quench, 0, 3)
+    _connect(connect, quench, quenched, 0, 0)
+
+    _connect(connect, quenched, baghouse, 0, 0)
+    _connect(connect, baghouse, filtered, 0, 0)
+    _connect(connect, baghouse, baghouse_solids, 1, 0)
+
+    _connect(connect, filtered, scrubber, 0, 0)
+    _connect(connect, scrubber, scrubbed, 0, 0)
+    _connect(connect, scrubber, scrubber_blowdown, 1, 0)
+
+    _connect(connect, scrubbed, blower, 0, 0)
+    _connect(connect, blower, product, 0, 0)
+    _connect(connect, e_blower, blower, 0, 1)
+
+    return {
+        "syngas_in": feed_syngas,
+        "product": product,
+    }
+
+
+def downstream_order(
+    connections: Iterable[tuple[str, str]], changed: Iterable[str]
+) -> list[str] | None:
+    """
+    Return *changed* and every object downstream of it, in dependency order.
+
+    *connections* are ``(source, target)`` object-name pairs as recorded by
+    ``FlowsheetBuilder.connect``.  Objects upstream of the changes are not
+    included, so their converged state can be kept.  Returns None if the
+    affected part of the flowsheet contains a cycle (a recycle loop), which
+    needs the full solver.
+    """
+    edges: dict[str, list[str]] = {}
+    for source, target in connections:
+        edges.setdefault(source, []).append(target)
+
+    affected = set(changed)
+    queue = deque(affected)
+    while queue:
+        for target in edges.get(queue.popleft(), ()):
+            if target not in affected:
+                affected.add(target)
+                queue.append(target)
+
+    indegree = dict.fromkeys(affected, 0)
+    for source in affected:
+        for target in edges.get(source, ()):
+            indegree[target] += 1
+
+    ready = deque(sorted(name for name, n in indegree.items() if n == 0))
+    order: list[str] = []
+    while ready:
+        name = ready.popleft()
+        order.append(name)
+        for target in edges.get(name, ()):
+            indegree[target] -= 1
+            if indegree[target] == 0:
+                ready.append(target)
+
+    return order if len(order) == len(affected) else None
@@ -39,6 +39,8 @@ if not clr_available:
 
     def patched_init(self, dwsim_path=None):
         original_init(self, dwsim_path)
+        if not isinstance(self.sim, MagicMock):
+            return  # a real backend (e.g. the fake one) swapped in by a test
 
         self._mock_compounds = []
 
@@ -58,7 +60,8 @@ if not clr_available:
 
     def patched_add_pp(self, package_name="Peng-Robinson (PR)"):
         pkg = original_add_pp(self, package_name)
-        self._mock_packages.append(pkg)
+        if hasattr(self, "_mock_packages"):
+            self._mock_packages.append(pkg)
         return pkg
 
     core.FlowsheetBuilder.__init__ = patched_init
@@ -68,13 +71,27 @@ if not clr_available:
 FILE_MARKERS = {
     "test_biomass_decomposer.py": ("unit",),
     "test_metrics.py": ("unit",),
+    "test_overlay.py": ("unit",),
+    "test_profiling.py": ("unit",),
+    "test_reporter.py": ("unit",),
     "test_schema.py": ("unit",),
+    "test_surrogate.py": ("unit",),
     "test_builder.py": ("contract",),
+    "test_cache.py": ("contract",),
     "test_config_loader.py": ("contract",),
+    "test_continuation.py": ("contract",),
+    "test_extractor.py": ("unit",),
+    "test_compounds.py": ("unit",),
+    "test_fake_backend.py": ("contract",),
     "test_gasification_build.py": ("contract",),
     "test_reactions.py": ("contract",),
+    "test_scenarios.py": ("contract",),
+    "test_server.py": ("contract",),
+    "test_snapshot.py": ("contract",),
+    "test_stages.py": ("contract",),
     "test_sweep.py": ("contract",),
     "test_topology.py": ("contract",),
+    "test_warm.py": ("contract",),
     "test_acceptance_baseline.py": ("acceptance", "integration"),
     "test_gasification_module.py": ("dwsim", "integration"),
     "test_standalone.py": ("dwsim", "integration"),
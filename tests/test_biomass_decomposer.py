@@ -318,3 +318,96 @@ class TestHHVEstimation:
         assert decomposer.estimate_hhv(high_C_feed) > decomposer.estimate_hhv(
             low_C_feed
         )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Batch decomposition
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _library(pine_feed, rows):
+    """Column dict of *rows* (overrides of the pine feed)."""
+    table = {key: [] for key in (*pine_feed.ultimate_daf, "moisture_ar", "ash_ar")}
+    for overrides in rows:
+        row = {
+            **pine_feed.ultimate_daf,
+            "moisture_ar": pine_feed.moisture_ar,
+            "ash_ar": pine_feed.ash_ar,
+            **overrides,
+        }
+        for key, column in table.items():
+            column.append(row[key])
+    return table
+
+
+class TestDecomposeBatch:
+    def test_rows_match_scalar_decompose(self, pine_feed, standard_decomposer):
+        np = pytest.importorskip("numpy")
+        batch = standard_decomposer.decompose_batch(
+            _library(pine_feed, [{}, {"moisture_ar": 0.40}])
+        )
+
+        expected = standard_decomposer.decompose(pine_feed)
+        assert batch.compounds == tuple(standard_decomposer.compound_names)
+        for j, name in enumerate(batch.compounds):
+            assert batch.mole_fractions[0, j] == pytest.approx(expected.get(name, 0.0))
+        assert batch.hhv_mj_kg[0] == pytest.approx(
+            standard_decomposer.estimate_hhv(pine_feed)
+        )
+        assert batch.valid.tolist() == [True, True]
+        assert np.nansum(batch.mole_fractions, axis=1) == pytest.approx([1.0, 1.0])
+
+    def test_invalid_rows_are_masked_not_raised(self, pine_feed, standard_decomposer):
+        np = pytest.importorskip("numpy")
+        rows = [
+            {},
+            {"C": 50.1},  # percentages instead of fractions
+            {"moisture_ar": 0.70},
+            {"moisture_ar": 0.55, "ash_ar": 0.50},  # nothing left on a daf basis
+            {"H": float("nan")},
+        ]
+
+        batch = standard_decomposer.decompose_batch(_library(pine_feed, rows))
+
+        assert batch.valid.tolist() == [True, False, False, False, False]
+        assert batch.checks["ultimate_sum"].tolist()[1] is False
+        assert batch.checks["moisture_range"].tolist()[2] is False
+        assert batch.checks["daf_positive"].tolist()[3] is False
+        assert batch.checks["finite"].tolist()[4] is False
+        assert np.isnan(batch.mole_fractions[1:]).all()
+        assert np.isnan(batch.hhv_mj_kg[1:]).all()
+
+    def test_columns_follow_requested_compounds(self, pine_feed):
+        pytest.importorskip("numpy")
+        decomposer = BiomassDecomposer()
+        table = _library(pine_feed, [{}])
+        moisture, ash = table.pop("moisture_ar"), table.pop("ash_ar")
+
+        batch = decomposer.decompose_batch(
+            table, moisture, ash, compounds=["Hydrogen", "Nitrogen", "Carbon monoxide"]
+        )
+
+        expected = decomposer.decompose(pine_feed)
+        assert batch.mole_fractions[0].tolist() == pytest.approx(
+            [expected["Hydrogen"], 0.0, expected["Carbon monoxide"]]
+        )
+        assert batch.unmapped_fraction[0] == pytest.approx(
+            1.0 - expected["Hydrogen"] - expected["Carbon monoxide"]
+        )
+
+    def test_accepts_a_dataframe(self, pine_feed, standard_decomposer):
+        pd = pytest.importorskip("pandas")
+        frame = pd.DataFrame(_library(pine_feed, [{}, {"ash_ar": 0.2}]))
+
+        batch = standard_decomposer.decompose_batch(frame)
+
+        assert len(batch) == 2
+        assert batch.valid.all()
+
+    def test_missing_moisture_column_raises(self, pine_feed, standard_decomposer):
+        pytest.importorskip("numpy")
+        table = _library(pine_feed, [{}])
+        del table["moisture_ar"]
+
+        with pytest.raises(ValueError, match="moisture_ar"):
+            standard_decomposer.decompose_batch(table)
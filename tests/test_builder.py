@@ -23,3 +23,54 @@ def test_builder_property_package():
     _prop_pack = builder.add_property_package("Peng-Robinson (PR)")
     packages = list(builder.sim.PropertyPackages.Values)
     assert len(packages) > 0
+
+
+def _chain_builder():
+    """Feed -> Reactor -> Product, with a mocked DWSIM flowsheet."""
+    from unittest.mock import MagicMock
+
+    builder = FlowsheetBuilder()
+    builder.sim = MagicMock()
+    builder.sim.AddObject.side_effect = lambda *args: MagicMock()
+    feed = builder.add_object("MaterialStream", "Feed")
+    reactor = builder.add_object("RCT_Gibbs", "Reactor")
+    product = builder.add_object("MaterialStream", "Product")
+    builder.connect(feed, reactor)
+    builder.connect(reactor, product)
+    return builder, feed, reactor, product
+
+
+def test_builder_records_connections_by_name():
+    builder, *_ = _chain_builder()
+    assert builder.connections == [("Feed", "Reactor"), ("Reactor", "Product")]
+
+
+def test_builder_calculate_changed_recalculates_downstream_only():
+    builder, feed, reactor, product = _chain_builder()
+    builder.calculate(changed=["Reactor"])
+
+    feed.Calculate.assert_not_called()
+    reactor.Calculate.assert_called_once()
+    product.Calculate.assert_called_once()
+    builder.interf.CalculateFlowsheet2.assert_not_called()
+
+
+def test_builder_calculate_changed_energy_stream_recalculates_its_unit():
+    builder, feed, reactor, product = _chain_builder()
+    duty = builder.add_object("EnergyStream", "E_Duty")
+    builder.connect(reactor, duty)
+
+    builder.calculate(changed=["E_Duty"])
+
+    feed.Calculate.assert_not_called()
+    reactor.Calculate.assert_called_once()
+    product.Calculate.assert_called_once()
+    builder.interf.CalculateFlowsheet2.assert_not_called()
+
+
+def test_builder_calculate_unknown_change_runs_full_solve():
+    builder, feed, *_ = _chain_builder()
+    builder.calculate(changed=["Nope"])
+
+    feed.Calculate.assert_not_called()
+    builder.interf.CalculateFlowsheet2.assert_called_once_with(builder.sim)
@@ -0,0 +1,175 @@
+"""
+tests/test_cache.py
+===================
+Tests for the persistent result cache (results/cache.py).
+
+Covers:
+  - round-tripping FlowsheetResults + GasificationMetrics through disk
+  - key sensitivity to config, reactor mode and compound list
+  - LRU eviction by directory size
+  - recovery from corrupt entries
+  - the ParameterSweep default runner skipping the solve on a hit
+  - unconverged solves never being stored
+"""
+
+import os
+
+import pytest
+
+from dwsim_model.analysis.sweep import ParameterSweep, _default_model_runner
+from dwsim_model.results.cache import ResultCache, config_cache_key
+from dwsim_model.results.extractor import (
+    EnergyStreamResult,
+    FlowsheetResults,
+    StreamResult,
+)
+from dwsim_model.results.metrics import GasificationMetrics
+
+_CONFIG = {
+    "feeds": {"Gasifier_Biomass_Feed": {"temperature_C": 25.0, "mass_flow_kg_s": 10.0}},
+    "energy_streams": {"E_Gasifier_Heat": 4000.0},
+}
+
+
+def _results() -> FlowsheetResults:
+    return FlowsheetResults(
+        streams={
+            "Final_Syngas": StreamResult(
+                name="Final_Syngas",
+                temperature_C=850.0,
+                pressure_kPa=101.325,
+                mass_flow_kg_s=9.5,
+                mole_fractions={"Hydrogen": 0.4, "Carbon monoxide": 0.3},
+                mass_fractions={"Hydrogen": 0.05, "Carbon monoxide": 0.5},
+                volumetric_flow_Nm3_h=12000.0,
+            )
+        },
+        energy_streams={
+            "E_Gasifier_Heat": EnergyStreamResult("E_Gasifier_Heat", 4000.0)
+        },
+        converged=True,
+    )
+
+
+def _metrics() -> GasificationMetrics:
+    return GasificationMetrics(
+        cold_gas_efficiency=0.71, h2_co_ratio=1.33, warnings=["tar high"]
+    )
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(tmp_path / ".cache")
+
+
+class TestResultCache:
+    def test_miss_returns_none(self, cache):
+        assert cache.get(_CONFIG) is None
+
+    def test_round_trip(self, cache):
+        cache.put(_CONFIG, _results(), _metrics())
+        results, metrics = cache.get(_CONFIG)
+
+        syngas = results.get_stream("Final_Syngas")
+        assert syngas.temperature_C == 850.0
+        assert syngas.mole_fractions["Hydrogen"] == 0.4
+        assert results.energy_streams["E_Gasifier_Heat"].energy_flow_kW == 4000.0
+        assert results.converged is True
+        assert metrics.cold_gas_efficiency == 0.71
+        assert metrics.warnings == ["tar high"]
+
+    def test_key_depends_on_config_mode_and_compounds(self):
+        changed = {**_CONFIG, "energy_streams": {"E_Gasifier_Heat": 4100.0}}
+        base = config_cache_key(_CONFIG)
+        assert config_cache_key(dict(reversed(list(_CONFIG.items())))) == base
+        assert config_cache_key(changed) != base
+        assert config_cache_key(_CONFIG, reactor_mode="conversion") != base
+        assert config_cache_key(_CONFIG, compound_set=["Hydrogen"]) != base
+
+    def test_evicts_least_recently_used(self, cache):
+        configs = [{"feeds": {}, "energy_streams": {"E": float(i)}} for i in range(3)]
+        paths = [cache.put(c, _results(), _metrics()) for c in configs]
+        for age, path in enumerate(reversed(paths)):
+            os.utime(path, (1000.0 - age, 1000.0 - age))
+
+        # A hit on the oldest entry makes it the most recently used.
+        assert cache.get(configs[0]) is not None
+
+        cache.max_bytes = paths[0].stat().st_size * 2
+        assert cache.evict() == 1
+        assert paths[0].exists()
+        assert not paths[1].exists()
+        assert paths[2].exists()
+
+    def test_corrupt_entry_is_discarded(self, cache):
+        path = cache.put(_CONFIG, _results(), _metrics())
+        path.write_text("{not json", encoding="utf-8")
+
+        assert cache.get(_CONFIG) is None
+        assert not path.exists()
+
+    def test_clear(self, cache):
+        cache.put(_CONFIG, _results(), _metrics())
+        cache.clear()
+        assert cache.get(_CONFIG) is None
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    """Fake flowsheet stack; returns the build log and the results to extract."""
+    builds = []
+    solved = {"results": _results()}
+
+    class FakeFlowsheet:
+        def __init__(self, runtime_config=None, snapshots=None):
+            self.compound_set = ["Hydrogen", "Carbon monoxide"]
+            self.builder = object()
+
+        def build_flowsheet(self):
+            builds.append(1)
+
+        def run(self):
+            pass
+
+    class FakeExtractor:
+        def __init__(self, compound_names=None, key_streams=None, plan=None):
+            pass
+
+        def extract(self, builder):
+            return solved["results"]
+
+    class FakeCalculator:
+        def calculate(self, results):
+            return _metrics()
+
+    monkeypatch.setattr("dwsim_model.gasification.GasificationFlowsheet", FakeFlowsheet)
+    monkeypatch.setattr("dwsim_model.results.extractor.ResultsExtractor", FakeExtractor)
+    monkeypatch.setattr("dwsim_model.results.metrics.MetricsCalculator", FakeCalculator)
+    return builds, solved
+
+
+def test_default_runner_skips_solve_on_cache_hit(fake_model, cache):
+    builds, _solved = fake_model
+
+    first = _default_model_runner(dict(_CONFIG), cache=cache)
+    second = _default_model_runner(dict(_CONFIG), cache=cache)
+
+    assert first == second
+    assert first["cold_gas_efficiency"] == 0.71
+    assert len(builds) == 1
+
+
+def test_default_runner_does_not_cache_unconverged_solve(fake_model, cache):
+    builds, solved = fake_model
+    solved["results"].converged = False
+
+    _default_model_runner(dict(_CONFIG), cache=cache)
+    _default_model_runner(dict(_CONFIG), cache=cache)
+
+    assert len(builds) == 2
+    assert cache.get(_CONFIG) is None
+
+
+def test_sweep_ignores_cache_with_custom_runner(cache):
+    ps = ParameterSweep(model_runner=lambda cfg: {"ok": 1}, cache=cache)
+    assert ps._runner({}) == {"ok": 1}
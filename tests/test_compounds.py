@@ -0,0 +1,52 @@
+"""
+tests/test_compounds.py
+=======================
+Unit tests for the compiled compound registry (compounds.py).
+"""
+
+import pytest
+
+from dwsim_model.compounds import KNOWN_COMPOUNDS, compound_registry
+from dwsim_model.constants import CARBON_MASS_FRACTION, LHV_MJ_KG, MW_G_MOL
+
+NAMES = ["Hydrogen", "Carbon monoxide", "Naphthalene", "Unobtainium"]
+
+
+def test_vectors_are_aligned_with_names():
+    registry = compound_registry(NAMES)
+
+    assert registry.names == tuple(NAMES)
+    assert list(registry.mw_g_mol) == [
+        MW_G_MOL["Hydrogen"],
+        MW_G_MOL["Carbon monoxide"],
+        MW_G_MOL["Naphthalene"],
+        0.0,
+    ]
+    assert list(registry.is_tar) == [0.0, 0.0, 1.0, 0.0]
+    assert compound_registry(NAMES) is registry  # cached per compound list
+
+
+def test_mixture_properties_match_dict_scans():
+    registry = compound_registry()
+    w = {"Hydrogen": 0.1, "Carbon monoxide": 0.6, "Toluene": 0.05, "Argon": 0.25}
+
+    assert registry.lhv(w) == pytest.approx(
+        sum(wf * LHV_MJ_KG.get(c, 0.0) for c, wf in w.items())
+    )
+    assert registry.carbon_fraction(w) == pytest.approx(
+        sum(wf * CARBON_MASS_FRACTION.get(c, 0.0) for c, wf in w.items())
+    )
+    assert registry.tar_fraction(w) == pytest.approx(0.05)
+    assert set(KNOWN_COMPOUNDS) >= set(w)
+
+
+def test_aligned_vector_and_mapping_agree():
+    registry = compound_registry(NAMES)
+    x = {"Hydrogen": 0.5, "Carbon monoxide": 0.5, "Unobtainium": 0.0}
+
+    assert registry.mixture_mw(x) == pytest.approx(
+        registry.mixture_mw([0.5, 0.5, 0.0, 0.0])
+    )
+    assert registry.element_moles(x) == pytest.approx(
+        {"C": 0.5, "H": 1.0, "O": 0.5, "N": 0.0, "S": 0.0}
+    )
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import copy
+import os
+import shutil
 from pathlib import Path
 
 import pytest
 
+from dwsim_model import config_loader
+from dwsim_model.config.bundle import (
+    StaleBundleError,
+    compile_config,
+    load_bundle,
+    read_bundle,
+)
 from dwsim_model.config_loader import ConfigLoader
 
 
@@ -81,3 +91,167 @@ def test_load_master_config_raises_for_invalid_feed_config(tmp_path: Path) -> No
 
     with pytest.raises(ValueError, match="Gasifier_Biomass_Feed"):
         loader.load()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Compiled bundles
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def config_copy(tmp_path: Path) -> Path:
+    shutil.copytree("config", tmp_path / "config")
+    return tmp_path / "config" / "master_config.yaml"
+
+
+def test_bundle_loads_the_same_config_without_reading_sources(
+    config_copy: Path, monkeypatch
+) -> None:
+    expected = ConfigLoader(config_path=config_copy).load()
+    bundle = compile_config(config_copy)
+    monkeypatch.setattr(config_loader, "_load_file", _no_read)
+
+    loader = ConfigLoader(config_path=bundle)
+
+    assert bundle == config_copy.with_suffix(".cfgbundle")
+    assert loader.load() == expected
+    assert loader.sources == []
+
+
+def test_bundle_records_every_source(config_copy: Path) -> None:
+    sources = read_bundle(compile_config(config_copy)).sources
+
+    names = {Path(p).name for p in sources}
+    assert {"master_config.yaml", "baseline.yaml", "energy_inputs.yaml"} <= names
+    assert "gasifier_reactions.yaml" in names
+
+
+def test_edited_source_makes_bundle_stale(config_copy: Path) -> None:
+    bundle = compile_config(config_copy)
+    scenario = config_copy.parent / "scenarios" / "baseline.yaml"
+    text = scenario.read_text(encoding="utf-8")
+    scenario.write_text(
+        text.replace("E_PEM_AC_Power: 5000000.0", "E_PEM_AC_Power: 4000000.0"),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(StaleBundleError, match=r"baseline\.yaml"):
+        load_bundle(bundle)
+    # The loader falls back to the sources.
+    config = ConfigLoader(config_path=bundle).load()
+    assert config["energy_streams"]["E_PEM_AC_Power"] == pytest.approx(4_000_000.0)
+
+
+def test_touched_source_keeps_bundle_fresh(config_copy: Path) -> None:
+    bundle = compile_config(config_copy)
+    stat = config_copy.stat()
+    os.utime(config_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert read_bundle(bundle).stale_sources() == []
+
+
+def test_compile_config_cli(config_copy: Path, tmp_path: Path) -> None:
+    from dwsim_model.__main__ import main
+
+    output = tmp_path / "compiled.cfgbundle"
+
+    assert (
+        main(["compile-config", "--config", str(config_copy), "--output", str(output)])
+        == 0
+    )
+    assert load_bundle(output)["feeds"]
+
+
+def _no_read(path):
+    raise AssertionError(f"read {path} instead of the bundle")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Differential application
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class RecordingStream:
+    def __init__(self):
+        self.writes: list[tuple[str, float]] = []
+
+    def SetPropertyValue(self, prop: str, value: float) -> None:
+        self.writes.append((prop, value))
+
+
+FEED = {
+    "temperature_C": 25.0,
+    "pressure_Pa": 101325.0,
+    "mass_flow_kg_s": 10.0,
+    "components": {"Hydrogen": 0.5, "Carbon monoxide": 0.5},
+}
+
+
+def _apply(config: dict, previous: dict | None):
+    streams = {"Feed": RecordingStream()}
+    energy = {"E_Power": RecordingStream()}
+    loader = ConfigLoader(config_data=config)
+    loader.config = config
+    changed = loader.apply_to_flowsheet(None, streams, energy, previous=previous)
+    return changed, streams["Feed"].writes, energy["E_Power"].writes
+
+
+def test_apply_without_previous_writes_everything() -> None:
+    changed, writes, energy = _apply(
+        {"feeds": {"Feed": FEED}, "energy_streams": {"E_Power": 1000.0}}, None
+    )
+
+    assert changed == ["Feed", "E_Power"]
+    assert len(writes) == 5
+    assert energy == [("PROP_ES_0", pytest.approx(1.0))]
+
+
+def test_apply_with_previous_writes_only_changed_values() -> None:
+    previous = {"feeds": {"Feed": FEED}, "energy_streams": {"E_Power": 1000.0}}
+    feed = dict(FEED, mass_flow_kg_s=12.0, temperature_K=298.15)
+    del feed["temperature_C"]
+
+    changed, writes, energy = _apply(
+        {"feeds": {"Feed": feed}, "energy_streams": {"E_Power": 1000.0}}, previous
+    )
+
+    # 25 °C == 298.15 K, so only the flow is written.
+    assert changed == ["Feed"]
+    assert writes == [("MassFlow", 12.0)]
+    assert energy == []
+
+
+def test_apply_with_previous_diffs_compositions() -> None:
+    previous = {"feeds": {"Feed": FEED}}
+    feed = dict(FEED, components={"Hydrogen": 0.5, "Methane": 0.5})
+
+    _changed, writes, _energy = _apply({"feeds": {"Feed": feed}}, previous)
+
+    assert sorted(writes) == [
+        ("MoleFraction.Carbon monoxide", 0.0),
+        ("MoleFraction.Methane", 0.5),
+    ]
+
+
+def test_apply_with_unchanged_previous_writes_nothing() -> None:
+    config = {"feeds": {"Feed": FEED}, "energy_streams": {"E_Power": 1000.0}}
+
+    assert _apply(config, copy.deepcopy(config)) == ([], [], [])
+
+
+def test_failed_fraction_write_is_reported_as_error() -> None:
+    class RejectingStream(RecordingStream):
+        def SetPropertyValue(self, prop: str, value: float) -> None:
+            if prop == "MoleFraction.Methane":
+                raise RuntimeError("unknown compound")
+            super().SetPropertyValue(prop, value)
+
+    feed = dict(FEED, components={"Hydrogen": 0.5, "Methane": 0.5})
+    loader = ConfigLoader(config_data={})
+    loader.config = {"feeds": {"Feed": feed}}
+
+    loader.apply_to_flowsheet(None, {"Feed": RejectingStream()}, {}, previous=None)
+
+    assert loader._errors == [
+        "Feed: could not set fraction for 'Methane': unknown compound"
+    ]
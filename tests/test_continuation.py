@@ -0,0 +1,174 @@
+"""
+tests/test_continuation.py
+==========================
+Contract tests for continuation sweeps (analysis/continuation.py).
+
+Point ordering is checked with a recording runner; warm starts are checked
+end to end on the fake DWSIM backend, run on a virtual clock so that solve
+times are exact multiples of the simulated reactor iterations.
+"""
+
+from __future__ import annotations
+
+import copy
+import math
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from dwsim_model import core, fake_backend
+from dwsim_model.analysis.continuation import (
+    ContinuationRunner,
+    grid_order,
+    nearest_neighbour_order,
+    serpentine_order,
+)
+from dwsim_model.analysis.sweep import ParameterSweep
+from dwsim_model.config_loader import ConfigLoader
+from dwsim_model.fake_backend import FakeAutomation, ObjectType
+
+MASTER_CONFIG = Path(__file__).resolve().parents[1] / "config" / "master_config.yaml"
+FLOW_FEED = "Gasifier_Steam_Feed"
+
+#: Virtual solve time per simulated reactor iteration.
+ITERATION_S = 1e-3
+
+
+@pytest.fixture
+def fake_dwsim(monkeypatch):
+    """Fake backend whose iteration latency advances a virtual clock."""
+    automation = FakeAutomation(iteration_latency_s=ITERATION_S)
+    clock = SimpleNamespace(now=0.0)
+
+    def sleep(seconds):
+        clock.now += seconds
+
+    monkeypatch.setattr(fake_backend, "time", SimpleNamespace(sleep=sleep))
+    monkeypatch.setattr(core, "time", SimpleNamespace(perf_counter=lambda: clock.now))
+    monkeypatch.setattr(
+        core, "get_automation", lambda dwsim_path=None: (automation, ObjectType)
+    )
+
+
+def _missing(value) -> bool:
+    """None, or NaN once the rows went through a DataFrame."""
+    return value is None or math.isnan(value)
+
+
+def test_serpentine_reverses_every_other_row():
+    assert serpentine_order(3, 3) == [0, 1, 2, 5, 4, 3, 6, 7, 8]
+
+
+def test_nearest_neighbour_walks_adjacent_points():
+    coords = [(a, b) for a in (0.0, 1.0) for b in (0.0, 10.0, 20.0)]
+    assert nearest_neighbour_order(coords) == [0, 1, 2, 5, 4, 3]
+    with pytest.raises(ValueError, match="Unknown point order"):
+        grid_order("spiral", (2, 3), coords)
+
+
+def test_sweep_2d_solves_in_order_but_returns_grid_order():
+    seen = []
+
+    def runner(config):
+        seen.append((config["a"], config["b"]))
+        return {"kpi": config["a"] * 10 + config["b"], "warm_started": True}
+
+    ps = ParameterSweep(model_runner=runner)
+    ps.set_base_config({"a": 0.0, "b": 0.0})
+    rows = ps.sweep_2d(
+        "a", [1.0, 2.0], "b", [1.0, 2.0, 3.0], kpis=["kpi"], order="serpentine"
+    )
+    rows = rows.to_dict("records") if hasattr(rows, "to_dict") else rows
+
+    assert seen == [(1, 1), (1, 2), (1, 3), (2, 3), (2, 2), (2, 1)]
+    assert [(r["a"], r["b"]) for r in rows] == [
+        (1, 1),
+        (1, 2),
+        (1, 3),
+        (2, 1),
+        (2, 2),
+        (2, 3),
+    ]
+    # Warm-start columns survive KPI filtering.
+    assert all(r["warm_started"] for r in rows)
+
+
+def test_runner_warm_starts_from_previous_solution(fake_dwsim):
+    base = ConfigLoader(config_path=MASTER_CONFIG).load()
+    runner = ContinuationRunner(config_path=MASTER_CONFIG, measure_cold=True)
+
+    cold = runner(base)
+    warm = runner(base)
+
+    assert cold["warm_started"] is False
+    assert warm["warm_started"] is True
+    assert warm["solve_time_s"] < cold["solve_time_s"]
+    assert warm["time_saved_s"] == pytest.approx(
+        cold["solve_time_s"] - warm["solve_time_s"]
+    )
+    assert warm["h2_co_ratio"] == pytest.approx(cold["h2_co_ratio"])
+    assert runner.summary()["warm_solves"] == 1
+
+
+def test_savings_compare_each_point_with_its_own_cold_solve(fake_dwsim):
+    base = ConfigLoader(config_path=MASTER_CONFIG).load()
+    flows = [1.0, 5.0, 20.0, 60.0]
+
+    cold_runner = ContinuationRunner(config_path=MASTER_CONFIG)
+    cold_times = []
+    for flow in flows:
+        config = copy.deepcopy(base)
+        config["feeds"][FLOW_FEED]["mass_flow_kg_s"] = flow
+        cold_runner.reset()
+        cold_times.append(cold_runner(config)["solve_time_s"])
+    assert len(set(cold_times)) > 1
+
+    runner = ContinuationRunner(config_path=MASTER_CONFIG, measure_cold=True)
+    ps = ParameterSweep(model_runner=runner)
+    ps.set_base_config(base)
+    rows = ps.sweep_1d(f"feeds.{FLOW_FEED}.mass_flow_kg_s", flows)
+    rows = rows.to_dict("records") if hasattr(rows, "to_dict") else rows
+
+    assert [r["warm_started"] for r in rows] == [False, True, True, True]
+    assert _missing(rows[0]["time_saved_s"])
+    for row, cold in zip(rows[1:], cold_times[1:], strict=True):
+        assert row["time_saved_s"] == pytest.approx(cold - row["solve_time_s"])
+        assert row["time_saved_s"] > 0
+    assert runner.reference_solves == 3
+
+    # Without measure_cold there is no per-point reference to compare with.
+    plain = ContinuationRunner(config_path=MASTER_CONFIG)
+    plain(base)
+    assert plain(base)["time_saved_s"] is None
+
+
+def test_unconverged_solve_is_neither_seeded_nor_cached(fake_dwsim, monkeypatch):
+    from dwsim_model.results.extractor import ResultsExtractor
+
+    extract = ResultsExtractor.extract
+
+    def unconverged(self, builder):
+        results = extract(self, builder)
+        results.converged = False
+        return results
+
+    monkeypatch.setattr(ResultsExtractor, "extract", unconverged)
+
+    class RecordingCache:
+        stored = 0
+
+        def get(self, resolved):
+            return None
+
+        def put(self, resolved, results, metrics):
+            self.stored += 1
+
+    base = ConfigLoader(config_path=MASTER_CONFIG).load()
+    runner = ContinuationRunner(config_path=MASTER_CONFIG, cache=RecordingCache())
+
+    runner(base)
+    second = runner(base)
+
+    assert runner.cache.stored == 0
+    assert second["warm_started"] is False
@@ -0,0 +1,237 @@
+"""
+tests/test_extractor.py
+=======================
+Unit tests for ResultsExtractor composition reads.
+
+Fake DWSIM streams count interop calls so we can check that the bulk path
+reads each composition vector once per stream, and that the per-property
+path still works when the bulk API is missing.  The array-backed stream
+table (results/table.py) is checked against the dict-based results.
+"""
+
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from dwsim_model.results.extractor import (
+    EnergyStreamResult,
+    FlowsheetResults,
+    ResultsExtractor,
+    StreamResult,
+)
+
+np = pytest.importorskip("numpy")
+
+from dwsim_model.results.table import ResultsStack, StreamTable
+
+_DWSIM_ORDER = ["Water", "Hydrogen", "Carbon monoxide", "Methane"]
+_MOLE = [0.1, 0.5, 0.4, 0.0]
+_MASS = [0.2, 0.1, 0.7, 0.0]
+
+
+class FakeStream:
+    """Material stream exposing scalar properties and composition vectors."""
+
+    def __init__(self, bulk=True):
+        self.calls = 0
+        self._bulk = bulk
+        self.Phases = [
+            SimpleNamespace(Compounds=SimpleNamespace(Keys=list(_DWSIM_ORDER)))
+        ]
+
+    def GetPropertyValue(self, prop):
+        self.calls += 1
+        scalars = {
+            "Temperature": 1123.15,
+            "Pressure": 101325.0,
+            "MassFlow": 2.0,
+            "SpecificEnthalpy": -5000.0,
+        }
+        if prop in scalars:
+            return scalars[prop]
+        basis, compound = prop.split(".", 1)
+        values = _MOLE if basis == "MoleFraction" else _MASS
+        return values[_DWSIM_ORDER.index(compound)]
+
+    def GetOverallComposition(self):
+        self.calls += 1
+        if not self._bulk:
+            raise AttributeError("GetOverallComposition")
+        return list(_MOLE)
+
+    def GetOverallMassComposition(self):
+        self.calls += 1
+        return list(_MASS)
+
+
+def _builder(*streams):
+    return SimpleNamespace(
+        materials={f"S{i}": s for i, s in enumerate(streams)}, energy_streams={}
+    )
+
+
+COMPOUNDS = ["Hydrogen", "Carbon monoxide", "Methane", "Water"]
+
+
+class TestCompositionReads:
+    def test_bulk_path_matches_per_property_path(self):
+        bulk = ResultsExtractor(COMPOUNDS).extract(_builder(FakeStream()))
+        slow = ResultsExtractor(COMPOUNDS, bulk=False).extract(_builder(FakeStream()))
+
+        assert bulk.streams["S0"].mole_fractions == slow.streams["S0"].mole_fractions
+        assert bulk.streams["S0"].mass_fractions == slow.streams["S0"].mass_fractions
+        assert bulk.streams["S0"].mole_fractions == {
+            "Hydrogen": 0.5,
+            "Carbon monoxide": 0.4,
+            "Water": 0.1,
+        }
+
+    def test_bulk_path_uses_two_calls_per_stream(self):
+        streams = [FakeStream() for _ in range(3)]
+        extractor = ResultsExtractor(COMPOUNDS)
+        extractor.extract(_builder(*streams))
+
+        assert extractor.bulk_reads == 3
+        assert extractor.fallback_reads == 0
+        # 4 scalar properties + 2 composition vectors
+        assert all(s.calls == 6 for s in streams)
+
+    def test_falls_back_when_bulk_api_missing(self):
+        streams = [FakeStream(bulk=False), FakeStream(bulk=False)]
+        extractor = ResultsExtractor(COMPOUNDS)
+        results = extractor.extract(_builder(*streams))
+
+        assert extractor.bulk_reads == 0
+        assert extractor.fallback_reads == 2
+        assert results.streams["S1"].mass_fractions["Carbon monoxide"] == 0.7
+        # The failing bulk call is only attempted on the first stream.
+        assert streams[1].calls == 4 + 2 * len(COMPOUNDS)
+
+    def test_unknown_compound_is_absent(self):
+        extractor = ResultsExtractor(["Hydrogen", "Unobtainium"])
+        results = extractor.extract(_builder(FakeStream()))
+        assert results.streams["S0"].mole_fractions == {"Hydrogen": 0.5}
+
+    def test_volumetric_flow_uses_exact_molecular_weights(self):
+        # Regression: the fuzzy MW match mapped "Carbon monoxide" to C.
+        mw_mix = 0.1 * 18.015 + 0.5 * 2.016 + 0.4 * 28.010
+        expected = 2.0 / (mw_mix / 1000.0) * 8.314 * 273.15 / 101325.0 * 3600.0
+        for bulk in (True, False):
+            results = ResultsExtractor(COMPOUNDS, bulk=bulk).extract(
+                _builder(FakeStream())
+            )
+            assert results.streams["S0"].volumetric_flow_Nm3_h == pytest.approx(
+                expected
+            )
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Array-backed results
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+def _run(h2: float, with_quench: bool = True) -> FlowsheetResults:
+    streams = {
+        "Final_Syngas": StreamResult(
+            "Final_Syngas",
+            temperature_C=40.0,
+            mass_flow_kg_s=1.0 + h2,
+            mole_fractions={"Hydrogen": h2, "Carbon monoxide": 1.0 - h2},
+        )
+    }
+    if with_quench:
+        streams["Quench_Water_Injection"] = StreamResult(
+            "Quench_Water_Injection", mass_flow_kg_s=0.5, mole_fractions={"Water": 1.0}
+        )
+    return FlowsheetResults(
+        streams=streams,
+        energy_streams={"E_Blower": EnergyStreamResult("E_Blower", 20.0)},
+        converged=True,
+    )
+
+
+class TestStreamTable:
+    def test_extractor_table_matches_dict_results(self):
+        table = ResultsExtractor(COMPOUNDS).extract(
+            _builder(FakeStream(), FakeStream())
+        )
+        plain = ResultsExtractor(COMPOUNDS, table=False).extract(
+            _builder(FakeStream(), FakeStream())
+        )
+
+        assert isinstance(table.streams, StreamTable)
+        assert table.streams.mole_fractions.shape == (2, len(COMPOUNDS))
+        assert table.get_stream("S1") == plain.get_stream("S1")
+        assert table.to_dict() == plain.to_dict()
+
+    def test_views_write_through_and_pickle(self):
+        results = _run(0.4)
+        results.streams = StreamTable.from_streams(results.streams)
+        view = results.get_stream("Final_Syngas")
+        view.temperature_C = 55.0
+        view.mole_fractions = {"Hydrogen": 0.5, "Carbon monoxide": 0.5}
+
+        row = results.streams.row("Final_Syngas")
+        assert results.streams.temperature_C[row] == 55.0
+        assert results.streams.mole_fractions[row].tolist() == [0.5, 0.5, 0.0]
+        with pytest.raises(KeyError, match="not a column"):
+            view.mole_fractions = {"Argon": 1.0}
+
+        clone = pickle.loads(pickle.dumps(results))
+        assert clone.get_stream("Final_Syngas") == view.to_result()
+
+    def test_stack_runs_into_3d_arrays(self):
+        runs = [_run(0.3), _run(0.5, with_quench=False), _run(0.6)]
+        stack = ResultsStack.from_results(runs)
+
+        assert len(stack) == 3
+        assert stack.mole_fractions.shape == (3, 2, 3)
+        assert stack.fractions("Final_Syngas", "Hydrogen").tolist() == [0.3, 0.5, 0.6]
+        flows = stack.series("Quench_Water_Injection", "mass_flow_kg_s")
+        assert flows[0] == 0.5 and np.isnan(flows[1])
+        assert stack.energy_flow_kW[:, 0].tolist() == [20.0, 20.0, 20.0]
+
+        second = stack.run(1)
+        assert second.get_stream("Final_Syngas") == runs[1].get_stream("Final_Syngas")
+        assert np.shares_memory(second.streams.mole_fractions, stack.mole_fractions)
+        assert second.to_dict()["energy_streams"] == {
+            "E_Blower": {"energy_flow_kW": 20.0}
+        }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Extraction plans
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestExtractionPlan:
+    def test_plan_reads_only_listed_streams_and_properties(self):
+        from dwsim_model.results.extractor import ExtractionPlan
+
+        streams = [FakeStream(), FakeStream()]
+        plan = ExtractionPlan.of({"S0": {"mass_flow_kg_s", "mole_fractions"}})
+        results = ResultsExtractor(COMPOUNDS, plan=plan).extract(_builder(*streams))
+
+        assert list(results.streams) == ["S0"]
+        assert streams[0].calls == 2  # mass flow + mole-fraction vector
+        assert streams[1].calls == 0
+        s0 = results.get_stream("S0")
+        assert s0.mass_flow_kg_s == 2.0
+        assert s0.mole_fractions["Hydrogen"] == 0.5
+        assert s0.mass_fractions == {}
+        assert s0.temperature_C == 0.0
+
+    def test_plans_merge_and_reject_unknown_properties(self):
+        from dwsim_model.results.extractor import ExtractionPlan
+
+        merged = ExtractionPlan.of({"A": {"temperature_C"}}) | ExtractionPlan.of(
+            {"A": {"pressure_kPa"}, "B": {"mass_flow_kg_s"}}, ["E_Blower"]
+        )
+        assert merged.streams == {
+            "A": {"temperature_C", "pressure_kPa"},
+            "B": {"mass_flow_kg_s"},
+        }
+        assert merged.energy_streams == {"E_Blower"}
+        with pytest.raises(ValueError, match="Unknown stream properties"):
+            ExtractionPlan.of({"A": {"colour"}})
@@ -0,0 +1,156 @@
+"""
+tests/test_fake_backend.py
+==========================
+Contract tests for the pure-Python DWSIM stand-in (fake_backend.py).
+
+The whole pipeline — build, config application, solve, extraction and
+metrics — runs against ``FakeAutomation`` instead of the MagicMock
+automation installed by conftest.
+"""
+
+from __future__ import annotations
+
+import copy
+import time
+from pathlib import Path
+
+import pytest
+
+from dwsim_model import core
+from dwsim_model.analysis.warm import WarmModelRunner
+from dwsim_model.config_loader import ConfigLoader
+from dwsim_model.fake_backend import CP_J_KG_K, FakeAutomation, ObjectType
+from dwsim_model.gasification import GasificationFlowsheet
+from dwsim_model.results.extractor import ResultsExtractor
+
+MASTER_CONFIG = Path(__file__).resolve().parents[1] / "config" / "master_config.yaml"
+
+
+@pytest.fixture
+def automation(monkeypatch):
+    automation = FakeAutomation()
+    monkeypatch.setattr(
+        core, "get_automation", lambda dwsim_path=None: (automation, ObjectType)
+    )
+    return automation
+
+
+def _solve(config=None):
+    flowsheet = GasificationFlowsheet(
+        config_path=str(MASTER_CONFIG), runtime_config=config
+    )
+    flowsheet.build_flowsheet()
+    flowsheet.run()
+    results = ResultsExtractor(compound_names=flowsheet.compound_set).extract(
+        flowsheet.builder
+    )
+    return flowsheet, results
+
+
+def test_pipeline_conserves_mass(automation):
+    _flowsheet, results = _solve()
+    streams = results.streams
+    feeds = ConfigLoader(config_path=MASTER_CONFIG).load()["feeds"]
+    inlets = [n for n in feeds if n != "Gasifier_Cooling_Water_In"]  # coolant loop
+    outlets = [
+        "Final_Syngas",
+        "Scrubber_Blowdown",
+        "Baghouse_Solids_Out",
+        "Gasifier_Glass_Out",
+        "PEM_Glass_Out",
+    ]
+    feed = sum(streams[n].mass_flow_kg_s for n in inlets)
+    product = sum(streams[n].mass_flow_kg_s for n in outlets)
+
+    assert automation.solves == 1
+    assert streams["Final_Syngas"].mass_flow_kg_s > 0
+    assert product == pytest.approx(feed)
+    assert sum(streams["Final_Syngas"].mole_fractions.values()) == pytest.approx(1.0)
+
+
+def test_heater_adds_its_energy_stream_duty(automation):
+    flowsheet, results = _solve()
+    before = results.streams["PEM_Mixed_Feed"]
+    after = results.streams["PEM_Feed_PostAC"]
+    duty_W = flowsheet.builder.energy_streams["E_PEM_AC_Power"].GetPropertyValue(
+        "EnergyFlow"
+    )
+
+    rise = duty_W / (before.mass_flow_kg_s * CP_J_KG_K)
+    assert after.temperature_C - before.temperature_C == pytest.approx(rise)
+
+
+def test_warm_energy_patch_matches_cold_solve(automation):
+    base = ConfigLoader(config_path=MASTER_CONFIG).load()
+    changed = copy.deepcopy(base)
+    changed["energy_streams"]["E_PEM_AC_Power"] = 4_000_000.0
+
+    runner = WarmModelRunner(config_path=MASTER_CONFIG)
+    runner.solve(base)
+    warm, _metrics = runner.solve(changed)
+    _flowsheet, cold = _solve(changed)
+
+    assert runner.builds == 1
+    for name in ("PEM_Feed_PostAC", "PEM_Feed_Final", "Final_Syngas"):
+        assert warm.streams[name].temperature_C == pytest.approx(
+            cold.streams[name].temperature_C
+        )
+
+
+def test_saved_flowsheet_reloads_with_connections(automation, tmp_path):
+    flowsheet, results = _solve()
+    path = tmp_path / "fake.dwxml"
+    flowsheet.builder.save(str(path))
+
+    builder = core.FlowsheetBuilder()
+    builder.load(str(path))
+    reloaded = ResultsExtractor(compound_names=flowsheet.compound_set).extract(builder)
+
+    assert sorted(builder.connections) == sorted(flowsheet.builder.connections)
+    assert reloaded.streams["Final_Syngas"].mass_flow_kg_s == pytest.approx(
+        results.streams["Final_Syngas"].mass_flow_kg_s
+    )
+
+
+def test_simulated_latency(monkeypatch):
+    monkeypatch.setenv("DWSIM_FAKE_SOLVE_LATENCY_S", "0.05")
+    automation = FakeAutomation.from_env()
+    sim = automation.CreateFlowsheet()
+
+    start = time.perf_counter()
+    automation.CalculateFlowsheet2(sim)
+    assert time.perf_counter() - start >= 0.05
+
+    with pytest.raises(ValueError, match=">= 0"):
+        FakeAutomation(solve_latency_s=-1.0)
+
+
+def test_kpi_plan_gives_the_same_kpis_from_fewer_streams(automation):
+    from dwsim_model.results.metrics import MetricsCalculator, extraction_plan
+
+    flowsheet, full = _solve()
+    kpis = ["cold_gas_efficiency", "h2_co_ratio", "tar_loading_mg_Nm3"]
+    partial = ResultsExtractor(
+        compound_names=flowsheet.compound_set, plan=extraction_plan(kpis)
+    ).extract(flowsheet.builder)
+
+    expected = MetricsCalculator().calculate(full).to_dict()
+    actual = MetricsCalculator().calculate(partial).to_dict()
+    assert len(partial.streams) == 2 < len(full.streams)
+    assert {k: actual[k] for k in kpis} == {k: expected[k] for k in kpis}
+
+
+def test_setup_thermo_before_build_adds_compounds_once(automation):
+    flowsheet = GasificationFlowsheet(config_path=str(MASTER_CONFIG))
+    added = []
+    add_compound = flowsheet.builder.add_compound
+
+    def spy(name):
+        added.append(name)
+        add_compound(name)
+
+    flowsheet.builder.add_compound = spy
+    flowsheet.setup_thermo()
+    flowsheet.build_flowsheet()
+
+    assert sorted(added) == sorted(flowsheet.compound_set)
@@ -417,3 +417,94 @@ class TestMetricsFromDecomposer:
         # Should have computed H2/CO ratio from the decomposed mole fractions
         assert metrics.h2_co_ratio is not None
         assert metrics.h2_co_ratio >= 0.0
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Batch calculation
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestCalculateBatch:
+    """calculate_batch must agree with calculate() run by run."""
+
+    @staticmethod
+    def _run(scale: float, syngas: bool = True, biomass: bool = True):
+        from dwsim_model.results.extractor import (
+            EnergyStreamResult,
+            FlowsheetResults,
+            StreamResult,
+        )
+
+        streams = {}
+        if biomass:
+            streams["Gasifier_Biomass_Feed"] = StreamResult(
+                "Gasifier_Biomass_Feed",
+                mass_flow_kg_s=1.0,
+                specific_enthalpy_kJ_kg=-500.0,
+                mass_fractions={"Methane": 0.4 * scale, "Water": 1 - 0.4 * scale},
+            )
+        if syngas:
+            streams["Final_Syngas"] = StreamResult(
+                "Final_Syngas",
+                temperature_C=40.0 * scale,
+                mass_flow_kg_s=0.9 * scale,
+                volumetric_flow_Nm3_h=2000.0,
+                specific_enthalpy_kJ_kg=-300.0,
+                mole_fractions={"Hydrogen": 0.3 * scale, "Carbon monoxide": 0.4},
+                mass_fractions={
+                    "Hydrogen": 0.05,
+                    "Carbon monoxide": 0.6,
+                    "Naphthalene": 1e-4 * scale,
+                },
+            )
+        return FlowsheetResults(
+            streams=streams,
+            energy_streams={
+                "E_PEM_AC_Power": EnergyStreamResult("E_PEM_AC_Power", 400.0 * scale)
+            },
+        )
+
+    def test_batch_matches_single_run_calculation(self):
+        pytest.importorskip("numpy")
+        runs = [
+            self._run(1.0),
+            self._run(2.0),  # CGE > 150 % warning
+            self._run(0.5, biomass=False),
+            self._run(1.0, syngas=False),
+        ]
+        for calculator in (
+            MetricsCalculator(),
+            MetricsCalculator(biomass_lhv_mj_kg=18.0, biomass_carbon_mass_fraction=0.5),
+        ):
+            batch = calculator.calculate_batch(runs)
+            for i, run in enumerate(runs):
+                single = calculator.calculate(run).to_state()
+                for key, value in single.items():
+                    if key == "warnings":
+                        assert batch[key][i] == value
+                    else:
+                        assert batch[key][i] == pytest.approx(value), key
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# KPI extraction plans
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class TestExtractionPlan:
+    def test_plan_covers_only_the_requested_kpis(self):
+        from dwsim_model.results.metrics import extraction_plan
+
+        plan = extraction_plan(["cold_gas_efficiency", "h2_co_ratio"])
+        assert plan.streams == {
+            "Final_Syngas": {"mass_flow_kg_s", "mass_fractions", "mole_fractions"},
+            "Gasifier_Biomass_Feed": {"mass_flow_kg_s"},
+        }
+        assert plan.energy_streams == set()
+        assert extraction_plan(["specific_energy_consumption_kWh_t"]).energy_streams
+
+    def test_unknown_kpi_or_empty_list_means_full_extraction(self):
+        from dwsim_model.results.metrics import extraction_plan
+
+        assert extraction_plan(None) is None
+        assert extraction_plan(["cold_gas_efficiency", "warnings"]) is None
@@ -0,0 +1,95 @@
+"""
+tests/test_overlay.py
+=====================
+Unit tests for the copy-on-write ConfigOverlay (config/overlay.py).
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from dwsim_model.analysis.sweep import _get_nested, _set_nested
+from dwsim_model.config.overlay import ConfigOverlay
+from dwsim_model.config_loader import ConfigLoader
+
+
+def _base():
+    return {
+        "feeds": {
+            "Gasifier_Biomass_Feed": {"temperature_C": 25.0, "mass_flow_kg_s": 10.0},
+            "Gasifier_Steam_Feed": {"temperature_C": 400.0, "mass_flow_kg_s": 2.0},
+        },
+        "energy_streams": {"E_Gasifier_Heat": 4000.0},
+    }
+
+
+class TestConfigOverlay:
+    def test_patch_is_visible_and_base_untouched(self):
+        base = _base()
+        cfg = ConfigOverlay(base)
+        cfg.set("feeds.Gasifier_Biomass_Feed.mass_flow_kg_s", 9.0)
+
+        assert cfg["feeds"]["Gasifier_Biomass_Feed"]["mass_flow_kg_s"] == 9.0
+        assert cfg["feeds"]["Gasifier_Biomass_Feed"]["temperature_C"] == 25.0
+        assert base == _base()
+
+    def test_unpatched_branches_are_shared(self):
+        base = _base()
+        cfg = ConfigOverlay(base).set("feeds.Gasifier_Biomass_Feed.mass_flow_kg_s", 9.0)
+        assert cfg["energy_streams"] is base["energy_streams"]
+        assert (
+            cfg["feeds"]["Gasifier_Steam_Feed"] is base["feeds"]["Gasifier_Steam_Feed"]
+        )
+
+    def test_equals_materialised_dict(self):
+        cfg = ConfigOverlay(_base(), {"energy_streams.E_Gasifier_Heat": 4100.0})
+        expected = _base()
+        expected["energy_streams"]["E_Gasifier_Heat"] = 4100.0
+
+        assert cfg == expected
+        assert cfg.to_dict() == expected
+        assert type(cfg.to_dict()["feeds"]) is dict
+
+    def test_new_leaf_and_missing_intermediate(self):
+        cfg = ConfigOverlay(_base())
+        cfg.set("energy_streams.E_New", 1.0)
+        assert "E_New" in cfg["energy_streams"]
+        assert len(cfg["energy_streams"]) == 2
+
+        with pytest.raises(KeyError, match="missing key 'nope'"):
+            cfg.set("feeds.nope.mass_flow_kg_s", 1.0)
+
+    def test_patch_inside_replaced_subtree(self):
+        cfg = ConfigOverlay(_base())
+        cfg.set("feeds.Gasifier_Steam_Feed", {"mass_flow_kg_s": 1.0})
+        cfg.set("feeds.Gasifier_Steam_Feed.mass_flow_kg_s", 3.0)
+        assert cfg["feeds"]["Gasifier_Steam_Feed"] == {"mass_flow_kg_s": 3.0}
+        assert ConfigOverlay(cfg.base, cfg.patches) == cfg
+
+    def test_nested_views_are_read_only(self):
+        cfg = ConfigOverlay(_base()).set("feeds.Gasifier_Steam_Feed.temperature_C", 1)
+        with pytest.raises(TypeError):
+            cfg["feeds"].set("Gasifier_Steam_Feed.temperature_C", 2)
+
+    def test_pickle_and_deepcopy_round_trip(self):
+        cfg = ConfigOverlay(_base(), {"feeds.Gasifier_Steam_Feed.mass_flow_kg_s": 3.0})
+        for clone in (pickle.loads(pickle.dumps(cfg)), copy.deepcopy(cfg)):
+            assert isinstance(clone, ConfigOverlay)
+            assert clone == cfg
+            assert clone.patches == cfg.patches
+
+    def test_sweep_helpers_accept_overlays(self):
+        base = _base()
+        cfg = ConfigOverlay(base)
+        _set_nested(cfg, "feeds.Gasifier_Steam_Feed.mass_flow_kg_s", 2.5)
+        assert _get_nested(cfg, "feeds.Gasifier_Steam_Feed.mass_flow_kg_s") == 2.5
+        assert _get_nested(base, "feeds.Gasifier_Steam_Feed.mass_flow_kg_s") == 2.0
+
+    def test_config_loader_accepts_overlay(self):
+        cfg = ConfigOverlay(
+            _base(), {"feeds.Gasifier_Biomass_Feed.mass_flow_kg_s": 8.0}
+        )
+        loaded = ConfigLoader(config_data=cfg).load()
+        assert loaded["feeds"]["Gasifier_Biomass_Feed"]["mass_flow_kg_s"] == 8.0
+        assert set(loaded["feeds"]) == set(_base()["feeds"])
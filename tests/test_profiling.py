@@ -0,0 +1,102 @@
+"""
+tests/test_profiling.py
+=======================
+Unit tests for the phase-timing / interop-count instrumentation
+(profiling.py) and the places it surfaces: sweep rows and the HTML report.
+"""
+
+from types import SimpleNamespace
+
+from dwsim_model.analysis.sweep import ParameterSweep
+from dwsim_model.profiling import (
+    UNATTRIBUTED,
+    Profiler,
+    count_interop,
+    is_profile_column,
+    span,
+)
+from dwsim_model.results.extractor import FlowsheetResults, ResultsExtractor
+from dwsim_model.results.metrics import GasificationMetrics
+from dwsim_model.results.reporter import generate_html_report
+
+
+def _instrumented_runner(config):
+    with span("build"):
+        count_interop(5)
+        with span("apply_config"):
+            count_interop(2)
+    with span("solve"):
+        count_interop()
+    return {"cold_gas_efficiency": config["x"]}
+
+
+class TestProfiler:
+    def test_hooks_are_noops_without_profiler(self):
+        with span("build"):
+            count_interop(10)  # must not raise or record anywhere
+
+    def test_nested_spans_and_interop_attribution(self):
+        with Profiler() as prof:
+            _instrumented_runner({"x": 1.0})
+            count_interop()
+
+        build = prof.phases["build"]
+        apply = prof.phases["apply_config"]
+        assert build.calls == 1 and apply.calls == 1
+        assert build.interop_calls == 5
+        assert apply.interop_calls == 2
+        assert prof.phases[UNATTRIBUTED].interop_calls == 1
+        assert prof.interop_calls == 9
+        assert build.total_s >= apply.total_s
+        assert abs(build.self_s - (build.total_s - apply.total_s)) < 1e-9
+
+    def test_columns_are_flagged_as_non_kpi(self):
+        with Profiler() as prof:
+            _instrumented_runner({"x": 1.0})
+        columns = prof.columns()
+        assert {"time_build_s", "interop_build", "time_solve_s"} <= set(columns)
+        assert all(is_profile_column(name) for name in columns)
+        assert not is_profile_column("cold_gas_efficiency")
+
+    def test_cprofile_capture(self, tmp_path):
+        with Profiler(cprofile=True) as prof:
+            _instrumented_runner({"x": 1.0})
+        path = prof.dump_stats(tmp_path / "run.prof")
+        assert path.stat().st_size > 0
+        assert "_instrumented_runner" in prof.top_functions()
+
+
+def test_extractor_counts_interop_calls():
+    stream = SimpleNamespace(GetPropertyValue=lambda prop: 1.0)
+    builder = SimpleNamespace(materials={"S": stream}, energy_streams={})
+    with Profiler() as prof:
+        ResultsExtractor(["Hydrogen"], bulk=False).extract(builder)
+
+    # 4 scalar properties + mole and mass fraction of one compound
+    assert prof.phases["extract"].interop_calls == 6
+
+
+def test_sweep_adds_profile_columns():
+    sweep = ParameterSweep(model_runner=_instrumented_runner, profile=True)
+    sweep.set_base_config({"x": 0.0})
+    rows = sweep.sweep_1d("x", [1.0, 2.0])
+    rows = rows.to_dict("records") if hasattr(rows, "to_dict") else rows
+
+    assert [r["interop_calls"] for r in rows] == [8, 8]
+    assert all(r["interop_solve"] == 1 for r in rows)
+    assert all(r["time_build_s"] >= 0 for r in rows)
+
+
+def test_html_report_timing_section(tmp_path):
+    with Profiler() as prof:
+        _instrumented_runner({"x": 1.0})
+    results = FlowsheetResults(converged=True)
+    path = generate_html_report(
+        results, GasificationMetrics(), tmp_path / "r.html", timing=prof.to_dict()
+    )
+    html = path.read_text(encoding="utf-8")
+    assert "<h2>Timing</h2>" in html
+    assert "apply_config" in html
+
+    plain = generate_html_report(results, GasificationMetrics(), tmp_path / "p.html")
+    assert "<h2>Timing</h2>" not in plain.read_text(encoding="utf-8")
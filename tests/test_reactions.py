@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import os
+import shutil
 from types import SimpleNamespace
 
 import pytest
 
+from dwsim_model.chemistry import reactions
 from dwsim_model.chemistry.reactions import (
+    REACTOR_CONTRACTS,
     ReactorAdapter,
     ReactorConfigurationError,
+    ReactorContractCache,
     configure_gasifier,
     configure_pem,
     configure_trc,
+    reactor_contract_path,
 )
 from dwsim_model.config.schema import validate_reactor_config
 
@@ -219,3 +225,82 @@ def test_configure_trc_loads_and_applies_contract_file():
     assert reactor.properties["PROP_PF_2"] == pytest.approx(2.0)
     assert reactor.properties["PROP_PF_3"] == pytest.approx(3.0)
     assert reactor.Reactions.ids
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Contract cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def contract_file(tmp_path):
+    path = tmp_path / "gasifier_reactions.yaml"
+    shutil.copy(reactor_contract_path(REACTOR_CONTRACTS["gasifier"]), path)
+    return path
+
+
+class TestReactorContractCache:
+    def test_unchanged_file_is_parsed_once(self, contract_file):
+        cache = ReactorContractCache()
+
+        first = cache.contract(contract_file)
+        second = cache.contract(contract_file)
+
+        assert second is first
+        assert (cache.misses, cache.hits) == (1, 1)
+
+    def test_touched_file_keeps_parsed_contract(self, contract_file):
+        cache = ReactorContractCache()
+        first = cache.contract(contract_file)
+        stat = contract_file.stat()
+        os.utime(contract_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert cache.contract(contract_file) is first
+        assert cache.misses == 1
+
+    def test_edited_file_is_reloaded(self, contract_file):
+        cache = ReactorContractCache()
+        assert cache.contract(contract_file).temperature_C == pytest.approx(900.0)
+        text = contract_file.read_text(encoding="utf-8")
+        contract_file.write_text(
+            text.replace("temperature_C: 900.0", "temperature_C: 123.0"),
+            encoding="utf-8",
+        )
+        stat = contract_file.stat()
+        os.utime(contract_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert cache.contract(contract_file).temperature_C == pytest.approx(123.0)
+        assert cache.misses == 2
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(ReactorConfigurationError, match="not found"):
+            ReactorContractCache().contract(tmp_path / "missing.yaml")
+        assert ReactorContractCache().digest(tmp_path / "missing.yaml") is None
+
+    def test_raw_returns_private_copies(self, contract_file):
+        cache = ReactorContractCache()
+        cache.raw(contract_file)["reactions"].clear()
+
+        assert cache.raw(contract_file)["reactions"]
+
+    def test_file_blocks_are_not_validated_again(self, contract_file, monkeypatch):
+        cache = ReactorContractCache()
+        config = cache.contract(contract_file)
+        monkeypatch.setattr(reactions, "validate_reactor_config", _fail)
+
+        assert cache.validate(cache.raw(contract_file)) is config
+
+    def test_prefilled_cache_does_not_parse(self, contract_file, monkeypatch):
+        parent = ReactorContractCache()
+        config = parent.contract(contract_file)
+        worker = ReactorContractCache()
+        monkeypatch.setattr(reactions, "_parse_contract", _fail)
+
+        worker.prefill(parent.export())
+
+        assert worker.contract(contract_file) == config
+        assert worker.misses == 0
+
+
+def _fail(*args, **kwargs):
+    raise AssertionError("should have been served from the cache")
@@ -0,0 +1,41 @@
+"""
+tests/test_reporter.py
+======================
+Unit tests for the JSON and HTML reports (results/reporter.py).
+
+``FlowsheetResults.energy_streams`` holds ``EnergyStreamResult`` objects in
+kW; both reports must show those values, not treat them as watts.
+"""
+
+import json
+
+from dwsim_model.results.extractor import EnergyStreamResult, FlowsheetResults
+from dwsim_model.results.metrics import GasificationMetrics
+from dwsim_model.results.reporter import generate_html_report, generate_json_report
+
+
+def _results() -> FlowsheetResults:
+    return FlowsheetResults(
+        energy_streams={
+            "E_PEM_AC_Power": EnergyStreamResult("E_PEM_AC_Power", 5000.0),
+            "E_TRC_Heat": EnergyStreamResult("E_TRC_Heat", 1250.0),
+        },
+        converged=True,
+    )
+
+
+def test_json_report_lists_energy_streams_in_kW(tmp_path):
+    path = generate_json_report(_results(), GasificationMetrics(), tmp_path / "r.json")
+
+    report = json.loads(path.read_text(encoding="utf-8"))
+
+    assert report["energy_streams"] == {"E_PEM_AC_Power": 5000.0, "E_TRC_Heat": 1250.0}
+
+
+def test_html_energy_table_shows_kW_and_total(tmp_path):
+    path = generate_html_report(_results(), GasificationMetrics(), tmp_path / "r.html")
+
+    html = path.read_text(encoding="utf-8")
+
+    assert '">5000.0 kW</td>' in html
+    assert '<td>TOTAL</td><td class="num">6250.0 kW</td>' in html
@@ -0,0 +1,82 @@
+"""
+tests/test_scenarios.py
+=======================
+Contract tests for scenario batches (analysis/scenarios.py).
+
+Scenarios are resolved from the real config tree and solved on the fake
+DWSIM backend in-process (``workers=1``).
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import pytest
+
+from dwsim_model import core
+from dwsim_model.analysis.scenarios import (
+    comparison_rows,
+    discover_scenarios,
+    partition,
+    resolve_scenario,
+    run_scenarios,
+)
+from dwsim_model.fake_backend import FakeAutomation, ObjectType
+
+MASTER_CONFIG = Path(__file__).resolve().parents[1] / "config" / "master_config.yaml"
+
+
+@pytest.fixture
+def fake_dwsim(monkeypatch):
+    automation = FakeAutomation()
+    monkeypatch.setattr(
+        core, "get_automation", lambda dwsim_path=None: (automation, ObjectType)
+    )
+
+
+def test_discover_lists_scenario_files():
+    assert {"baseline", "air_blown", "high_steam"} <= set(
+        discover_scenarios(MASTER_CONFIG)
+    )
+
+
+def test_resolve_applies_each_scenarios_overrides():
+    baseline = resolve_scenario(MASTER_CONFIG, "baseline")
+    air = resolve_scenario(MASTER_CONFIG, "air_blown")
+
+    assert baseline["energy_streams"]["E_PEM_AC_Power"] == pytest.approx(5_000_000.0)
+    assert air["energy_streams"]["E_PEM_AC_Power"] == pytest.approx(3_000_000.0)
+    assert air["scenario"]["name"] == "Air Blown"
+
+
+def test_partition_groups_by_topology_then_splits_for_workers():
+    def item(name, mode):
+        return (name, {"reactor_mode": mode, "compound_set": "standard"})
+
+    items = [item("a", "mixed"), item("b", "equilibrium"), item("c", "mixed")]
+
+    assert [[n for n, _ in b] for b in partition(items, 1)] == [["a", "c"], ["b"]]
+    assert sorted([n for n, _ in b] for b in partition(items, 3)) == [
+        ["a"],
+        ["b"],
+        ["c"],
+    ]
+
+
+def test_batch_reuses_one_flowsheet_and_reports_failures(fake_dwsim, caplog):
+    with caplog.at_level(logging.INFO, logger="dwsim_model.analysis.scenarios"):
+        outcomes = run_scenarios(
+            MASTER_CONFIG, ["baseline", "missing", "air_blown"], workers=1
+        )
+
+    assert [o.name for o in outcomes] == ["baseline", "missing", "air_blown"]
+    assert "1 build(s) and 1 patched run(s)" in caplog.text
+    assert outcomes[1].error and "not found" in outcomes[1].error
+    assert outcomes[2].targets["h2_co_ratio_target"] == pytest.approx(1.0)
+
+    rows = comparison_rows(outcomes)
+    assert [r["error"] is None for r in rows] == [True, False, True]
+    assert rows[0]["reactor_mode"] == "mixed"
+    assert rows[0]["h2_co_ratio"] is not None
+    assert rows[1]["converged"] is False
@@ -0,0 +1,127 @@
+"""
+tests/test_server.py
+====================
+Contract tests for the local model server and its client.
+
+A real ``ModelServer`` is started on a free localhost port in a thread,
+with a fake runner in place of the warm DWSIM runner.
+"""
+
+from __future__ import annotations
+
+import json
+import pickle
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from dwsim_model.results.extractor import FlowsheetResults, StreamResult
+from dwsim_model.results.metrics import GasificationMetrics
+from dwsim_model.server import ModelClient, ModelServer, ServerError
+
+
+class FakeRunner:
+    builds = 1
+
+    def __init__(self):
+        self.configs: list[dict] = []
+
+    def solve(self, config):
+        if config.get("fail"):
+            raise RuntimeError("DWSIM solver returned an error")
+        if config.get("invalid"):
+            raise ValueError("Unknown reactor mode 'invalid'")
+        self.configs.append(config)
+        flow = config["feeds"]["Gasifier_Biomass_Feed"]["mass_flow_kg_s"]
+        results = FlowsheetResults(
+            streams={"Final_Syngas": StreamResult("Final_Syngas", mass_flow_kg_s=flow)},
+            converged=True,
+        )
+        return results, GasificationMetrics(syngas_mass_flow_kg_s=flow)
+
+    def __call__(self, config):
+        return self.solve(config)[1].to_dict()
+
+
+def _config(flow: float) -> dict:
+    return {"feeds": {"Gasifier_Biomass_Feed": {"mass_flow_kg_s": flow}}}
+
+
+@pytest.fixture
+def served():
+    runner = FakeRunner()
+    server = ModelServer(port=0, runner=runner)
+    url = server.start(preload=False)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield ModelClient(url, timeout=10), runner
+    server.shutdown()
+    thread.join(timeout=5)
+
+
+def test_run_round_trips_results_and_metrics(served):
+    client, runner = served
+    results, metrics = client.run(_config(9.5))
+
+    assert runner.configs == [_config(9.5)]
+    assert results.converged
+    assert results.streams["Final_Syngas"].mass_flow_kg_s == 9.5
+    assert metrics.syngas_mass_flow_kg_s == 9.5
+    assert client.health()["requests"] == 1
+
+
+def test_sweep_returns_one_row_per_config(served):
+    client, _runner = served
+    rows = client.sweep(
+        [_config(8.0), {"fail": True}, _config(10.0)], kpis=["syngas_mass_flow_kg_s"]
+    )
+
+    assert [r.get("syngas_mass_flow_kg_s") for r in rows] == [8.0, None, 10.0]
+    assert "DWSIM solver" in rows[1]["error"]
+
+
+def test_model_failure_raises_server_error(served):
+    client, _runner = served
+    with pytest.raises(ServerError, match="DWSIM solver"):
+        client.run({"fail": True})
+    with pytest.raises(ServerError, match="'config' must be"):
+        client._request("POST", "/run", {"config": [1, 2]})
+
+
+def _status(url: str, path: str, data: bytes) -> int:
+    request = urllib.request.Request(url + path, data=data, method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status
+    except urllib.error.HTTPError as exc:
+        return exc.code
+
+
+def test_only_malformed_bodies_are_bad_requests(served):
+    client, _runner = served
+
+    def post(path, body):
+        return _status(client.url, path, json.dumps(body).encode("utf-8"))
+
+    assert _status(client.url, "/run", b"{not json") == 400
+    assert post("/run", [1, 2]) == 400
+    assert post("/run", {"config": [1, 2]}) == 400
+    assert post("/sweep", {"configs": [1, 2]}) == 400
+    assert post("/sweep", {"configs": [], "kpis": "cold_gas_efficiency"}) == 400
+    assert post("/run", {"config": {"invalid": True}}) == 500
+    assert post("/run", {"config": _config(9.0)}) == 200
+
+
+def test_unreachable_server_raises_server_error():
+    client = ModelClient("http://127.0.0.1:9", timeout=1)
+    with pytest.raises(ServerError, match="not reachable"):
+        client.health()
+
+
+def test_client_pickles_as_sweep_runner(served):
+    client, _runner = served
+    clone = pickle.loads(pickle.dumps(client))
+    assert clone.url == client.url
+    assert clone.health()["status"] == "ok"
@@ -0,0 +1,153 @@
+"""
+tests/test_snapshot.py
+======================
+Contract tests for prebuilt flowsheet snapshots (snapshot.py).
+
+A fake builder stands in for DWSIM: ``save`` writes the object names to a
+file and ``load`` recreates them, so we can check that a second build with
+the same key loads the snapshot instead of adding objects one by one.
+"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from dwsim_model.core import FlowsheetBuilder
+from dwsim_model.gasification import GasificationFlowsheet, ReactorMode
+from dwsim_model.snapshot import SnapshotStore, snapshot_key
+
+
+class FakeBuilder:
+    def __init__(self):
+        self.materials = {}
+        self.energy_streams = {}
+        self.operations = {}
+        self.added = 0
+        self.loads = 0
+
+    def add_compound(self, name):
+        pass
+
+    def add_property_package(self, package_name):
+        pass
+
+    def add_object(self, obj_type_name, name, x=0, y=0):
+        obj = SimpleNamespace(Name=name)
+        if obj_type_name == "MaterialStream":
+            self.materials[name] = obj
+        elif obj_type_name == "EnergyStream":
+            self.energy_streams[name] = obj
+        else:
+            self.operations[name] = obj
+        self.added += 1
+        return obj
+
+    def connect(self, *args):
+        pass
+
+    def save(self, filepath):
+        names = {
+            "materials": list(self.materials),
+            "energy_streams": list(self.energy_streams),
+            "operations": list(self.operations),
+        }
+        Path(filepath).write_text(json.dumps(names), encoding="utf-8")
+
+    def load(self, filepath):
+        names = json.loads(Path(filepath).read_text(encoding="utf-8"))
+        for kind, objects in names.items():
+            setattr(self, kind, {n: SimpleNamespace(Name=n) for n in objects})
+        self.loads += 1
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    counts = {"reactors": 0, "config": 0}
+
+    def configure(self):
+        counts["reactors"] += 1
+
+    def load_config(self):
+        counts["config"] += 1
+
+    monkeypatch.setattr(GasificationFlowsheet, "_configure_reactors", configure)
+    monkeypatch.setattr(GasificationFlowsheet, "_load_config", load_config)
+    return counts
+
+
+def _build(store, mode=ReactorMode.MIXED):
+    flowsheet = GasificationFlowsheet(builder=FakeBuilder(), mode=mode, snapshots=store)
+    flowsheet.build_flowsheet()
+    return flowsheet
+
+
+def test_second_build_loads_snapshot(tmp_path, calls):
+    store = SnapshotStore(tmp_path)
+    first = _build(store)
+    second = _build(store)
+
+    assert not first.loaded_from_snapshot
+    assert first.builder.added > 0
+    assert store.path_for(first.snapshot_key()).exists()
+
+    assert second.loaded_from_snapshot
+    assert second.builder.added == 0
+    assert second.builder.loads == 1
+    assert set(second.builder.materials) == set(first.builder.materials)
+    assert set(second.builder.operations) == set(first.builder.operations)
+    # Reactors are configured once (they are part of the snapshot); the
+    # feed/energy config is applied on every build.
+    assert calls == {"reactors": 1, "config": 2}
+
+
+def test_key_depends_on_reactor_types_and_compounds(tmp_path, calls):
+    store = SnapshotStore(tmp_path)
+    _build(store)
+    other = _build(store, mode=ReactorMode.EQUILIBRIUM)
+    assert not other.loaded_from_snapshot
+
+    base = snapshot_key({"gasifier": "RCT_Conversion"}, ["Hydrogen"])
+    assert snapshot_key({"gasifier": "RCT_Conversion"}, ["Hydrogen"]) == base
+    assert snapshot_key({"gasifier": "RCT_PFR"}, ["Hydrogen"]) != base
+    assert snapshot_key({"gasifier": "RCT_Conversion"}, ["Methane"]) != base
+
+
+def test_unusable_snapshot_is_discarded(tmp_path, calls):
+    store = SnapshotStore(tmp_path)
+    first = _build(store)
+    path = store.path_for(first.snapshot_key())
+    path.write_text(json.dumps({"materials": ["Final_Syngas"]}), encoding="utf-8")
+
+    rebuilt = _build(store)
+    assert not rebuilt.loaded_from_snapshot
+    assert rebuilt.builder.added > 0
+    # The full build wrote a complete snapshot again.
+    assert _build(store).loaded_from_snapshot
+
+
+def test_builder_rebinds_loaded_objects_by_name():
+    builder = FlowsheetBuilder()
+    kinds = builder.ObjectType
+
+    def obj(tag, kind):
+        return SimpleNamespace(GraphicObject=SimpleNamespace(Tag=tag, ObjectType=kind))
+
+    loaded = SimpleNamespace(
+        SimulationObjects=SimpleNamespace(
+            Values=[
+                obj("Final_Syngas", kinds.MaterialStream),
+                obj("E_Blower", kinds.EnergyStream),
+                obj("Blower", kinds.Compressor),
+            ]
+        )
+    )
+    builder.interf.LoadFlowsheet.return_value = loaded
+
+    builder.load("snapshot.dwxml")
+
+    assert builder.sim is loaded
+    assert list(builder.materials) == ["Final_Syngas"]
+    assert list(builder.energy_streams) == ["E_Blower"]
+    assert list(builder.operations) == ["Blower"]
@@ -0,0 +1,172 @@
+"""
+tests/test_stages.py
+====================
+Contract tests for stage-level memoization (analysis/stages.py).
+
+The flowsheet, extractor and metrics classes are replaced with fakes so we
+can check which stages get rebuilt and which boundary stream is set from
+the cache, without a DWSIM runtime.
+"""
+
+from __future__ import annotations
+
+import copy
+from types import SimpleNamespace
+
+import pytest
+
+from dwsim_model.analysis.stages import (
+    StageCache,
+    StagedModelRunner,
+    stage_key,
+    stage_streams,
+)
+from dwsim_model.results.extractor import FlowsheetResults, StreamResult
+from dwsim_model.topology import STAGE_OUTLETS, STAGES
+
+REACTOR_TYPES = {
+    "gasifier": "RCT_Conversion",
+    "pem": "RCT_Equilibrium",
+    "trc": "RCT_PFR",
+}
+CLEANUP = ("Syngas_Pre_Baghouse", "Final_Syngas")
+
+
+class FakeStream:
+    def __init__(self):
+        self.writes: list[tuple[str, float]] = []
+
+    def SetPropertyValue(self, prop: str, value: float) -> None:
+        self.writes.append((prop, value))
+
+
+class FakeFlowsheet:
+    instances: list[FakeFlowsheet] = []
+
+    def __init__(self, config_path=None, runtime_config=None, snapshots=None):
+        self.compound_set = ["Hydrogen", "Carbon monoxide"]
+        self.start_stage = "gasifier"
+        self.builder = SimpleNamespace(materials={}, energy_streams={})
+        FakeFlowsheet.instances.append(self)
+
+    def _get_reactor_types(self):
+        return dict(REACTOR_TYPES)
+
+    def build_flowsheet(self):
+        start = STAGES.index(self.start_stage)
+        names = list(CLEANUP)
+        if start > 0:
+            names.append(STAGE_OUTLETS[STAGES[start - 1]])  # free-standing inlet
+        for stage in STAGES[start:-1]:
+            names += stage_streams(stage)[0]
+        self.builder.materials = {name: FakeStream() for name in names}
+
+    def run(self):
+        pass
+
+
+class FakeExtractor:
+    def __init__(self, compound_names=None):
+        pass
+
+    def extract(self, builder):
+        return FlowsheetResults(
+            streams={
+                name: StreamResult(
+                    name=name,
+                    temperature_C=900.0,
+                    pressure_kPa=101.325,
+                    mass_flow_kg_s=3.0,
+                    mole_fractions={"Hydrogen": 0.4, "Carbon monoxide": 0.6},
+                )
+                for name in builder.materials
+            },
+            converged=True,
+        )
+
+
+class FakeMetrics:
+    def calculate(self, results):
+        return SimpleNamespace(to_dict=lambda: {"streams": len(results.streams)})
+
+
+BASE_CONFIG = {
+    "feeds": {
+        "Gasifier_Biomass_Feed": {"temperature_C": 25.0, "mass_flow_kg_s": 10.0},
+        "PEM_Oxygen_Feed": {"temperature_C": 25.0, "mass_flow_kg_s": 0.5},
+        "Quench_Water_Injection": {"temperature_C": 25.0, "mass_flow_kg_s": 2.0},
+    },
+    "energy_streams": {"E_PEM_AC_Power": 5_000_000.0},
+}
+
+
+@pytest.fixture
+def runner(monkeypatch, tmp_path):
+    FakeFlowsheet.instances = []
+    monkeypatch.setattr("dwsim_model.gasification.GasificationFlowsheet", FakeFlowsheet)
+    monkeypatch.setattr("dwsim_model.results.extractor.ResultsExtractor", FakeExtractor)
+    monkeypatch.setattr("dwsim_model.results.metrics.MetricsCalculator", FakeMetrics)
+    return StagedModelRunner(stage_cache=StageCache(tmp_path / "stages"))
+
+
+def test_stage_streams_exclude_the_syngas_inlet():
+    materials, energy = stage_streams("pem")
+    assert "PEM_Oxygen_Feed" in materials
+    assert "Syngas_Pre_TRC" in materials
+    assert "Syngas_Pre_PEM" not in materials
+    assert energy == ("E_PEM_AC_Power", "E_PEM_DC_Power", "E_PEM_HeatLoss")
+
+
+def test_stage_key_depends_only_on_own_inputs():
+    changed = copy.deepcopy(BASE_CONFIG)
+    changed["feeds"]["PEM_Oxygen_Feed"]["mass_flow_kg_s"] = 0.7
+
+    def key(stage, cfg, inlet=None):
+        return stage_key(stage, cfg, REACTOR_TYPES[stage], ["Hydrogen"], inlet)
+
+    assert key("gasifier", BASE_CONFIG) == key("gasifier", changed)
+    assert key("pem", BASE_CONFIG) != key("pem", changed)
+    assert key("pem", BASE_CONFIG, {"temperature_C": 800.0}) != key(
+        "pem", BASE_CONFIG, {"temperature_C": 801.0}
+    )
+
+
+def test_repeat_run_reuses_every_reactor_stage(runner):
+    first = runner(copy.deepcopy(BASE_CONFIG))
+    runner(copy.deepcopy(BASE_CONFIG))
+
+    full, cleanup_only = FakeFlowsheet.instances
+    assert full.start_stage == "gasifier"
+    assert cleanup_only.start_stage == "cleanup"
+    assert (runner.stage_solves, runner.stage_hits) == (3, 3)
+    # The cleanup train starts from the cached TRC outlet ...
+    boundary = cleanup_only.builder.materials["Syngas_Pre_Quench"]
+    assert ("Temperature", pytest.approx(900.0 + 273.15)) in boundary.writes
+    # ... and the merged results still carry every stage's streams.
+    assert runner(copy.deepcopy(BASE_CONFIG)) == first
+
+
+def test_pem_change_resolves_from_pem_stage(runner):
+    runner(copy.deepcopy(BASE_CONFIG))
+    changed = copy.deepcopy(BASE_CONFIG)
+    changed["feeds"]["PEM_Oxygen_Feed"]["mass_flow_kg_s"] = 0.7
+    runner(changed)
+
+    partial = FakeFlowsheet.instances[-1]
+    assert partial.start_stage == "pem"
+    assert partial.builder.materials["Syngas_Pre_PEM"].writes
+    assert "Gasifier_Biomass_Feed" not in partial.builder.materials
+    assert runner.stage_hits == 1
+
+
+def test_unconverged_runs_are_not_stored(runner, monkeypatch):
+    original = FakeExtractor.extract
+
+    def unconverged(self, builder):
+        results = original(self, builder)
+        results.converged = False
+        return results
+
+    monkeypatch.setattr(FakeExtractor, "extract", unconverged)
+    runner(copy.deepcopy(BASE_CONFIG))
+    assert not list(runner.stage_cache.directory.glob("*.json"))
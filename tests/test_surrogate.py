@@ -0,0 +1,133 @@
+"""
+tests/test_surrogate.py
+=======================
+Tests for the sweep-trained surrogate models (analysis/surrogate.py).
+
+Training data comes from ParameterSweep runs against an analytic mock
+runner, so we can check predictions against the known response.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("pandas")
+
+from dwsim_model.analysis.surrogate import SurrogateModel
+from dwsim_model.analysis.sweep import ParameterSweep, _get_nested
+
+FLOW = "feeds.biomass.flow"
+STEAM = "feeds.steam.steam_flow"
+PARAMS = {"flow": FLOW, "steam_flow": STEAM}
+
+
+def _analytic(config: dict) -> dict:
+    flow = float(_get_nested(config, FLOW))
+    steam = float(_get_nested(config, STEAM))
+    return {
+        "cold_gas_efficiency": 0.5 + 0.04 * flow - 0.002 * flow**2 + 0.03 * steam,
+        "h2_co_ratio": 1.0 + 0.3 * steam,
+    }
+
+
+@pytest.fixture(scope="module")
+def sweeps():
+    ps = ParameterSweep(model_runner=_analytic)
+    ps.set_base_config(
+        {"feeds": {"biomass": {"flow": 5.0}, "steam": {"steam_flow": 1.0}}}
+    )
+    df_2d = ps.sweep_2d(FLOW, np.linspace(2.0, 8.0, 7), STEAM, np.linspace(0.5, 2.0, 4))
+    df_1d = ps.sweep_1d(FLOW, [3.5, 6.5])
+    return df_2d, df_1d
+
+
+@pytest.mark.parametrize("kind", ["gp", "poly"])
+def test_predicts_analytic_response(sweeps, kind):
+    model = SurrogateModel.fit(sweeps, PARAMS, kind=kind, defaults={"steam_flow": 1.0})
+    x = {"flow": 4.7, "steam_flow": 1.3}
+    truth = _analytic(
+        {"feeds": {"biomass": {"flow": 4.7}, "steam": {"steam_flow": 1.3}}}
+    )
+    pred = model.predict(x)
+
+    assert set(model.kpis) == {"cold_gas_efficiency", "h2_co_ratio"}
+    assert pred.in_domain
+    for kpi, value in truth.items():
+        assert pred.mean[kpi] == pytest.approx(value, abs=2e-3)
+        assert pred.std[kpi] >= 0.0
+
+
+def test_gp_uncertainty_grows_outside_domain(sweeps):
+    model = SurrogateModel.fit(sweeps[0], PARAMS)
+    inside = model.predict({"flow": 5.0, "steam_flow": 1.0})
+    outside = model.predict({"flow": 14.0, "steam_flow": 1.0})
+
+    assert inside.in_domain
+    assert not outside.in_domain
+    assert outside.std["cold_gas_efficiency"] > inside.std["cold_gas_efficiency"]
+
+
+def test_rows_missing_a_param_are_dropped_without_default(sweeps):
+    model = SurrogateModel.fit(sweeps, PARAMS, kpis=["h2_co_ratio"])
+    X, _ = model._data["h2_co_ratio"]
+    assert len(X) == len(sweeps[0])
+
+
+def test_failed_rows_are_ignored():
+    rows = [
+        {"flow": 1.0, "cold_gas_efficiency": 0.6},
+        {"flow": 2.0, "error": "solver failed"},
+        {"flow": 3.0, "cold_gas_efficiency": 0.7},
+    ]
+    model = SurrogateModel.fit(rows, {"flow": FLOW}, kind="poly", degree=1)
+    assert model.predict({"flow": 2.0}).mean["cold_gas_efficiency"] == pytest.approx(
+        0.65
+    )
+
+
+def test_continuation_columns_are_not_fitted():
+    rows = [
+        {
+            "flow": flow,
+            "cold_gas_efficiency": 0.1 * flow,
+            "warm_started": flow > 1.0,
+            "solve_time_s": 0.02,
+            "time_saved_s": 0.01,
+        }
+        for flow in (1.0, 2.0, 3.0)
+    ]
+    model = SurrogateModel.fit(rows, {"flow": FLOW}, kind="poly", degree=1)
+    assert model.kpis == ["cold_gas_efficiency"]
+
+
+def test_save_load_round_trip(sweeps, tmp_path):
+    model = SurrogateModel.fit(sweeps[0], PARAMS)
+    path = model.save(tmp_path / "surrogate.json")
+    loaded = SurrogateModel.load(path)
+
+    x = {"flow": 6.1, "steam_flow": 0.8}
+    a, b = model.predict(x), loaded.predict(x)
+    assert loaded.params == PARAMS
+    for kpi in model.kpis:
+        assert b.mean[kpi] == pytest.approx(a.mean[kpi])
+        assert b.std[kpi] == pytest.approx(a.std[kpi])
+
+
+def test_drop_in_model_runner(sweeps):
+    model = SurrogateModel.fit(sweeps[0], PARAMS)
+    ps = ParameterSweep(model_runner=model)
+    ps.set_base_config(
+        {"feeds": {"biomass": {"flow": 5.0}, "steam": {"steam_flow": 1.0}}}
+    )
+
+    df = ps.sweep_1d(
+        FLOW, [3.0, 5.0, 20.0], kpis=["cold_gas_efficiency", "cold_gas_efficiency_std"]
+    )
+
+    assert list(df["out_of_domain"]) == [False, False, True]
+    assert df["cold_gas_efficiency_std"].iloc[2] > df["cold_gas_efficiency_std"].iloc[1]
+    assert "error" not in df.columns
+
+
+def test_invalid_kind_rejected():
+    with pytest.raises(ValueError):
+        SurrogateModel(PARAMS, kind="neural")
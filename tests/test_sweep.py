@@ -19,9 +19,11 @@ import pytest
 
 from dwsim_model.analysis.sweep import (
     ParameterSweep,
+    SweepCheckpoint,
     _default_model_runner,
     _get_nested,
     _set_nested,
+    narrowed_runner,
 )
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -233,6 +235,51 @@ class TestParameterSweep2D:
         assert (4.0, 1.5) in recorded
 
 
+def _pool_runner(config: dict) -> dict:
+    """Module-level (picklable) runner used by the process-pool tests."""
+    flow = float(_get_nested(config, "feeds.biomass.flow", default=4.0))
+    if flow == 3.0:
+        raise RuntimeError("Simulated solver failure")
+    return {"cold_gas_efficiency": 0.5 + flow * 0.05, "worker_flow": flow}
+
+
+class TestParallelSweep:
+
+    def setup_method(self):
+        self.sweep = ParameterSweep(model_runner=_pool_runner, workers=2)
+        self.sweep.set_base_config(
+            {"feeds": {"biomass": {"flow": 4.0}, "steam": {"flow": 1.0}}}
+        )
+
+    def test_rows_return_in_grid_order(self):
+        values = [5.0, 1.0, 4.0, 2.0]
+        df = self.sweep.sweep_1d("feeds.biomass.flow", values)
+        assert df["flow"].tolist() == values
+        assert df["worker_flow"].tolist() == values
+
+    def test_errors_captured_per_point(self):
+        df = self.sweep.sweep_1d("feeds.biomass.flow", [2.0, 3.0, 4.0])
+        assert len(df) == 3
+        assert df["error"].isna().tolist() == [True, False, True]
+        assert "Simulated solver failure" in df["error"].iloc[1]
+
+    def test_2d_grid_order_matches_serial(self):
+        serial = ParameterSweep(model_runner=_pool_runner)
+        serial.set_base_config(self.sweep._base_config)
+        args = ("feeds.biomass.flow", [1.0, 2.0], "feeds.steam.flow", [0.5, 1.5])
+        parallel_df = self.sweep.sweep_2d(*args)
+        serial_df = serial.sweep_2d(*args)
+        assert parallel_df[["flow", "worker_flow"]].values.tolist() == (
+            serial_df[["flow", "worker_flow"]].values.tolist()
+        )
+
+    def test_unpicklable_runner_rejected(self):
+        sweep = ParameterSweep(model_runner=lambda config: {}, workers=2)
+        sweep.set_base_config({"feeds": {"biomass": {"flow": 4.0}}})
+        with pytest.raises(ValueError, match="picklable"):
+            sweep.sweep_1d("feeds.biomass.flow", [1.0, 2.0])
+
+
 class TestSensitivityOAT:
 
     def test_oat_produces_rows_for_each_param(self):
@@ -259,11 +306,90 @@ class TestSensitivityOAT:
             assert sum(1 for _ in result) == 6
 
 
+def _cliff_kpis(config: dict) -> dict:
+    """CGE is flat except for a sharp step around flow = 6.3."""
+    flow = float(_get_nested(config, "feeds.biomass.flow"))
+    return {
+        "cold_gas_efficiency": 0.75 if flow > 6.3 else 0.55,
+        "h2_co_ratio": 1.5,
+    }
+
+
+class TestAdaptiveSweep:
+    def setup_method(self):
+        self.mock_runner = _make_mock_runner(_cliff_kpis)
+        self.sweep = ParameterSweep(model_runner=self.mock_runner)
+        self.sweep.set_base_config({"feeds": {"biomass": {"flow": 4.0}}})
+
+    def test_respects_budget(self):
+        df = self.sweep.sweep_adaptive("feeds.biomass.flow", (0.0, 10.0), budget=12)
+        assert len(df) == 12
+        assert len(self.mock_runner.calls) == 12
+
+    def test_same_columns_as_sweep_1d_and_sorted(self):
+        adaptive = self.sweep.sweep_adaptive(
+            "feeds.biomass.flow", (0.0, 10.0), budget=8
+        )
+        fixed = self.sweep.sweep_1d("feeds.biomass.flow", [0.0, 5.0, 10.0])
+        assert list(adaptive.columns) == list(fixed.columns)
+        assert list(adaptive["flow"]) == sorted(adaptive["flow"])
+
+    def test_runs_concentrate_at_the_cliff(self):
+        df = self.sweep.sweep_adaptive(
+            "feeds.biomass.flow", (0.0, 10.0), budget=15, initial_points=5
+        )
+        # Initial grid is 0, 2.5, 5, 7.5, 10; all 10 refinements must land
+        # strictly inside the interval containing the step.
+        inside = [x for x in df["flow"] if 5.0 < x < 7.5]
+        assert len(inside) == 10
+
+    def test_stops_early_on_linear_response(self):
+        sweep = ParameterSweep(
+            model_runner=_make_mock_runner(
+                lambda cfg: {
+                    "cold_gas_efficiency": 0.1 * cfg["feeds"]["biomass"]["flow"]
+                }
+            )
+        )
+        sweep.set_base_config({"feeds": {"biomass": {"flow": 4.0}}})
+        df = sweep.sweep_adaptive(
+            "feeds.biomass.flow", (0.0, 4.0), budget=50, tol=0.2, initial_points=5
+        )
+        # Every initial interval already jumps by exactly 0.25 of the range,
+        # so one round of bisection brings all of them to 0.125 < tol.
+        assert len(df) == 9
+
+    def test_continuation_columns_are_not_refined_on(self):
+        noise = iter(range(1000))
+
+        def kpis(cfg):
+            flow = cfg["feeds"]["biomass"]["flow"]
+            jitter = next(noise) % 7
+            return {
+                "cold_gas_efficiency": 0.1 * flow,
+                "warm_started": True,
+                "solve_time_s": 0.01 * jitter,
+                "time_saved_s": -0.01 * jitter,
+            }
+
+        sweep = ParameterSweep(model_runner=_make_mock_runner(kpis))
+        sweep.set_base_config({"feeds": {"biomass": {"flow": 4.0}}})
+        df = sweep.sweep_adaptive(
+            "feeds.biomass.flow", (0.0, 4.0), budget=50, tol=0.2, initial_points=5
+        )
+        # Same as the linear response above: timing noise is not a KPI.
+        assert len(df) == 9
+
+    def test_invalid_bounds_raise(self):
+        with pytest.raises(ValueError):
+            self.sweep.sweep_adaptive("feeds.biomass.flow", (5.0, 1.0))
+
+
 def test_default_model_runner_passes_compound_set_to_extractor(monkeypatch):
     observed: dict[str, object] = {}
 
     class FakeFlowsheet:
-        def __init__(self, runtime_config=None):
+        def __init__(self, runtime_config=None, snapshots=None):
             self.compound_set = ["Hydrogen", "Carbon monoxide"]
             self.builder = object()
             self._injected_config = runtime_config
@@ -275,7 +401,7 @@ def test_default_model_runner_passes_compound_set_to_extractor(monkeypatch):
             observed["ran"] = True
 
     class FakeExtractor:
-        def __init__(self, compound_names=None, key_streams=None):
+        def __init__(self, compound_names=None, key_streams=None, plan=None):
             observed["compound_names"] = compound_names
 
         def extract(self, builder):
@@ -308,3 +434,216 @@ def test_default_model_runner_passes_compound_set_to_extractor(monkeypatch):
     assert observed["config"] == config
     assert observed["compound_names"] == ["Hydrogen", "Carbon monoxide"]
     assert observed["results"] == "results"
+
+
+class TestNarrowedRunner:
+    def test_default_runner_gets_kpis_keyword(self):
+        with narrowed_runner(_default_model_runner, ["h2_co_ratio"]) as runner:
+            assert runner.keywords == {"kpis": ("h2_co_ratio",)}
+
+    def test_runner_object_kpis_set_and_restored(self):
+        class Runner:
+            kpis = None
+
+            def __call__(self, config):
+                return {"kpis": self.kpis}
+
+        runner = Runner()
+        ps = ParameterSweep(model_runner=runner)
+        ps.set_base_config({"x": 0})
+        rows = ps.sweep_1d("x", [1], kpis=["kpis"])
+        rows = rows.to_dict("records") if hasattr(rows, "to_dict") else rows
+
+        assert rows[0]["kpis"] == ("kpis",)
+        assert runner.kpis is None
+
+    def test_other_runners_unchanged(self):
+        def runner(config):
+            return {}
+
+        with narrowed_runner(runner, ["kpi"]) as narrowed:
+            assert narrowed is runner
+
+
+class _Killed(BaseException):
+    """Stands in for the job being killed mid-sweep (not caught per point)."""
+
+
+class TestCheckpointedSweep:
+
+    FLOWS = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+    def setup_method(self):
+        self.base = {"feeds": {"biomass": {"flow": 4.0}}}
+
+    def _sweep(self, runner):
+        sweep = ParameterSweep(model_runner=runner)
+        sweep.set_base_config(self.base)
+        return sweep
+
+    def test_rows_are_streamed_and_returned(self, tmp_path):
+        ckpt = tmp_path / "sweep.jsonl"
+        result = self._sweep(_make_mock_runner()).sweep_1d(
+            "feeds.biomass.flow", self.FLOWS, checkpoint=ckpt
+        )
+        lines = ckpt.read_text().splitlines()
+        assert len(lines) == len(self.FLOWS)
+        assert list(result["flow"]) == self.FLOWS
+        assert "point_hash" not in result.columns
+
+    def test_resume_after_kill_skips_recorded_points(self, tmp_path):
+        ckpt = tmp_path / "sweep.jsonl"
+
+        def dies_at_4(config):
+            if _get_nested(config, "feeds.biomass.flow") == 4.0:
+                raise _Killed
+            return _make_mock_runner()(config)
+
+        with pytest.raises(_Killed):
+            self._sweep(dies_at_4).sweep_1d(
+                "feeds.biomass.flow", self.FLOWS, checkpoint=ckpt
+            )
+        assert len(ckpt.read_text().splitlines()) == 3
+
+        runner = _make_mock_runner()
+        result = self._sweep(runner).sweep_1d(
+            "feeds.biomass.flow", self.FLOWS, checkpoint=ckpt, resume=True
+        )
+        ran = [_get_nested(c, "feeds.biomass.flow") for c in runner.calls]
+        assert ran == [4.0, 5.0, 6.0]
+        assert list(result["flow"]) == self.FLOWS
+
+    def test_failed_points_are_retried_on_resume(self, tmp_path):
+        ckpt = tmp_path / "sweep.jsonl"
+
+        def fails_at_2(config):
+            if _get_nested(config, "feeds.biomass.flow") == 2.0:
+                raise RuntimeError("transient")
+            return {"cold_gas_efficiency": 0.7}
+
+        self._sweep(fails_at_2).sweep_1d(
+            "feeds.biomass.flow", self.FLOWS, checkpoint=ckpt
+        )
+        runner = _make_mock_runner()
+        result = self._sweep(runner).sweep_1d(
+            "feeds.biomass.flow", self.FLOWS, checkpoint=ckpt, resume=True
+        )
+        assert len(runner.calls) == 1
+        assert len(result) == len(self.FLOWS)
+        assert "error" not in result.columns
+
+    def test_changed_base_config_is_not_resumed(self, tmp_path):
+        ckpt = tmp_path / "sweep.jsonl"
+        self._sweep(_make_mock_runner()).sweep_1d(
+            "feeds.biomass.flow", self.FLOWS, checkpoint=ckpt
+        )
+        self.base = {"feeds": {"biomass": {"flow": 4.0, "moisture": 0.3}}}
+        runner = _make_mock_runner()
+        self._sweep(runner).sweep_1d(
+            "feeds.biomass.flow", self.FLOWS, checkpoint=ckpt, resume=True
+        )
+        assert len(runner.calls) == len(self.FLOWS)
+
+    def test_truncated_last_line_is_ignored(self, tmp_path):
+        ckpt = tmp_path / "sweep.jsonl"
+        self._sweep(_make_mock_runner()).sweep_1d(
+            "feeds.biomass.flow", self.FLOWS[:3], checkpoint=ckpt
+        )
+        with ckpt.open("a") as fh:
+            fh.write('{"point_hash": "abc", "flow": 4.')
+        assert len(SweepCheckpoint(ckpt).rows()) == 3
+
+    def test_parallel_sweep_streams_in_grid_order(self, tmp_path):
+        ckpt = tmp_path / "sweep.jsonl"
+        sweep = ParameterSweep(model_runner=_pool_runner, workers=2)
+        sweep.set_base_config(self.base)
+        result = sweep.sweep_1d("feeds.biomass.flow", self.FLOWS, checkpoint=ckpt)
+        assert list(result["worker_flow"].dropna()) == [1.0, 2.0, 4.0, 5.0, 6.0]
+        assert len(ckpt.read_text().splitlines()) == len(self.FLOWS)
+
+
+def _ishigami(config: dict) -> dict:
+    """Ishigami test function on [-pi, pi]^3 — known Sobol indices."""
+    import math
+
+    x1, x2, x3 = (float(_get_nested(config, f"x.{k}")) for k in ("a", "b", "c"))
+    return {
+        "y": math.sin(x1) + 7 * math.sin(x2) ** 2 + 0.1 * x3**4 * math.sin(x1),
+        "x2_only": x2,
+    }
+
+
+class TestSobolSensitivity:
+
+    def setup_method(self):
+        import math
+
+        pytest.importorskip("numpy")
+        self.sweep = ParameterSweep(model_runner=_ishigami)
+        self.sweep.set_base_config({"x": {"a": 0.0, "b": 0.0, "c": 0.0}})
+        self.params = {f"x.{k}": (-math.pi, math.pi) for k in ("a", "b", "c")}
+
+    def _indices(self, df, kpi):
+        rows = df[df["kpi"] == kpi].set_index("param")
+        return rows["S1"].to_dict(), rows["ST"].to_dict()
+
+    def test_run_count_and_columns(self):
+        pytest.importorskip("pandas")
+        indices, runs = self.sweep.sensitivity_sobol(self.params, n_samples=16)
+        assert len(runs) == 16 * (3 + 2)
+        assert {"a", "b", "c", "sample_block", "sample_index"} <= set(runs.columns)
+        assert set(indices["kpi"]) == {"y", "x2_only"}
+        assert {"S1", "S1_conf", "ST", "ST_conf", "n_used"} <= set(indices.columns)
+
+    def test_continuation_columns_are_not_kpis(self):
+        pytest.importorskip("pandas")
+
+        def runner(config):
+            return _ishigami(config) | {
+                "warm_started": True,
+                "solve_time_s": 0.02,
+                "time_saved_s": 0.01,
+            }
+
+        sweep = ParameterSweep(model_runner=runner)
+        sweep.set_base_config({"x": {"a": 0.0, "b": 0.0, "c": 0.0}})
+        indices, _ = sweep.sensitivity_sobol(self.params, n_samples=16)
+        assert set(indices["kpi"]) == {"y", "x2_only"}
+
+    def test_ishigami_indices(self):
+        pytest.importorskip("pandas")
+        indices, _ = self.sweep.sensitivity_sobol(
+            self.params, kpis=["y"], n_samples=1024
+        )
+        s1, st = self._indices(indices, "y")
+        # Analytic: S1 = (0.314, 0.442, 0), ST = (0.558, 0.442, 0.244)
+        assert s1["x.a"] == pytest.approx(0.314, abs=0.05)
+        assert s1["x.b"] == pytest.approx(0.442, abs=0.05)
+        assert s1["x.c"] == pytest.approx(0.0, abs=0.05)
+        assert st["x.c"] == pytest.approx(0.244, abs=0.05)
+        # x3 acts only through its interaction with x1
+        assert st["x.c"] - s1["x.c"] > 0.15
+
+    def test_single_driver_identified(self):
+        pytest.importorskip("pandas")
+        indices, _ = self.sweep.sensitivity_sobol(
+            self.params, kpis=["x2_only"], n_samples=64, sampler="lhs", seed=3
+        )
+        s1, st = self._indices(indices, "x2_only")
+        assert s1["x.b"] == pytest.approx(1.0, abs=0.1)
+        assert st["x.a"] == pytest.approx(0.0, abs=1e-12)
+
+    def test_failed_runs_are_excluded(self):
+        pytest.importorskip("pandas")
+
+        def flaky(config):
+            if _get_nested(config, "x.a") > 2.5:
+                raise RuntimeError("no convergence")
+            return _ishigami(config)
+
+        self.sweep._runner = flaky
+        indices, runs = self.sweep.sensitivity_sobol(
+            self.params, kpis=["y"], n_samples=64
+        )
+        assert runs["error"].notna().any()
+        assert (indices["n_used"] < 64).all()
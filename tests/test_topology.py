@@ -3,9 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from dwsim_model.topology import (
+    build_cleanup_stage,
     build_gasifier_stage,
     build_pem_stage,
     build_trc_stage,
+    downstream_order,
 )
 
 
@@ -73,3 +75,27 @@ def test_trc_stage_creates_standalone_syngas_inlet_when_needed():
     assert "TRC_Syngas_Inlet" in builder.materials
     assert "TRC_Reactor" in builder.operations
     assert ("TRC_Reactor", "Syngas_Pre_Quench", 0, 0) in builder.connections
+
+
+def test_cleanup_stage_starts_from_standalone_quench_inlet():
+    builder = FakeBuilder()
+
+    def connect(source, target, source_port: int = 0, target_port: int = 0) -> None:
+        builder.connections.append((source.Name, target.Name, source_port, target_port))
+
+    build_cleanup_stage(builder, connect)
+
+    assert "Syngas_Pre_Quench" in builder.materials
+    assert ("Syngas_Pre_Quench", "Quench_Vessel", 0, 0) in builder.connections
+    assert ("Blower", "Final_Syngas", 0, 0) in builder.connections
+
+
+def test_downstream_order_skips_upstream_objects():
+    connections = [("A", "R1"), ("R1", "B"), ("B", "R2"), ("R2", "C"), ("E", "R2")]
+    assert downstream_order(connections, ["B"]) == ["B", "R2", "C"]
+    assert downstream_order(connections, ["A", "E"])[-1] == "C"
+
+
+def test_downstream_order_returns_none_for_recycle():
+    connections = [("A", "M"), ("M", "R"), ("R", "S"), ("S", "M")]
+    assert downstream_order(connections, ["A"]) is None
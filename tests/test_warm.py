@@ -0,0 +1,209 @@
+"""
+tests/test_warm.py
+==================
+Contract tests for WarmModelRunner.
+
+The flowsheet, extractor and metrics classes are replaced with small fakes
+so we can check *what* the runner pushes into DWSIM between runs without
+a DWSIM runtime.
+"""
+
+from __future__ import annotations
+
+import copy
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from dwsim_model.analysis.warm import WarmModelRunner
+
+
+class FakeStream:
+    def __init__(self, name: str):
+        self.name = name
+        self.writes: list[tuple[str, float]] = []
+
+    def SetPropertyValue(self, prop: str, value: float) -> None:
+        self.writes.append((prop, value))
+
+
+class FakeFlowsheet:
+    instances: list[FakeFlowsheet] = []
+
+    def __init__(self, config_path=None, runtime_config=None, snapshots=None):
+        self.compound_set = ["Hydrogen", "Carbon monoxide"]
+        self.runtime_config = runtime_config
+        self.builder = SimpleNamespace(
+            materials={
+                name: FakeStream(name)
+                for name in ("Gasifier_Biomass_Feed", "Quench_Water_Injection")
+            },
+            energy_streams={"E_PEM_AC_Power": FakeStream("E_PEM_AC_Power")},
+        )
+        self.runs = 0
+        self.changed: list = []
+        FakeFlowsheet.instances.append(self)
+
+    def build_flowsheet(self):
+        pass
+
+    def run(self, changed=None):
+        self.runs += 1
+        self.changed.append(changed)
+
+
+class FakeExtractor:
+    converged = True
+
+    def __init__(self, compound_names=None, key_streams=None, plan=None):
+        pass
+
+    def extract(self, builder):
+        return SimpleNamespace(converged=FakeExtractor.converged)
+
+
+class RecordingCache:
+    def __init__(self):
+        self.stored: list = []
+
+    def get(self, resolved):
+        return None
+
+    def put(self, resolved, results, metrics):
+        self.stored.append(results)
+
+
+class FakeMetrics:
+    def calculate(self, results):
+        return SimpleNamespace(to_dict=lambda: {"cold_gas_efficiency": 0.7})
+
+
+BASE_CONFIG = {
+    "reactor_mode": "mixed",
+    "compound_set": "standard",
+    "feeds": {
+        "Gasifier_Biomass_Feed": {"temperature_C": 25.0, "mass_flow_kg_s": 10.0},
+        "Quench_Water_Injection": {"temperature_C": 25.0, "mass_flow_kg_s": 2.0},
+    },
+    "energy_streams": {"E_PEM_AC_Power": 5_000_000.0},
+}
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    FakeFlowsheet.instances = []
+    monkeypatch.setattr("dwsim_model.gasification.GasificationFlowsheet", FakeFlowsheet)
+    monkeypatch.setattr("dwsim_model.results.extractor.ResultsExtractor", FakeExtractor)
+    monkeypatch.setattr("dwsim_model.results.metrics.MetricsCalculator", FakeMetrics)
+    monkeypatch.setattr(FakeExtractor, "converged", True)
+    return WarmModelRunner()
+
+
+def test_first_call_builds_and_solves(runner):
+    kpis = runner(copy.deepcopy(BASE_CONFIG))
+
+    assert kpis["cold_gas_efficiency"] == pytest.approx(0.7)
+    assert runner.builds == 1
+    assert FakeFlowsheet.instances[0].runs == 1
+
+
+def test_feed_change_patches_only_changed_stream(runner):
+    runner(copy.deepcopy(BASE_CONFIG))
+    flowsheet = FakeFlowsheet.instances[0]
+    for stream in flowsheet.builder.materials.values():
+        stream.writes.clear()
+
+    config = copy.deepcopy(BASE_CONFIG)
+    config["feeds"]["Quench_Water_Injection"]["mass_flow_kg_s"] = 3.0
+    runner(config)
+
+    assert runner.builds == 1
+    assert runner.patched_runs == 1
+    assert flowsheet.runs == 2
+    # Only the value that changed is written, not the stream's temperature.
+    assert flowsheet.builder.materials["Quench_Water_Injection"].writes == [
+        ("MassFlow", 3.0)
+    ]
+    assert flowsheet.builder.materials["Gasifier_Biomass_Feed"].writes == []
+    assert flowsheet.builder.energy_streams["E_PEM_AC_Power"].writes == []
+    # Only the quench stream's downstream part is recalculated.
+    assert flowsheet.changed == [None, ["Quench_Water_Injection"]]
+
+
+def test_energy_change_patches_energy_stream(runner):
+    runner(copy.deepcopy(BASE_CONFIG))
+    config = copy.deepcopy(BASE_CONFIG)
+    config["energy_streams"]["E_PEM_AC_Power"] = 4_000_000.0
+
+    runner(config)
+
+    writes = FakeFlowsheet.instances[0].builder.energy_streams["E_PEM_AC_Power"].writes
+    assert writes == [("PROP_ES_0", pytest.approx(4_000.0))]
+    assert runner.builds == 1
+
+
+@pytest.mark.parametrize(
+    ("key", "value"), [("reactor_mode", "equilibrium"), ("compound_set", "extended")]
+)
+def test_topology_key_change_forces_rebuild(runner, key, value):
+    runner(copy.deepcopy(BASE_CONFIG))
+    config = copy.deepcopy(BASE_CONFIG)
+    config[key] = value
+
+    runner(config)
+
+    assert runner.builds == 2
+    assert len(FakeFlowsheet.instances) == 2
+
+
+def test_failed_solve_drops_warm_flowsheet(runner, monkeypatch):
+    runner(copy.deepcopy(BASE_CONFIG))
+
+    def boom(changed=None):
+        raise RuntimeError("DWSIM solver returned an error")
+
+    monkeypatch.setattr(FakeFlowsheet.instances[0], "run", boom)
+    with pytest.raises(RuntimeError):
+        runner(copy.deepcopy(BASE_CONFIG))
+
+    runner(copy.deepcopy(BASE_CONFIG))
+    assert runner.builds == 2
+
+
+def test_failed_patch_is_retried_by_a_rebuild(runner, monkeypatch):
+    runner(copy.deepcopy(BASE_CONFIG))
+    quench = FakeFlowsheet.instances[0].builder.materials["Quench_Water_Injection"]
+
+    def reject(prop, value):
+        raise RuntimeError("read-only property")
+
+    monkeypatch.setattr(quench, "SetPropertyValue", reject)
+    runner.cache = RecordingCache()
+    config = copy.deepcopy(BASE_CONFIG)
+    config["feeds"]["Quench_Water_Injection"]["mass_flow_kg_s"] = 3.0
+    runner(config)
+
+    # The stale flowsheet is neither cached nor diffed against next time.
+    assert runner.cache.stored == []
+    runner(copy.deepcopy(config))
+    assert runner.builds == 2
+
+
+@pytest.mark.parametrize("converged", [True, False])
+def test_only_converged_solves_are_cached(runner, monkeypatch, converged):
+    monkeypatch.setattr(FakeExtractor, "converged", converged)
+    runner.cache = RecordingCache()
+
+    runner(copy.deepcopy(BASE_CONFIG))
+
+    assert len(runner.cache.stored) == (1 if converged else 0)
+
+
+def test_pickled_runner_starts_cold(runner):
+    runner(copy.deepcopy(BASE_CONFIG))
+
+    clone = pickle.loads(pickle.dumps(runner))
+
+    assert clone._flowsheet is None
+    assert clone.builds == 1